@@ -0,0 +1,235 @@
+"""
+Many concurrent agents on one ``AgentHost`` against a local stub Realtime
+server. Every agent streams 20 ms of silence per 20 ms, as a phone call would,
+and the server answers each agent with a short spoken response every second.
+Measures the memory each connected agent holds and how late the shared event
+loop runs under that load. The server runs in its own process, so its work
+does not count against the host's loop.
+
+Running
+-------
+::
+
+    python benchmarks/agent_host_load.py
+"""
+
+import asyncio
+import base64
+import json
+import logging
+import multiprocessing
+import time
+import tracemalloc
+from collections.abc import AsyncIterator
+
+from websockets.asyncio.server import ServerConnection, serve
+
+from rtvoice.agent import AgentHost
+from rtvoice.audio import AudioInput, AudioOutput
+from rtvoice.realtime import RealtimeProvider
+from rtvoice.tools import Tools
+
+AGENT_COUNTS = (10, 100, 250)
+LOAD_SECONDS = 5.0
+CHUNK_SECONDS = 0.02
+RESPONSE_INTERVAL_SECONDS = 1.0
+# 24 kHz, 16-bit mono
+_SAMPLE_BYTES_PER_SECOND = 48_000
+_SILENCE = bytes(int(_SAMPLE_BYTES_PER_SECOND * CHUNK_SECONDS))
+_AUDIO_DELTA = base64.b64encode(bytes(_SAMPLE_BYTES_PER_SECOND // 10)).decode()
+_DELTAS_PER_RESPONSE = 5
+
+
+class SilentCaller(AudioInput):
+    def __init__(self) -> None:
+        self._active = False
+
+    async def start(self) -> None:
+        self._active = True
+
+    async def stop(self) -> None:
+        self._active = False
+
+    async def stream_chunks(self) -> AsyncIterator[bytes]:
+        while self._active:
+            await asyncio.sleep(CHUNK_SECONDS)
+            yield _SILENCE
+
+    @property
+    def is_active(self) -> bool:
+        return self._active
+
+
+class DiscardingOutput(AudioOutput):
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    async def play_chunk(self, chunk: bytes) -> None:
+        pass
+
+    @property
+    def is_playing(self) -> bool:
+        return False
+
+    async def clear_buffer(self) -> None:
+        pass
+
+
+class StubProvider(RealtimeProvider):
+    def __init__(self, port: int) -> None:
+        self._port = port
+
+    def build_url(self, model: str) -> str:
+        return f"ws://127.0.0.1:{self._port}/?model={model}"
+
+    def build_headers(self) -> dict[str, str]:
+        return {}
+
+
+def _response_events(index: int) -> list[str]:
+    response_id = f"response-{index}"
+    usage = {
+        "input_tokens": 400,
+        "output_tokens": 120,
+        "input_token_details": {"text_tokens": 100, "audio_tokens": 300},
+        "output_token_details": {"text_tokens": 20, "audio_tokens": 100},
+    }
+    events = [
+        {
+            "type": "response.created",
+            "event_id": f"created-{index}",
+            "response": {"id": response_id},
+        },
+        *(
+            {
+                "type": "response.output_audio.delta",
+                "event_id": f"delta-{index}-{chunk}",
+                "item_id": f"item-{index}",
+                "response_id": response_id,
+                "output_index": 0,
+                "content_index": 0,
+                "delta": _AUDIO_DELTA,
+            }
+            for chunk in range(_DELTAS_PER_RESPONSE)
+        ),
+        {
+            "type": "response.done",
+            "event_id": f"done-{index}",
+            "response": {"id": response_id, "status": "completed", "usage": usage},
+        },
+    ]
+    return [json.dumps(event) for event in events]
+
+
+async def _serve_session(connection: ServerConnection) -> None:
+    async def talk() -> None:
+        index = 0
+        while True:
+            await asyncio.sleep(RESPONSE_INTERVAL_SECONDS)
+            for message in _response_events(index):
+                await connection.send(message)
+            index += 1
+
+    talker = asyncio.create_task(talk())
+    try:
+        async for _ in connection:
+            pass
+    finally:
+        talker.cancel()
+
+
+def _run_server(ports: multiprocessing.Queue) -> None:
+    async def serve_forever() -> None:
+        async with serve(_serve_session, "127.0.0.1", 0) as server:
+            ports.put(server.sockets[0].getsockname()[1])
+            await server.serve_forever()
+
+    asyncio.run(serve_forever())
+
+
+def _tools() -> Tools:
+    tools = Tools()
+
+    @tools.action("Look up the status of an order by its number.")
+    async def get_order_status(order_number: str) -> str:
+        return "shipped"
+
+    @tools.action("Book a callback from a human agent at the given time.")
+    async def book_callback(time: str) -> str:
+        return "booked"
+
+    return tools
+
+
+async def _measure(
+    host: AgentHost, agent_count: int
+) -> tuple[float, float, float, float, int]:
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    started_at = time.perf_counter()
+    agents = [
+        host.create_agent(
+            system_prompt="You answer questions about orders.",
+            audio_input=SilentCaller(),
+            audio_output=DiscardingOutput(),
+        )
+        for _ in range(agent_count)
+    ]
+    create_ms = (time.perf_counter() - started_at) / agent_count * 1000
+    runs = [asyncio.create_task(host.run(agent)) for agent in agents]
+    # every agent connected and through its first response
+    await asyncio.sleep(RESPONSE_INTERVAL_SECONDS * 1.5)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # lag is measured without tracemalloc slowing the loop down
+    host._loop_lag.reset()
+    lags: list[float] = []
+    deadline = time.perf_counter() + LOAD_SECONDS
+    while time.perf_counter() < deadline:
+        await asyncio.sleep(0.1)
+        lags.append(host.stats().loop_lag_seconds)
+    max_lag = host.stats().max_loop_lag_seconds
+    responses = sum(usage.responses for usage in host.usage())
+
+    await host.close()
+    await asyncio.gather(*runs)
+    lags.sort()
+    p99_lag = lags[int(len(lags) * 0.99)]
+    kib = (after - before) / agent_count / 1024
+    return create_ms, kib, p99_lag, max_lag, responses
+
+
+async def main() -> None:
+    logging.disable(logging.WARNING)
+
+    context = multiprocessing.get_context("spawn")
+    ports = context.Queue()
+    server = context.Process(target=_run_server, args=(ports,), daemon=True)
+    server.start()
+    port = await asyncio.to_thread(ports.get)
+
+    tools = _tools()
+    print(
+        f"{'agents':>7} {'create ms':>10} {'KiB/agent':>10} "
+        f"{'p99 lag ms':>11} {'max lag ms':>11} {'responses':>10}"
+    )
+    try:
+        for agent_count in AGENT_COUNTS:
+            host = AgentHost(tools=tools, provider=StubProvider(port))
+            create_ms, kib, p99_lag, max_lag, responses = await _measure(
+                host, agent_count
+            )
+            print(
+                f"{agent_count:>7} {create_ms:>10.2f} {kib:>10.1f} "
+                f"{p99_lag * 1000:>11.1f} {max_lag * 1000:>11.1f} {responses:>10}"
+            )
+    finally:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
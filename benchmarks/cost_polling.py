@@ -0,0 +1,82 @@
+"""
+Cost of reading a session's running cost, as a budget check polling every
+session once a second would: the itemised `usage_report()` against the
+incremental `cost` total.
+
+Running
+-------
+::
+
+    python benchmarks/cost_polling.py
+"""
+
+import asyncio
+import time
+
+from transitbus import EventBus
+
+from rtvoice.realtime.schemas import (
+    RealtimeResponseObject,
+    ResponseDoneEvent,
+    TokenInputTokenDetails,
+    TokenOutputTokenDetails,
+    TokenUsage,
+)
+from rtvoice.tokens import TokenTracker
+
+RESPONSES = 200
+READS = 10_000
+
+
+def _response(index: int) -> ResponseDoneEvent:
+    return ResponseDoneEvent(
+        type="response.done",
+        event_id=f"event-{index}",
+        response=RealtimeResponseObject(
+            id=f"response-{index}",
+            usage=TokenUsage(
+                input_tokens=1_500,
+                output_tokens=300,
+                total_tokens=1_800,
+                input_token_details=TokenInputTokenDetails(
+                    text_tokens=1_000,
+                    audio_tokens=500,
+                    cached_tokens=800,
+                    cached_tokens_details=TokenInputTokenDetails(
+                        text_tokens=600, audio_tokens=200
+                    ),
+                ),
+                output_token_details=TokenOutputTokenDetails(
+                    text_tokens=100, audio_tokens=200
+                ),
+            ),
+        ),
+    )
+
+
+def _per_read_us(read) -> float:
+    started_at = time.perf_counter()
+    for _ in range(READS):
+        read()
+    return (time.perf_counter() - started_at) / READS * 1_000_000
+
+
+async def main() -> None:
+    event_bus = EventBus()
+    tracker = TokenTracker(
+        event_bus=event_bus,
+        realtime_model="gpt-realtime-2.1",
+        transcription_model="whisper-1",
+    )
+    for index in range(RESPONSES):
+        await event_bus.dispatch(_response(index))
+
+    report = _per_read_us(tracker.report)
+    running = _per_read_us(lambda: tracker.cost)
+
+    print(f"{'usage_report()':>16} {'cost':>10}")
+    print(f"{report:>14.2f}us {running:>8.3f}us")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
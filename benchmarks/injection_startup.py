@@ -0,0 +1,87 @@
+"""
+Startup cost of seeding a session with an injected conversation, by history
+size. Compares one awaited send per message with the batched burst, and the
+burst with older messages folded into a single summary item.
+
+No network is involved: the websocket writes into a stub connection, so the
+numbers are the client-side serialization and write overhead only.
+
+Running
+-------
+::
+
+    python benchmarks/injection_startup.py
+"""
+
+import asyncio
+import time
+
+from rtvoice.agent.views import (
+    InjectedAssistantMessage,
+    InjectedConversation,
+    InjectedUserMessage,
+    RealtimeModel,
+)
+from rtvoice.realtime.providers import OpenAIProvider
+from rtvoice.realtime.session import _injected_conversation_events
+from rtvoice.realtime.websocket import RealtimeWebSocket
+
+HISTORY_SIZES = (10, 50, 200, 1000)
+REPEATS = 20
+KEEP_RECENT = 20
+
+
+class _StubConnection:
+    async def send(self, payload: str) -> None:
+        await asyncio.sleep(0)
+
+
+def _connected_socket() -> RealtimeWebSocket:
+    socket = RealtimeWebSocket(
+        model=RealtimeModel.GPT_REALTIME_2_1_MINI,
+        provider=OpenAIProvider(api_key="benchmark"),
+    )
+    socket._ws = _StubConnection()
+    socket._is_connected = True
+    return socket
+
+
+def _conversation(size: int, max_messages: int | None) -> InjectedConversation:
+    messages = [
+        InjectedUserMessage(text=f"User message number {i} with some content.")
+        if i % 2 == 0
+        else InjectedAssistantMessage(text=f"Assistant reply number {i}.")
+        for i in range(size)
+    ]
+    return InjectedConversation(messages=messages, max_messages=max_messages)
+
+
+async def _sequential(conversation: InjectedConversation) -> None:
+    socket = _connected_socket()
+    for event in _injected_conversation_events(conversation):
+        await socket.send(event)
+
+
+async def _batched(conversation: InjectedConversation) -> None:
+    socket = _connected_socket()
+    await socket.send_many(_injected_conversation_events(conversation))
+
+
+async def _measure(run, conversation: InjectedConversation) -> float:
+    started_at = time.perf_counter()
+    for _ in range(REPEATS):
+        await run(conversation)
+    return (time.perf_counter() - started_at) / REPEATS * 1000
+
+
+async def main() -> None:
+    print(f"{'messages':>8} {'sequential':>12} {'batched':>12} {'folded':>12}")
+    for size in HISTORY_SIZES:
+        sequential = await _measure(_sequential, _conversation(size, None))
+        batched = await _measure(_batched, _conversation(size, None))
+        folded = await _measure(_batched, _conversation(size, KEEP_RECENT))
+        print(f"{size:>8} {sequential:>10.2f}ms {batched:>10.2f}ms {folded:>10.2f}ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,62 @@
+"""
+Startup cost of discovering a skill library, by library size. Compares eager
+discovery, which parses every SKILL.md in full, with lazy discovery reading
+only the frontmatter, and lazy discovery on a warm cache that opens no skill
+file at all.
+
+The skills are generated into a temporary directory, each with a long body so
+the cost of parsing it shows.
+
+Running
+-------
+::
+
+    python benchmarks/skill_discovery.py
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+from rtvoice.skills import Skills
+
+LIBRARY_SIZES = (10, 100, 500)
+REPEATS = 5
+BODY = "\n".join(f"- Step {i}: do the thing carefully." for i in range(400))
+
+
+def _library(root: Path, size: int) -> Path:
+    skills = root / f"skills-{size}"
+    for i in range(size):
+        directory = skills / f"skill-{i}"
+        directory.mkdir(parents=True)
+        (directory / "SKILL.md").write_text(
+            f"---\nname: skill-{i}\ndescription: Skill number {i}.\n---\n{BODY}\n",
+            encoding="utf-8",
+        )
+    return skills
+
+
+def _measure(skills: Path, **kwargs) -> float:
+    started_at = time.perf_counter()
+    for _ in range(REPEATS):
+        Skills.from_local_dir(skills, **kwargs)
+    return (time.perf_counter() - started_at) / REPEATS * 1000
+
+
+def main() -> None:
+    print(f"{'skills':>8} {'eager':>12} {'lazy':>12} {'cached':>12}")
+    with tempfile.TemporaryDirectory() as temporary:
+        root = Path(temporary)
+        for size in LIBRARY_SIZES:
+            skills = _library(root, size)
+            cache = root / f"cache-{size}.json"
+            eager = _measure(skills)
+            lazy = _measure(skills, lazy=True)
+            Skills.from_local_dir(skills, lazy=True, cache_path=cache)
+            cached = _measure(skills, lazy=True, cache_path=cache)
+            print(f"{size:>8} {eager:>10.2f}ms {lazy:>10.2f}ms {cached:>10.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Per-call latency of a `.py` skill script, run as a fresh subprocess and in a
+warm `PythonWorkerPool`. The script imports a few standard-library modules,
+the kind of setup a worker only pays once.
+
+Running
+-------
+::
+
+    python benchmarks/skill_scripts.py
+"""
+
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from rtvoice.skills import PythonWorkerPool
+from rtvoice.skills.scripts import run_script
+
+CALLS = 20
+SCRIPT = "import json, csv, decimal, email.parser\nprint(json.dumps({'ok': True}))\n"
+
+
+async def _measure(run) -> float:
+    started_at = time.perf_counter()
+    for _ in range(CALLS):
+        await run()
+    return (time.perf_counter() - started_at) / CALLS * 1000
+
+
+async def main() -> None:
+    with tempfile.TemporaryDirectory() as temporary:
+        cwd = Path(temporary)
+        script = cwd / "script.py"
+        script.write_text(SCRIPT, encoding="utf-8")
+
+        subprocess = await _measure(lambda: run_script(script, cwd=cwd))
+        pool = PythonWorkerPool(size=1)
+        try:
+            await pool.run(script, cwd=cwd)
+            pooled = await _measure(lambda: pool.run(script, cwd=cwd))
+        finally:
+            await pool.close()
+
+    print(f"{'subprocess':>12} {'worker pool':>12}")
+    print(f"{subprocess:>10.2f}ms {pooled:>10.2f}ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,93 @@
+"""
+Per-call overhead of the tool pipeline, without the work the tool itself does.
+Measures argument resolution alone (the part the invocation plan replaces) and
+a full ``Tools.execute`` through the middleware chain, for a plain tool, a
+params-model tool and a tool with injected dependencies.
+
+Running
+-------
+::
+
+    python benchmarks/tool_call_overhead.py
+"""
+
+import asyncio
+import logging
+import time
+
+from pydantic import BaseModel
+from transitbus import EventBus
+
+from rtvoice.conversation import ConversationHistory
+from rtvoice.tools import Inject, ToolContext, Tools
+from rtvoice.tools.argument_resolver import resolve_arguments
+
+CALLS = 20_000
+
+
+class SearchParams(BaseModel):
+    query: str
+    limit: int = 5
+
+
+def _build_tools() -> Tools:
+    tools = Tools()
+
+    @tools.action("Plain tool.")
+    def plain(query: str, limit: int = 5) -> str:
+        return query
+
+    @tools.action("Params model tool.", params=SearchParams)
+    async def with_params(params: SearchParams) -> str:
+        return params.query
+
+    @tools.action("Injected tool.")
+    async def injected(
+        query: str,
+        event_bus: Inject[EventBus],
+        history: Inject[ConversationHistory],
+    ) -> str:
+        return query
+
+    event_bus = EventBus()
+    tools.set_context(ToolContext(event_bus, ConversationHistory(event_bus)))
+    return tools
+
+
+def _time_resolution(tools: Tools, name: str, args: dict) -> float:
+    tool = tools.get(name)
+    params = tool.param_model(**args) if tool.param_model else None
+    context = tools._context
+    started = time.perf_counter()
+    for _ in range(CALLS):
+        resolve_arguments(tool, args, params, context)
+    return (time.perf_counter() - started) / CALLS * 1e6
+
+
+async def _time_execute(tools: Tools, name: str, args: dict) -> float:
+    started = time.perf_counter()
+    for _ in range(CALLS):
+        await tools.execute(name, args)
+    return (time.perf_counter() - started) / CALLS * 1e6
+
+
+async def main() -> None:
+    # the call logging middleware would dominate otherwise
+    logging.disable(logging.INFO)
+
+    tools = _build_tools()
+    cases = (
+        ("plain", {"query": "weather", "limit": 3}),
+        ("with_params", {"query": "weather"}),
+        ("injected", {"query": "weather"}),
+    )
+
+    print(f"{'tool':<12} {'resolve µs/call':>16} {'execute µs/call':>16}")
+    for name, args in cases:
+        resolve = _time_resolution(tools, name, args)
+        execute = await _time_execute(tools, name, args)
+        print(f"{name:<12} {resolve:>16.2f} {execute:>16.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,4 +1,12 @@
-from .agent import AgentListener, RealtimeAgent, TextAgent
+from .agent import (
+    AgentHost,
+    AgentListener,
+    AgentSupervisor,
+    RealtimeAgent,
+    SessionHandler,
+    SessionRequest,
+    TextAgent,
+)
 from .agent.views import (
     AssistantVoice,
     InjectedAssistantMessage,
@@ -15,10 +23,22 @@ from .agent.views import (
     TurnDetection,
 )
 from .audio import EchoCancellation, EchoCanceller
+from .context import (
+    AutomaticCompaction,
+    ContextEngine,
+    LLMCompactor,
+    TokenBudgetPolicy,
+)
+from .conversation import (
+    ConversationStore,
+    JSONLConversationStore,
+    SQLiteConversationStore,
+)
 from .realtime import (
     AzureOpenAIProvider,
     OpenAIProvider,
     RealtimeProvider,
+    ReconnectPolicy,
 )
 from .skills import Skill, Skills
 from .tokens import (
@@ -28,24 +48,44 @@ from .tokens import (
     PricingCatalog,
     TokenTotals,
     TokenTracker,
+    UsageAggregator,
     UsageReport,
 )
-from .tools import ActionKind, Inject, ToolContext, Tools
+from .tools import (
+    ActionKind,
+    CachePolicy,
+    ExecutionPolicy,
+    Inject,
+    ResiliencePolicy,
+    ToolContext,
+    ToolProgress,
+    ToolRetrieval,
+    Tools,
+)
 
 __all__ = [
     "ActionKind",
+    "AgentHost",
     "AgentListener",
+    "AgentSupervisor",
     "AssistantVoice",
+    "AutomaticCompaction",
     "AzureOpenAIProvider",
+    "CachePolicy",
+    "ContextEngine",
+    "ConversationStore",
     "CostEstimate",
     "CostLineItem",
     "Currency",
     "EchoCancellation",
     "EchoCanceller",
+    "ExecutionPolicy",
     "Inject",
     "InjectedAssistantMessage",
     "InjectedConversation",
     "InjectedUserMessage",
+    "JSONLConversationStore",
+    "LLMCompactor",
     "NoiseReduction",
     "OpenAIProvider",
     "OutputModality",
@@ -54,17 +94,26 @@ __all__ = [
     "RealtimeModel",
     "RealtimeProvider",
     "ReasoningEffort",
+    "ReconnectPolicy",
+    "ResiliencePolicy",
+    "SQLiteConversationStore",
     "SemanticEagerness",
     "SemanticVAD",
     "ServerVAD",
+    "SessionHandler",
+    "SessionRequest",
     "Skill",
     "Skills",
     "TextAgent",
+    "TokenBudgetPolicy",
     "TokenTotals",
     "TokenTracker",
     "ToolContext",
+    "ToolProgress",
+    "ToolRetrieval",
     "Tools",
     "TranscriptionModel",
     "TurnDetection",
+    "UsageAggregator",
     "UsageReport",
 ]
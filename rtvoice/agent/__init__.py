@@ -1,5 +1,27 @@
+from .host import AgentHost, AgentUsage, HostStats
 from .listener import AgentListener
 from .realtime_agent import RealtimeAgent
+from .supervisor import (
+    AgentSupervisor,
+    SessionFailedError,
+    SessionHandler,
+    SessionRequest,
+    SupervisorStats,
+    WorkerStats,
+)
 from .text_agent import TextAgent
 
-__all__ = ["AgentListener", "RealtimeAgent", "TextAgent"]
+__all__ = [
+    "AgentHost",
+    "AgentListener",
+    "AgentSupervisor",
+    "AgentUsage",
+    "HostStats",
+    "RealtimeAgent",
+    "SessionFailedError",
+    "SessionHandler",
+    "SessionRequest",
+    "SupervisorStats",
+    "TextAgent",
+    "WorkerStats",
+]
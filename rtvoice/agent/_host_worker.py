@@ -0,0 +1,179 @@
+"""Worker process of `AgentSupervisor`, started as
+``python -m rtvoice.agent._host_worker <handler> <heartbeat seconds>``.
+
+Requests and replies are JSON lines on the original stdin and stdout. Both
+descriptors are moved away before the handler is imported, and stdout is
+pointed at stderr, so output from sessions cannot corrupt the protocol.
+"""
+
+import asyncio
+import contextlib
+import importlib
+import io
+import json
+import logging
+import os
+import sys
+import threading
+from dataclasses import asdict
+from typing import Any
+
+from rtvoice.agent.host import AgentHost
+from rtvoice.agent.supervisor import SessionHandler, SessionRequest
+
+logger = logging.getLogger(__name__)
+
+# how long sessions get to return after their agents were stopped
+_STOP_GRACE_SECONDS = 5.0
+
+
+def _detach_protocol() -> tuple[io.TextIOWrapper, io.TextIOWrapper]:
+    requests = os.fdopen(os.dup(0), "r", encoding="utf-8")
+    replies = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    devnull = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(devnull, 0)
+    os.close(devnull)
+    os.dup2(2, 1)
+    return requests, replies
+
+
+def load_handler(path: str) -> SessionHandler:
+    module_name, _, attribute = path.partition(":")
+    target: Any = importlib.import_module(module_name)
+    for name in attribute.split("."):
+        target = getattr(target, name)
+    handler = target()
+    if not isinstance(handler, SessionHandler):
+        raise TypeError(f"'{path}' is not a SessionHandler")
+    return handler
+
+
+class _Worker:
+    def __init__(
+        self,
+        handler: SessionHandler,
+        host: AgentHost,
+        replies: io.TextIOWrapper,
+        heartbeat_interval_seconds: float,
+    ) -> None:
+        self._handler = handler
+        self._host = host
+        self._replies = replies
+        self._heartbeat_interval_seconds = heartbeat_interval_seconds
+        self._sessions: dict[str, asyncio.Task] = {}
+        self._draining = False
+
+    async def serve(self, requests: asyncio.Queue) -> None:
+        self._reply({"op": "ready"})
+        heartbeat = asyncio.create_task(self._heartbeat())
+        try:
+            while (request := await requests.get()) is not None:
+                match request["op"]:
+                    case "start":
+                        self._start(request["session_id"], request["payload"])
+                    case "stop":
+                        if task := self._sessions.get(request["session_id"]):
+                            task.cancel()
+                    case "drain":
+                        await self._drain(request["timeout"])
+                        return
+            # the supervisor is gone; nobody is waiting for a graceful drain
+            await self._drain(0)
+        finally:
+            heartbeat.cancel()
+
+    def _start(self, session_id: str, payload: dict[str, Any]) -> None:
+        if self._draining:
+            self._reply(
+                {"op": "ended", "session_id": session_id, "error": "worker is draining"}
+            )
+            return
+        request = SessionRequest(session_id=session_id, payload=payload)
+        self._sessions[session_id] = asyncio.create_task(self._run(request))
+
+    async def _run(self, request: SessionRequest) -> None:
+        error = None
+        try:
+            await self._handler.run_session(self._host, request)
+        except asyncio.CancelledError:
+            error = "session was cancelled"
+        except Exception as exc:
+            logger.exception("Session %s failed", request.session_id)
+            error = f"{type(exc).__name__}: {exc}"
+        finally:
+            del self._sessions[request.session_id]
+        self._reply({"op": "ended", "session_id": request.session_id, "error": error})
+
+    async def _drain(self, timeout: float) -> None:
+        self._draining = True
+        if self._sessions and timeout > 0:
+            logger.info("Draining %d sessions", len(self._sessions))
+            await asyncio.wait(list(self._sessions.values()), timeout=timeout)
+        # stopping the agents ends the sessions still running
+        await self._host.close()
+        if self._sessions:
+            _, pending = await asyncio.wait(
+                list(self._sessions.values()), timeout=_STOP_GRACE_SECONDS
+            )
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        self._reply({"op": "drained"})
+
+    async def _heartbeat(self) -> None:
+        while True:
+            host_stats = asdict(self._host.stats())
+            host_stats["cost"] = str(host_stats["cost"])
+            self._reply(
+                {
+                    "op": "heartbeat",
+                    "sessions": len(self._sessions),
+                    "stats": host_stats,
+                }
+            )
+            await asyncio.sleep(self._heartbeat_interval_seconds)
+
+    def _reply(self, message: dict[str, Any]) -> None:
+        self._replies.write(json.dumps(message) + "\n")
+        self._replies.flush()
+
+
+def _read_requests(
+    requests: io.TextIOWrapper, loop: asyncio.AbstractEventLoop
+) -> asyncio.Queue:
+    queue: asyncio.Queue = asyncio.Queue()
+
+    def put(request: dict[str, Any] | None) -> None:
+        # the loop is gone once the worker returned
+        with contextlib.suppress(RuntimeError):
+            loop.call_soon_threadsafe(queue.put_nowait, request)
+
+    def read() -> None:
+        for line in requests:
+            put(json.loads(line))
+        put(None)
+
+    threading.Thread(target=read, name="rtvoice-host-requests", daemon=True).start()
+    return queue
+
+
+async def _serve(
+    handler_path: str,
+    heartbeat_interval_seconds: float,
+    requests: io.TextIOWrapper,
+    replies: io.TextIOWrapper,
+) -> None:
+    handler = load_handler(handler_path)
+    host = handler.create_host()
+    worker = _Worker(handler, host, replies, heartbeat_interval_seconds)
+    await worker.serve(_read_requests(requests, asyncio.get_running_loop()))
+
+
+def main() -> None:
+    handler_path, heartbeat_interval_seconds = sys.argv[1], float(sys.argv[2])
+    requests, replies = _detach_protocol()
+    asyncio.run(_serve(handler_path, heartbeat_interval_seconds, requests, replies))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+import asyncio
+import logging
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from decimal import Decimal
+from typing import Any
+
+from transitbus import EventBus
+
+from rtvoice.agent.realtime_agent import RealtimeAgent
+from rtvoice.agent.views import AgentResult
+from rtvoice.events.views import (
+    CostUpdatedEvent,
+    ToolExecutedEvent,
+    ToolExecutionCompletedEvent,
+    ToolExecutionStartedEvent,
+)
+from rtvoice.realtime import OpenAIProvider, RealtimeProvider
+from rtvoice.shared.loop_lag import LoopLagMonitor
+from rtvoice.skills import Skills
+from rtvoice.tokens import PricingCatalog, UsageAggregator
+from rtvoice.tools import Tools
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class AgentUsage:
+    """What one hosted agent has used so far."""
+
+    agent_id: str
+    tenant: str
+    # None until the agent runs
+    started_at: datetime | None
+    cost: Decimal
+    responses: int
+    tool_calls: int
+    # wall time with at least one tool call of a response in flight
+    tool_seconds: float
+
+
+@dataclass(frozen=True, slots=True)
+class HostStats:
+    agents: int
+    running_agents: int
+    finished_agents: int
+    # finished agents included
+    cost: Decimal
+    loop_lag_seconds: float
+    max_loop_lag_seconds: float
+
+
+class _AgentAccount:
+    def __init__(self, agent_id: str, tenant: str, event_bus: EventBus) -> None:
+        self.agent_id = agent_id
+        self.tenant = tenant
+        self.started_at: datetime | None = None
+        self.cost = Decimal(0)
+        self.responses = 0
+        self.tool_calls = 0
+        self.tool_seconds = 0.0
+        self._tools_started_at: dict[str, float] = {}
+
+        event_bus.on(CostUpdatedEvent, self._on_cost_updated)
+        event_bus.on(ToolExecutedEvent, self._on_tool_executed)
+        event_bus.on(ToolExecutionStartedEvent, self._on_tools_started)
+        event_bus.on(ToolExecutionCompletedEvent, self._on_tools_completed)
+
+    def usage(self) -> AgentUsage:
+        return AgentUsage(
+            agent_id=self.agent_id,
+            tenant=self.tenant,
+            started_at=self.started_at,
+            cost=self.cost,
+            responses=self.responses,
+            tool_calls=self.tool_calls,
+            tool_seconds=self.tool_seconds,
+        )
+
+    async def _on_cost_updated(self, event: CostUpdatedEvent) -> None:
+        self.cost = event.total
+        if event.response_id is not None:
+            self.responses += 1
+
+    async def _on_tool_executed(self, _: ToolExecutedEvent) -> None:
+        self.tool_calls += 1
+
+    async def _on_tools_started(self, event: ToolExecutionStartedEvent) -> None:
+        self._tools_started_at[event.response_id] = time.perf_counter()
+
+    async def _on_tools_completed(self, event: ToolExecutionCompletedEvent) -> None:
+        started_at = self._tools_started_at.pop(event.response_id, None)
+        if started_at is not None:
+            self.tool_seconds += time.perf_counter() - started_at
+
+
+class AgentHost:
+    """Runs many RealtimeAgents on one event loop, e.g. one per phone call.
+    What does not change between agents is built once and shared: the tool
+    registry with its compiled tools and schemas, the skills and their
+    index, the pricing tables and the provider. Tool functions run on the
+    registry's executors, which are process-wide unless the Tools was given
+    its own. Each agent keeps its own event bus, session, tool context and
+    middleware state.
+
+    Usage per agent and the loop's lag are available while agents run, so a
+    gateway can see what each call costs and when the process is full."""
+
+    def __init__(
+        self,
+        *,
+        tools: Tools | None = None,
+        skills: Skills | None = None,
+        provider: RealtimeProvider | None = None,
+        api_key: str | None = None,
+        pricing_catalog: PricingCatalog | None = None,
+        usage_aggregator: UsageAggregator | None = None,
+        lag_interval_seconds: float = 0.1,
+    ) -> None:
+        if api_key and provider:
+            raise ValueError("Pass either `provider` or `api_key`, not both.")
+        # a snapshot, so registering on the caller's Tools later does not
+        # change the tools of agents already running
+        self._tools = tools.fork() if tools else Tools()
+        self._skills = skills
+        self._provider = provider or OpenAIProvider(api_key=api_key)
+        self._pricing_catalog = pricing_catalog or PricingCatalog()
+        self._usage_aggregator = usage_aggregator
+        self._loop_lag = LoopLagMonitor(lag_interval_seconds)
+
+        self._agents: dict[str, RealtimeAgent] = {}
+        self._accounts: dict[RealtimeAgent, _AgentAccount] = {}
+        self._running = 0
+        self._finished = 0
+        self._finished_cost = Decimal(0)
+
+    def create_agent(
+        self,
+        *,
+        system_prompt: str,
+        agent_id: str | None = None,
+        tenant: str = "default",
+        **options: Any,
+    ) -> RealtimeAgent:
+        """Creates an agent on the host's shared pieces. `options` are passed
+        to RealtimeAgent; tools, skills, provider, pricing and usage
+        aggregation come from the host."""
+        agent_id = agent_id or uuid.uuid4().hex
+        if agent_id in self._agents:
+            raise ValueError(f"Agent '{agent_id}' already exists")
+
+        agent = RealtimeAgent(
+            system_prompt=system_prompt,
+            tools=self._tools,
+            skills=self._skills,
+            provider=self._provider,
+            pricing_catalog=self._pricing_catalog,
+            usage_aggregator=self._usage_aggregator,
+            tenant=tenant,
+            **options,
+        )
+        self._agents[agent_id] = agent
+        self._accounts[agent] = _AgentAccount(agent_id, tenant, agent._event_bus)
+        return agent
+
+    async def run(self, agent: RealtimeAgent) -> AgentResult:
+        """Runs a hosted agent until it stops, then forgets it."""
+        account = self._accounts.get(agent)
+        if account is None:
+            raise ValueError("Agent was not created by this host")
+        if account.started_at is not None:
+            raise ValueError(f"Agent '{account.agent_id}' is already running")
+
+        self._loop_lag.start()
+        account.started_at = datetime.now(UTC)
+        self._running += 1
+        try:
+            return await agent.start()
+        finally:
+            self._running -= 1
+            self._finished += 1
+            self._finished_cost += account.cost
+            self._forget(account)
+
+    def get(self, agent_id: str) -> RealtimeAgent | None:
+        return self._agents.get(agent_id)
+
+    def usage(self, tenant: str | None = None) -> list[AgentUsage]:
+        """Usage of every agent not yet finished, optionally of one tenant."""
+        return [
+            account.usage()
+            for account in self._accounts.values()
+            if tenant is None or account.tenant == tenant
+        ]
+
+    def stats(self) -> HostStats:
+        return HostStats(
+            agents=len(self._agents),
+            running_agents=self._running,
+            finished_agents=self._finished,
+            cost=self._finished_cost
+            + sum((account.cost for account in self._accounts.values()), Decimal(0)),
+            loop_lag_seconds=self._loop_lag.latest_seconds,
+            max_loop_lag_seconds=self._loop_lag.max_seconds,
+        )
+
+    async def close(self) -> None:
+        """Stops every hosted agent and the lag monitor."""
+        agents = list(self._accounts)
+        if agents:
+            logger.info("Stopping %d hosted agents", len(agents))
+            await asyncio.gather(*(agent.stop() for agent in agents))
+        for agent in agents:
+            account = self._accounts.get(agent)
+            # running agents are forgotten when their run returns
+            if account is not None and account.started_at is None:
+                self._forget(account)
+        await self._loop_lag.close()
+
+    def _forget(self, account: _AgentAccount) -> None:
+        agent = self._agents.pop(account.agent_id)
+        del self._accounts[agent]
@@ -17,6 +17,7 @@ from rtvoice.events.views import (
     AssistantTranscriptCompletedEvent,
     AssistantTranscriptDeltaEvent,
     ToolExecutedEvent,
+    ToolProgressEvent,
     UserInactivityCountdownEvent,
     UserStartedSpeakingEvent,
     UserStoppedSpeakingEvent,
@@ -85,6 +86,9 @@ class AgentListener:
     ) -> None:
         """Runs after the tool's effective response behavior is known."""
 
+    async def on_tool_progress(self, name: str, message: str) -> None:
+        """A running tool reported progress, or its `status` was formatted."""
+
 
 class AgentListenerBridge:
     def __init__(
@@ -147,6 +151,7 @@ class AgentListenerBridge:
             self._on_user_inactivity_countdown,
         )
         self._event_bus.on(ToolExecutedEvent, self._on_tool_executed)
+        self._event_bus.on(ToolProgressEvent, self._on_tool_progress)
 
     async def _on_user_transcript_completed(
         self, event: UserTranscriptCompletedEvent
@@ -206,6 +211,9 @@ class AgentListenerBridge:
             event.silent,
         )
 
+    async def _on_tool_progress(self, event: ToolProgressEvent) -> None:
+        await self._listener.on_tool_progress(event.name, event.message)
+
     def _warn_countdown_mismatch_if_necessary(self) -> None:
         overrides_countdown = self._listener_overrides_countdown()
         listener_name = type(self._listener).__name__
@@ -1,6 +1,8 @@
 import asyncio
 import logging
+import uuid
 from collections.abc import Sequence
+from decimal import Decimal
 from pathlib import Path
 from typing import assert_never
 
@@ -30,12 +32,16 @@ from rtvoice.audio import (
     AudioSession,
     EchoCancellation,
 )
+from rtvoice.context import ContextEngine
 from rtvoice.conversation import (
     AssistantTurn,
     ConversationHistory,
+    ConversationStore,
     ConversationTurn,
+    ConversationWriter,
     UserTurn,
 )
+from rtvoice.conversation.store import estimate_tokens
 from rtvoice.events.views import (
     AgentStartingEvent,
     AgentStoppedEvent,
@@ -49,12 +55,13 @@ from rtvoice.realtime import (
     RealtimeProvider,
     RealtimeSession,
     RealtimeSessionSettings,
+    ReconnectPolicy,
 )
 from rtvoice.shared.decorators import timed
 from rtvoice.shared.speech_speed import SpeechSpeed
 from rtvoice.skills import Skills
-from rtvoice.tokens import PricingCatalog
-from rtvoice.tools import ToolContext, Tools
+from rtvoice.tokens import PricingCatalog, UsageAggregator
+from rtvoice.tools import ToolContext, ToolRetrieval, ToolRetriever, Tools
 
 logger = logging.getLogger(__name__)
 
@@ -83,14 +90,38 @@ class RealtimeAgent:
         injected_conversation: InjectedConversation | None = None,
         inactivity_timeout_seconds: float | None = None,
         recording_path: str | Path | None = None,
+        history_spill_path: str | Path | None = None,
+        conversation_store: ConversationStore | None = None,
+        conversation_id: str | None = None,
+        resume_from: str | None = None,
+        resume_token_budget: int = 4_000,
         provider: RealtimeProvider | None = None,
         api_key: str | None = None,
         pricing_catalog: PricingCatalog | None = None,
+        reconnect: ReconnectPolicy | None = None,
+        context_engine: ContextEngine | None = None,
+        cache_stable_prefix: bool = False,
+        early_tool_dispatch: bool = False,
+        speak_tool_progress: bool = False,
+        tool_retrieval: ToolRetrieval | None = None,
+        cost_budget: Decimal | float | None = None,
+        usage_aggregator: UsageAggregator | None = None,
+        tenant: str = "default",
     ):
         self._text_agent = text_agent
 
         if api_key and provider:
             raise ValueError("Pass either `provider` or `api_key`, not both.")
+        if cost_budget is not None and cost_budget <= 0:
+            raise ValueError("`cost_budget` must be positive.")
+        if resume_from is not None and conversation_store is None:
+            raise ValueError("`resume_from` needs a `conversation_store`.")
+        if tool_retrieval is not None and transcription_model is None:
+            raise ValueError("`tool_retrieval` needs a `transcription_model`.")
+        if resume_from is not None and injected_conversation is not None:
+            raise ValueError(
+                "Pass either `injected_conversation` or `resume_from`, not both."
+            )
 
         self._listener = listener
         recording_path_obj = Path(recording_path) if recording_path else None
@@ -100,20 +131,43 @@ class RealtimeAgent:
         self._stop_requested = False
 
         self._event_bus = EventBus()
-        self._conversation_history = ConversationHistory(self._event_bus)
+        self._conversation_history = ConversationHistory(
+            self._event_bus,
+            spill_path=Path(history_spill_path) if history_spill_path else None,
+        )
         if injected_conversation:
             self._conversation_history.seed(
                 _injected_turn(message) for message in injected_conversation.messages
             )
 
+        # the store is read and written from a worker thread once the agent
+        # starts, so creating an agent does no I/O
+        self._conversation_store = conversation_store
+        self._resume_from = resume_from
+        self._resume_token_budget = resume_token_budget
+        self._conversation_id: str | None = None
+        if conversation_store is not None:
+            self._conversation_id = conversation_id or resume_from or uuid.uuid4().hex
+
         self._skills = skills
-        self._tools = Tools()
-        if tools:
-            self._tools.merge(tools)
+        self._tools = tools.fork() if tools else Tools()
 
+        tool_retriever = (
+            ToolRetriever(self._tools, self._skills, tool_retrieval)
+            if tool_retrieval is not None
+            else None
+        )
+        # retrieved skills are listed in load_skill's description instead
+        prompt_skills = (
+            self._skills.summaries()
+            if self._skills is not None
+            and (tool_retrieval is None or not tool_retrieval.retrieves_skills)
+            else ()
+        )
         self._system_prompt = SystemPrompt(
             system_prompt,
-            skills=self._skills if self._skills is not None else (),
+            skills=prompt_skills,
+            canonical=cache_stable_prefix,
         )
 
         tool_context = ToolContext(
@@ -121,9 +175,11 @@ class RealtimeAgent:
             self._conversation_history,
             self._skills,
             self._text_agent,
+            tool_retriever,
             *tool_dependencies,
         )
         self._tools.set_context(tool_context)
+        self._tool_context = tool_context
 
         input_device = audio_input or self._create_default_input()
         output_device = audio_output or self._create_default_output()
@@ -149,6 +205,9 @@ class RealtimeAgent:
             output_modalities=tuple(output_modalities or ["audio"]),
             noise_reduction=noise_reduction,
             turn_detection=turn_detection or SemanticVAD(),
+            # a spoken turn is answered once its tools are selected
+            auto_response=tool_retrieval is None,
+            cache_stable_prefix=cache_stable_prefix,
         )
 
         self._realtime_session = RealtimeSession(
@@ -161,6 +220,17 @@ class RealtimeAgent:
             inactivity_timeout_seconds=inactivity_timeout_seconds,
             recording_path=recording_path_obj,
             pricing_catalog=pricing_catalog,
+            conversation_history=self._conversation_history,
+            reconnect_policy=reconnect,
+            context_engine=context_engine,
+            early_tool_dispatch=early_tool_dispatch,
+            speak_tool_progress=speak_tool_progress,
+            tool_retriever=tool_retriever,
+            cost_budget=(
+                Decimal(str(cost_budget)) if cost_budget is not None else None
+            ),
+            usage_aggregator=usage_aggregator,
+            tenant=tenant,
         )
 
         self._setup_shutdown_handlers()
@@ -224,6 +294,7 @@ class RealtimeAgent:
         await self._event_bus.dispatch(AgentStartingEvent())
 
         try:
+            await self._restore_conversation()
             await self._realtime_session.start()
             logger.info("Agent started successfully")
 
@@ -235,8 +306,58 @@ class RealtimeAgent:
             turns=self._conversation_history.turns,
             recording_path=self._realtime_session.recording_path,
             usage=self._realtime_session.usage_report,
+            conversation_id=self._conversation_id,
+        )
+
+    async def _restore_conversation(self) -> None:
+        store = self._conversation_store
+        if store is None or self._conversation_id is None:
+            return
+
+        if self._resume_from is not None:
+            resumed_turns = await asyncio.to_thread(store.load, self._resume_from)
+            self._conversation_history.seed(resumed_turns)
+            injected_conversation = _resumed_conversation(
+                resumed_turns, self._resume_token_budget
+            )
+            self._realtime_session.inject_conversation(injected_conversation)
+            logger.info(
+                "Resuming conversation %s [turns=%d, injected=%d, folded=%d]",
+                self._resume_from,
+                len(resumed_turns),
+                len(injected_conversation.recent_messages),
+                len(injected_conversation.folded_messages),
+            )
+
+        # seeded turns are stored already unless they move to a new id
+        turns = list(enumerate(self._conversation_history.snapshot()))
+        if turns and self._conversation_id != self._resume_from:
+            await asyncio.to_thread(store.save, self._conversation_id, turns)
+        self._conversation_writer = ConversationWriter(
+            self._event_bus,
+            self._conversation_history,
+            store,
+            self._conversation_id,
         )
 
+    @property
+    def cost(self) -> Decimal:
+        """Running cost estimate in USD, updated after every response. The
+        itemised estimate is in `AgentResult.usage`."""
+        return self._realtime_session.cost
+
+    @property
+    def tool_context(self) -> ToolContext:
+        """The dependencies tools resolve against. Providing or removing one
+        mid-session re-evaluates `available_when` and updates the model's
+        tools."""
+        return self._tool_context
+
+    def refresh_tools(self) -> None:
+        """Re-evaluates tool availability and descriptions after a dependency
+        was changed in place."""
+        self._tools.invalidate_schema()
+
     async def set_speech_speed(self, speed: float) -> None:
         await self._event_bus.dispatch(UpdateSpeechSpeedCommand(speed=speed))
 
@@ -277,3 +398,42 @@ def _injected_turn(message: InjectedMessage) -> ConversationTurn:
             return AssistantTurn(transcript=text)
         case _:
             assert_never(message)
+
+
+def _resumed_conversation(
+    turns: Sequence[ConversationTurn], max_tokens: int
+) -> InjectedConversation:
+    """The newest spoken turns as items; older ones are folded into the
+    summary item, which gets a quarter of `max_tokens`. Tool results are not
+    restored as items."""
+    messages = [
+        message for message in map(_resumed_message, turns) if message is not None
+    ]
+    folded_budget = max(1, max_tokens // 4)
+    recent_budget = max_tokens - folded_budget
+    start = len(messages)
+    used = 0
+    while (
+        start > 0 and used + estimate_tokens(messages[start - 1].text) <= recent_budget
+    ):
+        start -= 1
+        used += estimate_tokens(messages[start].text)
+
+    return InjectedConversation(
+        messages=messages,
+        summary="This call continues an earlier conversation." if start else None,
+        max_messages=len(messages) - start,
+        folded_token_budget=folded_budget,
+    )
+
+
+def _resumed_message(turn: ConversationTurn) -> InjectedMessage | None:
+    match turn:
+        case UserTurn(transcript=transcript):
+            return InjectedUserMessage(text=transcript)
+        case AssistantTurn():
+            # restore only what the user heard
+            heard = turn.heard_transcript
+            return InjectedAssistantMessage(text=heard) if heard else None
+        case _:
+            return None
@@ -0,0 +1,444 @@
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import sys
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any
+
+from rtvoice.agent.host import AgentHost, HostStats
+
+logger = logging.getLogger(__name__)
+
+# heartbeats carry a worker's stats; far below this in practice
+_REPLY_LIMIT_BYTES = 1024 * 1024
+# how long a draining worker gets beyond its drain timeout to stop agents
+_EXIT_GRACE_SECONDS = 10.0
+# upper bound for the back-off between failed attempts to restart a worker
+_MAX_RESPAWN_DELAY_SECONDS = 30.0
+
+
+class SessionFailedError(Exception):
+    """A session ended with an error in its worker, or with its worker."""
+
+
+@dataclass(frozen=True, slots=True)
+class SessionRequest:
+    session_id: str
+    # as passed to `AgentSupervisor.run_session`, after a JSON round trip
+    payload: dict[str, Any] = field(default_factory=dict)
+
+
+class SessionHandler(ABC):
+    """Runs in every worker process of an AgentSupervisor. The supervisor
+    names it by import path ("package.module:Class"), and each worker imports
+    it and calls it without arguments, so anything a worker needs - API keys,
+    tools, skills - is set up in `create_host` rather than passed in."""
+
+    @abstractmethod
+    def create_host(self) -> AgentHost:
+        """Called once per worker, before it accepts sessions."""
+
+    @abstractmethod
+    async def run_session(self, host: AgentHost, request: SessionRequest) -> None:
+        """Creates and runs the session's agent, e.g. by attaching its audio
+        to the call named in the payload. Returns when the session is over."""
+
+
+@dataclass(frozen=True, slots=True)
+class WorkerStats:
+    index: int
+    pid: int | None
+    healthy: bool
+    sessions: int
+    restarts: int
+    # from the latest heartbeat; None before the first
+    host: HostStats | None
+
+
+@dataclass(frozen=True, slots=True)
+class SupervisorStats:
+    workers: tuple[WorkerStats, ...]
+
+    @property
+    def sessions(self) -> int:
+        return sum(worker.sessions for worker in self.workers)
+
+    @property
+    def cost(self) -> Decimal:
+        """Cost reported by the current worker processes. A restarted worker
+        starts from zero."""
+        return sum(
+            (worker.host.cost for worker in self.workers if worker.host is not None),
+            Decimal(0),
+        )
+
+    @property
+    def max_loop_lag_seconds(self) -> float:
+        return max(
+            (
+                worker.host.loop_lag_seconds
+                for worker in self.workers
+                if worker.host is not None
+            ),
+            default=0.0,
+        )
+
+
+class _WorkerProcess:
+    def __init__(
+        self, index: int, process: asyncio.subprocess.Process, restarts: int
+    ) -> None:
+        self.index = index
+        self.process = process
+        self.restarts = restarts
+        self.sessions: dict[str, asyncio.Future[None]] = {}
+        self.host_stats: HostStats | None = None
+        self.started_at = time.monotonic()
+        self.last_heartbeat = self.started_at
+        self.ready = asyncio.Event()
+        self.exited = asyncio.Event()
+        self.draining = False
+        self.reader: asyncio.Task | None = None
+
+    @property
+    def accepting(self) -> bool:
+        return self.ready.is_set() and not self.exited.is_set() and not self.draining
+
+    def send(self, message: dict[str, Any]) -> None:
+        if not self.exited.is_set():
+            self.process.stdin.write((json.dumps(message) + "\n").encode())
+
+    def kill(self) -> None:
+        if self.process.returncode is None:
+            self.process.kill()
+
+    def stats(self) -> WorkerStats:
+        return WorkerStats(
+            index=self.index,
+            pid=self.process.pid,
+            healthy=self.accepting,
+            sessions=len(self.sessions),
+            restarts=self.restarts,
+            host=self.host_stats,
+        )
+
+
+class AgentSupervisor:
+    """Spreads sessions over worker processes, each running its own AgentHost
+    on its own event loop, so one gateway uses more than one core. A new
+    session goes to the healthy worker with the fewest sessions, then the
+    least loop lag.
+
+    Workers send a heartbeat with their host's stats every
+    `heartbeat_interval_seconds`. One that exits, or misses heartbeats for
+    `heartbeat_timeout_seconds` because its loop is stuck, is killed and
+    replaced; its sessions fail with SessionFailedError. `close` drains:
+    workers take no new sessions and give running ones time to end before
+    their agents are stopped."""
+
+    def __init__(
+        self,
+        handler: str,
+        *,
+        workers: int | None = None,
+        max_sessions_per_worker: int | None = None,
+        heartbeat_interval_seconds: float = 1.0,
+        heartbeat_timeout_seconds: float = 10.0,
+        startup_timeout_seconds: float = 60.0,
+    ) -> None:
+        module, _, attribute = handler.partition(":")
+        if not module or not attribute:
+            raise ValueError(
+                f"handler must be an import path like 'package.module:Class', "
+                f"got '{handler}'"
+            )
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if max_sessions_per_worker is not None and max_sessions_per_worker < 1:
+            raise ValueError("max_sessions_per_worker must be at least 1")
+        if heartbeat_interval_seconds <= 0:
+            raise ValueError("heartbeat_interval_seconds must be positive")
+        if heartbeat_timeout_seconds <= heartbeat_interval_seconds:
+            raise ValueError(
+                "heartbeat_timeout_seconds must exceed heartbeat_interval_seconds"
+            )
+        self._handler = handler
+        self._worker_count = workers
+        self._max_sessions_per_worker = max_sessions_per_worker
+        self._heartbeat_interval_seconds = heartbeat_interval_seconds
+        self._heartbeat_timeout_seconds = heartbeat_timeout_seconds
+        self._startup_timeout_seconds = startup_timeout_seconds
+
+        self._workers: list[_WorkerProcess] = []
+        self._placements: dict[str, _WorkerProcess] = {}
+        self._watchdog: asyncio.Task | None = None
+        self._running = False
+        # set by close to cut short a restart back-off
+        self._closing = asyncio.Event()
+
+    async def start(self) -> None:
+        """Starts the workers and waits until each has created its host."""
+        if self._running:
+            return
+        try:
+            self._workers = list(
+                await asyncio.gather(
+                    *(self._spawn(index) for index in range(self._worker_count))
+                )
+            )
+            await asyncio.gather(*(self._wait_ready(w) for w in self._workers))
+        except BaseException:
+            await self._kill_all()
+            raise
+        self._running = True
+        self._closing.clear()
+        self._watchdog = asyncio.create_task(self._watch())
+        logger.info("Started %d agent workers", len(self._workers))
+
+    async def run_session(
+        self, session_id: str, payload: Mapping[str, Any] | None = None
+    ) -> None:
+        """Runs a session on the least loaded worker and returns when it
+        ended. `payload` must be JSON-serializable; it reaches the handler as
+        `SessionRequest.payload`. Cancelling the call cancels the session."""
+        if not self._running:
+            raise RuntimeError("AgentSupervisor is not running")
+        if session_id in self._placements:
+            raise ValueError(f"Session '{session_id}' already exists")
+        message = {
+            "op": "start",
+            "session_id": session_id,
+            "payload": dict(payload or {}),
+        }
+        # fail on an unserializable payload before anything is placed
+        json.dumps(message)
+
+        worker = self._least_loaded()
+        if worker is None:
+            raise RuntimeError("No worker can take another session")
+        ended = asyncio.get_running_loop().create_future()
+        worker.sessions[session_id] = ended
+        self._placements[session_id] = worker
+        worker.send(message)
+        try:
+            await ended
+        except asyncio.CancelledError:
+            worker.send({"op": "stop", "session_id": session_id})
+            raise
+        finally:
+            worker.sessions.pop(session_id, None)
+            del self._placements[session_id]
+
+    def stats(self) -> SupervisorStats:
+        return SupervisorStats(
+            workers=tuple(worker.stats() for worker in self._workers)
+        )
+
+    async def close(self, drain_timeout_seconds: float = 30.0) -> None:
+        """Stops routing sessions, lets running ones end for up to
+        `drain_timeout_seconds`, then stops their agents and the workers."""
+        self._running = False
+        self._closing.set()
+        if self._watchdog is not None:
+            self._watchdog.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._watchdog
+            self._watchdog = None
+
+        workers = [worker for worker in self._workers if not worker.exited.is_set()]
+        for worker in workers:
+            worker.draining = True
+            worker.send({"op": "drain", "timeout": drain_timeout_seconds})
+        if workers:
+            logger.info("Draining %d agent workers", len(workers))
+            _, pending = await asyncio.wait(
+                [asyncio.create_task(worker.exited.wait()) for worker in workers],
+                timeout=drain_timeout_seconds + _EXIT_GRACE_SECONDS,
+            )
+            for task in pending:
+                task.cancel()
+        await self._kill_all()
+
+    async def _spawn(self, index: int, restarts: int = 0) -> _WorkerProcess:
+        process = await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-m",
+            "rtvoice.agent._host_worker",
+            self._handler,
+            str(self._heartbeat_interval_seconds),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            env=_worker_environment(),
+            limit=_REPLY_LIMIT_BYTES,
+        )
+        logger.debug("Started agent worker %d [pid=%d]", index, process.pid)
+        worker = _WorkerProcess(index, process, restarts)
+        worker.reader = asyncio.create_task(self._read(worker))
+        return worker
+
+    async def _wait_ready(self, worker: _WorkerProcess) -> None:
+        ready = asyncio.create_task(worker.ready.wait())
+        exited = asyncio.create_task(worker.exited.wait())
+        await asyncio.wait(
+            {ready, exited},
+            timeout=self._startup_timeout_seconds,
+            return_when=asyncio.FIRST_COMPLETED,
+        )
+        ready.cancel()
+        exited.cancel()
+        if not worker.ready.is_set():
+            raise RuntimeError(
+                f"Agent worker {worker.index} did not start "
+                f"(exit code {worker.process.returncode})"
+            )
+
+    async def _read(self, worker: _WorkerProcess) -> None:
+        try:
+            while line := await worker.process.stdout.readline():
+                try:
+                    self._handle_reply(worker, json.loads(line))
+                except Exception:
+                    logger.exception(
+                        "Ignoring malformed reply from agent worker %d: %.200r",
+                        worker.index,
+                        line,
+                    )
+        except ValueError:
+            # the stream is unusable after a reply over the limit
+            logger.error(
+                "Agent worker %d sent a reply over %d bytes; killing it",
+                worker.index,
+                _REPLY_LIMIT_BYTES,
+            )
+            worker.kill()
+        await worker.process.wait()
+        worker.exited.set()
+
+        for session_id, ended in worker.sessions.items():
+            if not ended.done():
+                ended.set_exception(
+                    SessionFailedError(
+                        f"Session '{session_id}' was lost with agent worker "
+                        f"{worker.index} (exit code {worker.process.returncode})"
+                    )
+                )
+        if self._running:
+            logger.warning(
+                "Agent worker %d exited with code %s; restarting",
+                worker.index,
+                worker.process.returncode,
+            )
+            await self._replace(worker)
+
+    async def _replace(self, worker: _WorkerProcess) -> None:
+        # the exited worker keeps its slot, not accepting sessions, until a
+        # replacement starts; a failed start is retried with back-off
+        delay = self._heartbeat_interval_seconds
+        while self._running:
+            try:
+                replacement = await self._spawn(worker.index, worker.restarts + 1)
+            except Exception:
+                logger.exception(
+                    "Could not restart agent worker %d; retrying in %.1f s",
+                    worker.index,
+                    delay,
+                )
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._closing.wait(), delay)
+                delay = min(delay * 2, _MAX_RESPAWN_DELAY_SECONDS)
+                continue
+            self._workers[worker.index] = replacement
+            if not self._running:
+                # closed while the replacement was starting
+                replacement.kill()
+            return
+
+    def _handle_reply(self, worker: _WorkerProcess, reply: dict[str, Any]) -> None:
+        match reply["op"]:
+            case "ready":
+                worker.last_heartbeat = time.monotonic()
+                worker.ready.set()
+            case "heartbeat":
+                worker.last_heartbeat = time.monotonic()
+                stats = reply["stats"]
+                worker.host_stats = HostStats(
+                    **{**stats, "cost": Decimal(stats["cost"])}
+                )
+            case "ended":
+                ended = worker.sessions.get(reply["session_id"])
+                if ended is None or ended.done():
+                    return
+                if reply["error"] is None:
+                    ended.set_result(None)
+                else:
+                    ended.set_exception(
+                        SessionFailedError(
+                            f"Session '{reply['session_id']}' failed: {reply['error']}"
+                        )
+                    )
+            case "drained":
+                logger.debug("Agent worker %d drained", worker.index)
+
+    def _least_loaded(self) -> _WorkerProcess | None:
+        candidates = [
+            worker
+            for worker in self._workers
+            if worker.accepting
+            and (
+                self._max_sessions_per_worker is None
+                or len(worker.sessions) < self._max_sessions_per_worker
+            )
+        ]
+        return min(
+            candidates,
+            key=lambda worker: (
+                len(worker.sessions),
+                worker.host_stats.loop_lag_seconds if worker.host_stats else 0.0,
+            ),
+            default=None,
+        )
+
+    async def _watch(self) -> None:
+        while True:
+            await asyncio.sleep(self._heartbeat_interval_seconds)
+            now = time.monotonic()
+            for worker in self._workers:
+                if worker.exited.is_set():
+                    continue
+                if worker.ready.is_set():
+                    silent_for = now - worker.last_heartbeat
+                    limit = self._heartbeat_timeout_seconds
+                else:
+                    silent_for = now - worker.started_at
+                    limit = self._startup_timeout_seconds
+                if silent_for > limit:
+                    logger.warning(
+                        "Agent worker %d sent no heartbeat for %.1f s; killing it",
+                        worker.index,
+                        silent_for,
+                    )
+                    worker.kill()
+
+    async def _kill_all(self) -> None:
+        for worker in self._workers:
+            worker.kill()
+        readers = [w.reader for w in self._workers if w.reader is not None]
+        await asyncio.gather(*readers, return_exceptions=True)
+
+
+def _worker_environment() -> dict[str, str]:
+    # workers import the handler by path, so they need the supervisor's
+    # import path, including directories added at runtime
+    environment = dict(os.environ)
+    environment["PYTHONPATH"] = os.pathsep.join(
+        path for path in sys.path if path and os.path.isdir(path)
+    )
+    return environment
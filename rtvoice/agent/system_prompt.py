@@ -12,7 +12,17 @@ class _SkillInfo(Protocol):
 
 
 class SystemPrompt:
-    def __init__(self, content: str, *, skills: Iterable[_SkillInfo] = ()) -> None:
+    def __init__(
+        self,
+        content: str,
+        *,
+        skills: Iterable[_SkillInfo] = (),
+        canonical: bool = False,
+    ) -> None:
+        # canonical: skills listed by name instead of discovery order, so the
+        # prompt does not change when skill directories are passed differently
+        if canonical:
+            skills = sorted(skills, key=lambda skill: skill.name)
         self._content = _append_skill_discovery(content, skills)
 
     def __str__(self) -> str:
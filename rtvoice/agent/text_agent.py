@@ -1,25 +1,42 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Collection, Sequence
 
 from llmify import (
     AssistantMessage,
     ChatModel,
     ChatOpenAI,
     Message,
+    StreamEnd,
+    StreamTextDelta,
     SystemMessage,
+    ToolCall,
     ToolResultMessage,
     UserMessage,
 )
 
 from rtvoice.agent.system_prompt import SystemPrompt
 from rtvoice.skills import Skills
-from rtvoice.tools import Handoff, ToolContext, Tools, ToolSchemaFormat
+from rtvoice.tools import (
+    ActionKind,
+    Handoff,
+    ToolContext,
+    Tools,
+    ToolSchemaFormat,
+    ToolTurnEnded,
+)
 
 logger = logging.getLogger(__name__)
 
+# kinds whose calls in one turn may run at the same time; the others run one
+# after another, in the order the model asked for them
+_DEFAULT_CONCURRENT_KINDS = frozenset({ActionKind.GENERIC, ActionKind.READ})
+_MAX_ITERATIONS_REACHED = "Max iterations reached."
+_DEFAULT_CONTEXT_TOKEN_BUDGET = 4_000
+
 
 class TextAgent(Handoff):
     def __init__(
@@ -34,23 +51,27 @@ class TextAgent(Handoff):
         handoff_instructions: str | None = None,
         result_instructions: str | None = None,
         tool_dependencies: Sequence[object] = (),
+        concurrent_tool_kinds: Collection[ActionKind] = _DEFAULT_CONCURRENT_KINDS,
+        streaming: bool = False,
+        context_token_budget: int | None = _DEFAULT_CONTEXT_TOKEN_BUDGET,
     ) -> None:
         self.name = "text_agent"
         self.description = description
         self._llm = llm or ChatOpenAI(model="gpt-5.4-mini")
         self._skills = skills
-        self._tools = Tools()
-        if tools:
-            self._tools.merge(tools)
+        self._tools = tools.fork() if tools else Tools()
 
         self._system_prompt = SystemPrompt(
             system_prompt,
-            skills=self._skills if self._skills is not None else (),
+            skills=self._skills.summaries() if self._skills is not None else (),
         )
 
         self._max_iterations = max_iterations
+        self._concurrent_tool_kinds = frozenset(concurrent_tool_kinds)
         self.handoff_instructions = handoff_instructions
         self.result_instructions = result_instructions
+        self.streaming = streaming
+        self.context_token_budget = context_token_budget
 
         # withholding the Handoff keeps the handoff tool unavailable here: a
         # delegated agent must not delegate to another agent again
@@ -66,6 +87,33 @@ class TextAgent(Handoff):
         messages = self._build_messages(task=task, context=context)
         return await self._loop(messages)
 
+    async def stream(
+        self,
+        task: str,
+        context: str | None = None,
+    ) -> AsyncIterator[str | ToolTurnEnded]:
+        """Like `start`, but yields the assistant's text as the LLM generates
+        it. A turn that ends in tool calls may have streamed a short remark
+        before them and is closed by a ToolTurnEnded; the text after the last
+        one is the answer `start` returns."""
+        messages = self._build_messages(task=task, context=context)
+        tool_schema = self._tools.get_schema(ToolSchemaFormat.TEXT)
+
+        for _ in range(self._max_iterations):
+            end: StreamEnd | None = None
+            async for event in self._llm.stream(messages, tools=tool_schema):
+                if isinstance(event, StreamTextDelta):
+                    yield event.delta
+                elif isinstance(event, StreamEnd):
+                    end = event
+
+            if end is None or not end.tool_calls:
+                return
+            yield ToolTurnEnded()
+            await self._run_tool_calls(messages, end.completion, end.tool_calls)
+
+        yield _MAX_ITERATIONS_REACHED
+
     def _build_messages(self, task: str, context: str | None) -> list[Message]:
         messages = [SystemMessage(content=str(self._system_prompt))]
         if context:
@@ -86,45 +134,63 @@ class TextAgent(Handoff):
             if not response.tool_calls:
                 return response.completion
 
-            messages.append(
-                AssistantMessage(
-                    content=response.completion,
-                    tool_calls=response.tool_calls,
-                )
+            await self._run_tool_calls(
+                messages, response.completion, response.tool_calls
             )
 
-            for tool_call in response.tool_calls:
-                tool_name = tool_call.function.name
-                try:
-                    tool_args = json.loads(tool_call.function.arguments)
-                except json.JSONDecodeError as exc:
-                    logger.warning(
-                        "Failed to parse arguments for tool '%s': %s", tool_name, exc
-                    )
-                    messages.append(
-                        ToolResultMessage(
-                            tool_call_id=tool_call.id,
-                            content=f"Error: could not parse tool arguments – {exc}. Please retry with valid JSON.",
-                        )
-                    )
-                    continue
-
-                result = await self._tools.execute(tool_name, tool_args)
-                if not result.ok:
-                    messages.append(
-                        ToolResultMessage(
-                            tool_call_id=tool_call.id,
-                            content=(
-                                f"Error: tool '{tool_name}' failed with: {result.error}. "
-                                "Please handle this and try again."
-                            ),
-                        )
-                    )
-                    continue
-
-                content = "OK" if result.value is None else str(result.value)
-                messages.append(
-                    ToolResultMessage(tool_call_id=tool_call.id, content=content)
-                )
+        return _MAX_ITERATIONS_REACHED
+
+    async def _run_tool_calls(
+        self, messages: list[Message], completion: str, tool_calls: list[ToolCall]
+    ) -> None:
+        messages.append(AssistantMessage(content=completion, tool_calls=tool_calls))
+
+        results: list[ToolResultMessage] = []
+        for group in self._execution_groups(tool_calls):
+            results.extend(
+                await asyncio.gather(*(self._run_tool_call(call) for call in group))
+            )
+        messages.extend(results)
+
+    def _execution_groups(self, tool_calls: list[ToolCall]) -> list[list[ToolCall]]:
+        """Splits the turn into groups that run one after another. Neighbouring
+        calls of a concurrent kind share a group; any other call gets its own,
+        so it sees the effects of everything asked for before it."""
+        groups: list[list[ToolCall]] = []
+        extends_group = False
+        for call in tool_calls:
+            tool = self._tools.get(call.function.name)
+            # unknown tools only produce an error result, so they cannot conflict
+            concurrent = tool is None or tool.kind in self._concurrent_tool_kinds
+            if concurrent and extends_group:
+                groups[-1].append(call)
+            else:
+                groups.append([call])
+            extends_group = concurrent
+        return groups
+
+    async def _run_tool_call(self, tool_call: ToolCall) -> ToolResultMessage:
+        tool_name = tool_call.function.name
+        try:
+            tool_args = json.loads(tool_call.function.arguments)
+        except json.JSONDecodeError as exc:
+            logger.warning(
+                "Failed to parse arguments for tool '%s': %s", tool_name, exc
+            )
+            return ToolResultMessage(
+                tool_call_id=tool_call.id,
+                content=f"Error: could not parse tool arguments – {exc}. Please retry with valid JSON.",
+            )
+
+        result = await self._tools.execute(tool_name, tool_args)
+        if not result.ok:
+            return ToolResultMessage(
+                tool_call_id=tool_call.id,
+                content=(
+                    f"Error: tool '{tool_name}' failed with: {result.error}. "
+                    "Please handle this and try again."
+                ),
+            )
 
-        return "Max iterations reached."
+        content = "OK" if result.value is None else str(result.value)
+        return ToolResultMessage(tool_call_id=tool_call.id, content=content)
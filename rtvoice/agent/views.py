@@ -3,8 +3,9 @@ from enum import StrEnum
 from pathlib import Path
 from typing import Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
+from rtvoice.conversation.store import estimate_tokens
 from rtvoice.conversation.views import ConversationTurn
 from rtvoice.tokens.models import UsageReport
 
@@ -143,6 +144,48 @@ class InjectedConversation(BaseModel):
     """Conversation items sent after session.update but before mic audio starts."""
 
     messages: list[InjectedMessage]
+    # historical context from outside these messages, e.g. a previous session
+    summary: str | None = None
+    # messages older than the last `max_messages` are folded into the single
+    # summary item, which keeps startup cheap for long seeded histories
+    max_messages: int | None = Field(default=None, ge=0)
+    # tokens the folded messages may take up in the summary item; the oldest
+    # beyond it are only counted
+    folded_token_budget: int = Field(default=1_000, ge=1)
+
+    @property
+    def recent_messages(self) -> list[InjectedMessage]:
+        if self.max_messages is None:
+            return list(self.messages)
+        if self.max_messages == 0:
+            return []
+        return self.messages[-self.max_messages :]
+
+    @property
+    def folded_messages(self) -> list[InjectedMessage]:
+        return self.messages[: len(self.messages) - len(self.recent_messages)]
+
+    def summary_text(self) -> str | None:
+        """`summary` followed by the newest folded messages that fit into
+        `folded_token_budget`, oldest first."""
+        folded = self.folded_messages
+        lines: list[str] = []
+        used = 0
+        for message in reversed(folded):
+            line = f"[{message.role.upper()}]: {message.text}"
+            tokens = estimate_tokens(line)
+            if used + tokens > self.folded_token_budget:
+                break
+            lines.append(line)
+            used += tokens
+        lines.reverse()
+
+        parts = [self.summary] if self.summary else []
+        if omitted := len(folded) - len(lines):
+            noun = "message" if omitted == 1 else "messages"
+            parts.append(f"({omitted} earlier {noun} omitted)")
+        parts.extend(lines)
+        return "\n".join(parts) or None
 
 
 class AgentError(BaseModel):
@@ -157,3 +200,5 @@ class AgentResult(BaseModel):
     turns: list[ConversationTurn]
     recording_path: Path | None = None
     usage: UsageReport
+    # where the turns were persisted, for `RealtimeAgent(resume_from=...)`
+    conversation_id: str | None = None
@@ -0,0 +1,39 @@
+from .compaction import (
+    AutomaticCompaction,
+    CompactionPolicy,
+    Compactor,
+    LLMCompactor,
+    TokenBudgetPolicy,
+)
+from .engine import ContextEngine
+from .ledger import ConversationLedger
+from .views import (
+    CompactionInput,
+    CompactionPlan,
+    ContextEvent,
+    ContextEventKind,
+    ContextItem,
+    ContextItemKind,
+    ContextUpdate,
+    ContextUsage,
+    ConversationSnapshot,
+)
+
+__all__ = [
+    "AutomaticCompaction",
+    "CompactionInput",
+    "CompactionPlan",
+    "CompactionPolicy",
+    "Compactor",
+    "ContextEngine",
+    "ContextEvent",
+    "ContextEventKind",
+    "ContextItem",
+    "ContextItemKind",
+    "ContextUpdate",
+    "ContextUsage",
+    "ConversationLedger",
+    "ConversationSnapshot",
+    "LLMCompactor",
+    "TokenBudgetPolicy",
+]
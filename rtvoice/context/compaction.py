@@ -0,0 +1,172 @@
+import logging
+from typing import Protocol
+
+from llmify import ChatModel, SystemMessage, UserMessage
+
+from rtvoice.context.views import (
+    CompactionInput,
+    CompactionPlan,
+    ContextEvent,
+    ContextEventKind,
+    ContextItem,
+    ContextUpdate,
+    ContextUsage,
+    ConversationSnapshot,
+)
+
+logger = logging.getLogger(__name__)
+
+# rough average for mixed English/German text; policies only need an estimate
+# to decide how many turns to fold, the trigger itself uses real usage
+_CHARS_PER_TOKEN = 4
+
+_DEFAULT_COMPACTION_PROMPT = (
+    "You condense the older part of a voice conversation into a summary the "
+    "assistant will read as background context.\n"
+    "- Keep facts about the user, decisions, tool results, open goals and next "
+    "steps.\n"
+    "- Lines marked INTERRUPTED were cut off; the user only heard the part "
+    "shown, never treat them as fully communicated.\n"
+    "- Fold an existing summary into the new one instead of repeating it.\n"
+    "- Write plain, compact prose without preamble."
+)
+
+
+class Compactor(Protocol):
+    async def compact(self, input: CompactionInput) -> str: ...
+
+
+class CompactionPolicy(Protocol):
+    def plan(
+        self,
+        snapshot: ConversationSnapshot,
+        usage: ContextUsage | None,
+    ) -> CompactionPlan | None: ...
+
+
+class TokenBudgetPolicy:
+    """Compacts once the last response's input crossed `trigger_tokens`, folding
+    the oldest complete user turns until the estimate is back at
+    `target_tokens`. A turn starts at a user message, so tool calls and their
+    results always go together; the last `keep_last_user_turns` are untouched."""
+
+    def __init__(
+        self,
+        *,
+        trigger_tokens: int = 24_000,
+        target_tokens: int = 12_000,
+        keep_last_user_turns: int = 4,
+    ) -> None:
+        if target_tokens >= trigger_tokens:
+            raise ValueError("target_tokens must be below trigger_tokens.")
+        if keep_last_user_turns < 1:
+            raise ValueError("keep_last_user_turns must be at least 1.")
+        self._trigger_tokens = trigger_tokens
+        self._target_tokens = target_tokens
+        self._keep_last_user_turns = keep_last_user_turns
+
+    def plan(
+        self,
+        snapshot: ConversationSnapshot,
+        usage: ContextUsage | None,
+    ) -> CompactionPlan | None:
+        if usage is None or usage.input_tokens < self._trigger_tokens:
+            return None
+
+        turns = _user_turns(snapshot.conversation_items)
+        candidates = turns[: max(0, len(turns) - self._keep_last_user_turns)]
+        excess = usage.input_tokens - self._target_tokens
+
+        selected: list[ContextItem] = []
+        freed = 0
+        for turn in candidates:
+            if freed >= excess:
+                break
+            selected.extend(turn)
+            freed += sum(estimate_tokens(item) for item in turn)
+
+        if not selected:
+            return None
+        return CompactionPlan(items=tuple(selected), previous_summary=snapshot.summary)
+
+
+class LLMCompactor:
+    def __init__(self, llm: ChatModel, *, prompt: str | None = None) -> None:
+        self._llm = llm
+        self._prompt = prompt or _DEFAULT_COMPACTION_PROMPT
+
+    async def compact(self, input: CompactionInput) -> str:
+        sections = []
+        if input.previous_summary:
+            sections.append(
+                f"<previous_summary>\n{input.previous_summary}\n</previous_summary>"
+            )
+        transcript = "\n".join(item.format() for item in input.items)
+        sections.append(f"<conversation>\n{transcript}\n</conversation>")
+
+        response = await self._llm.invoke(
+            [
+                SystemMessage(content=self._prompt),
+                UserMessage(content="\n\n".join(sections)),
+            ]
+        )
+        return response.completion.strip()
+
+
+class AutomaticCompaction:
+    """ContextEngine that replaces old turns with a summary. The policy picks the
+    items, the compactor only writes the text."""
+
+    def __init__(self, *, compactor: Compactor, policy: CompactionPolicy) -> None:
+        self._compactor = compactor
+        self._policy = policy
+
+    async def process(
+        self,
+        event: ContextEvent,
+        snapshot: ConversationSnapshot,
+    ) -> ContextUpdate | None:
+        if event.kind is not ContextEventKind.RESPONSE_DONE:
+            return None
+
+        plan = self._policy.plan(snapshot, event.usage)
+        if plan is None:
+            return None
+
+        previous = plan.previous_summary
+        summary = await self._compactor.compact(
+            CompactionInput(
+                items=plan.items,
+                previous_summary=previous.text if previous else None,
+            )
+        )
+        if not summary:
+            logger.warning("Compactor returned an empty summary - keeping context")
+            return None
+
+        deleted = tuple(item.id for item in plan.items)
+        if previous is not None:
+            deleted = (previous.id, *deleted)
+        logger.info(
+            "Compacting context [items=%d, input_tokens=%s]",
+            len(plan.items),
+            event.usage.input_tokens if event.usage else None,
+        )
+        return ContextUpdate(
+            create=(ContextItem.new_summary(summary),),
+            delete_item_ids=deleted,
+        )
+
+
+def estimate_tokens(item: ContextItem) -> int:
+    return max(1, len(item.text) // _CHARS_PER_TOKEN)
+
+
+def _user_turns(items: tuple[ContextItem, ...]) -> list[list[ContextItem]]:
+    turns: list[list[ContextItem]] = []
+    for item in items:
+        if item.is_user_message or not turns:
+            turns.append([item])
+        else:
+            turns[-1].append(item)
+    return turns
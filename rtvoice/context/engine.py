@@ -0,0 +1,15 @@
+from typing import Protocol
+
+from rtvoice.context.views import ContextEvent, ContextUpdate, ConversationSnapshot
+
+
+class ContextEngine(Protocol):
+    """Decides how the model's context should change. Gets library events and
+    immutable snapshots, never the websocket; the realtime layer validates and
+    applies whatever update it returns. One instance belongs to one session."""
+
+    async def process(
+        self,
+        event: ContextEvent,
+        snapshot: ConversationSnapshot,
+    ) -> ContextUpdate | None: ...
@@ -0,0 +1,86 @@
+from collections import deque
+from dataclasses import replace
+
+from rtvoice.context.views import ContextItem, ConversationSnapshot
+
+# previous_item_id the server uses for items inserted at the start
+ROOT_ITEM_ID = "root"
+
+
+class ConversationLedger:
+    """Server-mirrored list of the active context items, indexed by id.
+    Deleted items move to an archive of the latest `max_archived_items`, so a
+    long session only holds its active context and a bounded history."""
+
+    def __init__(self, max_archived_items: int = 1_000) -> None:
+        self._items: list[ContextItem] = []
+        self._positions: dict[str, int] = {}
+        self._archived: deque[ContextItem] = deque(maxlen=max_archived_items)
+
+    def add(self, item: ContextItem, previous_item_id: str | None = None) -> None:
+        if item.id in self._positions:
+            self.replace(item)
+            return
+
+        if previous_item_id == ROOT_ITEM_ID:
+            self._insert(0, item)
+            return
+
+        position = self._positions.get(previous_item_id) if previous_item_id else None
+        if position is None:
+            self._positions[item.id] = len(self._items)
+            self._items.append(item)
+        else:
+            self._insert(position + 1, item)
+
+    def replace(self, item: ContextItem) -> None:
+        position = self._positions.get(item.id)
+        if position is not None:
+            self._items[position] = item
+
+    def set_text(self, item_id: str, text: str) -> None:
+        item = self.get(item_id)
+        if item is not None:
+            self.replace(replace(item, text=text))
+
+    def mark_interrupted(self, item_id: str) -> None:
+        item = self.get(item_id)
+        if item is not None:
+            self.replace(replace(item, interrupted=True))
+
+    def mark_deleted(self, item_id: str) -> None:
+        position = self._positions.pop(item_id, None)
+        if position is None:
+            return
+        self._archived.append(self._items.pop(position))
+        self._reindex(position)
+
+    def mark_all_deleted(self) -> None:
+        """For a new server conversation, e.g. after a reconnect: every item so
+        far moves to the archive and is no longer part of the context."""
+        self._archived.extend(self._items)
+        self._items.clear()
+        self._positions.clear()
+
+    def get(self, item_id: str) -> ContextItem | None:
+        position = self._positions.get(item_id)
+        return self._items[position] if position is not None else None
+
+    def is_active(self, item_id: str) -> bool:
+        return item_id in self._positions
+
+    def snapshot(self) -> ConversationSnapshot:
+        return ConversationSnapshot(items=tuple(self._items))
+
+    @property
+    def archive(self) -> tuple[ContextItem, ...]:
+        """The latest deleted items, oldest first, followed by the active ones."""
+        return (*self._archived, *self._items)
+
+    def _insert(self, position: int, item: ContextItem) -> None:
+        self._items.insert(position, item)
+        self._reindex(position)
+
+    def _reindex(self, start: int) -> None:
+        for position in range(start, len(self._items)):
+            self._positions[self._items[position].id] = position
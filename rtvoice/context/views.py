@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import StrEnum
+from uuid import uuid4
+
+# realtime item ids are capped at 32 characters
+_ITEM_ID_PREFIX = "ctx_"
+_ITEM_ID_HEX_LENGTH = 24
+
+
+class ContextItemKind(StrEnum):
+    MESSAGE = "message"
+    FUNCTION_CALL = "function_call"
+    FUNCTION_CALL_OUTPUT = "function_call_output"
+
+
+class ContextEventKind(StrEnum):
+    RESPONSE_DONE = "response_done"
+    SESSION_ENDED = "session_ended"
+
+
+def new_item_id() -> str:
+    return f"{_ITEM_ID_PREFIX}{uuid4().hex[:_ITEM_ID_HEX_LENGTH]}"
+
+
+@dataclass(frozen=True, slots=True)
+class ContextItem:
+    """Provider-neutral view of one item in the model's context."""
+
+    id: str
+    kind: ContextItemKind
+    text: str
+    role: str | None = None
+    call_id: str | None = None
+    interrupted: bool = False
+    summary: bool = False
+
+    @classmethod
+    def new_summary(cls, text: str) -> ContextItem:
+        return cls(
+            id=new_item_id(),
+            kind=ContextItemKind.MESSAGE,
+            text=text,
+            role="system",
+            summary=True,
+        )
+
+    @property
+    def is_user_message(self) -> bool:
+        return self.kind is ContextItemKind.MESSAGE and self.role == "user"
+
+    def format(self) -> str:
+        match self.kind:
+            case ContextItemKind.FUNCTION_CALL:
+                return f"[TOOL CALL]: {self.text}"
+            case ContextItemKind.FUNCTION_CALL_OUTPUT:
+                return f"[TOOL RESULT]: {self.text}"
+        role = (self.role or "unknown").upper()
+        if self.interrupted:
+            return f"[{role}, INTERRUPTED]: {self.text}"
+        return f"[{role}]: {self.text}"
+
+
+@dataclass(frozen=True, slots=True)
+class ConversationSnapshot:
+    """Immutable, ordered view of the active model context at one point in time;
+    items added later are never part of it."""
+
+    items: tuple[ContextItem, ...] = ()
+
+    @property
+    def summary(self) -> ContextItem | None:
+        return next((item for item in self.items if item.summary), None)
+
+    @property
+    def conversation_items(self) -> tuple[ContextItem, ...]:
+        return tuple(item for item in self.items if not item.summary)
+
+
+@dataclass(frozen=True, slots=True)
+class ContextUsage:
+    input_tokens: int
+    cached_input_tokens: int = 0
+    output_tokens: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class ContextEvent:
+    kind: ContextEventKind
+    usage: ContextUsage | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class ContextUpdate:
+    """Requested context changes; the realtime layer creates before it deletes."""
+
+    create: tuple[ContextItem, ...] = ()
+    delete_item_ids: tuple[str, ...] = ()
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.create and not self.delete_item_ids
+
+
+@dataclass(frozen=True, slots=True)
+class CompactionPlan:
+    items: tuple[ContextItem, ...]
+    previous_summary: ContextItem | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class CompactionInput:
+    items: tuple[ContextItem, ...]
+    previous_summary: str | None = None
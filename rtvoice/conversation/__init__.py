@@ -1,12 +1,22 @@
 from .history import ConversationHistory
 from .inactivity_timer import ConversationInactivityTimer
+from .persistence import (
+    ConversationStore,
+    ConversationWriter,
+    JSONLConversationStore,
+    SQLiteConversationStore,
+)
 from .views import AssistantTurn, ConversationTurn, ToolTurn, TurnRole, UserTurn
 
 __all__ = [
     "AssistantTurn",
     "ConversationHistory",
     "ConversationInactivityTimer",
+    "ConversationStore",
     "ConversationTurn",
+    "ConversationWriter",
+    "JSONLConversationStore",
+    "SQLiteConversationStore",
     "ToolTurn",
     "TurnRole",
     "UserTurn",
@@ -1,8 +1,16 @@
-from collections.abc import Iterable
+import logging
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
+from pathlib import Path
 
 from transitbus import EventBus
 
+from rtvoice.conversation.store import (
+    CHARS_PER_TOKEN,
+    TurnRecord,
+    TurnSnapshot,
+    TurnStore,
+)
 from rtvoice.conversation.views import (
     AssistantTurn,
     ConversationTurn,
@@ -17,8 +25,15 @@ from rtvoice.events.views import (
 )
 from rtvoice.shared.speech_speed import DEFAULT_SPEECH_SPEED, SpeechSpeed
 
+logger = logging.getLogger(__name__)
+
 type _AssistantTurnKey = str
 type _TurnIndex = int
+type TurnListener = Callable[[int, ConversationTurn], None]
+
+_DEFAULT_MAX_IN_MEMORY_TURNS = 1024
+_NO_CONVERSATION = "(no conversation yet)"
+_TRUNCATION_MARKER = " [...]"
 
 
 @dataclass(frozen=True)
@@ -45,11 +60,25 @@ def _interruption_keys(
 
 
 class ConversationHistory:
-    def __init__(self, event_bus: EventBus):
+    """The turns of the call so far. Each turn is rendered once when it is
+    added; with a `spill_path`, turns beyond `max_in_memory_turns` are kept in
+    a JSONL file instead of memory."""
+
+    def __init__(
+        self,
+        event_bus: EventBus,
+        *,
+        spill_path: Path | None = None,
+        max_in_memory_turns: int = _DEFAULT_MAX_IN_MEMORY_TURNS,
+    ):
         self._event_bus = event_bus
-        self._turns: list[ConversationTurn] = []
+        self._store = TurnStore(
+            spill_path=spill_path, max_in_memory_turns=max_in_memory_turns
+        )
         self._assistant_turns: dict[_AssistantTurnKey, _TurnIndex] = {}
+        self._last_assistant_turn: _TurnIndex | None = None
         self._pending_interruptions: dict[_AssistantTurnKey, _Interruption] = {}
+        self._listeners: list[TurnListener] = []
 
         self._event_bus.on(UserTranscriptCompletedEvent, self._on_user)
         self._event_bus.on(AssistantTranscriptCompletedEvent, self._on_assistant)
@@ -57,10 +86,10 @@ class ConversationHistory:
         self._event_bus.on(ToolExecutedEvent, self._on_tool_executed)
 
     async def _on_user(self, event: UserTranscriptCompletedEvent) -> None:
-        self._turns.append(UserTurn(transcript=event.transcript))
+        self.add(UserTurn(transcript=event.transcript))
 
     async def _on_tool_executed(self, event: ToolExecutedEvent) -> None:
-        self._turns.append(ToolTurn(name=event.name, result=event.result))
+        self.add(ToolTurn(name=event.name, result=event.result))
 
     async def _on_assistant(self, event: AssistantTranscriptCompletedEvent) -> None:
         keys = _assistant_keys(event.item_id, event.response_id)
@@ -72,8 +101,8 @@ class ConversationHistory:
             ),
             None,
         )
-        turn_index: _TurnIndex = len(self._turns)
-        self._turns.append(
+        turn_index: _TurnIndex = len(self._store)
+        self.add(
             AssistantTurn(
                 transcript=event.transcript,
                 interrupted=interruption is not None,
@@ -101,39 +130,98 @@ class ConversationHistory:
             self._pending_interruptions.update(dict.fromkeys(keys, interruption))
             return
 
-        for turn_index in range(len(self._turns) - 1, -1, -1):
-            if isinstance(self._turns[turn_index], AssistantTurn):
-                self._mark_interrupted(turn_index, interruption)
-                return
+        if self._last_assistant_turn is not None:
+            self._mark_interrupted(self._last_assistant_turn, interruption)
 
     def _mark_interrupted(
         self, turn_index: _TurnIndex, interruption: _Interruption
     ) -> None:
-        turn = self._turns[turn_index]
+        turn = self._store.get(turn_index).turn
         if not isinstance(turn, AssistantTurn):
             return
 
-        self._turns[turn_index] = turn.model_copy(
-            update={
-                "interrupted": True,
-                "played_ms": interruption.played_ms,
-                "speech_speed": interruption.speech_speed,
-            }
+        # the fields are already valid, so the new turn skips validation
+        interrupted = AssistantTurn.model_construct(
+            transcript=turn.transcript,
+            interrupted=True,
+            played_ms=interruption.played_ms,
+            speech_speed=interruption.speech_speed,
         )
+        if not self._store.replace(turn_index, TurnRecord(interrupted)):
+            logger.debug("Interrupted turn %d was already spilled", turn_index)
+            return
+        self._notify(turn_index, interrupted)
 
     def add(self, turn: ConversationTurn) -> None:
-        self._turns.append(turn)
+        turn_index = self._store.append(TurnRecord(turn))
+        if isinstance(turn, AssistantTurn):
+            self._last_assistant_turn = turn_index
+        self._notify(turn_index, turn)
+
+    def subscribe(self, listener: TurnListener) -> None:
+        """Calls `listener(index, turn)` for every added turn and again when a
+        turn at an existing index is replaced, e.g. after an interruption."""
+        self._listeners.append(listener)
+
+    def _notify(self, turn_index: _TurnIndex, turn: ConversationTurn) -> None:
+        for listener in self._listeners:
+            listener(turn_index, turn)
 
     def seed(self, turns: Iterable[ConversationTurn]) -> None:
-        self._turns.extend(turns)
+        for turn in turns:
+            self.add(turn)
 
     @property
     def turns(self) -> list[ConversationTurn]:
-        return list(self._turns)
+        return list(self._store.snapshot())
+
+    def snapshot(self) -> TurnSnapshot:
+        """An immutable view of the turns so far that later turns and
+        interruptions do not change. Cheaper than `turns` for long calls,
+        because it shares storage with the history instead of copying it."""
+        return self._store.snapshot()
+
+    def __len__(self) -> int:
+        return len(self._store)
 
     def format(self) -> str:
-        if not self._turns:
-            return "(no conversation yet)"
+        if not len(self._store):
+            return _NO_CONVERSATION
+        return "\n".join(record.line for record in self._store)
+
+    def format_window(self, max_tokens: int) -> str:
+        """The most recent turns that fit into `max_tokens`, newest last.
+        Older turns are replaced by a note saying how many were left out; a
+        latest turn that alone exceeds the budget is cut short. Only the turns
+        inside the window are touched, so the cost does not grow with the
+        length of the call."""
+        if max_tokens < 1:
+            raise ValueError("max_tokens must be at least 1")
+        if not len(self._store):
+            return _NO_CONVERSATION
+
+        lines: list[str] = []
+        used = 0
+        for record in self._store.reversed_records():
+            if used + record.tokens > max_tokens:
+                break
+            lines.append(record.line)
+            used += record.tokens
+
+        if not lines:
+            lines.append(
+                _truncate(self._store.get(len(self._store) - 1).line, max_tokens)
+            )
+        lines.reverse()
 
-        lines = [turn.format() for turn in self._turns]
+        start = len(self._store) - len(lines)
+
+        if start:
+            noun = "turn" if start == 1 else "turns"
+            lines = [f"({start} earlier {noun} omitted)", *lines]
         return "\n".join(lines)
+
+
+def _truncate(line: str, max_tokens: int) -> str:
+    keep = max(0, max_tokens * CHARS_PER_TOKEN - len(_TRUNCATION_MARKER))
+    return line[:keep] + _TRUNCATION_MARKER
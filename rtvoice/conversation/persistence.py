@@ -0,0 +1,228 @@
+import asyncio
+import contextlib
+import json
+import logging
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from pathlib import Path
+
+from pydantic import TypeAdapter
+from transitbus import EventBus
+
+from rtvoice.conversation.history import ConversationHistory
+from rtvoice.conversation.views import ConversationTurn
+from rtvoice.events.views import AgentStoppedEvent
+
+logger = logging.getLogger(__name__)
+
+type StoredTurn = tuple[int, ConversationTurn]
+
+_TURN_ADAPTER: TypeAdapter[ConversationTurn] = TypeAdapter(ConversationTurn)
+
+
+class ConversationStore(ABC):
+    """Durable storage for conversation turns. Turns are addressed by their
+    position, so saving a position again replaces the earlier version. Methods
+    are blocking and are called from a worker thread. The store belongs to the
+    application, which closes it; one store can serve many agents."""
+
+    @abstractmethod
+    def save(self, conversation_id: str, turns: Sequence[StoredTurn]) -> None: ...
+
+    @abstractmethod
+    def load(self, conversation_id: str) -> list[ConversationTurn]: ...
+
+    def close(self) -> None:  # noqa: B027 - optional hook
+        pass
+
+
+class SQLiteConversationStore(ConversationStore):
+    def __init__(self, path: str | Path) -> None:
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(Path(path), check_same_thread=False)
+        with self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS turns ("
+                "conversation_id TEXT NOT NULL, "
+                "position INTEGER NOT NULL, "
+                "turn TEXT NOT NULL, "
+                "PRIMARY KEY (conversation_id, position)"
+                ") WITHOUT ROWID"
+            )
+
+    def save(self, conversation_id: str, turns: Sequence[StoredTurn]) -> None:
+        rows = [
+            (conversation_id, position, _TURN_ADAPTER.dump_json(turn).decode())
+            for position, turn in turns
+        ]
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO turns VALUES (?, ?, ?)", rows
+            )
+
+    def load(self, conversation_id: str) -> list[ConversationTurn]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT turn FROM turns WHERE conversation_id = ? ORDER BY position",
+                (conversation_id,),
+            ).fetchall()
+        return [_TURN_ADAPTER.validate_json(turn) for (turn,) in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+class JSONLConversationStore(ConversationStore):
+    """One append-only `<conversation_id>.jsonl` file per conversation. A
+    replaced turn is appended again; the last line for a position wins. A
+    line cut short by a crash is skipped on load and terminated before the
+    next append."""
+
+    def __init__(self, directory: str | Path) -> None:
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def save(self, conversation_id: str, turns: Sequence[StoredTurn]) -> None:
+        lines = [
+            json.dumps(
+                {
+                    "position": position,
+                    "turn": _TURN_ADAPTER.dump_python(turn, mode="json"),
+                }
+            )
+            + "\n"
+            for position, turn in turns
+        ]
+        path = self._path(conversation_id)
+        with self._lock:
+            if _ends_mid_line(path):
+                lines.insert(0, "\n")
+            with path.open("a", encoding="utf-8") as file:
+                file.writelines(lines)
+
+    def load(self, conversation_id: str) -> list[ConversationTurn]:
+        path = self._path(conversation_id)
+        if not path.exists():
+            return []
+
+        turns: dict[int, ConversationTurn] = {}
+        with self._lock, path.open(encoding="utf-8") as file:
+            for number, line in enumerate(file, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    logger.warning(
+                        "Skipping malformed line %d of %s, e.g. from an "
+                        "interrupted write",
+                        number,
+                        path,
+                    )
+                    continue
+                turns[record["position"]] = _TURN_ADAPTER.validate_python(
+                    record["turn"]
+                )
+        return [turns[position] for position in sorted(turns)]
+
+    def _path(self, conversation_id: str) -> Path:
+        if not conversation_id or Path(conversation_id).name != conversation_id:
+            raise ValueError(f"Invalid conversation id: {conversation_id!r}")
+        return self._directory / f"{conversation_id}.jsonl"
+
+
+def _ends_mid_line(path: Path) -> bool:
+    try:
+        with path.open("rb") as file:
+            file.seek(-1, 2)
+            return file.read(1) != b"\n"
+    except OSError:
+        # missing or empty
+        return False
+
+
+class ConversationWriter:
+    """Mirrors the history into a store without blocking the event loop.
+    Changes are collected per position and written in batches from a worker
+    thread, at most `flush_interval_seconds` after they happened; whatever is
+    still pending is written when the agent stops."""
+
+    def __init__(
+        self,
+        event_bus: EventBus,
+        history: ConversationHistory,
+        store: ConversationStore,
+        conversation_id: str,
+        *,
+        flush_interval_seconds: float = 1.0,
+        max_batch_size: int = 64,
+    ) -> None:
+        self._store = store
+        self._conversation_id = conversation_id
+        self._flush_interval_seconds = flush_interval_seconds
+        self._max_batch_size = max_batch_size
+        self._pending: dict[int, ConversationTurn] = {}
+        self._flush_task: asyncio.Task | None = None
+        self._write_lock = asyncio.Lock()
+        self._stopping = asyncio.Event()
+
+        history.subscribe(self._on_turn)
+        event_bus.on(AgentStoppedEvent, self._on_agent_stopped)
+
+    def _on_turn(self, position: int, turn: ConversationTurn) -> None:
+        self._pending[position] = turn
+        if self._flush_task is not None and not self._flush_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # outside the loop the turns wait for the next flush or the stop
+            return
+        self._flush_task = loop.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        if len(self._pending) < self._max_batch_size:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(
+                    self._stopping.wait(), self._flush_interval_seconds
+                )
+        await self.flush()
+
+    async def flush(self) -> None:
+        async with self._write_lock:
+            while self._pending:
+                batch = sorted(self._pending.items())[: self._max_batch_size]
+                for position, _ in batch:
+                    del self._pending[position]
+                try:
+                    await asyncio.to_thread(
+                        self._store.save, self._conversation_id, batch
+                    )
+                except Exception:
+                    logger.exception(
+                        "Failed to persist %d turns of conversation %s",
+                        len(batch),
+                        self._conversation_id,
+                    )
+                    # keep them for the next attempt unless a newer version exists
+                    for position, turn in batch:
+                        self._pending.setdefault(position, turn)
+                    return
+                logger.debug(
+                    "Persisted %d turns of conversation %s",
+                    len(batch),
+                    self._conversation_id,
+                )
+
+    async def _on_agent_stopped(self, _: AgentStoppedEvent) -> None:
+        # a batch may be mid-write, so wake the scheduled flush instead of
+        # cancelling it
+        self._stopping.set()
+        if self._flush_task is not None:
+            await self._flush_task
+        await self.flush()
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import functools
+import logging
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import overload
+
+from pydantic import TypeAdapter
+
+from rtvoice.conversation.views import ConversationTurn
+
+logger = logging.getLogger(__name__)
+
+CHARS_PER_TOKEN = 4
+_DEFAULT_CHUNK_SIZE = 256
+_DEFAULT_MAX_IN_MEMORY_TURNS = 1024
+
+_TURN_ADAPTER: TypeAdapter[ConversationTurn] = TypeAdapter(ConversationTurn)
+
+
+class TurnRecord:
+    """A turn with its rendered line and token estimate. Records are never
+    changed in place — an update swaps in a new one — so snapshots can share
+    them."""
+
+    __slots__ = ("line", "tokens", "turn")
+
+    def __init__(self, turn: ConversationTurn) -> None:
+        self.turn = turn
+        self.line = turn.format()
+        self.tokens = estimate_tokens(self.line)
+
+
+def estimate_tokens(text: str) -> int:
+    return max(1, len(text) // CHARS_PER_TOKEN)
+
+
+class _SpilledChunk:
+    """A sealed chunk written to the spill file, read back on access."""
+
+    __slots__ = ("count", "offset", "path")
+
+    def __init__(self, path: Path, offset: int, count: int) -> None:
+        self.path = path
+        self.offset = offset
+        self.count = count
+
+    def load(self) -> tuple[TurnRecord, ...]:
+        with self.path.open("rb") as file:
+            file.seek(self.offset)
+            return tuple(
+                TurnRecord(_TURN_ADAPTER.validate_json(file.readline()))
+                for _ in range(self.count)
+            )
+
+
+type _Chunk = tuple[TurnRecord, ...] | _SpilledChunk
+
+
+def _records(chunk: _Chunk) -> tuple[TurnRecord, ...]:
+    return _load_spilled(chunk) if isinstance(chunk, _SpilledChunk) else chunk
+
+
+# spilled chunks are immutable, so the few read last can be kept parsed;
+# walking a window of old turns then reads each chunk once
+@functools.lru_cache(maxsize=4)
+def _load_spilled(chunk: _SpilledChunk) -> tuple[TurnRecord, ...]:
+    return chunk.load()
+
+
+class TurnSnapshot(Sequence[ConversationTurn]):
+    """An immutable view of the history at one point in time. It shares the
+    sealed chunks with the store and copies at most one chunk, so taking one
+    costs O(n / chunk size) instead of O(n)."""
+
+    def __init__(self, chunks: tuple[_Chunk, ...], chunk_size: int) -> None:
+        self._chunks = chunks
+        self._chunk_size = chunk_size
+        self._length = sum(
+            chunk.count if isinstance(chunk, _SpilledChunk) else len(chunk)
+            for chunk in chunks
+        )
+
+    def __len__(self) -> int:
+        return self._length
+
+    @overload
+    def __getitem__(self, index: int) -> ConversationTurn: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[ConversationTurn]: ...
+
+    def __getitem__(
+        self, index: int | slice
+    ) -> ConversationTurn | list[ConversationTurn]:
+        if isinstance(index, slice):
+            return [
+                _records(self._chunks[chunk])[offset].turn
+                for chunk, offset in (
+                    divmod(i, self._chunk_size)
+                    for i in range(*index.indices(self._length))
+                )
+            ]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("turn index out of range")
+        # only the last chunk may be partially filled
+        chunk, offset = divmod(index, self._chunk_size)
+        return _records(self._chunks[chunk])[offset].turn
+
+    def __iter__(self) -> Iterator[ConversationTurn]:
+        for chunk in self._chunks:
+            for record in _records(chunk):
+                yield record.turn
+
+
+class TurnStore:
+    """Append-only turn storage in fixed-size chunks. Once full, a chunk is
+    sealed into a tuple; with a `spill_path`, the oldest sealed chunks move to
+    a JSONL file once more than `max_in_memory_turns` turns are held, and are
+    read back on demand. The file is truncated when the store is created."""
+
+    def __init__(
+        self,
+        *,
+        chunk_size: int = _DEFAULT_CHUNK_SIZE,
+        spill_path: Path | None = None,
+        max_in_memory_turns: int = _DEFAULT_MAX_IN_MEMORY_TURNS,
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        if max_in_memory_turns < 1:
+            raise ValueError("max_in_memory_turns must be at least 1")
+        self._chunk_size = chunk_size
+        self._spill_path = spill_path
+        self._max_in_memory_turns = max_in_memory_turns
+        self._sealed: list[_Chunk] = []
+        self._tail: list[TurnRecord] = []
+        self._length = 0
+        self._in_memory = 0
+        # the first sealed chunk that is still in memory
+        self._first_in_memory = 0
+        if spill_path is not None:
+            spill_path.parent.mkdir(parents=True, exist_ok=True)
+            spill_path.write_bytes(b"")
+
+    def __len__(self) -> int:
+        return self._length
+
+    def append(self, record: TurnRecord) -> int:
+        self._tail.append(record)
+        self._length += 1
+        self._in_memory += 1
+        if len(self._tail) == self._chunk_size:
+            self._sealed.append(tuple(self._tail))
+            self._tail = []
+            self._spill()
+        return self._length - 1
+
+    def get(self, index: int) -> TurnRecord:
+        chunk, offset = divmod(index, self._chunk_size)
+        if chunk == len(self._sealed):
+            return self._tail[offset]
+        return _records(self._sealed[chunk])[offset]
+
+    def replace(self, index: int, record: TurnRecord) -> bool:
+        """Swaps in a new record. Spilled turns are final; returns False for
+        them."""
+        chunk, offset = divmod(index, self._chunk_size)
+        if chunk == len(self._sealed):
+            self._tail[offset] = record
+            return True
+
+        sealed = self._sealed[chunk]
+        if isinstance(sealed, _SpilledChunk):
+            return False
+        # copy-on-write keeps snapshots that share the old chunk unchanged
+        self._sealed[chunk] = (*sealed[:offset], record, *sealed[offset + 1 :])
+        return True
+
+    def snapshot(self) -> TurnSnapshot:
+        chunks = (*self._sealed, tuple(self._tail)) if self._tail else self._sealed
+        return TurnSnapshot(tuple(chunks), self._chunk_size)
+
+    def __iter__(self) -> Iterator[TurnRecord]:
+        for chunk in self._sealed:
+            yield from _records(chunk)
+        yield from self._tail
+
+    def reversed_records(self) -> Iterator[TurnRecord]:
+        yield from reversed(self._tail)
+        for chunk in reversed(self._sealed):
+            yield from reversed(_records(chunk))
+
+    def _spill(self) -> None:
+        if self._spill_path is None:
+            return
+
+        while (
+            self._in_memory > self._max_in_memory_turns
+            and self._first_in_memory < len(self._sealed)
+        ):
+            chunk = self._sealed[self._first_in_memory]
+            with self._spill_path.open("ab") as file:
+                offset = file.tell()
+                file.writelines(
+                    _TURN_ADAPTER.dump_json(record.turn) + b"\n" for record in chunk
+                )
+            self._sealed[self._first_in_memory] = _SpilledChunk(
+                self._spill_path, offset, len(chunk)
+            )
+            self._first_in_memory += 1
+            self._in_memory -= len(chunk)
+            logger.debug(
+                "Spilled %d turns to %s [in_memory=%d]",
+                len(chunk),
+                self._spill_path,
+                self._in_memory,
+            )
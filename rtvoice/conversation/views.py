@@ -34,7 +34,7 @@ class AssistantTurn(BaseModel):
         if not self.interrupted:
             return f"[ASSISTANT]: {self.transcript}"
 
-        heard_prefix = " ".join(self.transcript.split()[: self._heard_words])
+        heard_prefix = self.heard_transcript
         content = (
             f"{heard_prefix} {_INTERRUPTION_MARKER}"
             if heard_prefix
@@ -42,6 +42,13 @@ class AssistantTurn(BaseModel):
         )
         return f"[ASSISTANT, INTERRUPTED]: {content}"
 
+    @property
+    def heard_transcript(self) -> str:
+        """What the user actually heard; the full transcript unless interrupted."""
+        if not self.interrupted:
+            return self.transcript
+        return " ".join(self.transcript.split()[: self._heard_words])
+
     @property
     def _heard_words(self) -> int:
         if self.played_ms is None:
@@ -1,3 +1,4 @@
+from decimal import Decimal
 from typing import TYPE_CHECKING, Any
 
 from transitbus import Event
@@ -99,6 +100,12 @@ class ToolExecutedEvent(Event):
     result: str
 
 
+class ToolProgressEvent(Event):
+    name: str
+    call_id: str
+    message: str
+
+
 class AssistantInterruptedEvent(Event):
     item_id: str | None = None
     played_ms: int | None = None
@@ -110,6 +117,52 @@ class AudioPlaybackCompletedEvent(Event):
     pass
 
 
+class RealtimeReconnectedEvent(Event):
+    attempts: int
+    downtime_seconds: float
+    replayed_items: int
+    flushed_audio_chunks: int
+    dropped_audio_chunks: int
+
+
+class ContextUpdateAppliedEvent(Event):
+    created_item_ids: list[str]
+    deleted_item_ids: list[str]
+    # deletes the server did not confirm; the items stay in the context and are
+    # picked up again by the next update
+    failed_item_ids: list[str]
+    input_tokens: int | None = None
+    duration_seconds: float
+
+
+class PromptCacheUsageEvent(Event):
+    response_id: str
+    input_tokens: int
+    cached_input_tokens: int
+
+    @property
+    def hit_ratio(self) -> float:
+        if not self.input_tokens:
+            return 0.0
+        return self.cached_input_tokens / self.input_tokens
+
+
+class CostUpdatedEvent(Event):
+    # None for transcription usage
+    response_id: str | None
+    delta: Decimal
+    total: Decimal
+    budget: Decimal | None = None
+    # False once some usage had no configured price
+    is_complete: bool = True
+
+    @property
+    def budget_remaining(self) -> Decimal | None:
+        if self.budget is None:
+            return None
+        return max(Decimal(0), self.budget - self.total)
+
+
 class AgentErrorEvent(Event):
     error: AgentErrorValue
     event_id: str | None = None
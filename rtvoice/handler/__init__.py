@@ -1,19 +1,25 @@
 from .audio_bridge import AudioBridge
 from .barge_in_coordinator import BargeInCoordinator
+from .context_engine_runner import ContextEngineRunner
 from .conversation_audio_recorder import ConversationAudioRecorder
 from .conversation_inactivity_monitor import ConversationInactivityMonitor
 from .speech_activity_event_adapter import SpeechActivityEventAdapter
+from .tool_availability_monitor import ToolAvailabilityMonitor
 from .tool_call_executor import ToolCallExecutor
+from .tool_retrieval_runner import ToolRetrievalRunner
 from .transcript_event_adapter import TranscriptEventAdapter
 from .transcript_logger import TranscriptLogger
 
 __all__ = [
     "AudioBridge",
     "BargeInCoordinator",
+    "ContextEngineRunner",
     "ConversationAudioRecorder",
     "ConversationInactivityMonitor",
     "SpeechActivityEventAdapter",
+    "ToolAvailabilityMonitor",
     "ToolCallExecutor",
+    "ToolRetrievalRunner",
     "TranscriptEventAdapter",
     "TranscriptLogger",
 ]
@@ -96,7 +96,8 @@ class AudioBridge:
     async def _on_input_audio_buffer_append(
         self, event: InputAudioBufferAppendEvent
     ) -> None:
-        if not self._websocket.is_connected:
+        # while reconnecting the websocket buffers audio for the new connection
+        if not (self._websocket.is_connected or self._websocket.is_reconnecting):
             logger.warning("Cannot send audio - WebSocket not connected")
             return
         await self._websocket.send(event)
@@ -0,0 +1,351 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from contextlib import suppress
+from typing import TYPE_CHECKING
+
+from transitbus import EventBus
+
+from rtvoice.context.ledger import ROOT_ITEM_ID, ConversationLedger
+from rtvoice.context.views import (
+    ContextEvent,
+    ContextEventKind,
+    ContextItem,
+    ContextItemKind,
+    ContextUpdate,
+    ContextUsage,
+)
+from rtvoice.events.views import (
+    AgentStoppedEvent,
+    ContextUpdateAppliedEvent,
+    RealtimeReconnectedEvent,
+)
+from rtvoice.realtime.schemas import (
+    ConversationItem,
+    ConversationItemAddedEvent,
+    ConversationItemCreateEvent,
+    ConversationItemDeletedEvent,
+    ConversationItemDeleteEvent,
+    ConversationItemTruncatedEvent,
+    FunctionCallConversationItem,
+    FunctionCallOutputConversationItem,
+    InputAudioTranscriptionCompleted,
+    MessageConversationItem,
+    ResponseCreatedEvent,
+    ResponseDoneEvent,
+    ResponseOutputAudioTranscriptDone,
+    ResponseOutputTextDone,
+    TokenUsage,
+    unwrap_conversation_summary,
+)
+from rtvoice.realtime.websocket import RealtimeWebSocket
+
+if TYPE_CHECKING:
+    from rtvoice.context.engine import ContextEngine
+
+logger = logging.getLogger(__name__)
+
+
+class ContextEngineRunner:
+    """Mirrors the server conversation into a ledger and runs the context engine
+    after each response. At most one engine run is in flight; its update is
+    applied between responses, creating new items and waiting for the server to
+    confirm them before anything is deleted."""
+
+    def __init__(
+        self,
+        event_bus: EventBus,
+        websocket: RealtimeWebSocket,
+        context_engine: ContextEngine,
+        ledger: ConversationLedger | None = None,
+        confirm_timeout_seconds: float = 10.0,
+    ) -> None:
+        self._event_bus = event_bus
+        self._websocket = websocket
+        self._context_engine = context_engine
+        self._ledger = ledger or ConversationLedger()
+        self._confirm_timeout_seconds = confirm_timeout_seconds
+
+        self._task: asyncio.Task | None = None
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._pending_creates: dict[str, asyncio.Future[None]] = {}
+        self._pending_deletes: dict[str, asyncio.Future[None]] = {}
+        # counts reconnects; an update is only valid on the connection it
+        # was computed for
+        self._connection = 0
+
+        self._event_bus.on(ConversationItemAddedEvent, self._on_item_added)
+        self._event_bus.on(ConversationItemDeletedEvent, self._on_item_deleted)
+        self._event_bus.on(ConversationItemTruncatedEvent, self._on_item_truncated)
+        self._event_bus.on(
+            InputAudioTranscriptionCompleted, self._on_user_transcript_completed
+        )
+        self._event_bus.on(
+            ResponseOutputAudioTranscriptDone, self._on_assistant_transcript_done
+        )
+        self._event_bus.on(ResponseOutputTextDone, self._on_assistant_text_done)
+        self._event_bus.on(ResponseCreatedEvent, self._on_response_created)
+        self._event_bus.on(ResponseDoneEvent, self._on_response_done)
+        self._event_bus.on(AgentStoppedEvent, self._on_agent_stopped)
+        self._event_bus.on(RealtimeReconnectedEvent, self._on_reconnected)
+        logger.debug("ContextEngineRunner initialized")
+
+    @property
+    def ledger(self) -> ConversationLedger:
+        return self._ledger
+
+    async def _on_item_added(self, event: ConversationItemAddedEvent) -> None:
+        item = _to_context_item(event.item)
+        if item is None:
+            return
+        self._ledger.add(item, event.previous_item_id)
+        _resolve(self._pending_creates, item.id)
+
+    async def _on_item_deleted(self, event: ConversationItemDeletedEvent) -> None:
+        self._ledger.mark_deleted(event.item_id)
+        _resolve(self._pending_deletes, event.item_id)
+
+    async def _on_item_truncated(self, event: ConversationItemTruncatedEvent) -> None:
+        self._ledger.mark_interrupted(event.item_id)
+
+    async def _on_user_transcript_completed(
+        self, event: InputAudioTranscriptionCompleted
+    ) -> None:
+        self._ledger.set_text(event.item_id, event.transcript)
+
+    async def _on_assistant_transcript_done(
+        self, event: ResponseOutputAudioTranscriptDone
+    ) -> None:
+        self._ledger.set_text(event.item_id, event.transcript)
+
+    async def _on_assistant_text_done(self, event: ResponseOutputTextDone) -> None:
+        self._ledger.set_text(event.item_id, event.text)
+
+    async def _on_reconnected(self, _: RealtimeReconnectedEvent) -> None:
+        # the server started a new conversation; the replayed items arrive as
+        # conversation.item.added with new ids and rebuild the context
+        self._connection += 1
+        self._ledger.mark_all_deleted()
+        # a response cut off by the disconnect never reports done
+        self._idle.set()
+
+    async def _on_response_created(self, _: ResponseCreatedEvent) -> None:
+        self._idle.clear()
+
+    async def _on_response_done(self, event: ResponseDoneEvent) -> None:
+        self._idle.set()
+
+        if self._task and not self._task.done():
+            logger.debug("Context engine still running - skipping response")
+            return
+
+        context_event = ContextEvent(
+            kind=ContextEventKind.RESPONSE_DONE,
+            usage=_to_context_usage(event.response.usage),
+        )
+        self._task = asyncio.create_task(self._run(context_event))
+
+    async def _on_agent_stopped(self, _: AgentStoppedEvent) -> None:
+        if self._task and not self._task.done():
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+        self._task = None
+
+        try:
+            await self._context_engine.process(
+                ContextEvent(kind=ContextEventKind.SESSION_ENDED),
+                self._ledger.snapshot(),
+            )
+        except Exception:
+            logger.exception("Context engine failed on session end")
+
+    async def _run(self, event: ContextEvent) -> None:
+        started_at = time.monotonic()
+        connection = self._connection
+        try:
+            update = await self._context_engine.process(event, self._ledger.snapshot())
+        except Exception:
+            logger.exception("Context engine failed - keeping context")
+            return
+
+        if update is None or update.is_empty:
+            return
+        await self._apply(update, event, started_at, connection)
+
+    async def _apply(
+        self,
+        update: ContextUpdate,
+        event: ContextEvent,
+        started_at: float,
+        connection: int,
+    ) -> None:
+        if connection != self._connection:
+            logger.warning("Reconnected while the engine ran - dropping update")
+            return
+        delete_item_ids = [
+            item_id
+            for item_id in update.delete_item_ids
+            if self._ledger.is_active(item_id)
+        ]
+        if len(delete_item_ids) != len(update.delete_item_ids):
+            logger.warning(
+                "Ignoring %d unknown or already deleted item ids",
+                len(update.delete_item_ids) - len(delete_item_ids),
+            )
+
+        # never rewrite the context under a running response
+        await self._idle.wait()
+        if not self._websocket.is_connected:
+            logger.warning("Cannot apply context update - WebSocket not connected")
+            return
+        if connection != self._connection:
+            logger.warning("Reconnected while waiting - dropping update")
+            return
+
+        created = await self._create(update.create)
+        if len(created) != len(update.create):
+            logger.warning("Summary not confirmed - keeping original items")
+            delete_item_ids = []
+        deleted = await self._delete(delete_item_ids)
+        failed = [item_id for item_id in delete_item_ids if item_id not in deleted]
+
+        duration = time.monotonic() - started_at
+        logger.info(
+            "Context updated [created=%d, deleted=%d, failed=%d] in %.2fs",
+            len(created),
+            len(deleted),
+            len(failed),
+            duration,
+        )
+        await self._event_bus.dispatch(
+            ContextUpdateAppliedEvent(
+                created_item_ids=created,
+                deleted_item_ids=deleted,
+                failed_item_ids=failed,
+                input_tokens=event.usage.input_tokens if event.usage else None,
+                duration_seconds=duration,
+            )
+        )
+
+    async def _create(self, items: tuple[ContextItem, ...]) -> list[str]:
+        messages = []
+        for item in items:
+            message = _to_create_event(item)
+            if message is None:
+                logger.warning("Skipping unsupported context item [kind=%s]", item.kind)
+                continue
+            messages.append(message)
+
+        return await self._send_and_confirm(
+            self._pending_creates,
+            [(message.item.id, message) for message in messages],
+        )
+
+    async def _delete(self, item_ids: list[str]) -> list[str]:
+        return await self._send_and_confirm(
+            self._pending_deletes,
+            [
+                (item_id, ConversationItemDeleteEvent(item_id=item_id))
+                for item_id in item_ids
+            ],
+        )
+
+    async def _send_and_confirm(
+        self,
+        pending: dict[str, asyncio.Future[None]],
+        messages: list[
+            tuple[str, ConversationItemCreateEvent | ConversationItemDeleteEvent]
+        ],
+    ) -> list[str]:
+        if not messages:
+            return []
+
+        loop = asyncio.get_running_loop()
+        futures = {item_id: loop.create_future() for item_id, _ in messages}
+        pending.update(futures)
+        try:
+            await self._websocket.send_many([message for _, message in messages])
+            await asyncio.wait(futures.values(), timeout=self._confirm_timeout_seconds)
+        finally:
+            for item_id in futures:
+                pending.pop(item_id, None)
+
+        return [item_id for item_id, future in futures.items() if future.done()]
+
+
+def _resolve(pending: dict[str, asyncio.Future[None]], item_id: str | None) -> None:
+    future = pending.get(item_id) if item_id else None
+    if future is not None and not future.done():
+        future.set_result(None)
+
+
+def _to_create_event(item: ContextItem) -> ConversationItemCreateEvent | None:
+    if item.kind is not ContextItemKind.MESSAGE:
+        return None
+
+    if item.summary:
+        message = ConversationItemCreateEvent.conversation_summary(item.text)
+        message.previous_item_id = ROOT_ITEM_ID
+    elif item.role == "user":
+        message = ConversationItemCreateEvent.user_message(item.text)
+    elif item.role == "assistant":
+        message = ConversationItemCreateEvent.assistant_message(item.text)
+    else:
+        message = ConversationItemCreateEvent.system_inject(item.text)
+
+    message.item.id = item.id
+    return message
+
+
+def _to_context_item(item: ConversationItem) -> ContextItem | None:
+    match item:
+        case MessageConversationItem(id=str(item_id)):
+            text = " ".join(
+                part_text
+                for part in item.content
+                if (
+                    part_text := getattr(part, "text", None)
+                    or getattr(part, "transcript", None)
+                )
+            )
+            summary = (
+                unwrap_conversation_summary(text) if item.role == "system" else None
+            )
+            return ContextItem(
+                id=item_id,
+                kind=ContextItemKind.MESSAGE,
+                text=summary if summary is not None else text,
+                role=item.role.value,
+                interrupted=item.status == "incomplete",
+                summary=summary is not None,
+            )
+        case FunctionCallConversationItem(id=str(item_id)):
+            return ContextItem(
+                id=item_id,
+                kind=ContextItemKind.FUNCTION_CALL,
+                text=f"{item.name}({item.arguments})",
+                call_id=item.call_id,
+            )
+        case FunctionCallOutputConversationItem(id=str(item_id)):
+            return ContextItem(
+                id=item_id,
+                kind=ContextItemKind.FUNCTION_CALL_OUTPUT,
+                text=item.output,
+                call_id=item.call_id,
+            )
+    return None
+
+
+def _to_context_usage(usage: TokenUsage | None) -> ContextUsage | None:
+    if usage is None or usage.input_tokens is None:
+        return None
+    details = usage.input_token_details
+    return ContextUsage(
+        input_tokens=usage.input_tokens,
+        cached_input_tokens=(details.cached_tokens or 0) if details else 0,
+        output_tokens=usage.output_tokens or 0,
+    )
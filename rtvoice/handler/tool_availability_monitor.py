@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from typing import TYPE_CHECKING
+
+from transitbus import EventBus
+
+from rtvoice.events.views import AgentSessionConnectedEvent, AgentStoppedEvent
+
+if TYPE_CHECKING:
+    from rtvoice.tools import Tools
+
+logger = logging.getLogger(__name__)
+
+
+class ToolAvailabilityMonitor:
+    """Pushes the tool list whenever it may have changed: a dependency was
+    provided or removed, a tool was registered, or `invalidate_schema` was
+    called after an in-place change. Changes within `debounce_seconds` of
+    each other coalesce into one update; the session then sends it only if
+    the list differs from what the server has.
+
+    Changes must happen on the agent's event loop. Before the session is
+    connected there is nothing to do, since the initial session.update reads
+    the tools when it goes out."""
+
+    def __init__(
+        self,
+        event_bus: EventBus,
+        tools: Tools,
+        update_tools: Callable[[], Awaitable[bool]],
+        debounce_seconds: float = 0.05,
+    ) -> None:
+        if debounce_seconds < 0:
+            raise ValueError("debounce_seconds must not be negative")
+        self._update_tools = update_tools
+        self._debounce_seconds = debounce_seconds
+        self._connected = False
+        self._task: asyncio.Task | None = None
+
+        tools.subscribe(self._on_tools_changed)
+        event_bus.on(AgentSessionConnectedEvent, self._on_connected)
+        event_bus.on(AgentStoppedEvent, self._on_stopped)
+
+    async def _on_connected(self, _: AgentSessionConnectedEvent) -> None:
+        self._connected = True
+
+    async def _on_stopped(self, _: AgentStoppedEvent) -> None:
+        self._connected = False
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
+    def _on_tools_changed(self) -> None:
+        if not self._connected or self._task is not None:
+            return
+        try:
+            self._task = asyncio.get_running_loop().create_task(self._flush_later())
+        except RuntimeError:
+            logger.warning("Tool change outside the event loop; not sent to the model")
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self._debounce_seconds)
+        # a change while the update is in flight schedules another one
+        self._task = None
+        try:
+            await self._update_tools()
+        except Exception:
+            logger.exception("Failed to update tools")
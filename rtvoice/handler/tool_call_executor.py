@@ -2,60 +2,165 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections import deque
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from transitbus import EventBus
 
 from rtvoice.events.views import (
+    RealtimeReconnectedEvent,
     ToolExecutedEvent,
     ToolExecutionCompletedEvent,
     ToolExecutionStartedEvent,
+    ToolProgressEvent,
 )
 from rtvoice.handler.tool_call_helpers import (
     send_batched_response,
     send_function_call_output,
     serialize_tool_result,
 )
-from rtvoice.realtime.schemas import FunctionCallItem, ResponseDoneEvent
+from rtvoice.realtime.schemas import (
+    ConversationResponseCreateEvent,
+    FunctionCallArgumentsDeltaEvent,
+    FunctionCallConversationItem,
+    FunctionCallItem,
+    ResponseCreatedEvent,
+    ResponseDoneEvent,
+    ResponseOutputItemAddedEvent,
+)
 from rtvoice.realtime.websocket import RealtimeWebSocket
+from rtvoice.shared.partial_json import PartialJSONObject
 
 if TYPE_CHECKING:
     from rtvoice.tools import Tools
+    from rtvoice.tools.progress import ProgressHandler, SpeechHandler
+    from rtvoice.tools.results import ActionResult
     from rtvoice.tools.views import Tool
 
 logger = logging.getLogger(__name__)
 
+# a tool that answers within this never gets a spoken filler
+_FILLER_DELAY_SECONDS = 1.0
+# upper bound for waiting on a filler before the results go out anyway
+_FILLER_WAIT_SECONDS = 5.0
+_FILLER_INSTRUCTIONS = (
+    "A tool is still running. In one short sentence and without asking "
+    "anything, tell the user what is happening: {message}"
+)
+_SPEECH_INSTRUCTIONS = (
+    "Say the following text to the user word for word, and nothing else: {text}"
+)
+
+
+@dataclass(frozen=True, slots=True)
+class _CallOutcome:
+    respond: bool
+    instruction: str | None
+
 
 @dataclass
 class _PendingCall:
     call_id: str
     tool: Tool
     task: asyncio.Task
+    # early dispatch only: sends the output as soon as the task finished
+    delivery: asyncio.Task[_CallOutcome] | None = None
 
 
 @dataclass
 class _ResponseBatch:
     response_id: str
+    # the server connection the calls were made on
+    connection: int
     calls: list[_PendingCall] = field(default_factory=list)
 
 
+@dataclass
+class _SpeculativeCall:
+    response_id: str
+    tool: Tool
+    arguments: PartialJSONObject = field(default_factory=PartialJSONObject)
+    started_with: dict[str, Any] | None = None
+    task: asyncio.Task | None = None
+
+
 class ToolCallExecutor:
     def __init__(
         self,
         event_bus: EventBus,
         tools: Tools,
         websocket: RealtimeWebSocket,
+        early_dispatch: bool = False,
+        speak_progress: bool = False,
     ) -> None:
         self._event_bus = event_bus
         self._tools = tools
         self._websocket = websocket
+        self._early_dispatch = early_dispatch
+        self._speak_progress = speak_progress
         self._batches: dict[str, _ResponseBatch] = {}
+        self._speculative: dict[str, _SpeculativeCall] = {}
+        self._completions: set[asyncio.Task] = set()
+        # latest progress message not yet spoken
+        self._pending_progress: str | None = None
+        # answer text a tool asked to say, in order; one response per entry
+        self._speech: deque[str] = deque()
+        self._speaker: asyncio.Task | None = None
+        self._idle = asyncio.Event()
+        self._idle.set()
+        # counts reconnects; call ids of an earlier connection are unknown to
+        # the server
+        self._connection = 0
 
         self._event_bus.on(FunctionCallItem, self._on_function_call)
+        self._event_bus.on(RealtimeReconnectedEvent, self._on_reconnected)
+        self._event_bus.on(ResponseCreatedEvent, self._on_response_created)
         self._event_bus.on(ResponseDoneEvent, self._on_response_done)
+        if early_dispatch:
+            self._event_bus.on(ResponseOutputItemAddedEvent, self._on_output_item)
+            self._event_bus.on(
+                FunctionCallArgumentsDeltaEvent, self._on_arguments_delta
+            )
         logger.debug("ToolCallExecutor initialized")
 
+    async def _on_output_item(self, event: ResponseOutputItemAddedEvent) -> None:
+        item = event.item
+        if not isinstance(item, FunctionCallConversationItem) or not item.call_id:
+            return
+
+        tool = self._tools.get(item.name)
+        # only side-effect free tools may run on arguments that are not final
+        if tool is None or not tool.is_read_only:
+            return
+        self._speculative[item.call_id] = _SpeculativeCall(
+            response_id=event.response_id, tool=tool
+        )
+
+    async def _on_arguments_delta(self, event: FunctionCallArgumentsDeltaEvent) -> None:
+        speculative = self._speculative.get(event.call_id)
+        if speculative is None or speculative.task is not None:
+            return
+
+        speculative.arguments.feed(event.delta)
+        if not _arguments_ready(speculative):
+            return
+
+        speculative.started_with = speculative.arguments.members
+        speculative.task = asyncio.create_task(
+            self._tools.execute(
+                speculative.tool.name,
+                speculative.started_with,
+                progress=self._progress_handler(event.call_id, speculative.tool),
+                speech=self._speech_handler(),
+            )
+        )
+        logger.debug(
+            "Started '%s' speculatively [call_id=%s]",
+            speculative.tool.name,
+            event.call_id,
+        )
+
     async def _on_function_call(self, event: FunctionCallItem) -> None:
         tool = self._tools.get(event.name)
         if not tool:
@@ -64,57 +169,157 @@ class ToolCallExecutor:
 
         batch = self._batches.get(event.response_id)
         if batch is None:
-            batch = _ResponseBatch(response_id=event.response_id)
+            batch = _ResponseBatch(
+                response_id=event.response_id, connection=self._connection
+            )
             self._batches[event.response_id] = batch
             await self._event_bus.dispatch(
                 ToolExecutionStartedEvent(response_id=event.response_id)
             )
 
-        task = asyncio.create_task(
-            self._tools.execute(event.name, event.arguments or {})
+        arguments = event.arguments or {}
+        task = self._take_speculative(event.call_id, arguments)
+        if task is None:
+            task = asyncio.create_task(
+                self._tools.execute(
+                    event.name,
+                    arguments,
+                    progress=self._progress_handler(event.call_id, tool),
+                    speech=self._speech_handler(),
+                )
+            )
+
+        call = _PendingCall(call_id=event.call_id, tool=tool, task=task)
+        if self._early_dispatch:
+            call.delivery = asyncio.create_task(self._deliver(batch, call))
+        batch.calls.append(call)
+
+        status = _format_status(tool, arguments)
+        if status:
+            await self._on_progress(event.call_id, tool, status)
+
+    def _progress_handler(self, call_id: str, tool: Tool) -> ProgressHandler:
+        async def report(message: str) -> None:
+            await self._on_progress(call_id, tool, message)
+
+        return report
+
+    def _speech_handler(self) -> SpeechHandler:
+        connection = self._connection
+
+        def speak(text: str) -> None:
+            if connection != self._connection:
+                return
+            self._speech.append(text)
+            if self._speaker is None or self._speaker.done():
+                self._speaker = asyncio.create_task(self._speak_queued())
+
+        return speak
+
+    async def _speak_queued(self) -> None:
+        while self._speech:
+            # a response.create while another response runs would be rejected
+            await self._wait_until_idle()
+            if not self._speech:
+                return
+            text = self._speech.popleft()
+            self._idle.clear()
+            logger.debug("Speaking tool answer [text=%r]", text)
+            await self._websocket.send(
+                ConversationResponseCreateEvent.out_of_band(
+                    _SPEECH_INSTRUCTIONS.format(text=text)
+                )
+            )
+
+    async def _on_progress(self, call_id: str, tool: Tool, message: str) -> None:
+        if self._speak_progress:
+            self._pending_progress = message
+        await self._event_bus.dispatch(
+            ToolProgressEvent(name=tool.name, call_id=call_id, message=message)
+        )
+
+    def _take_speculative(
+        self, call_id: str, arguments: dict[str, Any]
+    ) -> asyncio.Task | None:
+        speculative = self._speculative.pop(call_id, None)
+        if speculative is None or speculative.task is None:
+            return None
+        if speculative.started_with == arguments:
+            return speculative.task
+
+        logger.debug(
+            "Discarding speculative '%s' - final arguments differ",
+            speculative.tool.name,
         )
-        batch.calls.append(_PendingCall(call_id=event.call_id, tool=tool, task=task))
+        speculative.task.cancel()
+        return None
+
+    async def _deliver(self, batch: _ResponseBatch, call: _PendingCall) -> _CallOutcome:
+        (result,) = await asyncio.gather(call.task, return_exceptions=True)
+        return await self._report(batch, call, result)
+
+    async def _on_reconnected(self, _: RealtimeReconnectedEvent) -> None:
+        self._connection += 1
+        self._idle.set()
+        self._speech.clear()
+        for speculative in self._speculative.values():
+            if speculative.task is not None:
+                speculative.task.cancel()
+        self._speculative.clear()
+        # responses cut off by the disconnect never report done; their tools
+        # still finish, but the outputs are dropped
+        for batch in self._batches.values():
+            logger.warning(
+                "Dropping results of %d tool calls made before the reconnect",
+                len(batch.calls),
+            )
+            self._schedule_completion(batch)
+        self._batches.clear()
+
+    async def _on_response_created(self, _: ResponseCreatedEvent) -> None:
+        self._idle.clear()
 
     async def _on_response_done(self, event: ResponseDoneEvent) -> None:
+        self._idle.set()
+        self._drop_speculative(event.response_id)
         batch = self._batches.pop(event.response_id, None)
         if not batch or not batch.calls:
             return
+        self._schedule_completion(batch)
 
-        results = await asyncio.gather(
-            *(call.task for call in batch.calls), return_exceptions=True
-        )
-        result_instructions: list[str] = []
-        should_respond = False
-
-        for call, result in zip(batch.calls, results, strict=True):
-            if isinstance(result, BaseException):
-                logger.error("Tool '%s' crashed: %s", call.tool.name, result)
-                serialized = f"Tool execution failed: {result}"
-                call_should_respond = True
-                instruction = None
-            else:
-                serialized = serialize_tool_result(result)
-                if result.respond is not None:
-                    call_should_respond = result.respond
-                else:
-                    call_should_respond = call.tool.respond if result.ok else True
-                instruction = result.instruction or call.tool.result_instruction
-
-            should_respond |= call_should_respond
-            await self._event_bus.dispatch(
-                ToolExecutedEvent(
-                    name=call.tool.name,
-                    action_kind=call.tool.kind,
-                    silent=not call_should_respond,
-                    result=serialized,
-                )
-            )
+    def _schedule_completion(self, batch: _ResponseBatch) -> None:
+        # the bus handles server events one at a time, so waiting for the
+        # tools here would hold back every later event, a spoken filler too
+        task = asyncio.create_task(self._complete(batch))
+        self._completions.add(task)
+        task.add_done_callback(self._completions.discard)
 
-            await send_function_call_output(self._websocket, call.call_id, serialized)
-            if instruction:
-                result_instructions.append(instruction)
+    async def join(self) -> None:
+        """Waits until every batch whose response ended has been answered."""
+        while self._completions:
+            await asyncio.gather(*self._completions)
+
+    async def _complete(self, batch: _ResponseBatch) -> None:
+        filler = (
+            asyncio.create_task(self._speak_progress_while_running(batch))
+            if self._speak_progress
+            else None
+        )
+        try:
+            outcomes = await self._collect(batch)
+        finally:
+            if filler is not None:
+                filler.cancel()
+        self._pending_progress = None
 
+        should_respond = self._is_current(batch) and any(
+            outcome.respond for outcome in outcomes
+        )
+        result_instructions = [
+            outcome.instruction for outcome in outcomes if outcome.instruction
+        ]
         if should_respond:
+            await self._wait_for_spoken()
             await send_batched_response(self._websocket, result_instructions)
         await self._event_bus.dispatch(
             ToolExecutionCompletedEvent(
@@ -122,3 +327,118 @@ class ToolCallExecutor:
                 response_pending=should_respond,
             )
         )
+
+    async def _collect(self, batch: _ResponseBatch) -> list[_CallOutcome]:
+        if self._early_dispatch:
+            return await asyncio.gather(*(call.delivery for call in batch.calls))
+
+        results = await asyncio.gather(
+            *(call.task for call in batch.calls), return_exceptions=True
+        )
+        return [
+            await self._report(batch, call, result)
+            for call, result in zip(batch.calls, results, strict=True)
+        ]
+
+    async def _speak_progress_while_running(self, batch: _ResponseBatch) -> None:
+        tasks = [call.task for call in batch.calls]
+        while True:
+            _, running = await asyncio.wait(tasks, timeout=_FILLER_DELAY_SECONDS)
+            if not running:
+                return
+            message = self._pending_progress
+            if (
+                message is None
+                or not self._idle.is_set()
+                or not self._is_current(batch)
+                or self._is_speaking()
+            ):
+                continue
+
+            self._pending_progress = None
+            self._idle.clear()
+            logger.debug("Speaking tool progress [message=%r]", message)
+            await self._websocket.send(
+                ConversationResponseCreateEvent.out_of_band(
+                    _FILLER_INSTRUCTIONS.format(message=message)
+                )
+            )
+
+    def _is_speaking(self) -> bool:
+        return self._speaker is not None and not self._speaker.done()
+
+    async def _wait_for_spoken(self) -> None:
+        # a response.create while a filler or a spoken answer is still playing
+        # would be rejected
+        if self._is_speaking():
+            await asyncio.wait([self._speaker])
+        if self._speak_progress or self._speaker is not None:
+            await self._wait_until_idle()
+
+    async def _wait_until_idle(self) -> None:
+        if self._idle.is_set():
+            return
+        try:
+            await asyncio.wait_for(self._idle.wait(), _FILLER_WAIT_SECONDS)
+        except TimeoutError:
+            logger.warning("Spoken response did not finish, continuing anyway")
+
+    async def _report(
+        self,
+        batch: _ResponseBatch,
+        call: _PendingCall,
+        result: ActionResult | BaseException,
+    ) -> _CallOutcome:
+        if isinstance(result, BaseException):
+            logger.error("Tool '%s' crashed: %s", call.tool.name, result)
+            serialized = f"Tool execution failed: {result}"
+            should_respond = True
+            instruction = None
+        else:
+            serialized = serialize_tool_result(result)
+            if result.respond is not None:
+                should_respond = result.respond
+            else:
+                should_respond = call.tool.respond if result.ok else True
+            instruction = result.instruction or call.tool.result_instruction
+
+        await self._event_bus.dispatch(
+            ToolExecutedEvent(
+                name=call.tool.name,
+                action_kind=call.tool.kind,
+                silent=not should_respond,
+                result=serialized,
+            )
+        )
+        if self._is_current(batch):
+            await send_function_call_output(self._websocket, call.call_id, serialized)
+        return _CallOutcome(respond=should_respond, instruction=instruction)
+
+    def _is_current(self, batch: _ResponseBatch) -> bool:
+        return batch.connection == self._connection
+
+    def _drop_speculative(self, response_id: str) -> None:
+        # calls of a cancelled response never get their arguments.done
+        for call_id, speculative in list(self._speculative.items()):
+            if speculative.response_id != response_id:
+                continue
+            del self._speculative[call_id]
+            if speculative.task is not None:
+                speculative.task.cancel()
+
+
+def _format_status(tool: Tool, arguments: dict[str, Any]) -> str | None:
+    if tool.status is None:
+        return None
+    try:
+        return tool.format_status(arguments)
+    except Exception:
+        # arguments that fail validation are reported by the tool call itself
+        return None
+
+
+def _arguments_ready(speculative: _SpeculativeCall) -> bool:
+    if speculative.arguments.is_closed:
+        return True
+    required = speculative.tool.schema.required
+    return bool(required) and set(required) <= speculative.arguments.members.keys()
@@ -0,0 +1,55 @@
+import logging
+from collections.abc import Awaitable, Callable
+
+from transitbus import EventBus
+
+from rtvoice.realtime.schemas import (
+    InputAudioTranscriptionCompleted,
+    InputAudioTranscriptionFailed,
+)
+from rtvoice.tools.retrieval import ToolRetriever
+
+logger = logging.getLogger(__name__)
+
+
+class ToolRetrievalRunner:
+    """Reselects the exposed tools after every user transcript and sends them
+    when the selection changed. With `create_response`, turn detection leaves
+    responding to the runner: the response to a spoken turn starts once its
+    tools are in place, and with the current ones when transcription failed."""
+
+    def __init__(
+        self,
+        event_bus: EventBus,
+        retriever: ToolRetriever,
+        update_tools: Callable[[], Awaitable[bool]],
+        create_response: Callable[[], Awaitable[None]] | None = None,
+    ) -> None:
+        self._retriever = retriever
+        self._update_tools = update_tools
+        self._create_response = create_response
+        event_bus.on(InputAudioTranscriptionCompleted, self._on_user_transcript)
+        if create_response is not None:
+            event_bus.on(InputAudioTranscriptionFailed, self._on_transcription_failed)
+
+    async def _on_user_transcript(
+        self, event: InputAudioTranscriptionCompleted
+    ) -> None:
+        await self.select(event.transcript)
+        if self._create_response is not None:
+            await self._create_response()
+
+    async def _on_transcription_failed(
+        self, event: InputAudioTranscriptionFailed
+    ) -> None:
+        logger.warning(
+            "Transcription failed, responding with the current tools: %s",
+            event.error.message,
+        )
+        await self._create_response()
+
+    async def select(self, query: str) -> None:
+        if not query.strip() or not self._retriever.select(query):
+            return
+        logger.debug("Tool selection changed; updating session tools")
+        await self._update_tools()
@@ -1,5 +1,6 @@
 from .port import RealtimeProvider
 from .providers import AzureOpenAIProvider, OpenAIProvider
+from .reconnect import ReconnectPolicy
 from .session import RealtimeSession
 from .session_settings import RealtimeSessionSettings, build_session_payload
 
@@ -9,5 +10,6 @@ __all__ = [
     "RealtimeProvider",
     "RealtimeSession",
     "RealtimeSessionSettings",
+    "ReconnectPolicy",
     "build_session_payload",
 ]
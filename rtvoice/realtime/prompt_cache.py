@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+
+from rtvoice.realtime.schemas import FunctionTool
+
+logger = logging.getLogger(__name__)
+
+
+def canonical_tools(tools: list[FunctionTool]) -> list[FunctionTool]:
+    """Orders tools by name so the same tool set always serializes to the same
+    bytes, whatever order they were registered or merged in."""
+    return sorted(tools, key=lambda tool: tool.name)
+
+
+def canonical_instructions(text: str) -> str:
+    lines = text.replace("\r\n", "\n").split("\n")
+    return "\n".join(line.rstrip() for line in lines).strip()
+
+
+@dataclass(frozen=True, slots=True)
+class PromptPrefix:
+    """Fingerprint of the parts the provider caches as the prompt prefix."""
+
+    instructions_hash: str
+    tools_hash: str
+    tool_names: tuple[str, ...]
+
+    def changes(self, other: PromptPrefix) -> list[str]:
+        changed = []
+        if self.instructions_hash != other.instructions_hash:
+            changed.append("instructions")
+        if self.tools_hash != other.tools_hash:
+            changed.append("tools")
+        return changed
+
+
+class PromptCacheGuard:
+    """Remembers the prefix of the first session.update and warns when a later
+    update would change it, since everything after a changed byte is billed
+    as uncached input again."""
+
+    def __init__(self) -> None:
+        self._prefix: PromptPrefix | None = None
+
+    @property
+    def prefix(self) -> PromptPrefix | None:
+        return self._prefix
+
+    def observe(
+        self,
+        *,
+        tools: list[FunctionTool],
+        tools_json: str | None = None,
+        instructions: str | None = None,
+    ) -> list[str]:
+        """`instructions=None` is a tools-only update; `tools_json` skips
+        serializing the tools again when the caller already has them. Returns
+        the parts that changed against the previous update."""
+        previous = self._prefix
+        if instructions is not None:
+            instructions_hash = _digest(instructions)
+        elif previous is not None:
+            instructions_hash = previous.instructions_hash
+        else:
+            instructions_hash = _digest("")
+
+        self._prefix = PromptPrefix(
+            instructions_hash=instructions_hash,
+            tools_hash=_digest(
+                tools_json
+                if tools_json is not None
+                else json.dumps([tool.model_dump(exclude_none=True) for tool in tools])
+            ),
+            tool_names=tuple(tool.name for tool in tools),
+        )
+        if previous is None:
+            return []
+
+        changed = previous.changes(self._prefix)
+        if changed:
+            logger.warning(
+                "Session update invalidates the cached prompt prefix [changed=%s, "
+                "added_tools=%s, removed_tools=%s]",
+                ", ".join(changed),
+                sorted(set(self._prefix.tool_names) - set(previous.tool_names)),
+                sorted(set(previous.tool_names) - set(self._prefix.tool_names)),
+            )
+        return changed
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
@@ -0,0 +1,27 @@
+from collections.abc import Iterator
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class ReconnectPolicy(BaseModel):
+    """How a dropped realtime connection is re-established. Frozen because the
+    websocket reads it for the whole lifetime of a session."""
+
+    model_config = ConfigDict(frozen=True)
+
+    max_attempts: int = Field(default=5, ge=1)
+    initial_delay_seconds: float = Field(default=0.5, ge=0)
+    max_delay_seconds: float = Field(default=8.0, ge=0)
+    backoff_factor: float = Field(default=2.0, ge=1)
+    # mic chunks arriving while offline; the oldest are dropped once full so a
+    # long outage cannot grow memory without bound
+    max_buffered_audio_chunks: int = Field(default=250, ge=0)
+    # only the tail of the conversation is replayed so a reconnect late in a
+    # long call stays fast
+    replay_turns: int = Field(default=20, ge=0)
+
+    def delays(self) -> Iterator[float]:
+        delay = self.initial_delay_seconds
+        for _ in range(self.max_attempts):
+            yield min(delay, self.max_delay_seconds)
+            delay *= self.backoff_factor
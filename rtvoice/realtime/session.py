@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from contextlib import suppress
+from decimal import Decimal
 from pathlib import Path
 from typing import TYPE_CHECKING, assert_never
 
@@ -10,28 +12,44 @@ from transitbus import EventBus
 
 from rtvoice.agent.views import InjectedConversation, InjectedMessage
 from rtvoice.audio import AudioSession
+from rtvoice.conversation import (
+    AssistantTurn,
+    ConversationHistory,
+    ConversationTurn,
+    ToolTurn,
+    UserTurn,
+)
 from rtvoice.events.views import (
     AgentSessionConnectedEvent,
     AgentStoppedEvent,
     InterruptAssistantCommand,
     UpdateSpeechSpeedCommand,
+    UpdateToolChoiceCommand,
 )
 from rtvoice.handler import (
     AudioBridge,
     BargeInCoordinator,
+    ContextEngineRunner,
     ConversationAudioRecorder,
     ConversationInactivityMonitor,
     SpeechActivityEventAdapter,
+    ToolAvailabilityMonitor,
     ToolCallExecutor,
+    ToolRetrievalRunner,
     TranscriptEventAdapter,
     TranscriptLogger,
 )
 from rtvoice.realtime.port import RealtimeProvider
+from rtvoice.realtime.prompt_cache import PromptCacheGuard, canonical_tools
+from rtvoice.realtime.reconnect import ReconnectPolicy
 from rtvoice.realtime.schemas import (
     ConversationItemCreateEvent,
     ConversationResponseCreateEvent,
+    FunctionTool,
     SessionUpdateEvent,
     SpeedUpdateEvent,
+    ToolChoiceUpdateEvent,
+    ToolsUpdateEvent,
 )
 from rtvoice.realtime.session_settings import (
     RealtimeSessionSettings,
@@ -39,13 +57,16 @@ from rtvoice.realtime.session_settings import (
 )
 from rtvoice.realtime.websocket import RealtimeWebSocket
 from rtvoice.shared.decorators import timed
+from rtvoice.tokens.aggregation import UsageAggregator
 from rtvoice.tokens.models import UsageReport
 from rtvoice.tokens.pricing import PricingCatalog
 from rtvoice.tokens.tracker import TokenTracker
 from rtvoice.watchdogs import ErrorWatchdog
 
 if TYPE_CHECKING:
+    from rtvoice.context import ContextEngine
     from rtvoice.tools import Tools
+    from rtvoice.tools.retrieval import ToolRetriever
 
 logger = logging.getLogger(__name__)
 
@@ -63,6 +84,15 @@ class RealtimeSession:
         inactivity_timeout_seconds: float | None = None,
         recording_path: Path | None = None,
         pricing_catalog: PricingCatalog | None = None,
+        conversation_history: ConversationHistory | None = None,
+        reconnect_policy: ReconnectPolicy | None = None,
+        context_engine: ContextEngine | None = None,
+        early_tool_dispatch: bool = False,
+        speak_tool_progress: bool = False,
+        tool_retriever: ToolRetriever | None = None,
+        cost_budget: Decimal | None = None,
+        usage_aggregator: UsageAggregator | None = None,
+        tenant: str = "default",
     ):
         settings.model.warn_if_deprecated(stacklevel=3)
         self._event_bus = event_bus
@@ -72,11 +102,22 @@ class RealtimeSession:
         self._injected_conversation = injected_conversation
         self._inactivity_timeout_seconds = inactivity_timeout_seconds
         self._recording_path = recording_path
+        self._conversation_history = conversation_history
+        self._reconnect_policy = reconnect_policy
+        self._context_engine = context_engine
+        self._early_tool_dispatch = early_tool_dispatch
+        self._speak_tool_progress = speak_tool_progress
+        self._tool_retriever = tool_retriever
 
         # settings are frozen; only the speed is retunable mid-session
         self._speech_speed = settings.speech_speed
 
-        self._websocket = RealtimeWebSocket(model=settings.model, provider=provider)
+        self._websocket = RealtimeWebSocket(
+            model=settings.model,
+            provider=provider,
+            reconnect_policy=reconnect_policy,
+            on_reconnect=self._restore_after_reconnect,
+        )
         self._token_tracker = TokenTracker(
             event_bus=event_bus,
             realtime_model=settings.model.value,
@@ -86,13 +127,22 @@ class RealtimeSession:
                 else None
             ),
             pricing_catalog=pricing_catalog,
+            cost_budget=cost_budget,
+            usage_aggregator=usage_aggregator,
+            tenant=tenant,
         )
+        self._prompt_cache_guard = PromptCacheGuard()
         self._forward_task: asyncio.Task | None = None
         self._stopped = False
+        # what the server holds, so tool updates can skip no-op sends
+        self._sent_tools: list[FunctionTool] = []
+        self._sent_tools_json: str | None = None
+        self._tool_retrieval_runner: ToolRetrievalRunner | None = None
         self._setup_handlers()
 
         self._event_bus.on(AgentStoppedEvent, self._on_agent_stopped)
         self._event_bus.on(UpdateSpeechSpeedCommand, self._on_update_speech_speed)
+        self._event_bus.on(UpdateToolChoiceCommand, self._on_update_tool_choice)
 
     def _setup_handlers(self) -> None:
         self._transcript_logger = TranscriptLogger(event_bus=self._event_bus)
@@ -117,10 +167,18 @@ class RealtimeSession:
                 event_bus=self._event_bus
             )
 
+        self._tool_availability_monitor = ToolAvailabilityMonitor(
+            event_bus=self._event_bus,
+            tools=self._tools,
+            update_tools=self.update_tools,
+        )
+
         self._tool_call_executor = ToolCallExecutor(
             event_bus=self._event_bus,
             tools=self._tools,
             websocket=self._websocket,
+            early_dispatch=self._early_tool_dispatch,
+            speak_progress=self._speak_tool_progress,
         )
 
         self._error_watchdog = ErrorWatchdog(event_bus=self._event_bus)
@@ -134,6 +192,23 @@ class RealtimeSession:
                 timeout_seconds=self._inactivity_timeout_seconds,
             )
 
+        if self._context_engine is not None:
+            self._context_engine_runner = ContextEngineRunner(
+                event_bus=self._event_bus,
+                websocket=self._websocket,
+                context_engine=self._context_engine,
+            )
+
+        if self._tool_retriever is not None:
+            self._tool_retrieval_runner = ToolRetrievalRunner(
+                event_bus=self._event_bus,
+                retriever=self._tool_retriever,
+                update_tools=self.update_tools,
+                create_response=(
+                    None if self._settings.auto_response else self._create_response
+                ),
+            )
+
         if self._recording_path:
             self._conversation_audio_recorder = ConversationAudioRecorder(
                 event_bus=self._event_bus,
@@ -152,6 +227,15 @@ class RealtimeSession:
     def usage_report(self) -> UsageReport:
         return self._token_tracker.report()
 
+    @property
+    def cost(self) -> Decimal:
+        return self._token_tracker.cost
+
+    def inject_conversation(self, conversation: InjectedConversation) -> None:
+        """Replaces the conversation sent once connected; takes effect only
+        before `start`."""
+        self._injected_conversation = conversation
+
     @timed()
     async def start(self) -> None:
         logger.info("Starting realtime session")
@@ -171,28 +255,100 @@ class RealtimeSession:
         if not self._injected_conversation:
             return
 
+        conversation = self._injected_conversation
+        started_at = time.perf_counter()
+        events = _injected_conversation_events(conversation)
+        sent_bytes = await self._websocket.send_many(events)
+        logger.info(
+            "Injected conversation [messages=%d, folded=%d, items=%d, bytes=%d] "
+            "in %.1f ms",
+            len(conversation.messages),
+            len(conversation.folded_messages),
+            len(events),
+            sent_bytes,
+            (time.perf_counter() - started_at) * 1000,
+        )
+
+    async def _restore_after_reconnect(self) -> int:
+        # the server forgot everything with the old connection
+        await self._send_session_update()
+        return await self._replay_conversation()
+
+    async def _replay_conversation(self) -> int:
+        if self._conversation_history is None or self._reconnect_policy is None:
+            return 0
+
+        turns = self._conversation_history.snapshot()
+        window = self._reconnect_policy.replay_turns
+        replayed = turns[-window:] if window else []
+        events = [
+            event
+            for event in (_replay_event(turn) for turn in replayed)
+            if event is not None
+        ]
         logger.info(
-            "Injecting conversation [messages=%d]",
-            len(self._injected_conversation.messages),
+            "Replaying conversation [items=%d, skipped_turns=%d]",
+            len(events),
+            len(turns) - len(events),
         )
-        for message in self._injected_conversation.messages:
-            await self._websocket.send(self._injected_message_event(message))
-
-    def _injected_message_event(
-        self, message: InjectedMessage
-    ) -> ConversationItemCreateEvent:
-        match message.role:
-            case "user":
-                return ConversationItemCreateEvent.user_message(message.text)
-            case "assistant":
-                return ConversationItemCreateEvent.assistant_message(message.text)
-            case _:
-                assert_never(message)
+        for event in events:
+            await self._websocket.send(event)
+        return len(events)
 
     async def _send_session_update(self) -> None:
         logger.info("Applying session settings [%s]", self._settings.summary)
         settings = build_session_payload(self._settings, self._tools.get_schema())
+        tools_json = self._tools.get_schema_json(
+            sort_by_name=self._settings.cache_stable_prefix
+        )
+        self._prompt_cache_guard.observe(
+            instructions=settings.instructions,
+            tools=settings.tools or [],
+            tools_json=tools_json,
+        )
         await self._websocket.send(SessionUpdateEvent(session=settings))
+        self._remember_sent_tools(settings.tools or [], tools_json)
+
+    async def update_tools(self) -> bool:
+        """Sends the currently available tools, e.g. after the tool context
+        changed, unless they match what the server has already. Returns whether
+        an update went out. Logs a warning when it invalidates the cached
+        prompt prefix."""
+        if not self._websocket.is_connected:
+            logger.warning("Cannot update tools - WebSocket not connected")
+            return False
+
+        tools_json = self._tools.get_schema_json(
+            sort_by_name=self._settings.cache_stable_prefix
+        )
+        if tools_json == self._sent_tools_json:
+            logger.debug("Tools unchanged - skipping update")
+            return False
+
+        tools = self._tools.get_schema()
+        if self._settings.cache_stable_prefix:
+            tools = canonical_tools(tools)
+        added, removed, changed = _diff_tools(self._sent_tools, tools)
+        logger.info(
+            "Updating tools [added=%s, removed=%s, changed=%s]", added, removed, changed
+        )
+        self._prompt_cache_guard.observe(tools=tools, tools_json=tools_json)
+        await self._websocket.send(ToolsUpdateEvent.from_tools(tools))
+        self._remember_sent_tools(tools, tools_json)
+        return True
+
+    def _remember_sent_tools(self, tools: list[FunctionTool], tools_json: str) -> None:
+        self._sent_tools = tools
+        self._sent_tools_json = tools_json
+
+    @timed()
+    async def _on_update_tool_choice(self, event: UpdateToolChoiceCommand) -> None:
+        if not self._websocket.is_connected:
+            logger.warning("Cannot update tool choice - WebSocket not connected")
+            return
+
+        logger.info("Updating tool choice [mode=%s]", event.tool_choice)
+        await self._websocket.send(ToolChoiceUpdateEvent.from_mode(event.tool_choice))
 
     @timed()
     async def _on_update_speech_speed(self, event: UpdateSpeechSpeedCommand) -> None:
@@ -217,6 +373,9 @@ class RealtimeSession:
         logger.info(
             "Sending user message [text=%r, image=%s]", text, bool(base64_image)
         )
+        if self._tool_retrieval_runner is not None:
+            # typed text is known up front, so its tools are in place in time
+            await self._tool_retrieval_runner.select(text)
         item = (
             ConversationItemCreateEvent.user_message_with_image(text, base64_image)
             if base64_image
@@ -226,6 +385,9 @@ class RealtimeSession:
         await self._websocket.send(ConversationResponseCreateEvent())
         return True
 
+    async def _create_response(self) -> None:
+        await self._websocket.send(ConversationResponseCreateEvent())
+
     async def send_assistant_message(self, text: str) -> bool:
         if not self._websocket.is_connected:
             logger.warning("Cannot send assistant message - WebSocket not connected")
@@ -253,8 +415,61 @@ class RealtimeSession:
                 await self._forward_task
         self._forward_task = None
 
-        if not self._websocket.is_connected:
+        if not (self._websocket.is_connected or self._websocket.is_reconnecting):
             return
 
         await self._websocket.close()
         logger.info("Realtime session stopped")
+
+
+def _diff_tools(
+    sent: list[FunctionTool], current: list[FunctionTool]
+) -> tuple[list[str], list[str], list[str]]:
+    """Names added, removed and changed since `sent`, for logging; the
+    protocol has no delta update, so the full list goes out either way."""
+    before = {tool.name: tool for tool in sent}
+    after = {tool.name: tool for tool in current}
+    added = [name for name in after if name not in before]
+    removed = [name for name in before if name not in after]
+    changed = [name for name in after if name in before and after[name] != before[name]]
+    return added, removed, changed
+
+
+def _injected_conversation_events(
+    conversation: InjectedConversation,
+) -> list[ConversationItemCreateEvent]:
+    events = [
+        _injected_message_event(message) for message in conversation.recent_messages
+    ]
+    summary = conversation.summary_text()
+    if summary is None:
+        return events
+    return [ConversationItemCreateEvent.conversation_summary(summary), *events]
+
+
+def _injected_message_event(message: InjectedMessage) -> ConversationItemCreateEvent:
+    match message.role:
+        case "user":
+            return ConversationItemCreateEvent.user_message(message.text)
+        case "assistant":
+            return ConversationItemCreateEvent.assistant_message(message.text)
+        case _:
+            assert_never(message)
+
+
+def _replay_event(turn: ConversationTurn) -> ConversationItemCreateEvent | None:
+    match turn:
+        case UserTurn(transcript=transcript):
+            return ConversationItemCreateEvent.user_message(transcript)
+        case AssistantTurn():
+            # replay only what the user heard, as the truncated item did
+            heard = turn.heard_transcript
+            if not heard:
+                return None
+            return ConversationItemCreateEvent.assistant_message(heard)
+        case ToolTurn():
+            # the original call ids died with the connection, so results are
+            # replayed as plain context
+            return ConversationItemCreateEvent.system_inject(turn.format())
+        case _:
+            assert_never(turn)
@@ -15,6 +15,7 @@ from rtvoice.agent.views import (
     TranscriptionModel,
     TurnDetection,
 )
+from rtvoice.realtime.prompt_cache import canonical_instructions, canonical_tools
 from rtvoice.realtime.schemas import (
     AudioInputSettings,
     AudioOutputSettings,
@@ -47,6 +48,12 @@ class RealtimeSessionSettings(BaseModel):
     output_modalities: tuple[OutputModality, ...] = ("audio",)
     noise_reduction: NoiseReduction = NoiseReduction.FAR_FIELD
     turn_detection: TurnDetection = Field(default_factory=SemanticVAD)
+    # whether turn detection starts a response on its own; off, the response
+    # to a spoken turn has to be created explicitly
+    auto_response: bool = True
+    # canonical instructions and name-ordered tools, so equal sessions send
+    # byte-identical prefixes the provider can serve from its prompt cache
+    cache_stable_prefix: bool = False
 
     @field_validator("output_modalities", mode="after")
     @classmethod
@@ -77,16 +84,23 @@ class RealtimeSessionSettings(BaseModel):
 def build_session_payload(
     settings: RealtimeSessionSettings, tools: list[FunctionTool]
 ) -> RealtimeSessionPayload:
+    instructions = settings.instructions
+    if settings.cache_stable_prefix:
+        instructions = canonical_instructions(instructions)
+        tools = canonical_tools(tools)
+
     return RealtimeSessionPayload(
         model=settings.model,
         reasoning=_reasoning(settings.reasoning_effort),
-        instructions=settings.instructions,
+        instructions=instructions,
         output_modalities=list(settings.output_modalities),
         tool_choice=ToolChoiceMode.AUTO,
         tools=tools,
         audio=AudioSettings(
             input=AudioInputSettings(
-                turn_detection=_turn_detection(settings.turn_detection),
+                turn_detection=_turn_detection(
+                    settings.turn_detection, settings.auto_response
+                ),
                 noise_reduction=InputAudioNoiseReductionSettings(
                     type=settings.noise_reduction
                 ),
@@ -109,10 +123,14 @@ def _transcription(
     return None if model is None else InputAudioTranscriptionSettings(model=model)
 
 
-def _turn_detection(turn_detection: TurnDetection) -> TurnDetectionSettings:
+def _turn_detection(
+    turn_detection: TurnDetection, auto_response: bool
+) -> TurnDetectionSettings:
     match turn_detection:
         case SemanticVAD(eagerness=eagerness):
-            return SemanticVADSettings(eagerness=eagerness)
+            return SemanticVADSettings(
+                eagerness=eagerness, create_response=auto_response
+            )
         case ServerVAD(
             threshold=threshold,
             prefix_padding_ms=prefix_padding_ms,
@@ -122,6 +140,7 @@ def _turn_detection(turn_detection: TurnDetection) -> TurnDetectionSettings:
                 threshold=threshold,
                 prefix_padding_ms=prefix_padding_ms,
                 silence_duration_ms=silence_duration_ms,
+                create_response=auto_response,
             )
         case _:
             assert_never(turn_detection)
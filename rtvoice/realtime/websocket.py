@@ -1,7 +1,9 @@
 import asyncio
 import json
 import logging
-from collections.abc import AsyncGenerator
+import time
+from collections import deque
+from collections.abc import AsyncGenerator, Awaitable, Callable, Sequence
 from contextlib import suppress
 
 from pydantic import BaseModel, ValidationError
@@ -10,42 +12,59 @@ from websockets.asyncio.client import ClientConnection, connect
 from websockets.exceptions import ConnectionClosed
 
 from rtvoice.agent.views import RealtimeModel
+from rtvoice.events.views import RealtimeReconnectedEvent
 from rtvoice.realtime.port import RealtimeProvider
-from rtvoice.realtime.schemas import ServerEventAdapter
+from rtvoice.realtime.reconnect import ReconnectPolicy
+from rtvoice.realtime.schemas import InputAudioBufferAppendEvent, ServerEventAdapter
 
 logger = logging.getLogger(__name__)
 
+# Restores session state on a fresh connection; returns how many conversation
+# items it replayed.
+type ReconnectHandler = Callable[[], Awaitable[int]]
+
 
 class RealtimeWebSocket:
     def __init__(
         self,
         model: RealtimeModel,
         provider: RealtimeProvider,
+        *,
+        reconnect_policy: ReconnectPolicy | None = None,
+        on_reconnect: ReconnectHandler | None = None,
     ):
         self._model = model
         self._provider = provider
+        self._reconnect_policy = reconnect_policy
+        self._on_reconnect = on_reconnect
 
         self._ws: ClientConnection | None = None
         self._receive_task: asyncio.Task | None = None
         self._is_connected: bool = False
+        self._is_reconnecting: bool = False
+        self._closing: bool = False
         self._event_queue: asyncio.Queue = asyncio.Queue()
+        self._audio_buffer: deque[str] = deque(
+            maxlen=reconnect_policy.max_buffered_audio_chunks if reconnect_policy else 0
+        )
+        self._dropped_audio_chunks = 0
 
     @property
     def is_connected(self) -> bool:
         return self._is_connected
 
+    @property
+    def is_reconnecting(self) -> bool:
+        return self._is_reconnecting
+
     async def connect(self) -> None:
         if self._ws:
             logger.debug("Closing existing connection")
             await self.close()
 
-        url = self._provider.build_url(self._model.value)
-        headers = self._provider.build_headers()
-
-        logger.info("Connecting to %s...", url)
-
+        self._closing = False
         try:
-            self._ws = await connect(url, additional_headers=headers)
+            self._ws = await self._open()
             self._is_connected = True
             logger.info("Connected successfully")
             self._receive_task = asyncio.create_task(self._receive_loop())
@@ -55,30 +74,62 @@ class RealtimeWebSocket:
             logger.error("Connection failed: %s", e)
             raise
 
+    async def _open(self) -> ClientConnection:
+        url = self._provider.build_url(self._model.value)
+        headers = self._provider.build_headers()
+
+        logger.info("Connecting to %s...", url)
+        return await connect(url, additional_headers=headers)
+
     async def send(self, message: BaseModel) -> None:
+        if self._is_reconnecting and isinstance(message, InputAudioBufferAppendEvent):
+            self._buffer_audio(message)
+            return
+
         if not self.is_connected:
+            if self._is_reconnecting:
+                logger.warning("Dropping %s while reconnecting", type(message).__name__)
+                return
             raise RuntimeError("Not connected. Call connect() first.")
 
-        exclude = (
-            {"id", "parent_id", "created_at", "path"}
-            if isinstance(message, Event)
-            else None
-        )
-        payload = message.model_dump(exclude=exclude, exclude_none=True)
-        await self._ws.send(json.dumps(payload))
+        await self._ws.send(_serialize(message))
 
-    async def close(self) -> None:
-        if not self._ws:
+    async def send_many(self, messages: Sequence[BaseModel]) -> int:
+        """Serializes every message before the first write, so the burst goes
+        out back to back instead of interleaving model dumps with socket writes.
+        Returns the number of bytes written."""
+        if not self.is_connected:
+            raise RuntimeError("Not connected. Call connect() first.")
+
+        payloads = [_serialize(message) for message in messages]
+        for payload in payloads:
+            await self._ws.send(payload)
+        return sum(len(payload.encode()) for payload in payloads)
+
+    def _buffer_audio(self, message: InputAudioBufferAppendEvent) -> None:
+        if self._audio_buffer.maxlen == 0:
+            self._dropped_audio_chunks += 1
             return
+        if len(self._audio_buffer) == self._audio_buffer.maxlen:
+            self._dropped_audio_chunks += 1
+        self._audio_buffer.append(_serialize(message))
 
-        logger.info("Closing connection...")
+    async def close(self) -> None:
+        # also stops a reconnect that is backing off or restoring, which may
+        # have no live socket yet
+        self._closing = True
         self._is_connected = False
 
         if self._receive_task and not self._receive_task.done():
             self._receive_task.cancel()
             with suppress(asyncio.CancelledError):
                 await self._receive_task
+        self._audio_buffer.clear()
+
+        if not self._ws:
+            return
 
+        logger.info("Closing connection...")
         await self._ws.close()
         self._ws = None
         logger.info("Connection closed")
@@ -92,18 +143,106 @@ class RealtimeWebSocket:
 
     async def _receive_loop(self) -> None:
         try:
-            async for message in self._ws:
+            while True:
                 try:
-                    data = json.loads(message)
-                    event = ServerEventAdapter.validate_python(data)
-                    self._event_queue.put_nowait(event)
-                except ValidationError:
-                    logger.debug(
-                        "Skipping unknown event type: %s",
-                        data.get("type", "unknown"),
-                    )
-        except ConnectionClosed as e:
-            self._is_connected = False
-            logger.info("Connection closed: %s", e)
+                    await self._receive_messages()
+                except ConnectionClosed as e:
+                    self._is_connected = False
+                    logger.info("Connection closed: %s", e)
+
+                if self._reconnect_policy is None or self._closing:
+                    return
+                if not await self._reconnect(self._reconnect_policy):
+                    return
         finally:
             self._event_queue.put_nowait(None)
+
+    async def _receive_messages(self) -> None:
+        async for message in self._ws:
+            try:
+                data = json.loads(message)
+                event = ServerEventAdapter.validate_python(data)
+                self._event_queue.put_nowait(event)
+            except ValidationError:
+                logger.debug(
+                    "Skipping unknown event type: %s",
+                    data.get("type", "unknown"),
+                )
+
+    async def _reconnect(self, policy: ReconnectPolicy) -> bool:
+        self._is_connected = False
+        self._is_reconnecting = True
+        self._dropped_audio_chunks = 0
+        lost_at = time.monotonic()
+
+        try:
+            for attempt, delay in enumerate(policy.delays(), start=1):
+                await asyncio.sleep(delay)
+                try:
+                    self._ws = await self._open()
+                except Exception as e:
+                    logger.warning(
+                        "Reconnect attempt %d/%d failed: %s",
+                        attempt,
+                        policy.max_attempts,
+                        e,
+                    )
+                    continue
+
+                # connected but still reconnecting: session state is replayed
+                # first, mic audio keeps buffering until the replay is on the wire
+                self._is_connected = True
+                try:
+                    replayed_items = (
+                        await self._on_reconnect() if self._on_reconnect else 0
+                    )
+                    flushed_audio_chunks = await self._flush_audio_buffer()
+                except ConnectionClosed as e:
+                    self._is_connected = False
+                    logger.warning("Connection lost again while restoring: %s", e)
+                    continue
+
+                self._report_reconnect(
+                    RealtimeReconnectedEvent(
+                        attempts=attempt,
+                        downtime_seconds=time.monotonic() - lost_at,
+                        replayed_items=replayed_items,
+                        flushed_audio_chunks=flushed_audio_chunks,
+                        dropped_audio_chunks=self._dropped_audio_chunks,
+                    )
+                )
+                return True
+        finally:
+            self._is_reconnecting = False
+
+        logger.error("Giving up after %d reconnect attempts", policy.max_attempts)
+        self._audio_buffer.clear()
+        return False
+
+    async def _flush_audio_buffer(self) -> int:
+        flushed = 0
+        while self._audio_buffer:
+            await self._ws.send(self._audio_buffer.popleft())
+            flushed += 1
+        return flushed
+
+    def _report_reconnect(self, event: RealtimeReconnectedEvent) -> None:
+        logger.info(
+            "Reconnected after %.2fs [attempts=%d, replayed_items=%d, "
+            "flushed_audio_chunks=%d, dropped_audio_chunks=%d]",
+            event.downtime_seconds,
+            event.attempts,
+            event.replayed_items,
+            event.flushed_audio_chunks,
+            event.dropped_audio_chunks,
+        )
+        self._event_queue.put_nowait(event)
+
+
+def _serialize(message: BaseModel) -> str:
+    exclude = (
+        {"id", "parent_id", "created_at", "path"}
+        if isinstance(message, Event)
+        else None
+    )
+    return json.dumps(message.model_dump(exclude=exclude, exclude_none=True))
@@ -0,0 +1,47 @@
+import asyncio
+import contextlib
+
+
+class LoopLagMonitor:
+    """Measures how late the event loop wakes a sleeping task. With many
+    sessions on one loop, lag is what callers hear: audio chunks are 20-40 ms,
+    so a loop that is regularly late by that much stutters."""
+
+    def __init__(self, interval_seconds: float = 0.1) -> None:
+        if interval_seconds <= 0:
+            raise ValueError("interval_seconds must be positive")
+        self._interval_seconds = interval_seconds
+        self._latest = 0.0
+        self._max = 0.0
+        self._task: asyncio.Task | None = None
+
+    @property
+    def latest_seconds(self) -> float:
+        return self._latest
+
+    @property
+    def max_seconds(self) -> float:
+        """Worst lag since the monitor started or was last reset."""
+        return self._max
+
+    def reset(self) -> None:
+        self._max = self._latest
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def close(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            due = loop.time() + self._interval_seconds
+            await asyncio.sleep(self._interval_seconds)
+            self._latest = max(0.0, loop.time() - due)
+            self._max = max(self._max, self._latest)
@@ -0,0 +1,118 @@
+import json
+from typing import Any
+
+_WHITESPACE = " \t\r\n"
+
+
+class PartialJSONObject:
+    """Incrementally parses a JSON object streamed in chunks and exposes each
+    top-level member as soon as its value is complete. Numbers, booleans and
+    null only count as complete once the following `,` or `}` arrived, since
+    `1` may still become `12`."""
+
+    def __init__(self) -> None:
+        self._text = ""
+        self._position = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._expecting_value = False
+        self._key_start: int | None = None
+        self._key_end: int | None = None
+        self._value_start: int | None = None
+        self._value_done = False
+        self._closed = False
+        self._members: dict[str, Any] = {}
+
+    @property
+    def members(self) -> dict[str, Any]:
+        return dict(self._members)
+
+    @property
+    def is_closed(self) -> bool:
+        return self._closed
+
+    def feed(self, chunk: str) -> None:
+        self._text += chunk
+        text = self._text
+        for index in range(self._position, len(text)):
+            self._step(text[index], index)
+        self._position = len(text)
+
+    def _step(self, char: str, index: int) -> None:
+        if self._closed:
+            return
+
+        if self._in_string:
+            if self._escaped:
+                self._escaped = False
+            elif char == "\\":
+                self._escaped = True
+            elif char == '"':
+                self._in_string = False
+                self._close_string(index)
+            return
+
+        if char == '"':
+            self._in_string = True
+            if self._depth == 1 and not self._expecting_value:
+                self._key_start = index
+            elif self._depth == 1 and self._value_start is None:
+                self._value_start = index
+            return
+
+        if char in "{[":
+            if self._depth == 1 and self._expecting_value and self._value_start is None:
+                self._value_start = index
+            self._depth += 1
+            return
+
+        if char in "}]":
+            self._depth -= 1
+            if self._depth == 1 and self._value_start is not None:
+                self._emit(index + 1)
+            elif self._depth == 0:
+                self._emit(index)
+                self._closed = True
+            return
+
+        if self._depth != 1:
+            return
+        if char == ":":
+            self._expecting_value = True
+            self._value_start = None
+            self._value_done = False
+        elif char == ",":
+            self._emit(index)
+            self._expecting_value = False
+        elif (
+            char not in _WHITESPACE
+            and self._expecting_value
+            and self._value_start is None
+        ):
+            self._value_start = index
+
+    def _close_string(self, index: int) -> None:
+        if self._depth != 1:
+            return
+        if not self._expecting_value:
+            self._key_end = index + 1
+        elif self._value_start is not None:
+            self._emit(index + 1)
+
+    def _emit(self, value_end: int) -> None:
+        if (
+            self._value_done
+            or not self._expecting_value
+            or self._value_start is None
+            or self._key_start is None
+            or self._key_end is None
+        ):
+            return
+        self._value_done = True
+        try:
+            key = json.loads(self._text[self._key_start : self._key_end])
+            value = json.loads(self._text[self._value_start : value_end])
+        except json.JSONDecodeError:
+            return
+        self._members[key] = value
@@ -0,0 +1,32 @@
+from collections import deque
+from collections.abc import Hashable
+
+
+class RecentKeys[K: Hashable]:
+    """Remembers the last `capacity` keys seen. Deduplicates redelivered
+    events without growing for the life of a long session: a key older than
+    the window is forgotten, which only matters if it is delivered again
+    after `capacity` newer ones."""
+
+    def __init__(self, capacity: int = 1024) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self._order: deque[K] = deque()
+        self._keys: set[K] = set()
+        self._capacity = capacity
+
+    def add(self, key: K) -> bool:
+        """Records `key`; returns False if it is already in the window."""
+        if key in self._keys:
+            return False
+        self._keys.add(key)
+        self._order.append(key)
+        if len(self._order) > self._capacity:
+            self._keys.discard(self._order.popleft())
+        return True
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys
+
+    def __len__(self) -> int:
+        return len(self._keys)
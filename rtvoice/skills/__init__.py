@@ -1,7 +1,16 @@
 from .collection import Skills
-from .models import Skill
+from .discovery import SkillDiscoveryStats
+from .index import SkillIndex
+from .models import Skill, SkillSummary
+from .output import OutputLimits
+from .workers import PythonWorkerPool
 
 __all__ = [
+    "OutputLimits",
+    "PythonWorkerPool",
     "Skill",
+    "SkillDiscoveryStats",
+    "SkillIndex",
+    "SkillSummary",
     "Skills",
 ]
@@ -0,0 +1,156 @@
+"""Warm interpreter for `PythonWorkerPool`, started as a script so it imports
+nothing but the standard library.
+
+Requests and responses are JSON lines on the original stdin and stdout. Both
+descriptors are moved away before any skill runs, and the standard streams are
+pointed at /dev/null, so output from a script's own child processes cannot
+corrupt the protocol. Each script is compiled once per mtime and executed as
+`__main__` on every request; modules it imports stay loaded for the next run.
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import traceback
+
+_MEMORY_ERROR_EXIT = "memory"
+
+
+class _HeadTailText(io.TextIOBase):
+    """Keeps the first and last `limit // 2` bytes of UTF-8 written, like the
+    parent's HeadTailCapture, so a response stays within the parent's line
+    limit whatever the script prints."""
+
+    def __init__(self, limit: int) -> None:
+        self._head_limit = limit // 2
+        self._tail_limit = limit - self._head_limit
+        self._head = bytearray()
+        self._tail = bytearray()
+        self._total = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        data = text.encode("utf-8", errors="replace")
+        self._total += len(data)
+        room = self._head_limit - len(self._head)
+        if room > 0:
+            self._head += data[:room]
+            data = data[room:]
+        if data:
+            self._tail += data
+            # trim lazily so many small writes do not copy the tail each time
+            if len(self._tail) > 2 * self._tail_limit:
+                del self._tail[: -self._tail_limit]
+        return len(text)
+
+    def getvalue(self) -> str:
+        tail = self._tail[-self._tail_limit :]
+        omitted = self._total - len(self._head) - len(tail)
+        if omitted <= 0:
+            return (self._head + tail).decode("utf-8", errors="replace")
+        # a cut can split a multi-byte character; drop the fragments
+        return (
+            self._head.decode("utf-8", errors="ignore")
+            + f"\n[... {omitted} bytes omitted ...]\n"
+            + tail.decode("utf-8", errors="ignore")
+        )
+
+
+def _detach_protocol() -> tuple[io.TextIOWrapper, io.TextIOWrapper]:
+    requests = os.fdopen(os.dup(0), "r", encoding="utf-8")
+    responses = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    devnull = os.open(os.devnull, os.O_RDWR)
+    os.dup2(devnull, 0)
+    os.dup2(devnull, 1)
+    os.close(devnull)
+    return requests, responses
+
+
+def _limit_memory(max_memory_bytes: int | None) -> None:
+    if max_memory_bytes is None:
+        return
+    try:
+        import resource
+    except ImportError:  # pragma: no cover - not available on Windows
+        return
+    resource.setrlimit(resource.RLIMIT_AS, (max_memory_bytes, max_memory_bytes))
+
+
+_compiled: dict[str, tuple[int, object]] = {}
+
+
+def _code(script: str) -> object:
+    mtime_ns = os.stat(script).st_mtime_ns
+    cached = _compiled.get(script)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    with open(script, "rb") as file:
+        code = compile(file.read(), script, "exec")
+    _compiled[script] = (mtime_ns, code)
+    return code
+
+
+def _run(request: dict, limit: int) -> dict:
+    script, args, cwd = request["script"], request["args"], request["cwd"]
+    stdout, stderr = _HeadTailText(limit), _HeadTailText(limit)
+    saved_argv, saved_path, saved_cwd = sys.argv, list(sys.path), os.getcwd()
+    exit_code = 0
+    failure = None
+    try:
+        os.chdir(cwd)
+        sys.argv = [script, *args]
+        sys.path.insert(0, os.path.dirname(script))
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                exec(_code(script), {"__name__": "__main__", "__file__": script})
+            except SystemExit as exit:
+                if exit.code is None:
+                    exit_code = 0
+                elif isinstance(exit.code, int):
+                    exit_code = exit.code
+                else:
+                    print(exit.code, file=sys.stderr)
+                    exit_code = 1
+            except MemoryError:
+                exit_code = 1
+                failure = _MEMORY_ERROR_EXIT
+                print(
+                    "MemoryError: the script exceeded its memory limit.",
+                    file=sys.stderr,
+                )
+            except BaseException:
+                exit_code = 1
+                traceback.print_exc()
+    finally:
+        sys.argv, sys.path[:] = saved_argv, saved_path
+        os.chdir(saved_cwd)
+
+    return {
+        "exit_code": exit_code,
+        "stdout": stdout.getvalue(),
+        "stderr": stderr.getvalue(),
+        "failure": failure,
+    }
+
+
+def main() -> None:
+    max_memory = int(sys.argv[1]) if len(sys.argv) > 1 and sys.argv[1] else None
+    limit = int(sys.argv[2]) if len(sys.argv) > 2 else 64_000
+    requests, responses = _detach_protocol()
+    _limit_memory(max_memory)
+    for line in requests:
+        response = _run(json.loads(line), limit)
+        # raw UTF-8, so the capped streams are not inflated by \u escapes
+        responses.write(json.dumps(response, ensure_ascii=False) + "\n")
+        responses.flush()
+        if response["failure"] == _MEMORY_ERROR_EXIT:
+            # the heap may be fragmented or half-initialised; start fresh
+            return
+
+
+if __name__ == "__main__":
+    main()
@@ -5,22 +5,63 @@ from html import escape
 from pathlib import Path
 from typing import Self
 
-from rtvoice.skills.models import Skill, parse_skill
+from rtvoice.skills.discovery import SkillDiscoveryStats, discover_skills
+from rtvoice.skills.index import SkillIndex
+from rtvoice.skills.models import Skill, SkillSummary
+from rtvoice.skills.output import OutputLimits
 from rtvoice.skills.scripts import run_script
+from rtvoice.skills.workers import PythonWorkerPool
 
 logger = logging.getLogger(__name__)
 
 
 class Skills:
-    def __init__(self, paths: tuple[Path, ...]) -> None:
+    """Skills found under one or more directories. Eagerly, every SKILL.md is
+    parsed up front. With `lazy=True`, discovery reads only the frontmatter
+    and each skill is parsed the first time it is used; a `cache_path` lets
+    later starts skip even that for unchanged skills. With a `worker_pool`,
+    `.py` scripts run in warm interpreters instead of a fresh process.
+    `output_limits` bound what a script run or resource read returns."""
+
+    def __init__(
+        self,
+        paths: tuple[Path, ...],
+        *,
+        index: SkillIndex | None = None,
+        lazy: bool = False,
+        cache_path: Path | None = None,
+        worker_pool: PythonWorkerPool | None = None,
+        output_limits: OutputLimits | None = None,
+    ) -> None:
         if not paths:
             raise ValueError("At least one skills directory is required.")
-        self._skills: dict[str, Skill] = {}
-        self._discover(paths)
+        if cache_path is not None and not lazy:
+            raise ValueError("A skill cache_path requires lazy=True.")
+        self._index = index or SkillIndex()
+        self._worker_pool = worker_pool
+        self._output_limits = output_limits or OutputLimits()
+        self._skills, self._discovery_stats = discover_skills(
+            paths, lazy=lazy, cache_path=cache_path, on_parsed=self._index.add
+        )
 
     @classmethod
-    def from_local_dir(cls, *paths: str | Path) -> Self:
-        return cls(paths=tuple(Path(path) for path in paths))
+    def from_local_dir(
+        cls,
+        *paths: str | Path,
+        revalidate_after_seconds: float = 1.0,
+        lazy: bool = False,
+        cache_path: str | Path | None = None,
+        worker_pool: PythonWorkerPool | None = None,
+        output_limits: OutputLimits | None = None,
+    ) -> Self:
+        return cls(
+            paths=tuple(Path(path) for path in paths),
+            index=SkillIndex(revalidate_after_seconds=revalidate_after_seconds),
+            lazy=lazy,
+            cache_path=Path(cache_path) if cache_path is not None else None,
+            worker_pool=worker_pool,
+            output_limits=output_limits,
+        )
 
     @property
     def size(self) -> int:
@@ -30,20 +71,22 @@ class Skills:
     def directories(self) -> tuple[Path, ...]:
         return tuple(skill.directory for skill in self._skills.values())
 
+    @property
+    def discovery_stats(self) -> SkillDiscoveryStats:
+        return self._discovery_stats
+
     def names(self) -> list[str]:
         return list(self._skills)
 
+    def summaries(self) -> list[SkillSummary]:
+        """Name and description of every skill, without parsing any of them."""
+        return list(self._skills.values())
+
     def __iter__(self) -> Iterator[Skill]:
-        return iter(self._skills.values())
+        return (self._current(name) for name in self._skills)
 
     def get(self, name: str) -> Skill:
-        try:
-            return self._skills[name]
-        except KeyError as exc:
-            available = ", ".join(self.names()) or "none"
-            raise ValueError(
-                f"Skill '{name}' not found. Available skills: {available}."
-            ) from exc
+        return self._current(name)
 
     def load(self, name: str) -> str:
         skill = self._current(name)
@@ -60,20 +103,49 @@ class Skills:
             "</skill_content>"
         )
 
-    def read_resource(self, name: str, path: str) -> str:
+    def read_resource(
+        self, name: str, path: str, offset: int = 0, length: int | None = None
+    ) -> str:
+        """Reads at most one page of the resource, starting at byte `offset`.
+        A page is `length` bytes, capped by the output limits; a file that
+        does not fit ends with a note telling where the next page starts."""
+        if offset < 0:
+            raise ValueError("offset must not be negative.")
+        if length is not None and length < 1:
+            raise ValueError("length must be at least 1.")
+
         skill = self._current(name)
         resource = self._resolve(skill, path)
+        budget = self._output_limits.budget_bytes
+        length = budget if length is None else min(length, budget)
         try:
-            content = resource.read_bytes()
+            size = resource.stat().st_size
+            with resource.open("rb") as file:
+                file.seek(offset)
+                content = file.read(length)
         except OSError as exc:
             raise ValueError(
                 f"Could not read resource '{path}' from skill '{name}': {exc}"
             ) from exc
 
-        try:
-            return content.decode("utf-8")
-        except UnicodeDecodeError:
-            return f"base64: {base64.b64encode(content).decode('ascii')}"
+        start = offset
+        end = offset + len(content)
+        page = _decode_page(content, at_start=start == 0, at_end=end >= size)
+        if page is not None:
+            skipped, text, dropped = page
+            start, end = start + skipped, end - dropped
+            body = text
+        else:
+            # base64 grows by a third; keep the encoded page within the budget
+            content = content[: length * 3 // 4]
+            end = start + len(content)
+            body = f"base64: {base64.b64encode(content).decode('ascii')}"
+
+        if start == 0 and end >= size:
+            return body
+        if end >= size:
+            return f"{body}\n[bytes {start}-{end} of {size}]"
+        return f"{body}\n[bytes {start}-{end} of {size}; read on with offset={end}]"
 
     async def run_script(
         self,
@@ -84,56 +156,39 @@ class Skills:
     ) -> str:
         skill = self._current(name)
         script = self._resolve(skill, path)
-        return await run_script(script, args, cwd=skill.directory, timeout=timeout)
+        if self._worker_pool is not None and script.suffix.lower() == ".py":
+            output = await self._worker_pool.run(
+                script, args, cwd=skill.directory, timeout=timeout
+            )
+            return self._output_limits.clip(output)
+        return await run_script(
+            script,
+            args,
+            cwd=skill.directory,
+            timeout=timeout,
+            max_output_bytes=self._output_limits.budget_bytes,
+        )
 
     def _current(self, name: str) -> Skill:
-        discovered = self.get(name)
-        skill = parse_skill(discovered.location)
+        discovered = self._summary(name)
+        skill = self._index.skill(discovered.location)
         if skill.name != discovered.name:
             raise ValueError(
                 f"Skill at '{discovered.location}' changed its name after discovery."
             )
         return skill
 
-    def _discover(self, paths: tuple[Path, ...]) -> None:
-        for configured_path in paths:
-            root = configured_path.resolve()
-            if not root.exists():
-                raise ValueError(f"Skills directory does not exist: {root}")
-            if not root.is_dir():
-                raise ValueError(f"Skills path must be a directory: {root}")
-
-            for directory in sorted(root.iterdir(), key=lambda item: item.name):
-                skill_file = directory / "SKILL.md"
-                if not directory.is_dir() or not skill_file.is_file():
-                    continue
-                skill = parse_skill(skill_file)
-                previous = self._skills.get(skill.name)
-                if previous is not None:
-                    logger.warning(
-                        "Skill '%s' from %s overrides skill from %s.",
-                        skill.name,
-                        skill.directory,
-                        previous.directory,
-                    )
-                self._skills[skill.name] = skill
+    def _summary(self, name: str) -> SkillSummary:
+        try:
+            return self._skills[name]
+        except KeyError as exc:
+            available = ", ".join(self.names()) or "none"
+            raise ValueError(
+                f"Skill '{name}' not found. Available skills: {available}."
+            ) from exc
 
     def _resource_paths(self, skill: Skill) -> list[str]:
-        resources: list[str] = []
-        for candidate in skill.directory.rglob("*"):
-            if candidate.name == "SKILL.md" or not candidate.is_file():
-                continue
-            try:
-                resolved = candidate.resolve(strict=True)
-            except OSError:
-                continue
-            if _is_relative_to(resolved, skill.directory):
-                resources.append(resolved.relative_to(skill.directory).as_posix())
-            else:
-                logger.warning(
-                    "Skipping skill resource outside base directory: %s", candidate
-                )
-        return sorted(resources)
+        return self._index.resources(skill)
 
     def _resolve(self, skill: Skill, resource_path: str) -> Path:
         candidate = Path(resource_path)
@@ -158,6 +213,33 @@ class Skills:
         return resolved
 
 
+def _decode_page(
+    content: bytes, *, at_start: bool, at_end: bool
+) -> tuple[int, str, int] | None:
+    """Decodes a page of UTF-8 text cut out of a larger file. Returns how many
+    bytes were skipped at the front, the text, and how many bytes were left
+    off the end, or None for binary content."""
+    skipped = 0
+    if not at_start:
+        # a page may start inside a multi-byte character
+        while (
+            skipped < 3 and skipped < len(content) and content[skipped] & 0xC0 == 0x80
+        ):
+            skipped += 1
+    content = content[skipped:]
+    try:
+        return skipped, content.decode("utf-8"), 0
+    except UnicodeDecodeError as exc:
+        # ...and end inside one
+        if (
+            at_end
+            or exc.start < len(content) - 3
+            or exc.reason != "unexpected end of data"
+        ):
+            return None
+        return skipped, content[: exc.start].decode("utf-8"), len(content) - exc.start
+
+
 def _is_relative_to(path: Path, directory: Path) -> bool:
     try:
         path.relative_to(directory.resolve())
@@ -0,0 +1,190 @@
+import json
+import logging
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+from rtvoice.skills.models import Skill, SkillSummary, parse_skill, parse_skill_summary
+
+logger = logging.getLogger(__name__)
+
+_CACHE_VERSION = 1
+
+# (st_mtime_ns, st_size) of a SKILL.md
+type _Signature = tuple[int, int]
+
+
+@dataclass(frozen=True, slots=True)
+class SkillDiscoveryStats:
+    skills: int
+    # skill files read during discovery; the rest came from the cache
+    parsed: int
+    cached: int
+    elapsed_ms: float
+
+
+@dataclass(frozen=True, slots=True)
+class _CachedSkill:
+    summary: SkillSummary
+    signature: _Signature
+
+
+class _DiscoveryCache:
+    """Summaries from the last discovery, stored as JSON. A root whose mtime
+    is unchanged still has the same skill directories, so they are not listed
+    again; a skill whose SKILL.md kept its mtime and size is not read again."""
+
+    def __init__(self, path: Path | None) -> None:
+        self._path = path
+        self._roots: dict[str, dict] = {}
+        self.dirty = False
+        if path is not None:
+            self._roots = self._read(path)
+
+    def skill_directories(self, root: Path, mtime_ns: int) -> list[Path] | None:
+        cached = self._roots.get(str(root))
+        if cached is None or cached["mtime_ns"] != mtime_ns:
+            return None
+        return [Path(directory) for directory in cached["skills"]]
+
+    def skill(self, root: Path, directory: Path) -> _CachedSkill | None:
+        cached = self._roots.get(str(root), {}).get("skills", {}).get(str(directory))
+        if cached is None:
+            return None
+        return _CachedSkill(
+            SkillSummary(cached["name"], cached["description"], directory),
+            (cached["mtime_ns"], cached["size"]),
+        )
+
+    def update(
+        self, root: Path, mtime_ns: int, skills: dict[Path, _CachedSkill]
+    ) -> None:
+        entry = {
+            "mtime_ns": mtime_ns,
+            "skills": {
+                str(directory): {
+                    "name": skill.summary.name,
+                    "description": skill.summary.description,
+                    "mtime_ns": skill.signature[0],
+                    "size": skill.signature[1],
+                }
+                for directory, skill in skills.items()
+            },
+        }
+        if self._roots.get(str(root)) != entry:
+            self._roots[str(root)] = entry
+            self.dirty = True
+
+    def save(self) -> None:
+        if self._path is None or not self.dirty:
+            return
+        payload = {"version": _CACHE_VERSION, "roots": self._roots}
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            temporary = self._path.with_suffix(self._path.suffix + ".tmp")
+            temporary.write_text(json.dumps(payload), encoding="utf-8")
+            temporary.replace(self._path)
+        except OSError as exc:
+            logger.warning("Could not write skill cache %s: %s", self._path, exc)
+
+    @staticmethod
+    def _read(path: Path) -> dict[str, dict]:
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable skill cache %s: %s", path, exc)
+            return {}
+        if not isinstance(payload, dict) or payload.get("version") != _CACHE_VERSION:
+            return {}
+        return payload.get("roots", {})
+
+
+def discover_skills(
+    paths: tuple[Path, ...],
+    *,
+    lazy: bool,
+    cache_path: Path | None,
+    on_parsed: Callable[[Skill], None],
+) -> tuple[dict[str, SkillSummary], SkillDiscoveryStats]:
+    """Finds the skills under every root, later roots overriding earlier ones.
+    Eagerly, every skill is parsed in full and handed to `on_parsed`; lazily,
+    only frontmatter is read, and only for skills the cache does not cover."""
+    started_at = time.perf_counter()
+    cache = _DiscoveryCache(cache_path if lazy else None)
+    summaries: dict[str, SkillSummary] = {}
+    parsed = cached = 0
+
+    for configured_path in paths:
+        root = configured_path.resolve()
+        if not root.exists():
+            raise ValueError(f"Skills directory does not exist: {root}")
+        if not root.is_dir():
+            raise ValueError(f"Skills path must be a directory: {root}")
+
+        root_mtime_ns = root.stat().st_mtime_ns
+        found: dict[Path, _CachedSkill] = {}
+        for directory in _skill_directories(root, cache, root_mtime_ns):
+            location = directory / "SKILL.md"
+            try:
+                stat = location.stat()
+            except OSError:
+                continue
+            signature = (stat.st_mtime_ns, stat.st_size)
+
+            entry = cache.skill(root, directory) if lazy else None
+            if entry is not None and entry.signature == signature:
+                cached += 1
+            elif lazy:
+                entry = _CachedSkill(parse_skill_summary(location), signature)
+                parsed += 1
+            else:
+                skill = parse_skill(location)
+                on_parsed(skill)
+                entry = _CachedSkill(SkillSummary.of(skill), signature)
+                parsed += 1
+            found[directory] = entry
+
+            summary = entry.summary
+            previous = summaries.get(summary.name)
+            if previous is not None:
+                logger.warning(
+                    "Skill '%s' from %s overrides skill from %s.",
+                    summary.name,
+                    summary.directory,
+                    previous.directory,
+                )
+            summaries[summary.name] = summary
+        cache.update(root, root_mtime_ns, found)
+
+    cache.save()
+    stats = SkillDiscoveryStats(
+        skills=len(summaries),
+        parsed=parsed,
+        cached=cached,
+        elapsed_ms=(time.perf_counter() - started_at) * 1000,
+    )
+    logger.info(
+        "Discovered %d skills in %.1f ms [parsed=%d, cached=%d, lazy=%s]",
+        stats.skills,
+        stats.elapsed_ms,
+        stats.parsed,
+        stats.cached,
+        lazy,
+    )
+    return summaries, stats
+
+
+def _skill_directories(
+    root: Path, cache: _DiscoveryCache, root_mtime_ns: int
+) -> Iterator[Path]:
+    cached = cache.skill_directories(root, root_mtime_ns)
+    if cached is not None:
+        yield from cached
+        return
+
+    for directory in sorted(root.iterdir(), key=lambda item: item.name):
+        if directory.is_dir() and (directory / "SKILL.md").is_file():
+            yield directory.resolve()
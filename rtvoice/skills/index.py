@@ -0,0 +1,141 @@
+import logging
+import os
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from rtvoice.skills.models import Skill, parse_skill
+
+logger = logging.getLogger(__name__)
+
+# (st_mtime_ns, st_size); None when the path vanished
+type _Signature = tuple[int, int] | None
+
+
+@dataclass(slots=True)
+class _Entry:
+    skill: Skill
+    signature: _Signature
+    checked_at: float
+    resources: list[str] | None = None
+    # every directory of the skill tree with its mtime when listed
+    directories: dict[str, int] = field(default_factory=dict)
+    resources_checked_at: float = 0.0
+
+
+class SkillIndex:
+    """Parsed skills and their resource listings, kept until the files change.
+    A skill is re-parsed when its SKILL.md changes size or mtime; a listing is
+    rebuilt when a directory in the skill tree changes, which is what adding,
+    removing or renaming a file does. The check itself is a few `stat` calls
+    and runs at most once per `revalidate_after_seconds` per skill, so repeated
+    lookups in between cost a dictionary access."""
+
+    def __init__(
+        self,
+        *,
+        revalidate_after_seconds: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if revalidate_after_seconds < 0:
+            raise ValueError("revalidate_after_seconds must not be negative")
+        self._revalidate_after_seconds = revalidate_after_seconds
+        self._clock = clock
+        self._entries: dict[Path, _Entry] = {}
+
+    def add(self, skill: Skill) -> None:
+        """Records a skill that was just parsed, so the first lookup does not
+        parse it again."""
+        self._entries[skill.location] = _Entry(
+            skill, _signature(skill.location), self._clock()
+        )
+
+    def skill(self, location: Path) -> Skill:
+        entry = self._entries.get(location)
+        now = self._clock()
+        if (
+            entry is not None
+            and now - entry.checked_at < self._revalidate_after_seconds
+        ):
+            return entry.skill
+
+        signature = _signature(location)
+        if entry is not None and signature is not None and signature == entry.signature:
+            entry.checked_at = now
+            return entry.skill
+
+        skill = parse_skill(location)
+        logger.debug("Parsed skill '%s' from %s", skill.name, location)
+        self._entries[location] = _Entry(skill, signature, now)
+        return skill
+
+    def resources(self, skill: Skill) -> list[str]:
+        entry = self._entries.get(skill.location)
+        if entry is None:
+            self.add(skill)
+            entry = self._entries[skill.location]
+
+        now = self._clock()
+        if entry.resources is not None and (
+            now - entry.resources_checked_at < self._revalidate_after_seconds
+            or not _changed(entry.directories)
+        ):
+            entry.resources_checked_at = now
+            return entry.resources
+
+        entry.resources, entry.directories = _scan_resources(skill.directory)
+        entry.resources_checked_at = now
+        return entry.resources
+
+    def invalidate(self, location: Path | None = None) -> None:
+        if location is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(location, None)
+
+
+def _signature(path: Path) -> _Signature:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _changed(directories: dict[str, int]) -> bool:
+    for directory, mtime_ns in directories.items():
+        try:
+            if os.stat(directory).st_mtime_ns != mtime_ns:
+                return True
+        except OSError:
+            return True
+    return False
+
+
+def _scan_resources(root: Path) -> tuple[list[str], dict[str, int]]:
+    resources: list[str] = []
+    directories: dict[str, int] = {}
+    base = root.resolve()
+    for current, _, files in os.walk(root):
+        try:
+            directories[current] = os.stat(current).st_mtime_ns
+        except OSError:
+            continue
+        for file_name in files:
+            if file_name == "SKILL.md":
+                continue
+            candidate = Path(current, file_name)
+            try:
+                resolved = candidate.resolve(strict=True)
+            except OSError:
+                continue
+            if not resolved.is_file():
+                continue
+            if resolved.is_relative_to(base):
+                resources.append(resolved.relative_to(base).as_posix())
+            else:
+                logger.warning(
+                    "Skipping skill resource outside base directory: %s", candidate
+                )
+    return sorted(resources), directories
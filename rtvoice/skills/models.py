@@ -12,6 +12,8 @@ _FRONTMATTER_PATTERN = re.compile(
     re.DOTALL,
 )
 _SKILL_NAME_PATTERN = re.compile(r"^(?!.*--)[a-z0-9]+(?:-[a-z0-9]+)*$")
+_FRONTMATTER_DELIMITER = re.compile(r"---[ \t]*\r?\n?")
+_MAX_FRONTMATTER_BYTES = 16_384
 
 
 @dataclass(frozen=True, slots=True)
@@ -30,6 +32,65 @@ class Skill:
         return self.directory / "SKILL.md"
 
 
+@dataclass(frozen=True, slots=True)
+class SkillSummary:
+    """What discovery needs of a skill: enough for the prompt catalog and to
+    find the full skill later."""
+
+    name: str
+    description: str
+    directory: Path
+
+    @property
+    def location(self) -> Path:
+        return self.directory / "SKILL.md"
+
+    @classmethod
+    def of(cls, skill: Skill) -> SkillSummary:
+        return cls(skill.name, skill.description, skill.directory)
+
+
+def parse_skill_summary(
+    path: Path, max_bytes: int = _MAX_FRONTMATTER_BYTES
+) -> SkillSummary:
+    """Reads only the frontmatter, at most `max_bytes` of it; the body is
+    neither read nor validated."""
+    resolved_path = path.resolve()
+    lines: list[str] = []
+    read = 0
+    try:
+        with resolved_path.open("rb") as file:
+            for raw_line in file:
+                read += len(raw_line)
+                line = raw_line.decode("utf-8")
+                if not lines:
+                    if not _FRONTMATTER_DELIMITER.fullmatch(line):
+                        break
+                    lines.append(line)
+                    continue
+                if _FRONTMATTER_DELIMITER.fullmatch(line):
+                    break
+                if read > max_bytes:
+                    raise ValueError(
+                        f"Skill file '{resolved_path}' frontmatter must end within "
+                        f"{max_bytes} bytes."
+                    )
+                lines.append(line)
+            else:
+                lines = []
+    except OSError as exc:
+        raise ValueError(f"Could not read skill file '{resolved_path}': {exc}") from exc
+
+    if not lines:
+        raise ValueError(
+            f"Skill file '{resolved_path}' must start with YAML frontmatter."
+        )
+
+    frontmatter = _load_frontmatter("".join(lines[1:]), resolved_path)
+    name, description = _name_and_description(frontmatter, resolved_path)
+    return SkillSummary(name, description, resolved_path.parent)
+
+
 def parse_skill(path: Path) -> Skill:
     resolved_path = path.resolve()
     try:
@@ -43,32 +104,10 @@ def parse_skill(path: Path) -> Skill:
             f"Skill file '{resolved_path}' must start with YAML frontmatter."
         )
 
-    try:
-        frontmatter = yaml.safe_load(match.group(1))
-    except yaml.YAMLError as exc:
-        raise ValueError(
-            f"Skill file '{resolved_path}' has invalid YAML frontmatter: {exc}"
-        ) from exc
-
-    if not isinstance(frontmatter, dict):
-        raise ValueError(f"Skill file '{resolved_path}' frontmatter must be a mapping.")
-
-    name = _required_string(frontmatter, "name", resolved_path)
-    description = _required_string(frontmatter, "description", resolved_path)
+    frontmatter = _load_frontmatter(match.group(1), resolved_path)
+    name, description = _name_and_description(frontmatter, resolved_path)
     instructions = match.group(2).strip()
 
-    if not _SKILL_NAME_PATTERN.fullmatch(name) or len(name) > 64:
-        raise ValueError(
-            f"Skill name '{name}' must be 1-64 lowercase letters, numbers, or "
-            "hyphens, without leading, trailing, or consecutive hyphens."
-        )
-    if name != resolved_path.parent.name:
-        raise ValueError(
-            f"Skill name '{name}' must match its parent directory "
-            f"'{resolved_path.parent.name}'."
-        )
-    if len(description) > 1024:
-        raise ValueError(f"Skill '{name}' description must be at most 1024 characters.")
     if not instructions:
         raise ValueError(f"Skill '{name}' must contain Markdown instructions.")
 
@@ -94,6 +133,37 @@ def parse_skill(path: Path) -> Skill:
     )
 
 
+def _load_frontmatter(source: str, path: Path) -> dict[str, Any]:
+    try:
+        frontmatter = yaml.safe_load(source)
+    except yaml.YAMLError as exc:
+        raise ValueError(
+            f"Skill file '{path}' has invalid YAML frontmatter: {exc}"
+        ) from exc
+
+    if not isinstance(frontmatter, dict):
+        raise ValueError(f"Skill file '{path}' frontmatter must be a mapping.")
+    return frontmatter
+
+
+def _name_and_description(frontmatter: dict[str, Any], path: Path) -> tuple[str, str]:
+    name = _required_string(frontmatter, "name", path)
+    description = _required_string(frontmatter, "description", path)
+
+    if not _SKILL_NAME_PATTERN.fullmatch(name) or len(name) > 64:
+        raise ValueError(
+            f"Skill name '{name}' must be 1-64 lowercase letters, numbers, or "
+            "hyphens, without leading, trailing, or consecutive hyphens."
+        )
+    if name != path.parent.name:
+        raise ValueError(
+            f"Skill name '{name}' must match its parent directory '{path.parent.name}'."
+        )
+    if len(description) > 1024:
+        raise ValueError(f"Skill '{name}' description must be at most 1024 characters.")
+    return name, description
+
+
 def _required_string(frontmatter: dict[str, Any], key: str, path: Path) -> str:
     value = frontmatter.get(key)
     if not isinstance(value, str) or not value.strip():
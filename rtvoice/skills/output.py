@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+# rough average; budgets only need an estimate
+_CHARS_PER_TOKEN = 4
+_OMISSION_MARKER = "\n[... {omitted} bytes omitted ...]\n"
+
+
+@dataclass(frozen=True, slots=True)
+class OutputLimits:
+    """Caps what one script run or resource page adds to the model context.
+    The tighter of `max_bytes` and `max_tokens` wins; script output beyond it
+    keeps its beginning and end, resources are paged."""
+
+    max_bytes: int = 32_000
+    max_tokens: int | None = 4_000
+
+    def __post_init__(self) -> None:
+        if self.max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        if self.max_tokens is not None and self.max_tokens < 1:
+            raise ValueError("max_tokens must be at least 1")
+
+    @property
+    def budget_bytes(self) -> int:
+        if self.max_tokens is None:
+            return self.max_bytes
+        return min(self.max_bytes, self.max_tokens * _CHARS_PER_TOKEN)
+
+    def clip(self, text: str) -> str:
+        """Keeps the head and tail of `text` within the budget."""
+        data = text.encode("utf-8")
+        if len(data) <= self.budget_bytes:
+            return text
+        capture = HeadTailCapture(self.budget_bytes)
+        capture.feed(data)
+        return capture.text()
+
+
+class HeadTailCapture:
+    """Keeps the first and last `limit // 2` bytes of a stream of any length.
+    The beginning usually says what a script did, the end how it finished;
+    the middle is dropped and replaced by a note saying how much is missing."""
+
+    def __init__(self, limit: int) -> None:
+        if limit < 2:
+            raise ValueError("limit must be at least 2")
+        self._head_limit = limit // 2
+        self._tail_limit = limit - self._head_limit
+        self._head = bytearray()
+        self._tail = bytearray()
+        self._total = 0
+
+    @property
+    def truncated(self) -> bool:
+        return self._total > self._head_limit + self._tail_limit
+
+    def feed(self, chunk: bytes) -> None:
+        self._total += len(chunk)
+        room = self._head_limit - len(self._head)
+        if room > 0:
+            self._head += chunk[:room]
+            chunk = chunk[room:]
+        if not chunk:
+            return
+        self._tail += chunk
+        # trim lazily so a stream of small chunks does not copy on every feed
+        if len(self._tail) > 2 * self._tail_limit:
+            del self._tail[: -self._tail_limit]
+
+    def text(self) -> str:
+        tail = self._tail[-self._tail_limit :]
+        if not self.truncated:
+            return (self._head + tail).decode("utf-8", errors="replace")
+        # a cut can split a multi-byte character; drop the fragments
+        omitted = self._total - len(self._head) - len(tail)
+        return (
+            self._head.decode("utf-8", errors="ignore")
+            + _OMISSION_MARKER.format(omitted=omitted)
+            + tail.decode("utf-8", errors="ignore")
+        )
@@ -3,11 +3,13 @@ from __future__ import annotations
 import asyncio
 import logging
 import shutil
-import subprocess
 import sys
 from collections.abc import Sequence
+from dataclasses import dataclass
 from pathlib import Path
 
+from rtvoice.skills.output import HeadTailCapture
+
 logger = logging.getLogger(__name__)
 
 _INTERPRETERS = {
@@ -16,6 +18,21 @@ _INTERPRETERS = {
     ".bash": lambda: _which("bash"),
 }
 
+DEFAULT_MAX_OUTPUT_BYTES = 64_000
+_READ_CHUNK_BYTES = 16_384
+
+
+@dataclass(frozen=True, slots=True)
+class ScriptResult:
+    exit_code: int
+    stdout: str
+    stderr: str
+
+    def format(self) -> str:
+        if self.exit_code == 0:
+            return self.stdout.strip() or "Success"
+        return f"Error (exit code {self.exit_code}): {self.stderr.strip()}"
+
 
 async def run_script(
     script: Path,
@@ -23,6 +40,7 @@ async def run_script(
     *,
     cwd: Path,
     timeout: int = 60,
+    max_output_bytes: int = DEFAULT_MAX_OUTPUT_BYTES,
 ) -> str:
     try:
         argv = [*_interpreter(script), str(script), *args]
@@ -30,7 +48,49 @@ async def run_script(
         return f"Error: {exc}"
 
     logger.debug("Running skill script %s (timeout=%ss)", script, timeout)
-    return await asyncio.to_thread(_run, argv, cwd, timeout)
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *argv,
+            cwd=cwd,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+    except OSError as exc:
+        return f"Error: {exc}"
+
+    try:
+        async with asyncio.timeout(timeout):
+            stdout, stderr = await asyncio.gather(
+                _read_bounded(process.stdout, max_output_bytes),
+                _read_bounded(process.stderr, max_output_bytes),
+            )
+            exit_code = await process.wait()
+    except TimeoutError:
+        await _kill(process)
+        return f"Error: Script timed out after {timeout} seconds."
+    except asyncio.CancelledError:
+        # the tool call or the agent was stopped; the script must not outlive it
+        await _kill(process)
+        raise
+
+    return ScriptResult(exit_code, stdout, stderr).format()
+
+
+async def _read_bounded(stream: asyncio.StreamReader, limit: int) -> str:
+    """Reads the stream to its end but keeps only its head and tail, so a
+    chatty script cannot fill memory and still does not block on a full
+    pipe."""
+    capture = HeadTailCapture(limit)
+    while chunk := await stream.read(_READ_CHUNK_BYTES):
+        capture.feed(chunk)
+    return capture.text()
+
+
+async def _kill(process: asyncio.subprocess.Process) -> None:
+    if process.returncode is None:
+        process.kill()
+    await process.wait()
 
 
 def _interpreter(script: Path) -> list[str]:
@@ -47,23 +107,3 @@ def _which(executable: str) -> list[str]:
     if path is None:
         raise ValueError(f"'{executable}' is not installed or not on PATH.")
     return [path]
-
-
-def _run(argv: list[str], cwd: Path, timeout: int) -> str:
-    try:
-        result = subprocess.run(
-            argv,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            cwd=cwd,
-            check=False,
-        )
-    except subprocess.TimeoutExpired:
-        return f"Error: Script timed out after {timeout} seconds."
-    except OSError as exc:
-        return f"Error: {exc}"
-
-    if result.returncode == 0:
-        return result.stdout.strip() or "Success"
-    return f"Error (exit code {result.returncode}): {result.stderr.strip()}"
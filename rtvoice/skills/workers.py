@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+
+from rtvoice.skills.scripts import DEFAULT_MAX_OUTPUT_BYTES, ScriptResult
+
+logger = logging.getLogger(__name__)
+
+_WORKER_SCRIPT = Path(__file__).with_name("_worker.py")
+# a response carries two streams of at most max_output_bytes of UTF-8 each;
+# JSON escaping grows a control character to at most six bytes
+_RESPONSE_LIMIT_FACTOR = 16
+
+
+class _Worker:
+    def __init__(self, process: asyncio.subprocess.Process) -> None:
+        self.process = process
+        self.runs = 0
+
+    @property
+    def alive(self) -> bool:
+        return self.process.returncode is None
+
+    async def request(self, payload: dict) -> dict:
+        self.process.stdin.write((json.dumps(payload) + "\n").encode())
+        await self.process.stdin.drain()
+        line = await self.process.stdout.readline()
+        if not line:
+            raise ConnectionError("worker exited during the run")
+        return json.loads(line)
+
+    async def kill(self) -> None:
+        if self.alive:
+            self.process.kill()
+        await self.process.wait()
+
+
+class PythonWorkerPool:
+    """Warm interpreters for `.py` skill scripts. A worker compiles a script
+    once and runs it as `__main__` on request, so a call skips interpreter
+    startup and re-importing the script's dependencies. Scripts share their
+    worker's process across runs: modules they import stay loaded, which is
+    the point, and global state they leave behind is visible to the next run.
+
+    A run that times out kills its worker; `max_memory_mb` caps each worker's
+    address space, and a worker that ran out is replaced. Workers are also
+    recycled after `max_runs_per_worker` runs."""
+
+    def __init__(
+        self,
+        size: int = 2,
+        *,
+        max_memory_mb: int | None = None,
+        max_runs_per_worker: int = 100,
+        max_output_bytes: int = DEFAULT_MAX_OUTPUT_BYTES,
+    ) -> None:
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        if max_memory_mb is not None and max_memory_mb < 1:
+            raise ValueError("max_memory_mb must be at least 1")
+        if max_runs_per_worker < 1:
+            raise ValueError("max_runs_per_worker must be at least 1")
+        self._size = size
+        self._max_memory_mb = max_memory_mb
+        self._max_runs_per_worker = max_runs_per_worker
+        self._max_output_bytes = max_output_bytes
+        self._idle: list[_Worker] = []
+        self._slots = asyncio.Semaphore(size)
+        self._closed = False
+
+    async def run(
+        self,
+        script: Path,
+        args: Sequence[str] = (),
+        *,
+        cwd: Path,
+        timeout: int = 60,
+    ) -> str:
+        if self._closed:
+            raise RuntimeError("PythonWorkerPool is closed")
+
+        async with self._slots:
+            try:
+                worker = await self._checkout()
+            except OSError as exc:
+                return f"Error: {exc}"
+
+            payload = {"script": str(script), "args": list(args), "cwd": str(cwd)}
+            try:
+                async with asyncio.timeout(timeout):
+                    response = await worker.request(payload)
+            except TimeoutError:
+                await worker.kill()
+                return f"Error: Script timed out after {timeout} seconds."
+            except asyncio.CancelledError:
+                # mid-run, so the worker cannot take the next request
+                await worker.kill()
+                raise
+            except (ConnectionError, ValueError) as exc:
+                await worker.kill()
+                logger.warning("Skill worker failed running %s: %s", script, exc)
+                return f"Error: Script worker crashed: {exc}"
+
+            await self._checkin(worker, response)
+
+        return ScriptResult(
+            response["exit_code"], response["stdout"], response["stderr"]
+        ).format()
+
+    async def close(self) -> None:
+        self._closed = True
+        idle, self._idle = self._idle, []
+        await asyncio.gather(*(worker.kill() for worker in idle))
+
+    async def _checkout(self) -> _Worker:
+        while self._idle:
+            worker = self._idle.pop()
+            if worker.alive:
+                return worker
+        return await self._spawn()
+
+    async def _checkin(self, worker: _Worker, response: dict) -> None:
+        worker.runs += 1
+        if (
+            response.get("failure") is not None
+            or worker.runs >= self._max_runs_per_worker
+            or self._closed
+        ):
+            await worker.kill()
+            return
+        self._idle.append(worker)
+
+    async def _spawn(self) -> _Worker:
+        max_memory = (
+            str(self._max_memory_mb * 1024 * 1024) if self._max_memory_mb else ""
+        )
+        process = await asyncio.create_subprocess_exec(
+            sys.executable,
+            str(_WORKER_SCRIPT),
+            max_memory,
+            str(self._max_output_bytes),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            limit=self._max_output_bytes * _RESPONSE_LIMIT_FACTOR,
+        )
+        logger.debug("Started skill worker [pid=%d]", process.pid)
+        return _Worker(process)
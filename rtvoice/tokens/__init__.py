@@ -1,5 +1,14 @@
 from typing import TYPE_CHECKING, Any
 
+from .aggregation import (
+    JSONLUsageSink,
+    PrometheusUsageSink,
+    SQLiteUsageSink,
+    UsageAggregator,
+    UsageBucket,
+    UsageRecord,
+    UsageSink,
+)
 from .models import (
     CostEstimate,
     CostLineItem,
@@ -16,24 +25,37 @@ from .pricing import (
 )
 
 if TYPE_CHECKING:
+    from .cost import CostAccumulator
     from .tracker import TokenTracker
 
 __all__ = [
+    "CostAccumulator",
     "CostEstimate",
     "CostLineItem",
     "Currency",
+    "JSONLUsageSink",
     "PricingCatalog",
+    "PrometheusUsageSink",
     "RealtimeRates",
     "RealtimeTokenTotals",
+    "SQLiteUsageSink",
     "TokenTotals",
     "TokenTracker",
     "TranscriptionRates",
     "TranscriptionTokenTotals",
+    "UsageAggregator",
+    "UsageBucket",
+    "UsageRecord",
     "UsageReport",
+    "UsageSink",
 ]
 
 
 def __getattr__(name: str) -> Any:
+    if name == "CostAccumulator":
+        from .cost import CostAccumulator
+
+        return CostAccumulator
     if name == "TokenTracker":
         from .tracker import TokenTracker
 
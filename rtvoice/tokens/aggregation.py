@@ -0,0 +1,377 @@
+import asyncio
+import contextlib
+import json
+import logging
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from decimal import Decimal
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class UsageRecord:
+    """One priced response or transcription, as a session publishes it."""
+
+    tenant: str
+    model: str
+    # seconds since the epoch
+    at: float
+    input_tokens: int = 0
+    cached_input_tokens: int = 0
+    output_tokens: int = 0
+    cost: Decimal = Decimal(0)
+
+
+@dataclass(frozen=True, slots=True)
+class UsageBucket:
+    """Usage of one tenant and model within one time bucket."""
+
+    tenant: str
+    model: str
+    start: datetime
+    requests: int
+    input_tokens: int
+    cached_input_tokens: int
+    output_tokens: int
+    cost: Decimal
+
+
+type _BucketKey = tuple[str, str, int]
+
+
+class _Counters:
+    __slots__ = (
+        "cached_input_tokens",
+        "cost",
+        "input_tokens",
+        "output_tokens",
+        "requests",
+    )
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.input_tokens = 0
+        self.cached_input_tokens = 0
+        self.output_tokens = 0
+        self.cost = Decimal(0)
+
+    def add(self, record: UsageRecord) -> None:
+        self.requests += 1
+        self.input_tokens += record.input_tokens
+        self.cached_input_tokens += record.cached_input_tokens
+        self.output_tokens += record.output_tokens
+        self.cost += record.cost
+
+    def merge(self, other: "_Counters") -> None:
+        self.requests += other.requests
+        self.input_tokens += other.input_tokens
+        self.cached_input_tokens += other.cached_input_tokens
+        self.output_tokens += other.output_tokens
+        self.cost += other.cost
+
+    def bucket(self, key: _BucketKey) -> UsageBucket:
+        tenant, model, start = key
+        return UsageBucket(
+            tenant=tenant,
+            model=model,
+            start=datetime.fromtimestamp(start, UTC),
+            requests=self.requests,
+            input_tokens=self.input_tokens,
+            cached_input_tokens=self.cached_input_tokens,
+            output_tokens=self.output_tokens,
+            cost=self.cost,
+        )
+
+
+class UsageSink(ABC):
+    """Destination for aggregated usage. Each write carries the usage added
+    to a bucket since the previous successful write, so a sink adds it to
+    what it has. Writes are blocking and run in a worker thread. The sink
+    belongs to the application, which closes it."""
+
+    @abstractmethod
+    def write(self, buckets: Sequence[UsageBucket]) -> None: ...
+
+    def close(self) -> None:  # noqa: B027 - optional hook
+        pass
+
+
+class JSONLUsageSink(UsageSink):
+    """Appends one line per bucket and flush; summing lines with the same
+    tenant, model and start gives the bucket's total."""
+
+    def __init__(self, path: str | Path) -> None:
+        self._path = Path(path)
+        self._lock = threading.Lock()
+
+    def write(self, buckets: Sequence[UsageBucket]) -> None:
+        lines = "".join(
+            json.dumps(
+                {
+                    "tenant": bucket.tenant,
+                    "model": bucket.model,
+                    "start": bucket.start.isoformat(),
+                    "requests": bucket.requests,
+                    "input_tokens": bucket.input_tokens,
+                    "cached_input_tokens": bucket.cached_input_tokens,
+                    "output_tokens": bucket.output_tokens,
+                    "cost": str(bucket.cost),
+                }
+            )
+            + "\n"
+            for bucket in buckets
+        )
+        with self._lock:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            with self._path.open("a", encoding="utf-8") as file:
+                file.write(lines)
+
+
+class SQLiteUsageSink(UsageSink):
+    """Keeps one row per tenant, model and bucket, adding each write to it."""
+
+    def __init__(self, path: str | Path) -> None:
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(Path(path), check_same_thread=False)
+        with self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS usage ("
+                "tenant TEXT NOT NULL, "
+                "model TEXT NOT NULL, "
+                "bucket_start TEXT NOT NULL, "
+                "requests INTEGER NOT NULL, "
+                "input_tokens INTEGER NOT NULL, "
+                "cached_input_tokens INTEGER NOT NULL, "
+                "output_tokens INTEGER NOT NULL, "
+                # text, so summing costs never goes through a float
+                "cost TEXT NOT NULL, "
+                "PRIMARY KEY (tenant, model, bucket_start)"
+                ") WITHOUT ROWID"
+            )
+
+    def write(self, buckets: Sequence[UsageBucket]) -> None:
+        with self._lock, self._connection:
+            for bucket in buckets:
+                key = (bucket.tenant, bucket.model, bucket.start.isoformat())
+                row = self._connection.execute(
+                    "SELECT requests, input_tokens, cached_input_tokens, "
+                    "output_tokens, cost FROM usage "
+                    "WHERE tenant = ? AND model = ? AND bucket_start = ?",
+                    key,
+                ).fetchone()
+                requests, inputs, cached, outputs, cost = row or (0, 0, 0, 0, "0")
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO usage VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        *key,
+                        requests + bucket.requests,
+                        inputs + bucket.input_tokens,
+                        cached + bucket.cached_input_tokens,
+                        outputs + bucket.output_tokens,
+                        str(Decimal(cost) + bucket.cost),
+                    ),
+                )
+
+    def buckets(self, tenant: str | None = None) -> list[UsageBucket]:
+        query = "SELECT * FROM usage"
+        params: tuple[str, ...] = ()
+        if tenant is not None:
+            query += " WHERE tenant = ?"
+            params = (tenant,)
+        with self._lock:
+            rows = self._connection.execute(
+                query + " ORDER BY bucket_start, tenant, model", params
+            ).fetchall()
+        return [
+            UsageBucket(
+                tenant=tenant,
+                model=model,
+                start=datetime.fromisoformat(start),
+                requests=requests,
+                input_tokens=inputs,
+                cached_input_tokens=cached,
+                output_tokens=outputs,
+                cost=Decimal(cost),
+            )
+            for tenant, model, start, requests, inputs, cached, outputs, cost in rows
+        ]
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+class PrometheusUsageSink(UsageSink):
+    """Adds usage to Prometheus counters labelled by tenant and model. The
+    time dimension is Prometheus' own, so the bucket start is not a label."""
+
+    def __init__(self, registry: object | None = None, namespace: str = "rtvoice"):
+        try:
+            from prometheus_client import REGISTRY, Counter
+        except ImportError as exc:
+            raise ImportError(
+                "prometheus-client is required for PrometheusUsageSink. "
+                "Install it with: pip install rtvoice[metrics]"
+            ) from exc
+
+        registry = registry or REGISTRY
+        labels = ("tenant", "model")
+        self._requests = Counter(
+            "requests",
+            "Priced responses and transcriptions.",
+            labels,
+            namespace=namespace,
+            registry=registry,
+        )
+        self._tokens = Counter(
+            "tokens",
+            "Tokens by kind.",
+            (*labels, "kind"),
+            namespace=namespace,
+            registry=registry,
+        )
+        self._cost = Counter(
+            "cost_usd",
+            "Estimated cost in USD.",
+            labels,
+            namespace=namespace,
+            registry=registry,
+        )
+
+    def write(self, buckets: Sequence[UsageBucket]) -> None:
+        for bucket in buckets:
+            labels = (bucket.tenant, bucket.model)
+            self._requests.labels(*labels).inc(bucket.requests)
+            self._tokens.labels(*labels, "input").inc(bucket.input_tokens)
+            self._tokens.labels(*labels, "cached_input").inc(bucket.cached_input_tokens)
+            self._tokens.labels(*labels, "output").inc(bucket.output_tokens)
+            self._cost.labels(*labels).inc(float(bucket.cost))
+
+
+class UsageAggregator:
+    """Process-wide usage roll-up across sessions. Sessions `publish` records
+    to a queue; a deque append is atomic, so publishing takes no lock and
+    never waits, from any thread. Everything else runs on the aggregator's
+    event loop: records are drained into per tenant, model and time bucket
+    counters, and every `flush_interval_seconds` the usage added since the
+    last flush goes to each sink.
+
+    Memory stays bounded: `snapshot` keeps the latest `retention_buckets`
+    buckets only, and a sink's unsent usage is kept per bucket, not per
+    record, until a write succeeds."""
+
+    def __init__(
+        self,
+        sinks: Sequence[UsageSink] = (),
+        *,
+        bucket_seconds: int = 3600,
+        flush_interval_seconds: float = 60.0,
+        retention_buckets: int = 48,
+    ) -> None:
+        if bucket_seconds < 1:
+            raise ValueError("bucket_seconds must be at least 1")
+        if flush_interval_seconds <= 0:
+            raise ValueError("flush_interval_seconds must be positive")
+        if retention_buckets < 1:
+            raise ValueError("retention_buckets must be at least 1")
+        self._sinks = tuple(sinks)
+        self._bucket_seconds = bucket_seconds
+        self._flush_interval_seconds = flush_interval_seconds
+        self._retention_buckets = retention_buckets
+
+        self._queue: deque[UsageRecord] = deque()
+        self._recent: dict[_BucketKey, _Counters] = {}
+        self._unsent: list[dict[_BucketKey, _Counters]] = [{} for _ in self._sinks]
+        self._newest_start = 0
+        self._flush_lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+
+    def publish(self, record: UsageRecord) -> None:
+        self._queue.append(record)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def close(self) -> None:
+        """Stops the periodic flush and writes what is left."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        await self.flush()
+
+    def drain(self) -> int:
+        """Moves queued records into the bucket counters; returns how many."""
+        drained = 0
+        while self._queue:
+            record = self._queue.popleft()
+            start = int(record.at) // self._bucket_seconds * self._bucket_seconds
+            key = (record.tenant, record.model, start)
+            self._recent.setdefault(key, _Counters()).add(record)
+            for unsent in self._unsent:
+                unsent.setdefault(key, _Counters()).add(record)
+            self._newest_start = max(self._newest_start, start)
+            drained += 1
+        if drained:
+            self._evict()
+        return drained
+
+    def snapshot(self, tenant: str | None = None) -> list[UsageBucket]:
+        """Totals of the retained buckets, oldest first."""
+        self.drain()
+        return [
+            counters.bucket(key)
+            for key, counters in sorted(self._recent.items(), key=_bucket_order)
+            if tenant is None or key[0] == tenant
+        ]
+
+    async def flush(self) -> None:
+        async with self._flush_lock:
+            self.drain()
+            for index, sink in enumerate(self._sinks):
+                unsent = self._unsent[index]
+                if not unsent:
+                    continue
+                self._unsent[index] = {}
+                buckets = [
+                    counters.bucket(key)
+                    for key, counters in sorted(unsent.items(), key=_bucket_order)
+                ]
+                try:
+                    await asyncio.to_thread(sink.write, buckets)
+                except Exception:
+                    logger.exception("Usage sink %s failed; retrying later", sink)
+                    self._merge_back(index, unsent)
+
+    def _merge_back(self, index: int, failed: dict[_BucketKey, _Counters]) -> None:
+        # usage drained while the write was in flight landed in the new dict
+        for key, counters in self._unsent[index].items():
+            failed.setdefault(key, _Counters()).merge(counters)
+        self._unsent[index] = failed
+
+    def _evict(self) -> None:
+        oldest = (
+            self._newest_start - (self._retention_buckets - 1) * self._bucket_seconds
+        )
+        for key in [key for key in self._recent if key[2] < oldest]:
+            del self._recent[key]
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._flush_interval_seconds)
+            await self.flush()
+
+
+def _bucket_order(item: tuple[_BucketKey, _Counters]) -> tuple[int, str, str]:
+    tenant, model, start = item[0]
+    return start, tenant, model
@@ -0,0 +1,154 @@
+import functools
+from decimal import Decimal
+
+from rtvoice.realtime.schemas import DurationUsage, TokenUsage
+from rtvoice.tokens.pricing import PricingCatalog, RealtimeRates
+
+_MILLION = Decimal(1_000_000)
+_SECONDS_PER_MINUTE = Decimal(60)
+# whisper reports no duration with token usage; see PricingCatalog.estimate
+_SECONDS_PER_AUDIO_TOKEN = Decimal("0.1")
+
+# (text, cached text, audio, cached audio, image, cached image) input rates,
+# then (text, audio) output rates, all per token; None where nothing is priced
+type _RealtimeRateTuple = tuple[Decimal | None, ...]
+
+
+class CostAccumulator:
+    """Running cost of one session, updated per usage event. Rates are
+    converted to per-token tuples once per model, so an update is a handful
+    of multiplications and reading the total costs nothing; PricingCatalog's
+    itemised estimate stays available through `usage_report`.
+
+    Tokens without a configured rate add nothing and mark the total
+    incomplete, as they do in the estimate."""
+
+    def __init__(
+        self,
+        pricing_catalog: PricingCatalog,
+        *,
+        realtime_model: str,
+        transcription_model: str | None = None,
+    ) -> None:
+        self._realtime_rates = _realtime_rate_tuple(
+            pricing_catalog.realtime_rates(realtime_model)
+        )
+        self._transcription_rates = (
+            pricing_catalog.transcription_rates(transcription_model)
+            if transcription_model is not None
+            else None
+        )
+        self._total = Decimal(0)
+        self._complete = True
+
+    @property
+    def total(self) -> Decimal:
+        return self._total
+
+    @property
+    def is_complete(self) -> bool:
+        return self._complete
+
+    def add_response(self, usage: TokenUsage) -> Decimal:
+        """Adds one response's usage and returns its cost."""
+        counts = _realtime_counts(usage)
+        if self._realtime_rates is None:
+            self._complete = self._complete and not any(counts)
+            return Decimal(0)
+
+        cost = Decimal(0)
+        for tokens, rate in zip(counts, self._realtime_rates, strict=True):
+            if not tokens:
+                continue
+            if rate is None:
+                self._complete = False
+                continue
+            cost += tokens * rate
+        self._total += cost
+        return cost
+
+    def add_transcription(self, usage: TokenUsage | DurationUsage) -> Decimal:
+        """Adds one transcription's usage and returns its cost."""
+        rates = self._transcription_rates
+        if rates is None:
+            self._complete = False
+            return Decimal(0)
+
+        if rates.minute is not None:
+            cost = self._transcription_minutes(usage) * rates.minute
+        elif isinstance(usage, DurationUsage):
+            # token-priced model reporting a duration; nothing to price it by
+            self._complete = False
+            return Decimal(0)
+        elif rates.input_tokens is None or rates.output_tokens is None:
+            self._complete = False
+            return Decimal(0)
+        else:
+            details = usage.input_token_details
+            input_tokens = (
+                (details.text_tokens or 0) + (details.audio_tokens or 0)
+                if details
+                else 0
+            )
+            cost = (
+                input_tokens * rates.input_tokens
+                + (usage.output_tokens or 0) * rates.output_tokens
+            ) / _MILLION
+        self._total += cost
+        return cost
+
+    def _transcription_minutes(self, usage: TokenUsage | DurationUsage) -> Decimal:
+        if isinstance(usage, DurationUsage):
+            return Decimal(str(usage.seconds)) / _SECONDS_PER_MINUTE
+        details = usage.input_token_details
+        audio_tokens = (details.audio_tokens or 0) if details else 0
+        if not audio_tokens:
+            self._complete = False
+        return audio_tokens * _SECONDS_PER_AUDIO_TOKEN / _SECONDS_PER_MINUTE
+
+
+# rates are frozen, so sessions on the same model share one tuple
+@functools.lru_cache(maxsize=64)
+def _realtime_rate_tuple(rates: RealtimeRates | None) -> _RealtimeRateTuple | None:
+    if rates is None:
+        return None
+    return tuple(
+        rate / _MILLION if rate is not None else None
+        for rate in (
+            rates.text_input,
+            rates.text_cached_input,
+            rates.audio_input,
+            rates.audio_cached_input,
+            rates.image_input,
+            rates.image_cached_input,
+            rates.text_output,
+            rates.audio_output,
+        )
+    )
+
+
+def _realtime_counts(usage: TokenUsage) -> tuple[int, ...]:
+    """Token counts in rate tuple order, cached tokens split from the rest."""
+    text = audio = image = cached_text = cached_audio = cached_image = 0
+    if details := usage.input_token_details:
+        text = details.text_tokens or 0
+        audio = details.audio_tokens or 0
+        image = details.image_tokens or 0
+        if cached := details.cached_tokens_details:
+            cached_text = cached.text_tokens or 0
+            cached_audio = cached.audio_tokens or 0
+            cached_image = cached.image_tokens or 0
+    output_text = output_audio = 0
+    if details := usage.output_token_details:
+        output_text = details.text_tokens or 0
+        output_audio = details.audio_tokens or 0
+    return (
+        max(0, text - cached_text),
+        cached_text,
+        max(0, audio - cached_audio),
+        cached_audio,
+        max(0, image - cached_image),
+        cached_image,
+        output_text,
+        output_audio,
+    )
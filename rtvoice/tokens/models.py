@@ -25,6 +25,12 @@ class RealtimeTokenTotals(BaseModel):
     output_text_tokens: int = 0
     output_audio_tokens: int = 0
 
+    @property
+    def cache_hit_ratio(self) -> float:
+        if not self.input_tokens:
+            return 0.0
+        return self.cached_input_tokens / self.input_tokens
+
 
 class TranscriptionTokenTotals(BaseModel):
     transcriptions: int = 0
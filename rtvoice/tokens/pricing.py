@@ -54,6 +54,12 @@ class PricingCatalog:
             _TRANSCRIPTION_RATES if transcription is None else transcription
         )
 
+    def realtime_rates(self, model: str) -> RealtimeRates | None:
+        return self._realtime.get(model)
+
+    def transcription_rates(self, model: str) -> TranscriptionRates | None:
+        return self._transcription.get(model)
+
     def estimate(
         self,
         totals: TokenTotals,
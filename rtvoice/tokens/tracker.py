@@ -1,13 +1,23 @@
+import logging
+import time
 from decimal import Decimal
 
 from transitbus import EventBus
 
+from rtvoice.events.views import (
+    CostUpdatedEvent,
+    PromptCacheUsageEvent,
+    StopAgentCommand,
+)
 from rtvoice.realtime.schemas import (
     DurationUsage,
     InputAudioTranscriptionCompleted,
     ResponseDoneEvent,
     TokenUsage,
 )
+from rtvoice.shared.recent_keys import RecentKeys
+from rtvoice.tokens.aggregation import UsageAggregator, UsageRecord
+from rtvoice.tokens.cost import CostAccumulator
 from rtvoice.tokens.models import (
     TokenTotals,
     TranscriptionTokenTotals,
@@ -15,6 +25,8 @@ from rtvoice.tokens.models import (
 )
 from rtvoice.tokens.pricing import PricingCatalog
 
+logger = logging.getLogger(__name__)
+
 
 class TokenTracker:
     def __init__(
@@ -24,14 +36,30 @@ class TokenTracker:
         realtime_model: str,
         transcription_model: str | None = None,
         pricing_catalog: PricingCatalog | None = None,
+        cost_budget: Decimal | None = None,
+        usage_aggregator: UsageAggregator | None = None,
+        tenant: str = "default",
     ) -> None:
+        if cost_budget is not None and cost_budget <= 0:
+            raise ValueError("cost_budget must be positive")
         self._event_bus = event_bus
         self._realtime_model = realtime_model
         self._transcription_model = transcription_model
         self._pricing_catalog = pricing_catalog or PricingCatalog()
+        self._cost = CostAccumulator(
+            self._pricing_catalog,
+            realtime_model=realtime_model,
+            transcription_model=transcription_model,
+        )
+        self._cost_budget = cost_budget
+        self._budget_exceeded = False
+        self._usage_aggregator = usage_aggregator
+        self._tenant = tenant
         self._totals = TokenTotals()
-        self._response_ids: set[str] = set()
-        self._transcription_ids: set[tuple[str, int]] = set()
+        # redelivery happens around reconnects, so a window of recent ids is
+        # enough and keeps a long session from growing these without bound
+        self._response_ids = RecentKeys[str]()
+        self._transcription_ids = RecentKeys[tuple[str, int]]()
 
         self._event_bus.on(ResponseDoneEvent, self._on_response_done)
         self._event_bus.on(
@@ -43,6 +71,11 @@ class TokenTracker:
     def totals(self) -> TokenTotals:
         return self._totals.model_copy(deep=True)
 
+    @property
+    def cost(self) -> Decimal:
+        """Running cost estimate in USD; cheap enough to poll."""
+        return self._cost.total
+
     def report(self) -> UsageReport:
         totals = self.totals
         return UsageReport(
@@ -55,9 +88,10 @@ class TokenTracker:
         )
 
     async def _on_response_done(self, event: ResponseDoneEvent) -> None:
-        if event.response_id in self._response_ids or event.response.usage is None:
+        if event.response.usage is None or not self._response_ids.add(
+            event.response_id
+        ):
             return
-        self._response_ids.add(event.response_id)
         usage = event.response.usage
         totals = self._totals.realtime
         totals.responses += 1
@@ -78,21 +112,91 @@ class TokenTracker:
             totals.output_text_tokens += details.text_tokens or 0
             totals.output_audio_tokens += details.audio_tokens or 0
 
+        await self._report_cache_usage(event.response_id, usage)
+        cost = self._cost.add_response(usage)
+        self._publish(self._realtime_model, usage, cost)
+        await self._report_cost(event.response_id, cost)
+
+    async def _report_cache_usage(self, response_id: str, usage: TokenUsage) -> None:
+        details = usage.input_token_details
+        cache_usage = PromptCacheUsageEvent(
+            response_id=response_id,
+            input_tokens=usage.input_tokens or 0,
+            cached_input_tokens=(details.cached_tokens or 0) if details else 0,
+        )
+        logger.debug(
+            "Prompt cache [response=%s, cached=%d/%d, hit_ratio=%.2f]",
+            response_id,
+            cache_usage.cached_input_tokens,
+            cache_usage.input_tokens,
+            cache_usage.hit_ratio,
+        )
+        await self._event_bus.dispatch(cache_usage)
+
     async def _on_transcription_completed(
         self, event: InputAudioTranscriptionCompleted
     ) -> None:
         key = (event.item_id, event.content_index)
-        if key in self._transcription_ids or event.usage is None:
+        if event.usage is None or not self._transcription_ids.add(key):
             return
-        self._transcription_ids.add(key)
         totals = self._totals.transcription
         totals.transcriptions += 1
         usage = event.usage
 
         if isinstance(usage, DurationUsage):
             totals.duration_seconds += Decimal(str(usage.seconds))
+        else:
+            self._add_transcription_tokens(totals, usage)
+        cost = self._cost.add_transcription(usage)
+        if self._transcription_model is not None:
+            self._publish(
+                self._transcription_model,
+                usage if isinstance(usage, TokenUsage) else None,
+                cost,
+            )
+        await self._report_cost(None, cost)
+
+    def _publish(self, model: str, usage: TokenUsage | None, cost: Decimal) -> None:
+        if self._usage_aggregator is None:
+            return
+        details = usage.input_token_details if usage is not None else None
+        self._usage_aggregator.publish(
+            UsageRecord(
+                tenant=self._tenant,
+                model=model,
+                at=time.time(),
+                input_tokens=(usage.input_tokens or 0) if usage is not None else 0,
+                cached_input_tokens=(details.cached_tokens or 0) if details else 0,
+                output_tokens=(usage.output_tokens or 0) if usage is not None else 0,
+                cost=cost,
+            )
+        )
+
+    async def _report_cost(self, response_id: str | None, delta: Decimal) -> None:
+        if not delta:
+            return
+        await self._event_bus.dispatch(
+            CostUpdatedEvent(
+                response_id=response_id,
+                delta=delta,
+                total=self._cost.total,
+                budget=self._cost_budget,
+                is_complete=self._cost.is_complete,
+            )
+        )
+        if (
+            self._cost_budget is None
+            or self._budget_exceeded
+            or self._cost.total < self._cost_budget
+        ):
             return
-        self._add_transcription_tokens(totals, usage)
+        self._budget_exceeded = True
+        logger.warning(
+            "Cost budget reached [total=%s, budget=%s] - stopping the agent",
+            f"{self._cost.total:.4f}",
+            self._cost_budget,
+        )
+        await self._event_bus.dispatch(StopAgentCommand())
 
     def _add_transcription_tokens(
         self,
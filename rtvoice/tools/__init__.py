@@ -1,24 +1,37 @@
 from .binding import ToolAvailability, ToolDescription, described, provided, requires
 from .di import Inject, ToolContext
-from .handoff import Handoff
-from .middleware import ToolFeedbackError
+from .execution import ToolExecutors
+from .handoff import Handoff, ToolTurnEnded
+from .middleware import CacheStats, ToolFeedbackError
 from .params import ToolParams
+from .progress import ToolProgress
 from .results import ActionResult
+from .retrieval import BM25Index, ToolRetrieval, ToolRetriever
 from .tools import Tools, ToolSchemaFormat
-from .views import ActionKind, Tool
+from .views import ActionKind, CachePolicy, ExecutionPolicy, ResiliencePolicy, Tool
 
 __all__ = [
     "ActionKind",
     "ActionResult",
+    "BM25Index",
+    "CachePolicy",
+    "CacheStats",
+    "ExecutionPolicy",
     "Handoff",
     "Inject",
+    "ResiliencePolicy",
     "Tool",
     "ToolAvailability",
     "ToolContext",
     "ToolDescription",
+    "ToolExecutors",
     "ToolFeedbackError",
     "ToolParams",
+    "ToolProgress",
+    "ToolRetrieval",
+    "ToolRetriever",
     "ToolSchemaFormat",
+    "ToolTurnEnded",
     "Tools",
     "described",
     "provided",
@@ -1,9 +1,9 @@
-import inspect
-from typing import Annotated, Any, get_args, get_origin, get_type_hints
+from typing import Any
 
 from pydantic import BaseModel
 
-from rtvoice.tools.di import ToolContext, _InjectMarker
+from rtvoice.tools.di import ToolContext
+from rtvoice.tools.progress import ToolProgress
 from rtvoice.tools.views import Tool
 
 
@@ -12,26 +12,27 @@ def resolve_arguments(
     args: dict[str, Any],
     params: BaseModel | None,
     context: ToolContext | None,
+    progress: ToolProgress | None = None,
 ) -> dict[str, Any]:
     kwargs = _resolve_non_injected_args(tool, args, params)
-    hints = get_type_hints(tool.fn, include_extras=True)
-    signature = inspect.signature(tool.fn)
 
-    for param_name, param in signature.parameters.items():
-        hint = hints.get(param_name)
-        if hint is None or not _is_injectable(hint):
+    for slot in tool.plan.injected:
+        # call-scoped, so it never comes from the shared context; without a
+        # listener the tool still gets one whose reports go nowhere
+        if slot.dependency_type is ToolProgress:
+            kwargs[slot.name] = progress or ToolProgress()
             continue
-
-        actual_type = get_args(hint)[0]
-        dependency = context.resolve(actual_type) if context is not None else None
+        dependency = (
+            context.resolve(slot.dependency_type) if context is not None else None
+        )
         if dependency is None:
-            if param.default is inspect.Parameter.empty:
+            if slot.required:
                 raise ValueError(
-                    f"Missing injected dependency for parameter '{param_name}' "
-                    f"of type '{actual_type.__name__}'"
+                    f"Missing injected dependency for parameter '{slot.name}' "
+                    f"of type '{slot.dependency_type.__name__}'"
                 )
             continue
-        kwargs[param_name] = dependency
+        kwargs[slot.name] = dependency
 
     return kwargs
 
@@ -47,39 +48,10 @@ def _resolve_non_injected_args(
     if params is None:
         raise ValueError(f"Missing parsed params for tool '{tool.name}'")
 
-    hints = get_type_hints(tool.fn, include_extras=True)
-    signature = inspect.signature(tool.fn)
-    target = _find_param_model_parameter(signature, hints, tool.param_model)
+    target = tool.plan.param_target
     if target is None:
         raise ValueError(
             f"Tool '{tool.name}' uses params model '{tool.param_model.__name__}' "
             "but has no parameter that can receive it"
         )
     return {target: params}
-
-
-def _find_param_model_parameter(
-    signature: inspect.Signature,
-    hints: dict[str, Any],
-    param_model: type[BaseModel],
-) -> str | None:
-    candidates: list[str] = []
-    for param_name in signature.parameters:
-        if param_name in ("self", "cls"):
-            continue
-        hint = hints.get(param_name)
-        if hint is not None and _is_injectable(hint):
-            continue
-        candidates.append(param_name)
-        if hint == param_model:
-            return param_name
-
-    if len(candidates) == 1:
-        return candidates[0]
-    return None
-
-
-def _is_injectable(hint: Any) -> bool:
-    if get_origin(hint) is not Annotated:
-        return False
-    return any(isinstance(metadata, _InjectMarker) for metadata in get_args(hint))
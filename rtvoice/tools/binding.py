@@ -39,6 +39,9 @@ def described[T](
     render: Callable[[T], str],
     default: str,
 ) -> ToolDescription:
+    """Renders the description from the injected dependency. The text is
+    cached with the schema; after changing the dependency in place, call
+    `Tools.invalidate_schema()`."""
     return ToolDescription(dependency, render, default)  # type: ignore[arg-type]
 
 
@@ -54,6 +57,10 @@ def requires[T](
     *,
     predicate: Callable[[T], bool],
 ) -> ToolAvailability:
+    """Available while the dependency is injected and `predicate` holds. The
+    result is cached with the schema, so after changing the dependency in
+    place, call `Tools.invalidate_schema()`."""
+
     def _predicate(context: ToolContext | None) -> bool:
         if context is None:
             return False
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Annotated, Any, Self, final
 
 
@@ -24,21 +25,45 @@ else:
 class ToolContext:
     def __init__(self, *dependencies: Any) -> None:
         self._dependencies: list[Any] = [dep for dep in dependencies if dep is not None]
+        self._version = 0
+        self._listeners: list[Callable[[], None]] = []
+
+    @property
+    def version(self) -> int:
+        """Bumped on every change to the dependency list, so cached tool schemas
+        know when availability or descriptions may have changed."""
+        return self._version
+
+    def subscribe(self, listener: Callable[[], None]) -> None:
+        """Calls `listener()` after every change to the dependency list."""
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Callable[[], None]) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
 
     def provide(self, *dependencies: Any) -> Self:
         self._dependencies.extend(dep for dep in dependencies if dep is not None)
+        self._changed()
         return self
 
     def clear(self) -> Self:
         self._dependencies.clear()
+        self._changed()
         return self
 
     def without(self, *excluded: type) -> Self:
         self._dependencies = [
             dep for dep in self._dependencies if not isinstance(dep, excluded)
         ]
+        self._changed()
         return self
 
+    def _changed(self) -> None:
+        self._version += 1
+        for listener in self._listeners:
+            listener()
+
     def resolve[T](self, expected_type: type[T]) -> T | None:
         for dependency in self._dependencies:
             if isinstance(dependency, expected_type):
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from rtvoice.tools.views import ExecutionPolicy
+
+if TYPE_CHECKING:
+    from rtvoice.tools.views import Tool
+
+logger = logging.getLogger(__name__)
+
+# an audio chunk is 20-40 ms; anything longer on the loop is audible
+_DEFAULT_BLOCK_WARNING_SECONDS = 0.05
+
+
+class ToolExecutors:
+    """Runs tool functions according to their ExecutionPolicy. The pools are
+    bounded and created on first use, so agents that only have async tools
+    never start a thread or process."""
+
+    def __init__(
+        self,
+        *,
+        max_thread_workers: int | None = None,
+        max_process_workers: int | None = None,
+        block_warning_seconds: float = _DEFAULT_BLOCK_WARNING_SECONDS,
+    ) -> None:
+        cpus = os.cpu_count() or 1
+        self._max_thread_workers = max_thread_workers or min(8, cpus + 4)
+        self._max_process_workers = max_process_workers or min(4, cpus)
+        self._block_warning_seconds = block_warning_seconds
+        self._thread_pool: ThreadPoolExecutor | None = None
+        self._process_pool: ProcessPoolExecutor | None = None
+
+    async def run(self, tool: Tool, arguments: dict[str, Any]) -> Any:
+        match tool.execution:
+            case ExecutionPolicy.THREAD:
+                # copy the context so context variables (e.g. log correlation)
+                # are visible inside the tool
+                call = functools.partial(
+                    contextvars.copy_context().run, tool.fn, **arguments
+                )
+                return await self._submit(self._threads(), call)
+            case ExecutionPolicy.PROCESS:
+                return await self._submit(
+                    self._processes(), functools.partial(tool.fn, **arguments)
+                )
+        if tool.plan.is_async:
+            return await tool.execute(arguments)
+        return self._run_inline(tool, arguments)
+
+    def shutdown(self) -> None:
+        for pool in (self._thread_pool, self._process_pool):
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+        self._thread_pool = None
+        self._process_pool = None
+
+    def _run_inline(self, tool: Tool, arguments: dict[str, Any]) -> Any:
+        started_at = time.perf_counter()
+        try:
+            return tool.fn(**arguments)
+        finally:
+            blocked = time.perf_counter() - started_at
+            if blocked > self._block_warning_seconds:
+                logger.warning(
+                    "Inline tool '%s' blocked the event loop for %.0f ms - "
+                    "consider execution=ExecutionPolicy.THREAD",
+                    tool.name,
+                    blocked * 1000,
+                )
+
+    async def _submit(self, pool: Executor, call: functools.partial) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(pool, call)
+
+    def _threads(self) -> ThreadPoolExecutor:
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(
+                max_workers=self._max_thread_workers, thread_name_prefix="rtvoice-tool"
+            )
+        return self._thread_pool
+
+    def _processes(self) -> ProcessPoolExecutor:
+        if self._process_pool is None:
+            # spawn, not fork: the loop and audio threads are already running
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self._max_process_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._process_pool
+
+
+_shared: ToolExecutors | None = None
+
+
+def shared_executors() -> ToolExecutors:
+    """Process-wide executors every Tools instance uses unless given its own, so
+    the worker bound holds across agents."""
+    global _shared
+    if _shared is None:
+        _shared = ToolExecutors()
+    return _shared
@@ -1,4 +1,13 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class ToolTurnEnded:
+    """Yielded by `Handoff.stream` when an LLM turn ended in tool calls. Text
+    streamed since the previous turn was a remark before those calls, not
+    part of the answer."""
 
 
 class Handoff(ABC):
@@ -9,6 +18,18 @@ class Handoff(ABC):
     description: str
     handoff_instructions: str | None
     result_instructions: str | None
+    # whether the handoff tool consumes `stream` instead of awaiting `start`
+    streaming: bool = False
+    # token budget for the conversation passed along; None passes all of it
+    context_token_budget: int | None = None
 
     @abstractmethod
     async def start(self, task: str, context: str | None = None) -> str: ...
+
+    async def stream(
+        self, task: str, context: str | None = None
+    ) -> AsyncIterator[str | ToolTurnEnded]:
+        """Yields the answer as it is produced; agents that cannot stream
+        yield it in one piece. The answer is the text after the last
+        ToolTurnEnded, the same string `start` returns."""
+        yield await self.start(task, context)
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import inspect
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Annotated, Any, get_args, get_origin, get_type_hints
+
+from pydantic import BaseModel
+
+from rtvoice.tools.di import _InjectMarker
+
+
+@dataclass(frozen=True, slots=True)
+class InjectedSlot:
+    name: str
+    dependency_type: type
+    required: bool
+
+
+@dataclass(frozen=True, slots=True)
+class InvocationPlan:
+    """Everything a call needs to know about the tool function, worked out once
+    from its signature so calls never reflect on it again."""
+
+    is_async: bool
+    injected: tuple[InjectedSlot, ...] = ()
+    # parameter receiving the validated params model; None when the tool has no
+    # model or no parameter that can take it
+    param_target: str | None = None
+
+    @classmethod
+    def compile(
+        cls, fn: Callable, param_model: type[BaseModel] | None = None
+    ) -> InvocationPlan:
+        signature = inspect.signature(fn)
+        hints = get_type_hints(fn, include_extras=True)
+
+        injected = tuple(
+            InjectedSlot(
+                name=name,
+                dependency_type=get_args(hints[name])[0],
+                required=param.default is inspect.Parameter.empty,
+            )
+            for name, param in signature.parameters.items()
+            if name in hints and _is_injectable(hints[name])
+        )
+        return cls(
+            is_async=inspect.iscoroutinefunction(fn),
+            injected=injected,
+            param_target=(
+                _find_param_model_parameter(signature, hints, param_model)
+                if param_model is not None
+                else None
+            ),
+        )
+
+
+def _find_param_model_parameter(
+    signature: inspect.Signature,
+    hints: dict[str, Any],
+    param_model: type[BaseModel],
+) -> str | None:
+    candidates: list[str] = []
+    for param_name in signature.parameters:
+        if param_name in ("self", "cls"):
+            continue
+        hint = hints.get(param_name)
+        if hint is not None and _is_injectable(hint):
+            continue
+        candidates.append(param_name)
+        if hint == param_model:
+            return param_name
+
+    if len(candidates) == 1:
+        return candidates[0]
+    return None
+
+
+def _is_injectable(hint: Any) -> bool:
+    if get_origin(hint) is not Annotated:
+        return False
+    return any(isinstance(metadata, _InjectMarker) for metadata in get_args(hint))
@@ -1,22 +1,34 @@
 from .base import ToolCall, ToolHandler, ToolMiddleware, compose  # noqa: I001
 from .implementations import (
+    CacheStats,
     CallLoggingMiddleware,
+    CircuitBreakerMiddleware,
+    ConcurrencyLimitMiddleware,
     ErrorBoundaryMiddleware,
     ParamValidationMiddleware,
+    ResultCacheMiddleware,
+    TimeoutMiddleware,
     ToolFeedbackError,
     ToolResolutionMiddleware,
+    ToolTimeoutError,
 )
 from .chain import MiddlewareChain
 
 __all__ = [
+    "CacheStats",
     "CallLoggingMiddleware",
+    "CircuitBreakerMiddleware",
+    "ConcurrencyLimitMiddleware",
     "ErrorBoundaryMiddleware",
     "MiddlewareChain",
     "ParamValidationMiddleware",
+    "ResultCacheMiddleware",
+    "TimeoutMiddleware",
     "ToolCall",
     "ToolFeedbackError",
     "ToolHandler",
     "ToolMiddleware",
     "ToolResolutionMiddleware",
+    "ToolTimeoutError",
     "compose",
 ]
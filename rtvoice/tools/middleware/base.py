@@ -5,6 +5,7 @@ from dataclasses import dataclass
 from typing import Any
 
 from rtvoice.tools.di import ToolContext
+from rtvoice.tools.progress import ToolProgress
 from rtvoice.tools.results import ActionResult
 from rtvoice.tools.views import Tool
 
@@ -18,6 +19,7 @@ class ToolCall:
     # to them — including the tool itself — can rely on both being set
     tool: Tool | None = None
     params: Any | None = None
+    progress: ToolProgress | None = None
 
 
 type ToolHandler = Callable[[ToolCall], Awaitable[ActionResult]]
@@ -1,12 +1,25 @@
+from .cache import CacheStats, ResultCacheMiddleware
 from .errors import ErrorBoundaryMiddleware, ToolFeedbackError
 from .logging import CallLoggingMiddleware
+from .resilience import (
+    CircuitBreakerMiddleware,
+    ConcurrencyLimitMiddleware,
+    TimeoutMiddleware,
+    ToolTimeoutError,
+)
 from .resolution import ToolResolutionMiddleware
 from .validation import ParamValidationMiddleware
 
 __all__ = [
+    "CacheStats",
     "CallLoggingMiddleware",
+    "CircuitBreakerMiddleware",
+    "ConcurrencyLimitMiddleware",
     "ErrorBoundaryMiddleware",
     "ParamValidationMiddleware",
+    "ResultCacheMiddleware",
+    "TimeoutMiddleware",
     "ToolFeedbackError",
     "ToolResolutionMiddleware",
+    "ToolTimeoutError",
 ]
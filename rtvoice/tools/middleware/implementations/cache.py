@@ -0,0 +1,123 @@
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from pydantic import BaseModel
+
+from rtvoice.tools.middleware.base import ToolCall, ToolHandler, ToolMiddleware
+from rtvoice.tools.results import ActionResult
+from rtvoice.tools.views import CachePolicy
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __add__(self, other: "CacheStats") -> "CacheStats":
+        return CacheStats(
+            hits=self.hits + other.hits,
+            misses=self.misses + other.misses,
+            evictions=self.evictions + other.evictions,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class _Entry:
+    result: ActionResult
+    expires_at: float
+
+
+class _ToolCache:
+    def __init__(self, policy: CachePolicy) -> None:
+        self.policy = policy
+        self.entries: OrderedDict[str, _Entry] = OrderedDict()
+        self.stats = CacheStats()
+
+    def get(self, key: str, now: float) -> ActionResult | None:
+        entry = self.entries.get(key)
+        if entry is not None and entry.expires_at <= now:
+            del self.entries[key]
+            entry = None
+
+        if entry is None:
+            self._count(misses=1)
+            return None
+
+        self.entries.move_to_end(key)
+        self._count(hits=1)
+        return entry.result
+
+    def put(self, key: str, result: ActionResult, now: float) -> None:
+        self.entries[key] = _Entry(result, now + self.policy.ttl_seconds)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.policy.max_entries:
+            self.entries.popitem(last=False)
+            self._count(evictions=1)
+
+    def _count(self, **delta: int) -> None:
+        self.stats = self.stats + CacheStats(**delta)
+
+
+class ResultCacheMiddleware(ToolMiddleware):
+    """Reuses successful results of READ tools that opted in via `cache=`,
+    keyed by tool name and the canonicalized validated params. Failed results
+    are never stored, and a tool of any other kind is never looked up."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._caches: dict[str, _ToolCache] = {}
+
+    async def __call__(self, call: ToolCall, next: ToolHandler) -> ActionResult:
+        tool = call.tool
+        if tool.cache is None or not tool.is_read_only:
+            return await next(call)
+
+        cache = self._cache_for(call.name, tool.cache)
+        key = _cache_key(call)
+        cached = cache.get(key, self._clock())
+        if cached is not None:
+            return cached
+
+        result = await next(call)
+        if result.ok:
+            cache.put(key, result, self._clock())
+        return result
+
+    def stats(self, name: str | None = None) -> CacheStats:
+        if name is not None:
+            cache = self._caches.get(name)
+            return cache.stats if cache else CacheStats()
+        return sum((cache.stats for cache in self._caches.values()), CacheStats())
+
+    def clear(self, name: str | None = None) -> None:
+        """Drops cached results but keeps the hit/miss counters."""
+        caches = self._caches.values() if name is None else [self._caches.get(name)]
+        for cache in caches:
+            if cache is not None:
+                cache.entries.clear()
+
+    def _cache_for(self, name: str, policy: CachePolicy) -> _ToolCache:
+        cache = self._caches.get(name)
+        # a tool re-registered under the same name may bring a new policy
+        if cache is None or cache.policy != policy:
+            cache = self._caches[name] = _ToolCache(policy)
+        return cache
+
+
+def _cache_key(call: ToolCall) -> str:
+    args: Any = (
+        call.params.model_dump(mode="json")
+        if isinstance(call.params, BaseModel)
+        else call.raw_args
+    )
+    return json.dumps(args, sort_keys=True, separators=(",", ":"), default=repr)
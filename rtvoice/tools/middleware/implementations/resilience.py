@@ -0,0 +1,159 @@
+import asyncio
+import functools
+import logging
+import math
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from rtvoice.tools.middleware.base import ToolCall, ToolHandler, ToolMiddleware
+from rtvoice.tools.middleware.implementations.errors import ToolFeedbackError
+from rtvoice.tools.results import ActionResult
+from rtvoice.tools.views import ResiliencePolicy
+
+logger = logging.getLogger(__name__)
+
+
+class ToolTimeoutError(ToolFeedbackError):
+    """A tool missed its deadline. Counts as a failure for the circuit breaker,
+    unlike other feedback errors which are expected answers."""
+
+
+class TimeoutMiddleware(ToolMiddleware):
+    """Cancels the call once it exceeds the tool's deadline. A thread or
+    process tool keeps running in its worker, but the response no longer
+    waits for it."""
+
+    def __init__(self, default: ResiliencePolicy) -> None:
+        self._default = default
+
+    async def __call__(self, call: ToolCall, next: ToolHandler) -> ActionResult:
+        seconds = _policy(call, self._default).timeout_seconds
+        if seconds is None:
+            return await next(call)
+
+        try:
+            async with asyncio.timeout(seconds):
+                return await next(call)
+        except TimeoutError as error:
+            logger.warning("Tool '%s' timed out after %gs", call.name, seconds)
+            raise ToolTimeoutError(
+                f"'{call.name}' did not finish within {seconds:g} seconds."
+            ) from error
+
+
+class ConcurrencyLimitMiddleware(ToolMiddleware):
+    def __init__(self, default: ResiliencePolicy) -> None:
+        self._default = default
+        self._semaphores: dict[str, tuple[int, asyncio.Semaphore]] = {}
+
+    async def __call__(self, call: ToolCall, next: ToolHandler) -> ActionResult:
+        limit = _policy(call, self._default).max_concurrency
+        if limit is None:
+            return await next(call)
+
+        async with self._semaphore(call.name, limit):
+            return await next(call)
+
+    def _semaphore(self, name: str, limit: int) -> asyncio.Semaphore:
+        current = self._semaphores.get(name)
+        if current is None or current[0] != limit:
+            current = self._semaphores[name] = (limit, asyncio.Semaphore(limit))
+        return current[1]
+
+
+@dataclass
+class _Breaker:
+    failures: int = 0
+    # monotonic time until which calls fail fast; None while closed
+    open_until: float | None = None
+    trial_running: bool = False
+
+
+class CircuitBreakerMiddleware(ToolMiddleware):
+    """Fails fast while a tool keeps crashing or timing out, so a dead backend
+    costs the model one short error instead of a full deadline per call."""
+
+    def __init__(
+        self,
+        default: ResiliencePolicy,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._default = default
+        self._clock = clock
+        self._breakers: dict[str, _Breaker] = {}
+
+    def is_open(self, name: str) -> bool:
+        breaker = self._breakers.get(name)
+        return breaker is not None and breaker.open_until is not None
+
+    async def __call__(self, call: ToolCall, next: ToolHandler) -> ActionResult:
+        policy = _policy(call, self._default)
+        if policy.failure_threshold is None:
+            return await next(call)
+
+        breaker = self._breakers.setdefault(call.name, _Breaker())
+        is_trial = self._admit(call.name, breaker)
+        try:
+            result = await next(call)
+        except ToolTimeoutError:
+            self._record_failure(call.name, breaker, policy)
+            raise
+        except ToolFeedbackError:
+            self._record_success(breaker)
+            raise
+        except Exception:
+            self._record_failure(call.name, breaker, policy)
+            raise
+        finally:
+            if is_trial:
+                breaker.trial_running = False
+
+        self._record_success(breaker)
+        return result
+
+    def _admit(self, name: str, breaker: _Breaker) -> bool:
+        if breaker.open_until is None:
+            return False
+
+        remaining = breaker.open_until - self._clock()
+        if remaining > 0 or breaker.trial_running:
+            retry_in = max(1, math.ceil(remaining))
+            raise ToolFeedbackError(
+                f"'{name}' is temporarily unavailable after repeated failures. "
+                f"Try again in about {retry_in} seconds."
+            )
+
+        # half-open: exactly one call probes whether the backend recovered
+        breaker.trial_running = True
+        return True
+
+    def _record_success(self, breaker: _Breaker) -> None:
+        breaker.failures = 0
+        breaker.open_until = None
+
+    def _record_failure(
+        self, name: str, breaker: _Breaker, policy: ResiliencePolicy
+    ) -> None:
+        breaker.failures += 1
+        # a failed trial reopens immediately
+        if breaker.open_until is None and breaker.failures < policy.failure_threshold:
+            return
+
+        breaker.open_until = self._clock() + policy.recovery_seconds
+        logger.warning(
+            "Circuit open for tool '%s' after %d consecutive failures [%gs]",
+            name,
+            breaker.failures,
+            policy.recovery_seconds,
+        )
+
+
+def _policy(call: ToolCall, default: ResiliencePolicy) -> ResiliencePolicy:
+    own = call.tool.resilience
+    return default if own is None else _merged(own, default)
+
+
+@functools.lru_cache(maxsize=128)
+def _merged(own: ResiliencePolicy, default: ResiliencePolicy) -> ResiliencePolicy:
+    return own.merged_over(default)
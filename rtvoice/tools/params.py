@@ -19,6 +19,17 @@ class ReadSkillResourceParams(SkillParams):
     path: str = Field(
         description="Path of the bundled file, relative to the skill directory."
     )
+    offset: int = Field(
+        default=0,
+        ge=0,
+        description="Byte offset to start reading at. Use the offset given at "
+        "the end of a partial read to continue.",
+    )
+    length: int | None = Field(
+        default=None,
+        ge=1,
+        description="Maximum number of bytes to read. Defaults to one full page.",
+    )
 
 
 class RunSkillScriptParams(SkillParams):
@@ -0,0 +1,58 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+type ProgressHandler = Callable[[str], Awaitable[None]]
+# queues text to be said word for word; called in the order `speak` was
+type SpeechHandler = Callable[[str], None]
+
+
+class ToolProgress:
+    """Lets a running tool tell the user what it is doing while the final
+    result is still pending. Request it with `progress: Inject[ToolProgress]`;
+    every call gets its own instance, and `report` and `speak` are safe to
+    call from the event loop as well as from a worker thread."""
+
+    def __init__(
+        self,
+        handler: ProgressHandler | None = None,
+        speech: SpeechHandler | None = None,
+    ) -> None:
+        self._handler = handler
+        self._speech = speech
+        self._loop = (
+            asyncio.get_running_loop()
+            if handler is not None or speech is not None
+            else None
+        )
+        self._pending: set[asyncio.Task] = set()
+
+    @property
+    def speaks(self) -> bool:
+        """Whether `speak` reaches the user; a tool that speaks its answer
+        can return it with `respond=False`."""
+        return self._speech is not None
+
+    def report(self, message: str) -> None:
+        if self._handler is None or not message:
+            return
+        self._loop.call_soon_threadsafe(self._dispatch, message)
+
+    def speak(self, text: str) -> None:
+        """Says `text` to the user word for word, as part of the answer. Every
+        call is spoken once, in order."""
+        if self._speech is None or not text:
+            return
+        self._loop.call_soon_threadsafe(self._speech, text)
+
+    def _dispatch(self, message: str) -> None:
+        task = self._loop.create_task(self._handler(message))
+        self._pending.add(task)
+        task.add_done_callback(self._on_done)
+
+    def _on_done(self, task: asyncio.Task) -> None:
+        self._pending.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("Progress update failed: %s", task.exception())
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import functools
+import logging
+import math
+import re
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from rtvoice.skills import Skills, SkillSummary
+
+if TYPE_CHECKING:
+    from rtvoice.realtime.schemas import FunctionTool
+    from rtvoice.tools.tools import Tools
+
+logger = logging.getLogger(__name__)
+
+_WORD = re.compile(r"[A-Z]?[a-z]+|[A-Z]+(?![a-z])|\d+")
+_SUFFIXES = ("ing", "es", "ed", "s")
+_MIN_STEM_LENGTH = 3
+
+
+def _tokenize(text: str) -> list[str]:
+    """Lowercased words, with snake_case and camelCase identifiers split and
+    common English suffixes stripped, so "get_weather" matches "weather"."""
+    tokens = []
+    for match in _WORD.finditer(text):
+        word = match.group().lower()
+        for suffix in _SUFFIXES:
+            if word.endswith(suffix) and len(word) - len(suffix) >= _MIN_STEM_LENGTH:
+                word = word[: -len(suffix)]
+                break
+        tokens.append(word)
+    return tokens
+
+
+class BM25Index:
+    """Okapi BM25 over a fixed set of short documents, kept as one posting
+    array per term. A query touches only the postings of its own terms, so
+    search cost grows with how many documents share those terms rather than
+    with the size of the catalog."""
+
+    def __init__(
+        self, documents: Mapping[str, str], *, k1: float = 1.2, b: float = 0.75
+    ) -> None:
+        self._keys = list(documents)
+        tokenized = [_tokenize(text) for text in documents.values()]
+        lengths = np.array([len(tokens) for tokens in tokenized], dtype=np.float32)
+        average_length = (
+            float(lengths.mean()) if len(lengths) and lengths.any() else 1.0
+        )
+
+        term_counts: dict[str, dict[int, int]] = {}
+        for row, tokens in enumerate(tokenized):
+            for token in tokens:
+                counts = term_counts.setdefault(token, {})
+                counts[row] = counts.get(row, 0) + 1
+
+        size = len(self._keys)
+        norms = k1 * (1 - b + b * lengths / average_length)
+        self._postings: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        for term, counts in term_counts.items():
+            rows = np.fromiter(counts, dtype=np.intp, count=len(counts))
+            frequencies = np.fromiter(counts.values(), dtype=np.float32)
+            idf = math.log1p((size - len(counts) + 0.5) / (len(counts) + 0.5))
+            weights = idf * frequencies * (k1 + 1) / (frequencies + norms[rows])
+            self._postings[term] = (rows, weights)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def search(self, query: str, k: int) -> list[tuple[str, float]]:
+        """The `k` best matching documents with a positive score, best first."""
+        terms = {token for token in _tokenize(query) if token in self._postings}
+        if not terms or k < 1:
+            return []
+        scores = np.zeros(len(self._keys), dtype=np.float32)
+        for term in terms:
+            rows, weights = self._postings[term]
+            # each row occurs once per term, so fancy-index addition is exact
+            scores[rows] += weights
+        candidates = np.flatnonzero(scores > 0)
+        if len(candidates) > k:
+            candidates = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+        # ties keep catalog order
+        ranked = sorted(candidates, key=lambda row: (-scores[row], row))
+        return [(self._keys[row], float(scores[row])) for row in ranked]
+
+
+@dataclass(frozen=True, slots=True)
+class ToolRetrieval:
+    """Exposes only the tools and skills relevant to the latest user turn.
+    Built-in tools and `always_available` are always sent. With
+    `top_k_skills` set, skills are listed in load_skill's description instead
+    of the system prompt; None keeps every skill in the prompt."""
+
+    top_k: int = 8
+    top_k_skills: int | None = 5
+    always_available: frozenset[str] = frozenset()
+
+    def __post_init__(self) -> None:
+        if self.top_k < 1:
+            raise ValueError("top_k must be at least 1")
+        if self.top_k_skills is not None and self.top_k_skills < 1:
+            raise ValueError("top_k_skills must be at least 1")
+
+    @property
+    def retrieves_skills(self) -> bool:
+        return self.top_k_skills is not None
+
+
+class ToolRetriever:
+    """Keeps a BM25 index over the registered tools and the skills, and
+    narrows what the model sees to the best matches for a query. Until the
+    first match every tool is exposed. A query that matches nothing keeps the
+    previous selection, so a short reply like "yes, do that" does not hide the
+    tools under discussion."""
+
+    def __init__(
+        self,
+        tools: Tools,
+        skills: Skills | None = None,
+        policy: ToolRetrieval | None = None,
+    ) -> None:
+        self._tools = tools
+        self._skills = skills
+        self._policy = policy or ToolRetrieval()
+        self._tool_index: BM25Index | None = None
+        self._tool_catalog: tuple[tuple[str, str], ...] = ()
+        self._skill_index: BM25Index | None = None
+        self._skill_catalog: dict[str, SkillSummary] = {}
+        self._relevant_skills: tuple[SkillSummary, ...] = ()
+
+    @property
+    def policy(self) -> ToolRetrieval:
+        return self._policy
+
+    @property
+    def relevant_skills(self) -> tuple[SkillSummary, ...]:
+        return self._relevant_skills
+
+    def select(self, query: str) -> bool:
+        """Narrows tools and skills to those matching `query`. Returns whether
+        the exposed set changed and needs to be sent to the model."""
+        changed = self._select_tools(query)
+        if self._select_skills(query):
+            # load_skill's description renders the relevant skills
+            self._tools.invalidate_schema()
+            changed = True
+        return changed
+
+    def _select_tools(self, query: str) -> bool:
+        matches = self._current_tool_index().search(query, self._policy.top_k)
+        if not matches:
+            return False
+        selected = self._policy.always_available | {name for name, _ in matches}
+        logger.debug("Selected tools for %r: %s", query, sorted(selected))
+        return self._tools.focus(selected)
+
+    def _select_skills(self, query: str) -> bool:
+        top_k = self._policy.top_k_skills
+        if top_k is None or self._skills is None:
+            return False
+        matches = self._current_skill_index().search(query, top_k)
+        if not matches:
+            return False
+        relevant = tuple(self._skill_catalog[name] for name, _ in matches)
+        if relevant == self._relevant_skills:
+            return False
+        self._relevant_skills = relevant
+        return True
+
+    def _current_tool_index(self) -> BM25Index:
+        catalog = tuple(
+            (schema.name, _describe_tool(schema)) for schema in self._tools.catalog()
+        )
+        if self._tool_index is None or catalog != self._tool_catalog:
+            self._tool_index = _shared_index(catalog)
+            self._tool_catalog = catalog
+        return self._tool_index
+
+    def _current_skill_index(self) -> BM25Index:
+        catalog = {summary.name: summary for summary in self._skills.summaries()}
+        if self._skill_index is None or catalog != self._skill_catalog:
+            self._skill_index = _shared_index(
+                tuple(
+                    (name, f"{name} {name} {summary.description}")
+                    for name, summary in catalog.items()
+                )
+            )
+            self._skill_catalog = catalog
+        return self._skill_index
+
+
+@functools.lru_cache(maxsize=32)
+def _shared_index(documents: tuple[tuple[str, str], ...]) -> BM25Index:
+    """An index is never changed once built, so agents with the same tools or
+    skills share one instead of each building its own."""
+    return BM25Index(dict(documents))
+
+
+def _describe_tool(schema: FunctionTool) -> str:
+    # the name counts twice; it is the most specific text a tool has
+    parts: list[str] = [schema.name, schema.name, schema.description or ""]
+    parts.extend(_parameter_text(schema.parameters.properties))
+    return " ".join(parts)
+
+
+def _parameter_text(properties: Mapping) -> Iterable[str]:
+    for name, prop in properties.items():
+        yield name
+        if prop.description:
+            yield prop.description
+        if prop.properties:
+            yield from _parameter_text(prop.properties)
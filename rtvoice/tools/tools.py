@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import functools
+import json
 import logging
-from collections.abc import Callable
+import re
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
 from typing import Any, Literal, overload
 
 from llmify import RawSchemaTool
@@ -21,26 +25,90 @@ from rtvoice.tools.binding import (
     requires,
 )
 from rtvoice.tools.di import Inject, ToolContext
-from rtvoice.tools.handoff import Handoff
-from rtvoice.tools.middleware import MiddlewareChain, ToolCall
+from rtvoice.tools.execution import ToolExecutors, shared_executors
+from rtvoice.tools.handoff import Handoff, ToolTurnEnded
+from rtvoice.tools.middleware import (
+    CacheStats,
+    CallLoggingMiddleware,
+    CircuitBreakerMiddleware,
+    ConcurrencyLimitMiddleware,
+    MiddlewareChain,
+    ResultCacheMiddleware,
+    TimeoutMiddleware,
+    ToolCall,
+)
 from rtvoice.tools.params import (
     LoadSkillParams,
     ReadSkillResourceParams,
     RunSkillScriptParams,
     TextAgentParams,
 )
+from rtvoice.tools.progress import ProgressHandler, SpeechHandler, ToolProgress
 from rtvoice.tools.results import ActionResult
-from rtvoice.tools.views import ActionKind, Tool, ToolSchemaFormat
+from rtvoice.tools.retrieval import ToolRetriever
+from rtvoice.tools.views import (
+    ActionKind,
+    CachePolicy,
+    ExecutionPolicy,
+    ResiliencePolicy,
+    Tool,
+    ToolSchemaFormat,
+)
 
 logger = logging.getLogger(__name__)
 
+_LOAD_SKILL_DESCRIPTION = (
+    "Load a skill's instructions and the list of its bundled files. "
+    "Call this before using a skill."
+)
+
+# (registration version, focus version, context id, context version)
+type _SchemaKey = tuple[int, int, int, int]
+
+
+@dataclass(frozen=True, slots=True)
+class _CachedSchema:
+    key: _SchemaKey
+    schemas: list[RealtimeFunctionTool] | list[RawSchemaTool]
+
 
 class Tools:
-    def __init__(self):
+    def __init__(
+        self,
+        *,
+        executors: ToolExecutors | None = None,
+        resilience: ResiliencePolicy | None = None,
+    ):
         self._tools: dict[str, Tool] = {}
         self._context: ToolContext | None = None
-        self._handler = MiddlewareChain(self._tools).build(self._invoke)
-        self._register_default_tools()
+        self._executors = executors or shared_executors()
+        # bumped whenever the registered tool set changes
+        self._version = 0
+        self._schema_cache: dict[ToolSchemaFormat, _CachedSchema] = {}
+        self._schema_json_cache: dict[bool, tuple[_SchemaKey, str]] = {}
+        # names a ToolRetriever narrowed the schema to; None exposes everything
+        self._focus: frozenset[str] | None = None
+        self._focus_version = 0
+        self._catalog_cache: _CachedSchema | None = None
+        self._listeners: list[Callable[[], None]] = []
+        self._result_cache = ResultCacheMiddleware()
+        # applies to every tool registered without its own `resilience=`
+        resilience = resilience or ResiliencePolicy()
+        self._resilience = resilience
+        self._handler = MiddlewareChain(
+            self._tools,
+            inner=(
+                CallLoggingMiddleware(),
+                self._result_cache,
+                # the breaker sees timeouts as failures; the deadline also
+                # covers the wait for a concurrency slot
+                CircuitBreakerMiddleware(resilience),
+                TimeoutMiddleware(resilience),
+                ConcurrencyLimitMiddleware(resilience),
+            ),
+        ).build(self._invoke)
+        for tool in _default_tools():
+            self._tools[tool.name] = tool
         self._default_tool_names = frozenset(self._tools)
 
     def action(
@@ -54,6 +122,9 @@ class Tools:
         status: str | Callable | None = None,
         kind: ActionKind = ActionKind.GENERIC,
         available_when: ToolAvailability | None = None,
+        execution: ExecutionPolicy | None = None,
+        cache: CachePolicy | None = None,
+        resilience: ResiliencePolicy | None = None,
     ) -> Callable:
         def decorator(func: Callable) -> Callable:
             self._register_tool(
@@ -67,6 +138,9 @@ class Tools:
                     status=status,
                     kind=kind,
                     available_when=available_when,
+                    execution=execution,
+                    cache=cache,
+                    resilience=resilience,
                 )
             )
             return func
@@ -74,10 +148,73 @@ class Tools:
         return decorator
 
     def set_context(self, context: ToolContext) -> None:
+        if self._context is not None:
+            self._context.unsubscribe(self._notify)
         self._context = context
+        context.subscribe(self._notify)
+        # cached results may depend on the dependencies the old context held
+        self._result_cache.clear()
+        self.invalidate_schema()
+
+    def subscribe(self, listener: Callable[[], None]) -> None:
+        """Calls `listener()` whenever the exposed tools may have changed: on
+        registration, focus and context changes, and `invalidate_schema`."""
+        self._listeners.append(listener)
+
+    def _notify(self) -> None:
+        for listener in self._listeners:
+            listener()
 
     def inject_tool(self, tool: Tool) -> None:
         self._tools[tool.name] = tool
+        self.invalidate_schema()
+
+    def invalidate_schema(self) -> None:
+        """Drops cached schemas. Registration and context changes do this on
+        their own, but mutating a dependency in place does not: a tool whose
+        `requires(...)` predicate or `described(...)` text reads that
+        dependency keeps its cached availability and description until this
+        is called."""
+        self._version += 1
+        self._notify()
+
+    def focus(self, names: Iterable[str] | None) -> bool:
+        """Restricts the schema to `names` plus the built-in tools; None lifts
+        the restriction. Returns whether the exposed set changed."""
+        focus = frozenset(names) if names is not None else None
+        if focus == self._focus:
+            return False
+        self._focus = focus
+        self._focus_version += 1
+        self._notify()
+        return True
+
+    def catalog(self) -> list[RealtimeFunctionTool]:
+        """Every available tool a focus can choose from: the registered ones,
+        regardless of the current focus, without the built-ins."""
+        # the focus is left out of the key; it does not change the catalog
+        version, _, context_id, context_version = self._schema_key()
+        key = (version, 0, context_id, context_version)
+        cached = self._catalog_cache
+        if cached is None or cached.key != key:
+            cached = _CachedSchema(
+                key=key,
+                schemas=[
+                    tool.to_schema(self._context)
+                    for tool in self._tools.values()
+                    if tool.name not in self._default_tool_names
+                    and tool.is_available(self._context)
+                ],
+            )
+            self._catalog_cache = cached
+        return list(cached.schemas)
+
+    def cache_stats(self, name: str | None = None) -> CacheStats:
+        """Result cache hits and misses for one tool, or summed over all."""
+        return self._result_cache.stats(name)
+
+    def clear_cache(self, name: str | None = None) -> None:
+        self._result_cache.clear(name)
 
     def get(self, name: str) -> Tool | None:
         return self._tools.get(name)
@@ -94,11 +231,45 @@ class Tools:
 
     def get_schema(
         self, schema_format: ToolSchemaFormat = ToolSchemaFormat.REALTIME
+    ) -> list[RealtimeFunctionTool] | list[RawSchemaTool]:
+        key = self._schema_key()
+        cached = self._schema_cache.get(schema_format)
+        if cached is None or cached.key != key:
+            cached = _CachedSchema(key=key, schemas=self._build_schema(schema_format))
+            self._schema_cache[schema_format] = cached
+        # a fresh list so callers cannot reorder or extend the cached one
+        return list(cached.schemas)
+
+    def get_schema_json(self, *, sort_by_name: bool = False) -> str:
+        """The realtime tool list serialized as it goes out in `session.update`,
+        cached under the same key as get_schema."""
+        key = self._schema_key()
+        cached = self._schema_json_cache.get(sort_by_name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        schemas = self.get_schema()
+        if sort_by_name:
+            schemas.sort(key=lambda schema: schema.name)
+        payload = json.dumps(
+            [schema.model_dump(exclude_none=True) for schema in schemas]
+        )
+        self._schema_json_cache[sort_by_name] = (key, payload)
+        return payload
+
+    def _schema_key(self) -> _SchemaKey:
+        context = self._context
+        if context is None:
+            return (self._version, self._focus_version, 0, 0)
+        return (self._version, self._focus_version, id(context), context.version)
+
+    def _build_schema(
+        self, schema_format: ToolSchemaFormat
     ) -> list[RealtimeFunctionTool] | list[RawSchemaTool]:
         schemas = [
             tool.to_schema(self._context)
             for tool in self._tools.values()
-            if tool.is_available(self._context)
+            if self._in_focus(tool.name) and tool.is_available(self._context)
         ]
         if schema_format is ToolSchemaFormat.REALTIME:
             return schemas
@@ -111,18 +282,39 @@ class Tools:
             for schema in schemas
         ]
 
+    def _in_focus(self, name: str) -> bool:
+        return (
+            self._focus is None
+            or name in self._focus
+            or name in self._default_tool_names
+        )
+
     async def execute(
-        self, name: str, arguments: dict[str, Any] | None = None
+        self,
+        name: str,
+        arguments: dict[str, Any] | None = None,
+        *,
+        progress: ProgressHandler | None = None,
+        speech: SpeechHandler | None = None,
     ) -> ActionResult:
         return await self._handler(
-            ToolCall(name=name, raw_args=arguments or {}, context=self._context)
+            ToolCall(
+                name=name,
+                raw_args=arguments or {},
+                context=self._context,
+                progress=(
+                    ToolProgress(progress, speech)
+                    if progress is not None or speech is not None
+                    else None
+                ),
+            )
         )
 
     async def _invoke(self, call: ToolCall) -> ActionResult:
         resolved_args = resolve_arguments(
-            call.tool, call.raw_args, call.params, call.context
+            call.tool, call.raw_args, call.params, call.context, call.progress
         )
-        result = await call.tool.execute(resolved_args)
+        result = await self._executors.run(call.tool, resolved_args)
         if isinstance(result, ActionResult):
             return result
         return ActionResult.success(result)
@@ -134,79 +326,163 @@ class Tools:
                 continue
             self._register_tool(tool)
 
+    def fork(self) -> Tools:
+        """A registry with the same tools, executors and default resilience
+        policy, but its own context, focus, schema caches and middleware state.
+        Tool objects are shared, not recompiled, so one Tools can serve many
+        agents."""
+        forked = Tools(executors=self._executors, resilience=self._resilience)
+        forked.merge(self)
+        return forked
+
     def _register_tool(self, tool: Tool) -> None:
         if tool.name in self._tools:
             raise ValueError(f"Tool '{tool.name}' already registered")
         self._tools[tool.name] = tool
+        self.invalidate_schema()
 
-    def _register_default_tools(self) -> None:
-        """Every Tools instance carries these; `available_when` decides which of
-        them a given agent actually sees, based on what its context provides."""
-        _with_skills = requires(Skills, predicate=lambda skills: skills.size > 0)
 
-        @self.action(
-            "End the conversation and shut the agent down. Call this when the user "
-            "says goodbye or asks you to stop. Say a short farewell first.",
-            name="stop",
-            kind=ActionKind.END_SESSION,
-        )
-        async def _stop(event_bus: Inject[EventBus]) -> ActionResult:
-            await event_bus.dispatch(StopAgentCommand())
-            return ActionResult.success("Conversation ended.")
-
-        @self.action(
-            "Load a skill's instructions and the list of its bundled files. "
-            "Call this before using a skill.",
-            params=LoadSkillParams,
-            available_when=_with_skills,
-        )
-        def load_skill(params: LoadSkillParams, skills: Inject[Skills]) -> ActionResult:
-            return ActionResult.success(skills.load(params.name))
-
-        @self.action(
-            "Read one file bundled with a skill, as listed by load_skill.",
-            params=ReadSkillResourceParams,
-            kind=ActionKind.READ,
-            available_when=_with_skills,
+@functools.cache
+def _default_tools() -> tuple[Tool, ...]:
+    """Every Tools instance carries these; `available_when` decides which of
+    them a given agent actually sees, based on what its context provides.
+    Tools hold no per-agent state, so they are compiled once per process and
+    shared; compiling them per instance was most of an agent's setup time."""
+    tools: list[Tool] = []
+
+    def action(
+        description: str | ToolDescription,
+        name: str | None = None,
+        *,
+        params: type[BaseModel] | None = None,
+        **options: Any,
+    ) -> Callable:
+        def decorator(func: Callable) -> Callable:
+            tools.append(
+                Tool(
+                    name=name or func.__name__,
+                    description=description,
+                    fn=func,
+                    param_model=params,
+                    **options,
+                )
+            )
+            return func
+
+        return decorator
+
+    _with_skills = requires(Skills, predicate=lambda skills: skills.size > 0)
+
+    @action(
+        "End the conversation and shut the agent down. Call this when the user "
+        "says goodbye or asks you to stop. Say a short farewell first.",
+        name="stop",
+        kind=ActionKind.END_SESSION,
+    )
+    async def _stop(event_bus: Inject[EventBus]) -> ActionResult:
+        await event_bus.dispatch(StopAgentCommand())
+        return ActionResult.success("Conversation ended.")
+
+    @action(
+        described(
+            ToolRetriever,
+            render=_describe_relevant_skills,
+            default=_LOAD_SKILL_DESCRIPTION,
+        ),
+        params=LoadSkillParams,
+        available_when=_with_skills,
+    )
+    def load_skill(params: LoadSkillParams, skills: Inject[Skills]) -> ActionResult:
+        return ActionResult.success(skills.load(params.name))
+
+    @action(
+        "Read one file bundled with a skill, as listed by load_skill. Large "
+        "files are returned a page at a time; the end of a partial read says "
+        "which offset to continue from.",
+        params=ReadSkillResourceParams,
+        kind=ActionKind.READ,
+        available_when=_with_skills,
+    )
+    def read_skill_resource(
+        params: ReadSkillResourceParams, skills: Inject[Skills]
+    ) -> ActionResult:
+        return ActionResult.success(
+            skills.read_resource(params.name, params.path, params.offset, params.length)
         )
-        def read_skill_resource(
-            params: ReadSkillResourceParams, skills: Inject[Skills]
-        ) -> ActionResult:
-            return ActionResult.success(skills.read_resource(params.name, params.path))
-
-        @self.action(
-            "Run one script bundled with a skill, as listed by load_skill. The "
-            "script runs in the skill's directory; no shell is involved.",
-            params=RunSkillScriptParams,
-            kind=ActionKind.DESTRUCTIVE,
-            available_when=_with_skills,
+
+    @action(
+        "Run one script bundled with a skill, as listed by load_skill. The "
+        "script runs in the skill's directory; no shell is involved.",
+        params=RunSkillScriptParams,
+        kind=ActionKind.DESTRUCTIVE,
+        available_when=_with_skills,
+        status="Running {path}.",
+        # bounded by the script's own `timeout`, which may exceed the default
+        resilience=ResiliencePolicy(timeout_seconds=None),
+    )
+    async def run_skill_script(
+        params: RunSkillScriptParams, skills: Inject[Skills]
+    ) -> ActionResult:
+        output = await skills.run_script(
+            params.name, params.path, params.args, params.timeout
         )
-        async def run_skill_script(
-            params: RunSkillScriptParams, skills: Inject[Skills]
-        ) -> ActionResult:
-            output = await skills.run_script(
-                params.name, params.path, params.args, params.timeout
-            )
-            return ActionResult.success(output)
+        return ActionResult.success(output)
 
-        @self.action(
-            described(
-                Handoff,
-                render=_describe_handoff,
-                default="Delegate a task to the text agent.",
-            ),
-            params=TextAgentParams,
-            available_when=provided(Handoff),
+    @action(
+        described(
+            Handoff,
+            render=_describe_handoff,
+            default="Delegate a task to the text agent.",
+        ),
+        params=TextAgentParams,
+        available_when=provided(Handoff),
+        status="Working on the task.",
+        # several LLM round trips; fail only when the handoff is clearly stuck
+        resilience=ResiliencePolicy(timeout_seconds=300),
+    )
+    async def text_agent(
+        params: TextAgentParams,
+        handoff: Inject[Handoff],
+        conversation_history: Inject[ConversationHistory],
+        progress: Inject[ToolProgress],
+    ) -> ActionResult:
+        context = (
+            conversation_history.format_window(handoff.context_token_budget)
+            if handoff.context_token_budget is not None
+            else conversation_history.format()
         )
-        async def text_agent(
-            params: TextAgentParams,
-            handoff: Inject[Handoff],
-            conversation_history: Inject[ConversationHistory],
-        ) -> ActionResult:
-            answer = await handoff.start(
-                params.task, context=conversation_history.format()
-            )
-            return ActionResult.success(answer, instruction=handoff.result_instructions)
+        if handoff.streaming and progress.speaks:
+            answer = await _stream_handoff(handoff, params.task, context, progress)
+            # already said word for word; the output only keeps the context
+            return ActionResult.success(answer, respond=False)
+        answer = await handoff.start(params.task, context=context)
+        return ActionResult.success(answer, instruction=handoff.result_instructions)
+
+    return tuple(tools)
+
+
+async def _stream_handoff(
+    handoff: Handoff, task: str, context: str, progress: ToolProgress
+) -> str:
+    # a finished sentence is spoken once the next one is finished too: a turn
+    # may still end in tool calls, and a one-sentence remark before them is
+    # not part of the answer
+    turn = ""
+    spoken = 0
+    async for delta in handoff.stream(task, context=context):
+        if isinstance(delta, ToolTurnEnded):
+            turn, spoken = "", 0
+            continue
+        turn += delta
+        ends = [match.end() for match in _SENTENCE_END.finditer(turn, spoken)]
+        if len(ends) >= 2:
+            progress.speak(turn[spoken : ends[-2]].strip())
+            spoken = ends[-2]
+    progress.speak(turn[spoken:].strip())
+    return turn
+
+
+_SENTENCE_END = re.compile(r"[.!?\n]\s")
 
 
 def _describe_handoff(handoff: Handoff) -> str:
@@ -215,3 +491,14 @@ def _describe_handoff(handoff: Handoff) -> str:
     return (
         f"{handoff.description}\n\nHandoff instructions: {handoff.handoff_instructions}"
     )
+
+
+def _describe_relevant_skills(retriever: ToolRetriever) -> str:
+    if not retriever.policy.retrieves_skills or not retriever.relevant_skills:
+        return _LOAD_SKILL_DESCRIPTION
+    skills = "\n".join(
+        f"- {skill.name}: {skill.description}" for skill in retriever.relevant_skills
+    )
+    return (
+        f"{_LOAD_SKILL_DESCRIPTION} Skills relevant to the current request:\n{skills}"
+    )
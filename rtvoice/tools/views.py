@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import inspect
 import re
 from collections.abc import Callable
+from dataclasses import dataclass
 from enum import StrEnum
 from typing import Any
 
@@ -11,6 +11,7 @@ from pydantic import BaseModel
 from rtvoice.realtime.schemas import FunctionParameters, FunctionTool
 from rtvoice.tools.binding import ToolAvailability, ToolDescription
 from rtvoice.tools.di import ToolContext
+from rtvoice.tools.invocation import InvocationPlan
 from rtvoice.tools.schemas import build as build_schema
 
 
@@ -22,6 +23,103 @@ class ActionKind(StrEnum):
     END_SESSION = "end_session"
 
 
+class ExecutionPolicy(StrEnum):
+    # on the event loop; only for functions that return immediately
+    INLINE = "inline"
+    # in the shared, bounded thread pool; the default for sync functions
+    THREAD = "thread"
+    # in a worker process; the function and its arguments must be picklable
+    PROCESS = "process"
+
+
+@dataclass(frozen=True, slots=True)
+class CachePolicy:
+    """Opt-in result caching for a READ tool: identical validated arguments
+    reuse a successful result for `ttl_seconds`, keeping at most `max_entries`
+    results per tool."""
+
+    ttl_seconds: float
+    max_entries: int = 128
+
+    def __post_init__(self) -> None:
+        if self.ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+        if self.max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+
+_RESILIENCE_DEFAULTS: dict[str, Any] = {
+    "timeout_seconds": 60.0,
+    "max_concurrency": None,
+    "failure_threshold": 5,
+    "recovery_seconds": 30.0,
+}
+# marks a ResiliencePolicy argument that was not passed
+_UNSET: Any = object()
+
+
+@dataclass(frozen=True, slots=True, init=False)
+class ResiliencePolicy:
+    """Bounds how long and how often a tool may run. `None` disables a guard.
+
+    A call that exceeds `timeout_seconds` fails with a message the model can
+    speak about. At most `max_concurrency` calls of the tool run at once, the
+    rest wait for a slot. After `failure_threshold` consecutive crashes or
+    timeouts the tool fails fast for `recovery_seconds`, then one trial call
+    decides whether it recovered.
+
+    A per-tool policy only overrides the fields it was given; the others come
+    from the `Tools` default."""
+
+    timeout_seconds: float | None
+    max_concurrency: int | None
+    failure_threshold: int | None
+    recovery_seconds: float
+    # names of the fields passed explicitly
+    overridden: frozenset[str]
+
+    def __init__(
+        self,
+        timeout_seconds: float | None = _UNSET,
+        max_concurrency: int | None = _UNSET,
+        failure_threshold: int | None = _UNSET,
+        recovery_seconds: float = _UNSET,
+    ) -> None:
+        values = {
+            "timeout_seconds": timeout_seconds,
+            "max_concurrency": max_concurrency,
+            "failure_threshold": failure_threshold,
+            "recovery_seconds": recovery_seconds,
+        }
+        for name, value in values.items():
+            object.__setattr__(
+                self, name, _RESILIENCE_DEFAULTS[name] if value is _UNSET else value
+            )
+        object.__setattr__(
+            self,
+            "overridden",
+            frozenset(name for name, value in values.items() if value is not _UNSET),
+        )
+
+        if self.timeout_seconds is not None and self.timeout_seconds <= 0:
+            raise ValueError("timeout_seconds must be positive")
+        if self.max_concurrency is not None and self.max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if self.failure_threshold is not None and self.failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        if self.recovery_seconds <= 0:
+            raise ValueError("recovery_seconds must be positive")
+
+    def merged_over(self, base: ResiliencePolicy) -> ResiliencePolicy:
+        """`base` with the fields this policy was given replaced."""
+        return ResiliencePolicy(
+            **{
+                name: getattr(self if name in self.overridden else base, name)
+                for name in _RESILIENCE_DEFAULTS
+            }
+        )
+
+
 class ToolSchemaFormat(StrEnum):
     REALTIME = "realtime"
     TEXT = "text"
@@ -58,6 +156,9 @@ class Tool:
         status: str | Callable | None = None,
         kind: ActionKind = ActionKind.GENERIC,
         available_when: ToolAvailability | None = None,
+        execution: ExecutionPolicy | None = None,
+        cache: CachePolicy | None = None,
+        resilience: ResiliencePolicy | None = None,
     ):
         self.name = name
         self.description = description
@@ -69,8 +170,20 @@ class Tool:
         self.status = status
         self.kind = kind
         self.available_when = available_when
+        self.plan = InvocationPlan.compile(fn, param_model)
+        self.execution = self._resolve_execution(execution)
+        self.cache = self._validate_cache(cache)
+        # None falls back to the policy of the Tools instance running the call
+        self.resilience = resilience
+        # (description, schema) for plain-text descriptions, which read the same
+        # in every context; agents sharing the tool share the schema object
+        self._static_schema: tuple[str, FunctionTool] | None = None
         self._validate_status()
 
+    @property
+    def is_read_only(self) -> bool:
+        return self.kind is ActionKind.READ
+
     def is_available(self, context: ToolContext | None) -> bool:
         if self.available_when is None:
             return True
@@ -82,6 +195,19 @@ class Tool:
         return self.description
 
     def to_schema(self, context: ToolContext | None = None) -> FunctionTool:
+        if isinstance(self.description, str):
+            cached = self._static_schema
+            if cached is None or cached[0] is not self.description:
+                cached = (
+                    self.description,
+                    FunctionTool(
+                        name=self.name,
+                        description=self.description,
+                        parameters=self.schema,
+                    ),
+                )
+                self._static_schema = cached
+            return cached[1]
         return FunctionTool(
             name=self.name,
             description=self.resolve_description(context),
@@ -89,7 +215,7 @@ class Tool:
         )
 
     async def execute(self, arguments: dict[str, Any]) -> Any:
-        if inspect.iscoroutinefunction(self.fn):
+        if self.plan.is_async:
             return await self.fn(**arguments)
         return self.fn(**arguments)
 
@@ -113,6 +239,31 @@ class Tool:
         except KeyError:
             return self.status
 
+    def _resolve_execution(self, execution: ExecutionPolicy | None) -> ExecutionPolicy:
+        if execution is None:
+            return (
+                ExecutionPolicy.INLINE if self.plan.is_async else ExecutionPolicy.THREAD
+            )
+        if execution is not ExecutionPolicy.INLINE and self.plan.is_async:
+            raise ValueError(
+                f"Tool '{self.name}': async tools run on the event loop, "
+                f"execution={execution.value} needs a sync function"
+            )
+        if execution is ExecutionPolicy.PROCESS and self.plan.injected:
+            raise ValueError(
+                f"Tool '{self.name}': injected dependencies cannot be sent to "
+                "a worker process"
+            )
+        return execution
+
+    def _validate_cache(self, cache: CachePolicy | None) -> CachePolicy | None:
+        if cache is not None and not self.is_read_only:
+            raise ValueError(
+                f"Tool '{self.name}': only ActionKind.READ tools can cache "
+                f"results, got kind={self.kind.value}"
+            )
+        return cache
+
     def _validate_status(self) -> None:
         if self.status is None:
             return
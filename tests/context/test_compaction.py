@@ -0,0 +1,209 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from rtvoice.context import (
+    AutomaticCompaction,
+    CompactionInput,
+    ContextEvent,
+    ContextEventKind,
+    ContextItem,
+    ContextItemKind,
+    ContextUsage,
+    ConversationSnapshot,
+    LLMCompactor,
+    TokenBudgetPolicy,
+)
+
+
+def message(item_id: str, role: str, text: str = "x" * 400) -> ContextItem:
+    return ContextItem(id=item_id, kind=ContextItemKind.MESSAGE, text=text, role=role)
+
+
+def tool_call(item_id: str) -> ContextItem:
+    return ContextItem(
+        id=item_id, kind=ContextItemKind.FUNCTION_CALL, text="get_weather({})"
+    )
+
+
+def tool_output(item_id: str) -> ContextItem:
+    return ContextItem(
+        id=item_id, kind=ContextItemKind.FUNCTION_CALL_OUTPUT, text="sunny"
+    )
+
+
+def conversation(turns: int) -> tuple[ContextItem, ...]:
+    items: list[ContextItem] = []
+    for index in range(turns):
+        items.append(message(f"user_{index}", "user"))
+        items.append(message(f"assistant_{index}", "assistant"))
+    return tuple(items)
+
+
+def response_done(input_tokens: int) -> ContextEvent:
+    return ContextEvent(
+        kind=ContextEventKind.RESPONSE_DONE,
+        usage=ContextUsage(input_tokens=input_tokens),
+    )
+
+
+class TestTokenBudgetPolicy:
+    def test_does_nothing_below_trigger(self) -> None:
+        policy = TokenBudgetPolicy(trigger_tokens=1_000, target_tokens=500)
+        snapshot = ConversationSnapshot(items=conversation(10))
+
+        assert policy.plan(snapshot, ContextUsage(input_tokens=999)) is None
+        assert policy.plan(snapshot, None) is None
+
+    def test_keeps_last_user_turns(self) -> None:
+        policy = TokenBudgetPolicy(
+            trigger_tokens=1_000, target_tokens=0, keep_last_user_turns=2
+        )
+        snapshot = ConversationSnapshot(items=conversation(5))
+
+        plan = policy.plan(snapshot, ContextUsage(input_tokens=100_000))
+
+        assert plan is not None
+        assert [item.id for item in plan.items] == [
+            "user_0",
+            "assistant_0",
+            "user_1",
+            "assistant_1",
+            "user_2",
+            "assistant_2",
+        ]
+
+    def test_folds_only_until_target(self) -> None:
+        # every item is estimated at 100 tokens, one turn frees 200
+        policy = TokenBudgetPolicy(
+            trigger_tokens=1_000, target_tokens=800, keep_last_user_turns=1
+        )
+        snapshot = ConversationSnapshot(items=conversation(5))
+
+        plan = policy.plan(snapshot, ContextUsage(input_tokens=1_000))
+
+        assert plan is not None
+        assert [item.id for item in plan.items] == ["user_0", "assistant_0"]
+
+    def test_tool_call_and_result_stay_together(self) -> None:
+        policy = TokenBudgetPolicy(
+            trigger_tokens=1_000, target_tokens=999, keep_last_user_turns=1
+        )
+        items = (
+            message("user_0", "user", "short"),
+            tool_call("call_0"),
+            tool_output("output_0"),
+            message("assistant_0", "assistant", "short"),
+            message("user_1", "user"),
+        )
+
+        plan = policy.plan(
+            ConversationSnapshot(items=items), ContextUsage(input_tokens=1_000)
+        )
+
+        assert plan is not None
+        assert [item.id for item in plan.items] == [
+            "user_0",
+            "call_0",
+            "output_0",
+            "assistant_0",
+        ]
+
+    def test_passes_previous_summary(self) -> None:
+        policy = TokenBudgetPolicy(
+            trigger_tokens=1_000, target_tokens=0, keep_last_user_turns=1
+        )
+        summary = ContextItem.new_summary("earlier")
+        snapshot = ConversationSnapshot(items=(summary, *conversation(3)))
+
+        plan = policy.plan(snapshot, ContextUsage(input_tokens=2_000))
+
+        assert plan is not None
+        assert plan.previous_summary == summary
+        assert summary not in plan.items
+
+    def test_rejects_target_above_trigger(self) -> None:
+        with pytest.raises(ValueError):
+            TokenBudgetPolicy(trigger_tokens=1_000, target_tokens=1_000)
+
+
+class TestAutomaticCompaction:
+    @pytest.mark.asyncio
+    async def test_replaces_planned_items_and_old_summary(self) -> None:
+        compactor = MagicMock()
+        compactor.compact = AsyncMock(return_value="new summary")
+        engine = AutomaticCompaction(
+            compactor=compactor,
+            policy=TokenBudgetPolicy(
+                trigger_tokens=1_000, target_tokens=0, keep_last_user_turns=1
+            ),
+        )
+        summary = ContextItem.new_summary("old summary")
+        snapshot = ConversationSnapshot(items=(summary, *conversation(2)))
+
+        update = await engine.process(response_done(5_000), snapshot)
+
+        assert update is not None
+        assert len(update.create) == 1
+        assert update.create[0].summary
+        assert update.create[0].text == "new summary"
+        assert update.delete_item_ids == (summary.id, "user_0", "assistant_0")
+        compaction_input = compactor.compact.await_args.args[0]
+        assert compaction_input.previous_summary == "old summary"
+
+    @pytest.mark.asyncio
+    async def test_ignores_session_end(self) -> None:
+        compactor = MagicMock()
+        compactor.compact = AsyncMock()
+        engine = AutomaticCompaction(compactor=compactor, policy=TokenBudgetPolicy())
+
+        update = await engine.process(
+            ContextEvent(kind=ContextEventKind.SESSION_ENDED),
+            ConversationSnapshot(items=conversation(10)),
+        )
+
+        assert update is None
+        compactor.compact.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_empty_summary_keeps_context(self) -> None:
+        compactor = MagicMock()
+        compactor.compact = AsyncMock(return_value="")
+        engine = AutomaticCompaction(
+            compactor=compactor,
+            policy=TokenBudgetPolicy(
+                trigger_tokens=1_000, target_tokens=0, keep_last_user_turns=1
+            ),
+        )
+
+        update = await engine.process(
+            response_done(5_000), ConversationSnapshot(items=conversation(3))
+        )
+
+        assert update is None
+
+
+class TestLLMCompactor:
+    @pytest.mark.asyncio
+    async def test_marks_interrupted_items_and_includes_previous_summary(
+        self,
+    ) -> None:
+        llm = MagicMock()
+        llm.invoke = AsyncMock(return_value=MagicMock(completion="  summary  "))
+        compactor = LLMCompactor(llm)
+        interrupted = ContextItem(
+            id="a",
+            kind=ContextItemKind.MESSAGE,
+            text="half a sentence",
+            role="assistant",
+            interrupted=True,
+        )
+
+        summary = await compactor.compact(
+            CompactionInput(items=(interrupted,), previous_summary="before")
+        )
+
+        assert summary == "summary"
+        prompt = llm.invoke.await_args.args[0][1].content
+        assert "[ASSISTANT, INTERRUPTED]: half a sentence" in prompt
+        assert "<previous_summary>\nbefore\n</previous_summary>" in prompt
@@ -0,0 +1,82 @@
+from rtvoice.context import ContextItem, ContextItemKind, ConversationLedger
+
+
+def message(item_id: str, text: str = "hello") -> ContextItem:
+    return ContextItem(id=item_id, kind=ContextItemKind.MESSAGE, text=text, role="user")
+
+
+def ids(ledger: ConversationLedger) -> list[str]:
+    return [item.id for item in ledger.snapshot().items]
+
+
+class TestConversationLedger:
+    def test_appends_without_previous_item(self) -> None:
+        ledger = ConversationLedger()
+        ledger.add(message("a"))
+        ledger.add(message("b"))
+
+        assert ids(ledger) == ["a", "b"]
+
+    def test_inserts_after_previous_item_and_at_root(self) -> None:
+        ledger = ConversationLedger()
+        ledger.add(message("a"))
+        ledger.add(message("c"), previous_item_id="a")
+        ledger.add(message("b"), previous_item_id="a")
+        ledger.add(message("summary"), previous_item_id="root")
+
+        assert ids(ledger) == ["summary", "a", "b", "c"]
+
+    def test_deleted_items_leave_snapshot_but_stay_archived(self) -> None:
+        ledger = ConversationLedger()
+        ledger.add(message("a"))
+        ledger.add(message("b"))
+
+        ledger.mark_deleted("a")
+
+        assert ids(ledger) == ["b"]
+        assert [item.id for item in ledger.archive] == ["a", "b"]
+        assert not ledger.is_active("a")
+
+    def test_archive_keeps_only_the_latest_deleted_items(self) -> None:
+        ledger = ConversationLedger(max_archived_items=2)
+        for item_id in "abcd":
+            ledger.add(message(item_id))
+
+        for item_id in "abc":
+            ledger.mark_deleted(item_id)
+        ledger.add(message("e"), previous_item_id="d")
+
+        assert [item.id for item in ledger.archive] == ["b", "c", "d", "e"]
+        assert ledger.get("e") is not None
+
+    def test_mark_all_deleted_keeps_the_archive(self) -> None:
+        ledger = ConversationLedger()
+        ledger.add(message("a"))
+        ledger.add(message("b"))
+
+        ledger.mark_all_deleted()
+        ledger.add(message("c"))
+
+        assert ids(ledger) == ["c"]
+        assert [item.id for item in ledger.archive] == ["a", "b", "c"]
+
+    def test_updates_text_and_interruption(self) -> None:
+        ledger = ConversationLedger()
+        ledger.add(message("a", text=""))
+
+        ledger.set_text("a", "transcript")
+        ledger.mark_interrupted("a")
+
+        item = ledger.get("a")
+        assert item is not None
+        assert item.text == "transcript"
+        assert item.interrupted
+
+    def test_snapshot_is_not_affected_by_later_items(self) -> None:
+        ledger = ConversationLedger()
+        ledger.add(message("a"))
+        snapshot = ledger.snapshot()
+
+        ledger.add(message("b"))
+
+        assert [item.id for item in snapshot.items] == ["a"]
@@ -1,7 +1,7 @@
 import pytest
 from transitbus import EventBus
 
-from rtvoice.conversation import AssistantTurn, ConversationHistory, UserTurn
+from rtvoice.conversation import AssistantTurn, ConversationHistory, ToolTurn, UserTurn
 from rtvoice.events.views import (
     AssistantInterruptedEvent,
     AssistantTranscriptCompletedEvent,
@@ -109,6 +109,27 @@ class TestTurns:
     def test_turns_empty_initially(self, history: ConversationHistory) -> None:
         assert history.turns == []
 
+    def test_snapshot_keeps_turns_at_the_time_it_was_taken(
+        self, history: ConversationHistory
+    ) -> None:
+        history.add(UserTurn(transcript="First"))
+        snapshot = history.snapshot()
+
+        history.add(AssistantTurn(transcript="Second"))
+
+        assert [turn.transcript for turn in snapshot] == ["First"]
+        assert len(history) == 2
+
+    @pytest.mark.asyncio
+    async def test_spills_old_turns_to_disk(self, tmp_path, bus: EventBus) -> None:
+        path = tmp_path / "history.jsonl"
+        history = ConversationHistory(bus, spill_path=path, max_in_memory_turns=1)
+        history.seed(UserTurn(transcript=f"turn {i}") for i in range(600))
+
+        assert path.stat().st_size > 0
+        assert history.turns[0].transcript == "turn 0"
+        assert history.format_window(8).endswith("[USER]: turn 599")
+
 
 class TestToolExecutedTurns:
     @pytest.mark.asyncio
@@ -200,6 +221,19 @@ class TestInterruptions:
 
         assert history.turns[0].interrupted is False
 
+    @pytest.mark.asyncio
+    async def test_unkeyed_interruption_marks_latest_assistant_turn(
+        self, bus: EventBus, history: ConversationHistory
+    ) -> None:
+        history.add(AssistantTurn(transcript="Earlier."))
+        history.add(AssistantTurn(transcript="Latest."))
+        history.add(UserTurn(transcript="Wait"))
+
+        await bus.dispatch(AssistantInterruptedEvent(played_ms=0))
+
+        earlier, latest, _ = history.turns
+        assert (earlier.interrupted, latest.interrupted) == (False, True)
+
 
 class TestFormat:
     def test_format_returns_placeholder_when_empty(
@@ -355,3 +389,59 @@ class TestFormat:
         assert history.format() == (
             "[ASSISTANT, INTERRUPTED]: one two three <INTERRUPTED>"
         )
+
+
+class TestFormatWindow:
+    def test_returns_placeholder_when_empty(self, history: ConversationHistory) -> None:
+        assert history.format_window(100) == "(no conversation yet)"
+
+    def test_rejects_empty_budget(self, history: ConversationHistory) -> None:
+        with pytest.raises(ValueError, match="max_tokens"):
+            history.format_window(0)
+
+    def test_keeps_everything_within_budget(self, history: ConversationHistory) -> None:
+        history.seed([UserTurn(transcript="Hi"), AssistantTurn(transcript="Hello")])
+
+        assert history.format_window(1_000) == history.format()
+
+    def test_keeps_latest_turns_and_notes_the_rest(
+        self, history: ConversationHistory
+    ) -> None:
+        # every formatted turn is 40 characters, i.e. 10 estimated tokens
+        history.seed(UserTurn(transcript=f"message {i:022d}") for i in range(5))
+
+        window = history.format_window(25)
+
+        assert window.splitlines() == [
+            "(3 earlier turns omitted)",
+            f"[USER]: message {3:022d}",
+            f"[USER]: message {4:022d}",
+        ]
+
+    def test_cuts_an_oversized_latest_turn(self, history: ConversationHistory) -> None:
+        history.seed(
+            [UserTurn(transcript="Hi"), ToolTurn(name="dump", result="x" * 400)]
+        )
+
+        window = history.format_window(10)
+
+        first, last = window.splitlines()
+        assert first == "(1 earlier turn omitted)"
+        assert len(last) == 40
+        assert last.endswith(" [...]")
+
+    @pytest.mark.asyncio
+    async def test_reflects_interruptions(
+        self, bus: EventBus, history: ConversationHistory
+    ) -> None:
+        await bus.dispatch(
+            AssistantTranscriptCompletedEvent(
+                transcript="one two three",
+                item_id="item-1",
+                output_index=0,
+                content_index=0,
+            )
+        )
+        await bus.dispatch(AssistantInterruptedEvent(item_id="item-1", played_ms=0))
+
+        assert history.format_window(100) == "[ASSISTANT, INTERRUPTED]: <INTERRUPTED>"
@@ -0,0 +1,124 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+from transitbus import EventBus
+
+from rtvoice.conversation import (
+    AssistantTurn,
+    ConversationHistory,
+    ConversationStore,
+    ConversationWriter,
+    JSONLConversationStore,
+    SQLiteConversationStore,
+    ToolTurn,
+    UserTurn,
+)
+from rtvoice.events.views import AgentStoppedEvent, AssistantInterruptedEvent
+
+
+@pytest.fixture(params=["sqlite", "jsonl"])
+def store(request: pytest.FixtureRequest, tmp_path: Path) -> ConversationStore:
+    if request.param == "sqlite":
+        store = SQLiteConversationStore(tmp_path / "conversations.db")
+    else:
+        store = JSONLConversationStore(tmp_path / "conversations")
+    yield store
+    store.close()
+
+
+class TestStores:
+    def test_round_trips_all_turn_kinds(self, store: ConversationStore) -> None:
+        turns = [
+            UserTurn(transcript="Hi"),
+            AssistantTurn(transcript="Hello there", interrupted=True, played_ms=300),
+            ToolTurn(name="lookup", result="42"),
+        ]
+
+        store.save("call-1", list(enumerate(turns)))
+
+        assert store.load("call-1") == turns
+
+    def test_saving_a_position_again_replaces_it(
+        self, store: ConversationStore
+    ) -> None:
+        store.save(
+            "call-1", [(0, UserTurn(transcript="Hi")), (1, UserTurn(transcript="A"))]
+        )
+        store.save("call-1", [(1, UserTurn(transcript="B"))])
+
+        assert [turn.transcript for turn in store.load("call-1")] == ["Hi", "B"]
+
+    def test_conversations_are_separate(self, store: ConversationStore) -> None:
+        store.save("call-1", [(0, UserTurn(transcript="one"))])
+        store.save("call-2", [(0, UserTurn(transcript="two"))])
+
+        assert store.load("call-2") == [UserTurn(transcript="two")]
+        assert store.load("unknown") == []
+
+
+class TestJSONLConversationStore:
+    def test_rejects_ids_that_leave_the_directory(self, tmp_path: Path) -> None:
+        store = JSONLConversationStore(tmp_path)
+
+        with pytest.raises(ValueError, match="Invalid conversation id"):
+            store.save("../escape", [(0, UserTurn(transcript="x"))])
+
+    def test_survives_a_line_cut_short_by_a_crash(self, tmp_path: Path) -> None:
+        store = JSONLConversationStore(tmp_path)
+        store.save("call-1", [(0, UserTurn(transcript="one"))])
+        with (tmp_path / "call-1.jsonl").open("a", encoding="utf-8") as file:
+            file.write('{"position": 1, "turn": {"ro')
+
+        assert store.load("call-1") == [UserTurn(transcript="one")]
+
+        store.save("call-1", [(1, UserTurn(transcript="two"))])
+
+        assert store.load("call-1") == [
+            UserTurn(transcript="one"),
+            UserTurn(transcript="two"),
+        ]
+
+
+class TestConversationWriter:
+    @pytest.mark.asyncio
+    async def test_batches_changes_and_flushes_on_stop(self, tmp_path: Path) -> None:
+        bus = EventBus()
+        history = ConversationHistory(bus)
+        store = SQLiteConversationStore(tmp_path / "c.db")
+        ConversationWriter(bus, history, store, "call-1", flush_interval_seconds=60)
+
+        history.add(UserTurn(transcript="Hi"))
+        history.add(AssistantTurn(transcript="Hello"))
+        assert store.load("call-1") == []
+
+        await bus.dispatch(AgentStoppedEvent())
+
+        assert store.load("call-1") == history.turns
+
+    @pytest.mark.asyncio
+    async def test_writes_after_the_flush_interval(self, tmp_path: Path) -> None:
+        bus = EventBus()
+        history = ConversationHistory(bus)
+        store = JSONLConversationStore(tmp_path)
+        ConversationWriter(bus, history, store, "call-1", flush_interval_seconds=0.01)
+
+        history.add(UserTurn(transcript="Hi"))
+        await asyncio.sleep(0.1)
+
+        assert store.load("call-1") == [UserTurn(transcript="Hi")]
+
+    @pytest.mark.asyncio
+    async def test_persists_interruptions(self, tmp_path: Path) -> None:
+        bus = EventBus()
+        history = ConversationHistory(bus)
+        store = JSONLConversationStore(tmp_path)
+        ConversationWriter(bus, history, store, "call-1", flush_interval_seconds=0)
+
+        history.add(AssistantTurn(transcript="A long answer"))
+        await asyncio.sleep(0.05)
+        await bus.dispatch(AssistantInterruptedEvent(played_ms=0))
+        await bus.dispatch(AgentStoppedEvent())
+
+        (turn,) = store.load("call-1")
+        assert turn.interrupted
@@ -0,0 +1,105 @@
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from rtvoice.conversation import AssistantTurn, UserTurn
+from rtvoice.conversation.store import TurnRecord, TurnStore, _SpilledChunk
+
+
+def _fill(store: TurnStore, count: int) -> None:
+    for index in range(count):
+        store.append(TurnRecord(UserTurn(transcript=f"turn {index}")))
+
+
+class TestTurnStore:
+    def test_rejects_invalid_sizes(self) -> None:
+        with pytest.raises(ValueError, match="chunk_size"):
+            TurnStore(chunk_size=0)
+        with pytest.raises(ValueError, match="max_in_memory_turns"):
+            TurnStore(max_in_memory_turns=0)
+
+    def test_get_across_chunks(self) -> None:
+        store = TurnStore(chunk_size=3)
+        _fill(store, 7)
+
+        assert len(store) == 7
+        assert [store.get(i).turn.transcript for i in (0, 3, 6)] == [
+            "turn 0",
+            "turn 3",
+            "turn 6",
+        ]
+        assert [r.turn.transcript for r in store.reversed_records()][:2] == [
+            "turn 6",
+            "turn 5",
+        ]
+
+    def test_snapshot_is_unaffected_by_later_changes(self) -> None:
+        store = TurnStore(chunk_size=2)
+        _fill(store, 3)
+        snapshot = store.snapshot()
+
+        _fill(store, 2)
+        store.replace(0, TurnRecord(AssistantTurn(transcript="replaced")))
+
+        assert len(snapshot) == 3
+        assert [turn.transcript for turn in snapshot] == ["turn 0", "turn 1", "turn 2"]
+        assert store.get(0).turn.transcript == "replaced"
+
+    def test_snapshot_supports_negative_index_and_slices(self) -> None:
+        store = TurnStore(chunk_size=2)
+        _fill(store, 5)
+        snapshot = store.snapshot()
+
+        assert snapshot[-1].transcript == "turn 4"
+        assert [turn.transcript for turn in snapshot[-2:]] == ["turn 3", "turn 4"]
+        with pytest.raises(IndexError):
+            snapshot[5]
+
+
+class TestSpill:
+    def test_old_chunks_move_to_disk_and_read_back(self, tmp_path: Path) -> None:
+        path = tmp_path / "history.jsonl"
+        store = TurnStore(chunk_size=2, spill_path=path, max_in_memory_turns=3)
+
+        _fill(store, 6)
+
+        assert len(path.read_text().splitlines()) == 4
+        assert [turn.transcript for turn in store.snapshot()] == [
+            f"turn {index}" for index in range(6)
+        ]
+        assert store.get(1).turn.transcript == "turn 1"
+
+    def test_slice_reads_a_spilled_chunk_once(self, tmp_path: Path) -> None:
+        store = TurnStore(
+            chunk_size=4, spill_path=tmp_path / "h.jsonl", max_in_memory_turns=4
+        )
+        _fill(store, 8)
+        snapshot = store.snapshot()
+
+        with patch.object(_SpilledChunk, "load", autospec=True) as load:
+            load.side_effect = lambda chunk: tuple(
+                TurnRecord(UserTurn(transcript=f"turn {i}")) for i in range(4)
+            )
+            turns = snapshot[0:4]
+            snapshot[1]
+
+        assert [turn.transcript for turn in turns] == [f"turn {i}" for i in range(4)]
+        assert load.call_count == 1
+
+    def test_spilled_turns_are_final(self, tmp_path: Path) -> None:
+        store = TurnStore(
+            chunk_size=1, spill_path=tmp_path / "h.jsonl", max_in_memory_turns=1
+        )
+        _fill(store, 3)
+
+        assert not store.replace(0, TurnRecord(UserTurn(transcript="late")))
+        assert store.replace(2, TurnRecord(UserTurn(transcript="late")))
+
+    def test_existing_file_is_truncated(self, tmp_path: Path) -> None:
+        path = tmp_path / "history.jsonl"
+        path.write_text("stale\n")
+
+        TurnStore(spill_path=path)
+
+        assert path.read_text() == ""
@@ -48,6 +48,7 @@ def websocket() -> MagicMock:
     ws = MagicMock()
     ws.send = AsyncMock()
     ws.is_connected = False
+    ws.is_reconnecting = False
     return ws
 
 
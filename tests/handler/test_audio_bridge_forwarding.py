@@ -17,6 +17,7 @@ def websocket() -> MagicMock:
     ws = MagicMock()
     ws.send = AsyncMock()
     ws.is_connected = False
+    ws.is_reconnecting = False
     return ws
 
 
@@ -59,3 +60,17 @@ class TestAudioForwarding:
         await event_bus.dispatch(InputAudioBufferAppendEvent(audio="AAAA"))
 
         websocket.send.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_forwards_audio_event_while_reconnecting(
+        self,
+        event_bus: EventBus,
+        audio_bridge: AudioBridge,
+        websocket: MagicMock,
+    ) -> None:
+        websocket.is_reconnecting = True
+        audio_event = InputAudioBufferAppendEvent(audio="AAAA")
+
+        await event_bus.dispatch(audio_event)
+
+        websocket.send.assert_called_once_with(audio_event)
@@ -0,0 +1,358 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from transitbus import EventBus
+
+from rtvoice.context import (
+    ContextEventKind,
+    ContextItem,
+    ContextUpdate,
+    ConversationSnapshot,
+)
+from rtvoice.events.views import (
+    AgentStoppedEvent,
+    ContextUpdateAppliedEvent,
+    RealtimeReconnectedEvent,
+)
+from rtvoice.handler import ContextEngineRunner
+from rtvoice.realtime.schemas import (
+    ConversationItemAddedEvent,
+    ConversationItemCreateEvent,
+    ConversationItemDeletedEvent,
+    ConversationItemDeleteEvent,
+    ConversationItemTruncatedEvent,
+    InputConversationContent,
+    MessageConversationItem,
+    MessageRole,
+    RealtimeResponseObject,
+    RealtimeServerEvent,
+    ResponseCreatedEvent,
+    ResponseDoneEvent,
+    TokenUsage,
+    unwrap_conversation_summary,
+)
+
+
+class FakeEngine:
+    def __init__(self, update: ContextUpdate | None = None) -> None:
+        self.update = update
+        self.calls: list[tuple[ContextEventKind, ConversationSnapshot]] = []
+
+    async def process(self, event, snapshot):
+        self.calls.append((event.kind, snapshot))
+        return self.update
+
+
+def make_websocket(
+    event_bus: EventBus, *, confirm_creates: bool = True, confirm_deletes=True
+) -> MagicMock:
+    """Echoes conversation.item.added/deleted like the server would."""
+    ws = MagicMock()
+    ws.is_connected = True
+    ws.sent = []
+
+    async def send_many(messages):
+        ws.sent.extend(messages)
+        for message in messages:
+            if isinstance(message, ConversationItemCreateEvent) and confirm_creates:
+                await event_bus.dispatch(
+                    ConversationItemAddedEvent(
+                        type=RealtimeServerEvent.CONVERSATION_ITEM_ADDED,
+                        event_id="evt",
+                        previous_item_id=message.previous_item_id,
+                        item=message.item,
+                    )
+                )
+            if isinstance(message, ConversationItemDeleteEvent):
+                confirmed = (
+                    confirm_deletes(message.item_id)
+                    if callable(confirm_deletes)
+                    else confirm_deletes
+                )
+                if confirmed:
+                    await event_bus.dispatch(
+                        ConversationItemDeletedEvent(
+                            event_id="evt", item_id=message.item_id
+                        )
+                    )
+        return 0
+
+    ws.send_many = AsyncMock(side_effect=send_many)
+    return ws
+
+
+def item_added(
+    item_id: str, role: MessageRole, text: str
+) -> ConversationItemAddedEvent:
+    return ConversationItemAddedEvent(
+        type=RealtimeServerEvent.CONVERSATION_ITEM_ADDED,
+        event_id=f"evt_{item_id}",
+        item=MessageConversationItem(
+            id=item_id,
+            role=role,
+            content=[InputConversationContent(text=text)],
+        ),
+    )
+
+
+def response_created() -> ResponseCreatedEvent:
+    return ResponseCreatedEvent(
+        type=RealtimeServerEvent.RESPONSE_CREATED,
+        event_id="evt_created",
+        response=RealtimeResponseObject(id="resp_1"),
+    )
+
+
+def response_done(input_tokens: int = 30_000) -> ResponseDoneEvent:
+    return ResponseDoneEvent(
+        type=RealtimeServerEvent.RESPONSE_DONE,
+        event_id="evt_done",
+        response=RealtimeResponseObject(
+            id="resp_1", usage=TokenUsage(input_tokens=input_tokens)
+        ),
+    )
+
+
+async def seed(event_bus: EventBus) -> None:
+    await event_bus.dispatch(item_added("user_1", MessageRole.USER, "hi"))
+    await event_bus.dispatch(item_added("assistant_1", MessageRole.ASSISTANT, "hey"))
+
+
+async def finish(runner: ContextEngineRunner) -> None:
+    if runner._task:
+        await runner._task
+
+
+def reconnected() -> RealtimeReconnectedEvent:
+    return RealtimeReconnectedEvent(
+        attempts=1,
+        downtime_seconds=0.5,
+        replayed_items=2,
+        flushed_audio_chunks=0,
+        dropped_audio_chunks=0,
+    )
+
+
+def compaction_update() -> ContextUpdate:
+    return ContextUpdate(
+        create=(ContextItem.new_summary("they said hi"),),
+        delete_item_ids=("user_1", "assistant_1"),
+    )
+
+
+@pytest.fixture
+def event_bus() -> EventBus:
+    return EventBus()
+
+
+class TestLedgerMirroring:
+    @pytest.mark.asyncio
+    async def test_mirrors_items_and_interruptions(self, event_bus: EventBus) -> None:
+        runner = ContextEngineRunner(event_bus, make_websocket(event_bus), FakeEngine())
+
+        await seed(event_bus)
+        await event_bus.dispatch(
+            ConversationItemTruncatedEvent(
+                event_id="evt", item_id="assistant_1", content_index=0, audio_end_ms=5
+            )
+        )
+
+        items = runner.ledger.snapshot().items
+        assert [(item.id, item.role, item.text) for item in items] == [
+            ("user_1", "user", "hi"),
+            ("assistant_1", "assistant", "hey"),
+        ]
+        assert items[1].interrupted
+
+    @pytest.mark.asyncio
+    async def test_reconnect_starts_over_with_the_replayed_items(
+        self, event_bus: EventBus
+    ) -> None:
+        runner = ContextEngineRunner(event_bus, make_websocket(event_bus), FakeEngine())
+        await seed(event_bus)
+
+        await event_bus.dispatch(reconnected())
+        await event_bus.dispatch(item_added("replayed_1", MessageRole.USER, "hi"))
+        await event_bus.dispatch(item_added("replayed_2", MessageRole.ASSISTANT, "hey"))
+
+        assert [item.id for item in runner.ledger.snapshot().items] == [
+            "replayed_1",
+            "replayed_2",
+        ]
+        assert not runner.ledger.is_active("user_1")
+
+
+class TestContextEngineRunner:
+    @pytest.mark.asyncio
+    async def test_passes_usage_and_snapshot(self, event_bus: EventBus) -> None:
+        engine = FakeEngine()
+        runner = ContextEngineRunner(event_bus, make_websocket(event_bus), engine)
+        await seed(event_bus)
+
+        await event_bus.dispatch(response_done())
+        await finish(runner)
+
+        kind, snapshot = engine.calls[0]
+        assert kind is ContextEventKind.RESPONSE_DONE
+        assert [item.id for item in snapshot.items] == ["user_1", "assistant_1"]
+
+    @pytest.mark.asyncio
+    async def test_creates_summary_at_root_before_deleting(
+        self, event_bus: EventBus
+    ) -> None:
+        ws = make_websocket(event_bus)
+        runner = ContextEngineRunner(event_bus, ws, FakeEngine(compaction_update()))
+        applied: list[ContextUpdateAppliedEvent] = []
+        event_bus.on(ContextUpdateAppliedEvent, AsyncMock(side_effect=applied.append))
+        await seed(event_bus)
+
+        await event_bus.dispatch(response_done())
+        await finish(runner)
+
+        create, *deletes = ws.sent
+        assert isinstance(create, ConversationItemCreateEvent)
+        assert create.previous_item_id == "root"
+        assert unwrap_conversation_summary(create.item.content[0].text) == (
+            "they said hi"
+        )
+        assert [delete.item_id for delete in deletes] == ["user_1", "assistant_1"]
+
+        snapshot = runner.ledger.snapshot()
+        assert len(snapshot.items) == 1
+        assert snapshot.summary is not None
+        assert snapshot.summary.text == "they said hi"
+        assert applied[0].deleted_item_ids == ["user_1", "assistant_1"]
+        assert applied[0].input_tokens == 30_000
+
+    @pytest.mark.asyncio
+    async def test_unconfirmed_create_deletes_nothing(
+        self, event_bus: EventBus
+    ) -> None:
+        ws = make_websocket(event_bus, confirm_creates=False)
+        runner = ContextEngineRunner(
+            event_bus,
+            ws,
+            FakeEngine(compaction_update()),
+            confirm_timeout_seconds=0.01,
+        )
+        await seed(event_bus)
+
+        await event_bus.dispatch(response_done())
+        await finish(runner)
+
+        assert not any(isinstance(m, ConversationItemDeleteEvent) for m in ws.sent)
+        assert [item.id for item in runner.ledger.snapshot().items] == [
+            "user_1",
+            "assistant_1",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failed_deletes_stay_in_context(self, event_bus: EventBus) -> None:
+        ws = make_websocket(
+            event_bus, confirm_deletes=lambda item_id: item_id != "assistant_1"
+        )
+        runner = ContextEngineRunner(
+            event_bus,
+            ws,
+            FakeEngine(compaction_update()),
+            confirm_timeout_seconds=0.01,
+        )
+        applied: list[ContextUpdateAppliedEvent] = []
+        event_bus.on(ContextUpdateAppliedEvent, AsyncMock(side_effect=applied.append))
+        await seed(event_bus)
+
+        await event_bus.dispatch(response_done())
+        await finish(runner)
+
+        assert applied[0].failed_item_ids == ["assistant_1"]
+        assert runner.ledger.is_active("assistant_1")
+
+    @pytest.mark.asyncio
+    async def test_waits_for_running_response(self, event_bus: EventBus) -> None:
+        ws = make_websocket(event_bus)
+        release = asyncio.Event()
+
+        class SlowEngine(FakeEngine):
+            async def process(self, event, snapshot):
+                await release.wait()
+                return compaction_update()
+
+        runner = ContextEngineRunner(event_bus, ws, SlowEngine())
+        await seed(event_bus)
+        await event_bus.dispatch(response_done())
+        await event_bus.dispatch(response_created())
+
+        release.set()
+        await asyncio.sleep(0.01)
+        assert ws.sent == []
+
+        await event_bus.dispatch(response_done())
+        await finish(runner)
+        assert len(ws.sent) == 3
+
+    @pytest.mark.asyncio
+    async def test_runs_one_engine_call_at_a_time(self, event_bus: EventBus) -> None:
+        release = asyncio.Event()
+        calls = 0
+
+        class SlowEngine(FakeEngine):
+            async def process(self, event, snapshot):
+                nonlocal calls
+                calls += 1
+                await release.wait()
+
+        runner = ContextEngineRunner(event_bus, make_websocket(event_bus), SlowEngine())
+        await event_bus.dispatch(response_done())
+        await event_bus.dispatch(response_done())
+        release.set()
+        await finish(runner)
+
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_engine_failure_keeps_context(self, event_bus: EventBus) -> None:
+        engine = MagicMock()
+        engine.process = AsyncMock(side_effect=RuntimeError("boom"))
+        ws = make_websocket(event_bus)
+        runner = ContextEngineRunner(event_bus, ws, engine)
+        await seed(event_bus)
+
+        await event_bus.dispatch(response_done())
+        await finish(runner)
+
+        assert ws.sent == []
+
+    @pytest.mark.asyncio
+    async def test_notifies_engine_on_session_end(self, event_bus: EventBus) -> None:
+        engine = FakeEngine()
+        ContextEngineRunner(event_bus, make_websocket(event_bus), engine)
+
+        await event_bus.dispatch(AgentStoppedEvent())
+
+        assert engine.calls[0][0] is ContextEventKind.SESSION_ENDED
+
+    @pytest.mark.asyncio
+    async def test_reconnect_during_engine_run_drops_the_update(
+        self, event_bus: EventBus
+    ) -> None:
+        ws = make_websocket(event_bus)
+        release = asyncio.Event()
+
+        class SlowEngine(FakeEngine):
+            async def process(self, event, snapshot):
+                await release.wait()
+                return compaction_update()
+
+        runner = ContextEngineRunner(event_bus, ws, SlowEngine())
+        await seed(event_bus)
+        await event_bus.dispatch(response_done())
+
+        await event_bus.dispatch(reconnected())
+        await event_bus.dispatch(item_added("replayed_1", MessageRole.USER, "hi"))
+        release.set()
+        await finish(runner)
+
+        # the old ids do not exist on the new connection
+        assert ws.sent == []
+        assert [item.id for item in runner.ledger.snapshot().items] == ["replayed_1"]
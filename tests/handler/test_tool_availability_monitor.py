@@ -0,0 +1,95 @@
+import asyncio
+
+import pytest
+from transitbus import EventBus
+
+from rtvoice.events.views import AgentSessionConnectedEvent, AgentStoppedEvent
+from rtvoice.handler import ToolAvailabilityMonitor
+from rtvoice.tools import ToolContext, Tools, provided
+
+
+class Calendar:
+    pass
+
+
+class Harness:
+    def __init__(self, debounce_seconds: float = 0.01) -> None:
+        self.event_bus = EventBus()
+        self.tools = Tools()
+        self.context = ToolContext(self.event_bus)
+        self.tools.set_context(self.context)
+        self.updates = 0
+
+        @self.tools.action(
+            "Create a calendar event.", available_when=provided(Calendar)
+        )
+        def create_event(title: str) -> str: ...
+
+        async def update_tools() -> bool:
+            self.updates += 1
+            return True
+
+        self.monitor = ToolAvailabilityMonitor(
+            self.event_bus, self.tools, update_tools, debounce_seconds
+        )
+
+
+class TestToolAvailabilityMonitor:
+    def test_rejects_negative_debounce(self) -> None:
+        with pytest.raises(ValueError, match="debounce_seconds"):
+            ToolAvailabilityMonitor(EventBus(), Tools(), lambda: None, -1)
+
+    @pytest.mark.asyncio
+    async def test_changes_before_connecting_are_not_pushed(self) -> None:
+        harness = Harness()
+
+        harness.context.provide(Calendar())
+        await asyncio.sleep(0.03)
+
+        assert harness.updates == 0
+
+    @pytest.mark.asyncio
+    async def test_context_change_pushes_an_update(self) -> None:
+        harness = Harness()
+        await harness.event_bus.dispatch(AgentSessionConnectedEvent())
+
+        harness.context.provide(Calendar())
+        await asyncio.sleep(0.03)
+
+        assert harness.updates == 1
+
+    @pytest.mark.asyncio
+    async def test_burst_of_changes_coalesces(self) -> None:
+        harness = Harness()
+        await harness.event_bus.dispatch(AgentSessionConnectedEvent())
+
+        harness.context.provide(Calendar())
+        harness.context.without(Calendar)
+        harness.tools.invalidate_schema()
+        harness.context.provide(Calendar())
+        await asyncio.sleep(0.03)
+
+        assert harness.updates == 1
+
+    @pytest.mark.asyncio
+    async def test_change_after_an_update_is_pushed_again(self) -> None:
+        harness = Harness()
+        await harness.event_bus.dispatch(AgentSessionConnectedEvent())
+
+        harness.context.provide(Calendar())
+        await asyncio.sleep(0.03)
+        harness.context.without(Calendar)
+        await asyncio.sleep(0.03)
+
+        assert harness.updates == 2
+
+    @pytest.mark.asyncio
+    async def test_stop_drops_a_pending_update(self) -> None:
+        harness = Harness(debounce_seconds=0.05)
+        await harness.event_bus.dispatch(AgentSessionConnectedEvent())
+
+        harness.context.provide(Calendar())
+        await harness.event_bus.dispatch(AgentStoppedEvent())
+        await asyncio.sleep(0.08)
+
+        assert harness.updates == 0
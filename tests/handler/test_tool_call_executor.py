@@ -1,25 +1,31 @@
 import asyncio
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import ANY, AsyncMock, MagicMock
 
 import pytest
 from pydantic import BaseModel
 from transitbus import EventBus
 
 from rtvoice.events.views import (
+    RealtimeReconnectedEvent,
     ToolExecutedEvent,
     ToolExecutionCompletedEvent,
     ToolExecutionStartedEvent,
+    ToolProgressEvent,
 )
-from rtvoice.handler import ToolCallExecutor
+from rtvoice.handler import ToolCallExecutor, tool_call_executor
 from rtvoice.realtime.schemas import (
     ConversationItemCreateEvent,
     ConversationResponseCreateEvent,
+    FunctionCallArgumentsDeltaEvent,
+    FunctionCallConversationItem,
     FunctionCallItem,
     RealtimeResponseObject,
     RealtimeServerEvent,
+    ResponseCreatedEvent,
     ResponseDoneEvent,
+    ResponseOutputItemAddedEvent,
 )
-from rtvoice.tools import ActionKind, ActionResult
+from rtvoice.tools import ActionKind, ActionResult, Inject, ToolProgress, Tools
 from rtvoice.tools.views import Tool
 
 
@@ -86,6 +92,7 @@ def make_tool(
     tool.result_instruction = result_instruction
     tool.respond = respond
     tool.kind = kind
+    tool.status = None
     return tool
 
 
@@ -104,6 +111,7 @@ class TestToolBatching:
         assert websocket.send.call_count == 0
 
         await event_bus.dispatch(make_response_done())
+        await executor.join()
         sent_types = [type(call.args[0]) for call in websocket.send.call_args_list]
         assert sent_types == [
             ConversationItemCreateEvent,
@@ -129,6 +137,7 @@ class TestToolBatching:
             make_function_call_item("get_calendar", "call_calendar")
         )
         await event_bus.dispatch(make_response_done())
+        await executor.join()
 
         events = [call.args[0] for call in websocket.send.call_args_list]
         assert sum(isinstance(e, ConversationItemCreateEvent) for e in events) == 2
@@ -149,7 +158,7 @@ class TestToolBatching:
         started = [asyncio.Event(), asyncio.Event()]
         release = asyncio.Event()
 
-        async def execute(name: str, arguments: dict) -> ActionResult:
+        async def execute(name: str, arguments: dict, **_: object) -> ActionResult:
             started[0 if name == "first" else 1].set()
             await release.wait()
             return ActionResult.success(name)
@@ -161,6 +170,7 @@ class TestToolBatching:
         await asyncio.gather(*(event.wait() for event in started))
         release.set()
         await event_bus.dispatch(make_response_done())
+        await executor.join()
 
     @pytest.mark.asyncio
     async def test_failures_do_not_drop_other_outputs(
@@ -179,6 +189,7 @@ class TestToolBatching:
         await event_bus.dispatch(make_function_call_item("broken", "call_1"))
         await event_bus.dispatch(make_function_call_item("working", "call_2"))
         await event_bus.dispatch(make_response_done())
+        await executor.join()
 
         events = [call.args[0] for call in websocket.send.call_args_list]
         assert len(events) == 3
@@ -202,6 +213,7 @@ class TestToolBatching:
         await event_bus.dispatch(make_function_call_item("first", "call_1"))
         await event_bus.dispatch(make_function_call_item("second", "call_2"))
         await event_bus.dispatch(make_response_done())
+        await executor.join()
 
         response = websocket.send.call_args_list[-1].args[0]
         assert response.response.instructions == (
@@ -227,6 +239,7 @@ class TestToolBatching:
 
         await event_bus.dispatch(make_function_call_item())
         await event_bus.dispatch(make_response_done())
+        await executor.join()
 
         item = websocket.send.call_args_list[0].args[0]
         assert item.item.output == '{"city":"Berlin","temperature":18}'
@@ -241,7 +254,10 @@ class TestToolBatching:
         tools.get.return_value = make_tool()
         await event_bus.dispatch(make_function_call_item(arguments={"city": "Berlin"}))
         await event_bus.dispatch(make_response_done())
-        tools.execute.assert_awaited_once_with("get_weather", {"city": "Berlin"})
+        await executor.join()
+        tools.execute.assert_awaited_once_with(
+            "get_weather", {"city": "Berlin"}, progress=ANY, speech=ANY
+        )
 
     @pytest.mark.asyncio
     async def test_silent_result_sends_output_without_creating_response(
@@ -256,6 +272,7 @@ class TestToolBatching:
 
         await event_bus.dispatch(make_function_call_item())
         await event_bus.dispatch(make_response_done())
+        await executor.join()
 
         events = [call.args[0] for call in websocket.send.call_args_list]
         assert len(events) == 1
@@ -282,6 +299,7 @@ class TestToolBatching:
 
         await event_bus.dispatch(make_function_call_item())
         await event_bus.dispatch(make_response_done())
+        await executor.join()
 
         assert [event.response_id for event in started] == ["resp_001"]
         assert len(completed) == 1
@@ -307,6 +325,7 @@ class TestToolBatching:
 
         await event_bus.dispatch(make_function_call_item())
         await event_bus.dispatch(make_response_done())
+        await executor.join()
 
         assert executed[0].silent is False
 
@@ -322,6 +341,7 @@ class TestToolBatching:
 
         await event_bus.dispatch(make_function_call_item())
         await event_bus.dispatch(make_response_done())
+        await executor.join()
 
         assert len(websocket.send.call_args_list) == 1
 
@@ -338,6 +358,7 @@ class TestToolBatching:
 
         await event_bus.dispatch(make_function_call_item())
         await event_bus.dispatch(make_response_done())
+        await executor.join()
 
         events = [call.args[0] for call in websocket.send.call_args_list]
         assert isinstance(events[-1], ConversationResponseCreateEvent)
@@ -359,6 +380,7 @@ class TestToolBatching:
         await event_bus.dispatch(make_function_call_item("quiet", "call_1"))
         await event_bus.dispatch(make_function_call_item("loud", "call_2"))
         await event_bus.dispatch(make_response_done())
+        await executor.join()
 
         events = [call.args[0] for call in websocket.send.call_args_list]
         assert isinstance(events[-1], ConversationResponseCreateEvent)
@@ -376,10 +398,65 @@ class TestToolBatching:
 
         await event_bus.dispatch(make_function_call_item())
         await event_bus.dispatch(make_response_done())
+        await executor.join()
 
         assert len(websocket.send.call_args_list) == 1
 
 
+class TestReconnect:
+    @pytest.mark.asyncio
+    async def test_calls_cut_off_by_a_reconnect_send_no_output(
+        self,
+        event_bus: EventBus,
+        executor: ToolCallExecutor,
+        websocket: AsyncMock,
+        tools: MagicMock,
+    ) -> None:
+        completed: list[ToolExecutionCompletedEvent] = []
+        event_bus.on(ToolExecutionCompletedEvent, completed.append)
+        tools.get.return_value = make_tool()
+
+        await event_bus.dispatch(make_function_call_item())
+        await event_bus.dispatch(
+            RealtimeReconnectedEvent(
+                attempts=1,
+                downtime_seconds=0.5,
+                replayed_items=0,
+                flushed_audio_chunks=0,
+                dropped_audio_chunks=0,
+            )
+        )
+        await executor.join()
+
+        websocket.send.assert_not_called()
+        assert [event.response_pending for event in completed] == [False]
+
+    @pytest.mark.asyncio
+    async def test_calls_after_a_reconnect_are_answered(
+        self,
+        event_bus: EventBus,
+        executor: ToolCallExecutor,
+        websocket: AsyncMock,
+        tools: MagicMock,
+    ) -> None:
+        tools.get.return_value = make_tool()
+        await event_bus.dispatch(
+            RealtimeReconnectedEvent(
+                attempts=1,
+                downtime_seconds=0.5,
+                replayed_items=0,
+                flushed_audio_chunks=0,
+                dropped_audio_chunks=0,
+            )
+        )
+
+        await event_bus.dispatch(make_function_call_item())
+        await event_bus.dispatch(make_response_done())
+        await executor.join()
+
+        assert websocket.send.call_count == 2
+
+
 class TestUnknownTools:
     @pytest.mark.asyncio
     async def test_unknown_tool_is_ignored(
@@ -391,5 +468,312 @@ class TestUnknownTools:
     ) -> None:
         await event_bus.dispatch(make_function_call_item(name="missing"))
         await event_bus.dispatch(make_response_done())
+        await executor.join()
         websocket.send.assert_not_called()
         tools.execute.assert_not_called()
+
+
+def make_output_item_added(
+    name: str, call_id: str = "call_001", response_id: str = "resp_001"
+) -> ResponseOutputItemAddedEvent:
+    return ResponseOutputItemAddedEvent(
+        event_id=f"evt_added_{call_id}",
+        response_id=response_id,
+        output_index=0,
+        item=FunctionCallConversationItem(
+            id=f"item_{call_id}", call_id=call_id, name=name, arguments=""
+        ),
+    )
+
+
+def make_arguments_delta(
+    delta: str, call_id: str = "call_001", response_id: str = "resp_001"
+) -> FunctionCallArgumentsDeltaEvent:
+    return FunctionCallArgumentsDeltaEvent(
+        event_id=f"evt_delta_{call_id}",
+        response_id=response_id,
+        item_id=f"item_{call_id}",
+        output_index=0,
+        call_id=call_id,
+        delta=delta,
+    )
+
+
+class TestEarlyDispatch:
+    @pytest.fixture
+    def calls(self) -> list[dict]:
+        return []
+
+    @pytest.fixture
+    def real_tools(self, calls: list[dict]) -> Tools:
+        tools = Tools()
+
+        @tools.action("Weather lookup.", kind=ActionKind.READ)
+        async def get_weather(city: str, unit: str = "celsius") -> str:
+            calls.append({"city": city, "unit": unit})
+            return f"sunny in {city}"
+
+        @tools.action("Book a table.", kind=ActionKind.MUTATE)
+        async def book_table(city: str) -> str:
+            calls.append({"booked": city})
+            return "booked"
+
+        return tools
+
+    @pytest.fixture
+    def early_executor(
+        self, event_bus: EventBus, real_tools: Tools, websocket: AsyncMock
+    ) -> ToolCallExecutor:
+        return ToolCallExecutor(event_bus, real_tools, websocket, early_dispatch=True)
+
+    @pytest.mark.asyncio
+    async def test_read_tool_starts_once_required_arguments_are_complete(
+        self,
+        event_bus: EventBus,
+        early_executor: ToolCallExecutor,
+        websocket: AsyncMock,
+        calls: list[dict],
+    ) -> None:
+        await event_bus.dispatch(make_output_item_added("get_weather"))
+        await event_bus.dispatch(make_arguments_delta('{"city": "Ber'))
+        await asyncio.sleep(0)
+        assert calls == []
+
+        await event_bus.dispatch(make_arguments_delta('lin"}'))
+        await asyncio.sleep(0)
+        assert calls == [{"city": "Berlin", "unit": "celsius"}]
+
+        await event_bus.dispatch(
+            make_function_call_item("get_weather", arguments={"city": "Berlin"})
+        )
+        await event_bus.dispatch(make_response_done())
+        await early_executor.join()
+
+        assert len(calls) == 1
+        output, response = [call.args[0] for call in websocket.send.call_args_list]
+        assert output.item.output == "sunny in Berlin"
+        assert isinstance(response, ConversationResponseCreateEvent)
+
+    @pytest.mark.asyncio
+    async def test_reruns_when_final_arguments_differ(
+        self,
+        event_bus: EventBus,
+        early_executor: ToolCallExecutor,
+        calls: list[dict],
+    ) -> None:
+        await event_bus.dispatch(make_output_item_added("get_weather"))
+        await event_bus.dispatch(make_arguments_delta('{"city": "Berlin", "unit'))
+        await asyncio.sleep(0)
+
+        await event_bus.dispatch(
+            make_function_call_item(
+                "get_weather", arguments={"city": "Berlin", "unit": "kelvin"}
+            )
+        )
+        await event_bus.dispatch(make_response_done())
+        await early_executor.join()
+
+        assert calls[-1] == {"city": "Berlin", "unit": "kelvin"}
+
+    @pytest.mark.asyncio
+    async def test_non_read_tools_wait_for_final_arguments(
+        self,
+        event_bus: EventBus,
+        early_executor: ToolCallExecutor,
+        calls: list[dict],
+    ) -> None:
+        await event_bus.dispatch(make_output_item_added("book_table"))
+        await event_bus.dispatch(make_arguments_delta('{"city": "Berlin"}'))
+        await asyncio.sleep(0)
+
+        assert calls == []
+
+    @pytest.mark.asyncio
+    async def test_output_is_sent_before_the_response_ends(
+        self,
+        event_bus: EventBus,
+        early_executor: ToolCallExecutor,
+        websocket: AsyncMock,
+    ) -> None:
+        await event_bus.dispatch(
+            make_function_call_item("get_weather", arguments={"city": "Rome"})
+        )
+        await asyncio.sleep(0.01)
+
+        sent = [call.args[0] for call in websocket.send.call_args_list]
+        assert [type(event) for event in sent] == [ConversationItemCreateEvent]
+
+        await event_bus.dispatch(make_response_done())
+        await early_executor.join()
+        assert isinstance(
+            websocket.send.call_args_list[-1].args[0], ConversationResponseCreateEvent
+        )
+
+
+def make_response_created(response_id: str = "resp_filler") -> ResponseCreatedEvent:
+    return ResponseCreatedEvent(
+        type=RealtimeServerEvent.RESPONSE_CREATED,
+        event_id=f"evt_created_{response_id}",
+        response=RealtimeResponseObject(id=response_id),
+    )
+
+
+class TestToolProgress:
+    @pytest.fixture(autouse=True)
+    def short_filler_delay(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(tool_call_executor, "_FILLER_DELAY_SECONDS", 0.01)
+
+    @pytest.fixture
+    def release(self) -> asyncio.Event:
+        return asyncio.Event()
+
+    @pytest.fixture
+    def real_tools(self, release: asyncio.Event) -> Tools:
+        tools = Tools()
+
+        class SearchParams(BaseModel):
+            query: str
+
+        @tools.action(
+            "Search the archive.",
+            params=SearchParams,
+            status="Searching for {query}.",
+        )
+        async def search(params: SearchParams) -> str:
+            await release.wait()
+            return "three hits"
+
+        return tools
+
+    def _executor(
+        self,
+        event_bus: EventBus,
+        real_tools: Tools,
+        websocket: AsyncMock,
+        speak_progress: bool,
+    ) -> ToolCallExecutor:
+        return ToolCallExecutor(
+            event_bus, real_tools, websocket, speak_progress=speak_progress
+        )
+
+    @pytest.mark.asyncio
+    async def test_status_is_dispatched_as_progress(
+        self,
+        event_bus: EventBus,
+        real_tools: Tools,
+        websocket: AsyncMock,
+        release: asyncio.Event,
+    ) -> None:
+        progress: list[ToolProgressEvent] = []
+        event_bus.on(ToolProgressEvent, progress.append)
+        executor = self._executor(event_bus, real_tools, websocket, False)
+
+        await event_bus.dispatch(
+            make_function_call_item("search", arguments={"query": "invoices"})
+        )
+        release.set()
+        await event_bus.dispatch(make_response_done())
+        await executor.join()
+
+        assert [(event.name, event.message) for event in progress] == [
+            ("search", "Searching for invoices.")
+        ]
+        # nothing is spoken unless asked for
+        response = websocket.send.call_args_list[-1].args[0]
+        assert response.response is None
+
+    @pytest.mark.asyncio
+    async def test_slow_tool_speaks_filler_before_results(
+        self,
+        event_bus: EventBus,
+        real_tools: Tools,
+        websocket: AsyncMock,
+        release: asyncio.Event,
+    ) -> None:
+        executor = self._executor(event_bus, real_tools, websocket, True)
+
+        await event_bus.dispatch(
+            make_function_call_item("search", arguments={"query": "invoices"})
+        )
+        await event_bus.dispatch(make_response_done())
+        await asyncio.sleep(0.05)
+
+        (filler,) = [call.args[0] for call in websocket.send.call_args_list]
+        assert filler.response.conversation == "none"
+        assert "Searching for invoices." in filler.response.instructions
+
+        await event_bus.dispatch(make_response_created())
+        release.set()
+        await asyncio.sleep(0.01)
+        # the results wait until the filler finished playing
+        assert len(websocket.send.call_args_list) == 2
+
+        await event_bus.dispatch(make_response_done("resp_filler"))
+        await executor.join()
+
+        output, response = [call.args[0] for call in websocket.send.call_args_list][1:]
+        assert output.item.output == "three hits"
+        assert response.response is None
+
+    @pytest.mark.asyncio
+    async def test_fast_tool_gets_no_filler(
+        self,
+        event_bus: EventBus,
+        real_tools: Tools,
+        websocket: AsyncMock,
+        release: asyncio.Event,
+    ) -> None:
+        executor = self._executor(event_bus, real_tools, websocket, True)
+        release.set()
+
+        await event_bus.dispatch(
+            make_function_call_item("search", arguments={"query": "invoices"})
+        )
+        await event_bus.dispatch(make_response_done())
+        await executor.join()
+
+        sent = [call.args[0] for call in websocket.send.call_args_list]
+        assert [type(event) for event in sent] == [
+            ConversationItemCreateEvent,
+            ConversationResponseCreateEvent,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_spoken_answer_is_said_verbatim_once_and_in_order(
+        self, event_bus: EventBus, websocket: AsyncMock
+    ) -> None:
+        tools = Tools()
+
+        @tools.action("Answer a question.")
+        async def answer(progress: Inject[ToolProgress]) -> ActionResult:
+            for sentence in ["One.", "Two.", "Three."]:
+                progress.speak(sentence)
+            return ActionResult.success("One. Two. Three.", respond=False)
+
+        # without speak_progress, so no filler competes with the answer
+        executor = ToolCallExecutor(event_bus, tools, websocket)
+
+        await event_bus.dispatch(make_function_call_item("answer"))
+        await event_bus.dispatch(make_response_done())
+        for index in range(3):
+            await asyncio.sleep(0.01)
+            await event_bus.dispatch(make_response_created(f"resp_speech_{index}"))
+            await event_bus.dispatch(make_response_done(f"resp_speech_{index}"))
+        await executor.join()
+
+        sent = [call.args[0] for call in websocket.send.call_args_list]
+        spoken = [
+            event.response.instructions
+            for event in sent
+            if isinstance(event, ConversationResponseCreateEvent) and event.response
+        ]
+        assert [instructions.rsplit(": ", 1)[1] for instructions in spoken] == [
+            "One.",
+            "Two.",
+            "Three.",
+        ]
+        assert all("word for word" in instructions for instructions in spoken)
+        # the answer was said, so the output creates no response of its own
+        assert [type(event) for event in sent].count(
+            ConversationResponseCreateEvent
+        ) == 3
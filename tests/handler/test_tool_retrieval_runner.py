@@ -0,0 +1,116 @@
+import pytest
+from transitbus import EventBus
+
+from rtvoice.handler import ToolRetrievalRunner
+from rtvoice.realtime.schemas import (
+    ErrorDetails,
+    InputAudioTranscriptionCompleted,
+    InputAudioTranscriptionFailed,
+    RealtimeServerEvent,
+)
+from rtvoice.tools import ToolContext, ToolRetrieval, ToolRetriever, Tools
+
+
+def transcript(text: str) -> InputAudioTranscriptionCompleted:
+    return InputAudioTranscriptionCompleted(
+        type=RealtimeServerEvent.CONVERSATION_ITEM_INPUT_AUDIO_TRANSCRIPTION_COMPLETED,
+        event_id="evt_001",
+        item_id="item_001",
+        content_index=0,
+        transcript=text,
+    )
+
+
+class TestToolRetrievalRunner:
+    @pytest.fixture
+    def setup(self) -> tuple[EventBus, Tools, list[set[str]]]:
+        event_bus = EventBus()
+        tools = Tools()
+
+        @tools.action("Look up the weather forecast for a city.")
+        def get_weather(city: str) -> str: ...
+
+        @tools.action("Create a calendar event.")
+        def create_event(title: str) -> str: ...
+
+        tools.set_context(ToolContext(event_bus))
+        sent: list[set[str]] = []
+
+        async def update_tools() -> bool:
+            sent.append({schema.name for schema in tools.get_schema()})
+            return True
+
+        retriever = ToolRetriever(tools, policy=ToolRetrieval(top_k=1))
+        ToolRetrievalRunner(event_bus, retriever, update_tools)
+        return event_bus, tools, sent
+
+    @pytest.mark.asyncio
+    async def test_transcript_updates_session_tools(self, setup) -> None:
+        event_bus, _, sent = setup
+
+        await event_bus.dispatch(transcript("What's the weather in Paris?"))
+
+        assert sent == [{"get_weather", "stop"}]
+
+    @pytest.mark.asyncio
+    async def test_unchanged_selection_sends_nothing(self, setup) -> None:
+        event_bus, _, sent = setup
+
+        await event_bus.dispatch(transcript("weather in Paris"))
+        await event_bus.dispatch(transcript("and the weather in Rome?"))
+        await event_bus.dispatch(transcript("   "))
+
+        assert len(sent) == 1
+
+
+class TestResponseAfterSelection:
+    @pytest.fixture
+    def setup(self) -> tuple[EventBus, list[object]]:
+        event_bus = EventBus()
+        tools = Tools()
+
+        @tools.action("Look up the weather forecast for a city.")
+        def get_weather(city: str) -> str: ...
+
+        @tools.action("Create a calendar event.")
+        def create_event(title: str) -> str: ...
+
+        tools.set_context(ToolContext(event_bus))
+        calls: list[object] = []
+
+        async def update_tools() -> bool:
+            calls.append({schema.name for schema in tools.get_schema()})
+            return True
+
+        async def create_response() -> None:
+            calls.append("response.create")
+
+        retriever = ToolRetriever(tools, policy=ToolRetrieval(top_k=1))
+        ToolRetrievalRunner(event_bus, retriever, update_tools, create_response)
+        return event_bus, calls
+
+    @pytest.mark.asyncio
+    async def test_first_spoken_turn_is_answered_with_its_tools(self, setup) -> None:
+        event_bus, calls = setup
+
+        await event_bus.dispatch(transcript("What's the weather in Paris?"))
+
+        assert calls == [{"get_weather", "stop"}, "response.create"]
+
+    @pytest.mark.asyncio
+    async def test_every_turn_gets_a_response(self, setup) -> None:
+        event_bus, calls = setup
+
+        await event_bus.dispatch(transcript("weather in Paris"))
+        await event_bus.dispatch(transcript("   "))
+        await event_bus.dispatch(
+            InputAudioTranscriptionFailed(
+                type=RealtimeServerEvent.CONVERSATION_ITEM_INPUT_AUDIO_TRANSCRIPTION_FAILED,
+                event_id="evt_002",
+                item_id="item_002",
+                content_index=0,
+                error=ErrorDetails(message="audio too short", type="invalid_request"),
+            )
+        )
+
+        assert calls.count("response.create") == 3
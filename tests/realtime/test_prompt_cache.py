@@ -0,0 +1,86 @@
+import logging
+
+import pytest
+
+from rtvoice.realtime.prompt_cache import (
+    PromptCacheGuard,
+    canonical_instructions,
+    canonical_tools,
+)
+from rtvoice.realtime.schemas import FunctionParameters, FunctionTool
+from rtvoice.realtime.session_settings import (
+    RealtimeSessionSettings,
+    build_session_payload,
+)
+
+
+def tool(name: str, description: str = "does things") -> FunctionTool:
+    return FunctionTool(
+        name=name, description=description, parameters=FunctionParameters()
+    )
+
+
+class TestCanonicalLayout:
+    def test_tools_are_ordered_by_name(self) -> None:
+        tools = canonical_tools([tool("stop"), tool("get_weather"), tool("load")])
+
+        assert [t.name for t in tools] == ["get_weather", "load", "stop"]
+
+    def test_instructions_drop_trailing_whitespace(self) -> None:
+        assert canonical_instructions("Be brief.  \r\nBe kind.\n\n") == (
+            "Be brief.\nBe kind."
+        )
+
+    def test_payload_is_byte_identical_for_any_registration_order(self) -> None:
+        settings = RealtimeSessionSettings(
+            instructions="Be brief. ", cache_stable_prefix=True
+        )
+
+        first = build_session_payload(settings, [tool("b"), tool("a")])
+        second = build_session_payload(settings, [tool("a"), tool("b")])
+
+        assert first.model_dump_json() == second.model_dump_json()
+        assert first.instructions == "Be brief."
+
+    def test_payload_keeps_order_without_cache_mode(self) -> None:
+        payload = build_session_payload(
+            RealtimeSessionSettings(), [tool("b"), tool("a")]
+        )
+
+        assert [t.name for t in payload.tools] == ["b", "a"]
+
+
+class TestPromptCacheGuard:
+    def test_first_update_sets_the_prefix(self) -> None:
+        guard = PromptCacheGuard()
+
+        assert guard.observe(instructions="hi", tools=[tool("a")]) == []
+        assert guard.prefix is not None
+
+    def test_identical_update_keeps_the_prefix(self) -> None:
+        guard = PromptCacheGuard()
+        guard.observe(instructions="hi", tools=[tool("a")])
+
+        assert guard.observe(instructions="hi", tools=[tool("a")]) == []
+
+    def test_tools_only_update_keeps_instructions(self) -> None:
+        guard = PromptCacheGuard()
+        guard.observe(instructions="hi", tools=[tool("a")])
+
+        assert guard.observe(tools=[tool("a")]) == []
+
+    def test_warns_on_changed_tools(self, caplog: pytest.LogCaptureFixture) -> None:
+        guard = PromptCacheGuard()
+        guard.observe(instructions="hi", tools=[tool("a")])
+
+        with caplog.at_level(logging.WARNING):
+            changed = guard.observe(tools=[tool("a"), tool("b")])
+
+        assert changed == ["tools"]
+        assert "added_tools=['b']" in caplog.text
+
+    def test_reports_changed_instructions(self) -> None:
+        guard = PromptCacheGuard()
+        guard.observe(instructions="hi", tools=[])
+
+        assert guard.observe(instructions="hello", tools=[]) == ["instructions"]
@@ -11,9 +11,22 @@ from rtvoice.agent.views import (
     RealtimeModel,
 )
 from rtvoice.audio import AudioSession
-from rtvoice.events.views import AgentSessionConnectedEvent
-from rtvoice.realtime.schemas import ConversationItemCreateEvent, SessionUpdateEvent
-from rtvoice.realtime.session import RealtimeSession
+from rtvoice.conversation import (
+    AssistantTurn,
+    ConversationHistory,
+    ToolTurn,
+    UserTurn,
+)
+from rtvoice.events.views import AgentSessionConnectedEvent, UpdateToolChoiceCommand
+from rtvoice.realtime.reconnect import ReconnectPolicy
+from rtvoice.realtime.schemas import (
+    ConversationItemCreateEvent,
+    SessionUpdateEvent,
+    ToolChoiceMode,
+    ToolChoiceUpdateEvent,
+    ToolsUpdateEvent,
+)
+from rtvoice.realtime.session import RealtimeSession, _injected_message_event
 from rtvoice.realtime.session_settings import RealtimeSessionSettings
 from rtvoice.tools import Tools
 
@@ -21,9 +34,16 @@ from rtvoice.tools import Tools
 class FakeWebSocket:
     def __init__(self) -> None:
         self.is_connected = False
+        self.is_reconnecting = False
         self.connect = AsyncMock(side_effect=self._connect)
         self.close = AsyncMock(side_effect=self._close)
         self.send = AsyncMock()
+        self.send_many = AsyncMock(side_effect=self._send_many)
+
+    async def _send_many(self, messages: list[object]) -> int:
+        for message in messages:
+            await self.send(message)
+        return 0
 
     async def _connect(self) -> None:
         self.is_connected = True
@@ -39,6 +59,8 @@ class FakeWebSocket:
 def make_session(
     *,
     injected_conversation: InjectedConversation | None = None,
+    conversation_history: ConversationHistory | None = None,
+    reconnect_policy: ReconnectPolicy | None = None,
 ) -> tuple[RealtimeSession, FakeWebSocket, list[str]]:
     event_bus = EventBus()
     websocket = FakeWebSocket()
@@ -64,6 +86,8 @@ def make_session(
             audio_session=MagicMock(spec=AudioSession),
             provider=MagicMock(),
             injected_conversation=injected_conversation,
+            conversation_history=conversation_history,
+            reconnect_policy=reconnect_policy,
         )
     session._websocket = websocket
 
@@ -110,11 +134,64 @@ class TestInjectedConversation:
             isinstance(event, ConversationItemCreateEvent) for event in sent_events
         )
 
-    def test_injected_user_message_uses_input_text_content(self) -> None:
-        session, _, _ = make_session()
-        event = session._injected_message_event(
-            InjectedUserMessage(text="Ich bin Max.")
+    @pytest.mark.asyncio
+    async def test_start_sends_injected_conversation_as_one_burst(self) -> None:
+        conversation = InjectedConversation(
+            messages=[InjectedUserMessage(text=f"msg {i}") for i in range(5)]
         )
+        session, websocket, _ = make_session(injected_conversation=conversation)
+
+        await session.start()
+        await session.stop()
+
+        websocket.send_many.assert_awaited_once()
+        assert len(websocket.send_many.call_args.args[0]) == 5
+
+    @pytest.mark.asyncio
+    async def test_start_folds_messages_beyond_max_messages_into_a_summary_item(
+        self,
+    ) -> None:
+        conversation = InjectedConversation(
+            messages=[
+                InjectedUserMessage(text="Ich heiße Max."),
+                InjectedAssistantMessage(text="Hallo Max."),
+                InjectedUserMessage(text="Wie spät ist es?"),
+            ],
+            summary="Max ist Premium-Kunde.",
+            max_messages=1,
+        )
+        session, websocket, _ = make_session(injected_conversation=conversation)
+
+        await session.start()
+        await session.stop()
+
+        items = [event.item for event in websocket.send_many.call_args.args[0]]
+        assert [item.role for item in items] == ["system", "user"]
+        summary = items[0].content[0].text
+        assert "<conversation_summary>" in summary
+        assert (
+            "Max ist Premium-Kunde.\n[USER]: Ich heiße Max.\n[ASSISTANT]: Hallo Max."
+            in (summary)
+        )
+        assert items[1].content[0].text == "Wie spät ist es?"
+
+    def test_folded_messages_beyond_the_token_budget_are_only_counted(self) -> None:
+        conversation = InjectedConversation(
+            messages=[
+                InjectedUserMessage(text="x" * 400),
+                InjectedAssistantMessage(text="Hallo Max."),
+                InjectedUserMessage(text="Wie spät ist es?"),
+            ],
+            max_messages=1,
+            folded_token_budget=20,
+        )
+
+        assert conversation.summary_text() == (
+            "(1 earlier message omitted)\n[ASSISTANT]: Hallo Max."
+        )
+
+    def test_injected_user_message_uses_input_text_content(self) -> None:
+        event = _injected_message_event(InjectedUserMessage(text="Ich bin Max."))
 
         payload = event.model_dump(exclude_none=True)
         assert payload["item"]["role"] == "user"
@@ -123,10 +200,7 @@ class TestInjectedConversation:
         ]
 
     def test_injected_assistant_message_uses_output_text_content(self) -> None:
-        session, _, _ = make_session()
-        event = session._injected_message_event(
-            InjectedAssistantMessage(text="Hallo Max.")
-        )
+        event = _injected_message_event(InjectedAssistantMessage(text="Hallo Max."))
 
         payload = event.model_dump(exclude_none=True)
         assert payload["item"]["role"] == "assistant"
@@ -148,3 +222,138 @@ class TestSessionUpdate:
         assert sent.session.instructions == "Test assistant"
         assert sent.session.model == RealtimeModel.GPT_REALTIME_2_1_MINI
         assert sent.session.tools == session._tools.get_schema()
+
+    @pytest.mark.asyncio
+    async def test_update_tools_warns_when_the_cached_prefix_changes(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        session, websocket, _ = make_session()
+        await session.start()
+
+        @session._tools.action("Look something up.")
+        def lookup() -> str:
+            return "found"
+
+        with caplog.at_level("WARNING"):
+            assert await session.update_tools()
+        await session.stop()
+
+        sent = websocket.send.call_args_list[-1].args[0]
+        assert isinstance(sent, ToolsUpdateEvent)
+        assert "lookup" in [tool.name for tool in sent.session.tools]
+        assert "invalidates the cached prompt prefix" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_update_tools_skips_unchanged_tools(self) -> None:
+        session, websocket, _ = make_session()
+        await session.start()
+        sent_before = websocket.send.call_count
+
+        assert not await session.update_tools()
+        await session.stop()
+
+        assert websocket.send.call_count == sent_before
+
+    @pytest.mark.asyncio
+    async def test_update_tools_sends_each_change_once(self) -> None:
+        session, websocket, _ = make_session()
+        await session.start()
+
+        @session._tools.action("Look something up.")
+        def lookup() -> str:
+            return "found"
+
+        assert await session.update_tools()
+        assert not await session.update_tools()
+        await session.stop()
+
+        updates = [
+            call.args[0]
+            for call in websocket.send.call_args_list
+            if isinstance(call.args[0], ToolsUpdateEvent)
+        ]
+        assert len(updates) == 1
+
+    @pytest.mark.asyncio
+    async def test_tool_choice_command_sends_tool_choice_update(self) -> None:
+        session, websocket, _ = make_session()
+        await session.start()
+
+        await session._event_bus.dispatch(
+            UpdateToolChoiceCommand(tool_choice=ToolChoiceMode.REQUIRED)
+        )
+        await session.stop()
+
+        sent = websocket.send.call_args_list[-1].args[0]
+        assert isinstance(sent, ToolChoiceUpdateEvent)
+        assert sent.session.tool_choice is ToolChoiceMode.REQUIRED
+
+
+class TestReconnectReplay:
+    @pytest.mark.asyncio
+    async def test_restore_resends_session_update_then_replays_recent_turns(
+        self,
+    ) -> None:
+        history = ConversationHistory(EventBus())
+        history.seed(
+            [
+                UserTurn(transcript="too old"),
+                UserTurn(transcript="Wie wird das Wetter?"),
+                ToolTurn(name="get_weather", result="sonnig"),
+                AssistantTurn(transcript="Es wird sonnig."),
+            ]
+        )
+        session, websocket, _ = make_session(
+            conversation_history=history,
+            reconnect_policy=ReconnectPolicy(replay_turns=3),
+        )
+        websocket.is_connected = True
+
+        replayed = await session._restore_after_reconnect()
+
+        sent = [call.args[0] for call in websocket.send.call_args_list]
+        assert replayed == 3
+        assert isinstance(sent[0], SessionUpdateEvent)
+        assert [event.item.role for event in sent[1:]] == [
+            "user",
+            "system",
+            "assistant",
+        ]
+        assert sent[1].item.content[0].text == "Wie wird das Wetter?"
+
+    @pytest.mark.asyncio
+    async def test_replay_keeps_only_the_heard_part_of_interrupted_turns(
+        self,
+    ) -> None:
+        history = ConversationHistory(EventBus())
+        history.seed(
+            [
+                AssistantTurn(
+                    transcript="one two three four five six",
+                    interrupted=True,
+                    played_ms=800,
+                ),
+                AssistantTurn(transcript="never heard", interrupted=True, played_ms=0),
+            ]
+        )
+        session, websocket, _ = make_session(
+            conversation_history=history,
+            reconnect_policy=ReconnectPolicy(),
+        )
+
+        replayed = await session._replay_conversation()
+
+        sent = [call.args[0] for call in websocket.send.call_args_list]
+        assert replayed == 1
+        assert sent[0].item.content[0].text == "one two"
+
+    @pytest.mark.asyncio
+    async def test_stop_closes_the_socket_while_reconnecting(self) -> None:
+        session, websocket, _ = make_session(reconnect_policy=ReconnectPolicy())
+        await session.start()
+        websocket.is_connected = False
+        websocket.is_reconnecting = True
+
+        await session.stop()
+
+        websocket.close.assert_awaited_once()
@@ -8,7 +8,9 @@ from websockets import frames
 from websockets.exceptions import ConnectionClosed
 
 from rtvoice.agent.views import RealtimeModel
+from rtvoice.events.views import RealtimeReconnectedEvent
 from rtvoice.realtime.providers import OpenAIProvider
+from rtvoice.realtime.reconnect import ReconnectPolicy
 from rtvoice.realtime.schemas import InputAudioBufferAppendEvent
 from rtvoice.realtime.websocket import RealtimeWebSocket
 
@@ -181,6 +183,23 @@ class TestSend:
         assert payload == {"type": "input_audio_buffer.append", "audio": "AAAA"}
         socket._receive_task.cancel()
 
+    @pytest.mark.asyncio
+    async def test_send_many_writes_every_message_and_returns_bytes(
+        self, socket: RealtimeWebSocket
+    ) -> None:
+        ws = make_ws()
+
+        with patch("rtvoice.realtime.websocket.connect", AsyncMock(return_value=ws)):
+            await socket.connect()
+            sent_bytes = await socket.send_many(
+                [SampleMessage(type="a"), SampleMessage(type="b")]
+            )
+
+        payloads = [call.args[0] for call in ws.send.call_args_list]
+        assert [json.loads(payload)["type"] for payload in payloads] == ["a", "b"]
+        assert sent_bytes == sum(len(payload.encode()) for payload in payloads)
+        socket._receive_task.cancel()
+
     @pytest.mark.asyncio
     async def test_raises_when_not_connected(self, socket: RealtimeWebSocket) -> None:
         with pytest.raises(RuntimeError, match="Not connected"):
@@ -284,3 +303,181 @@ class TestReceiveLoop:
             await asyncio.sleep(0.05)
 
         assert socket.is_connected is False
+
+
+def make_dropping_ws() -> MagicMock:
+    ws = make_ws()
+    close_frame = frames.Close(code=1006, reason="abnormal")
+
+    async def aiter_raises():
+        raise ConnectionClosed(close_frame, None)
+        yield  # make it a generator
+
+    ws.__aiter__ = lambda self: aiter_raises()
+    return ws
+
+
+def make_idle_ws() -> MagicMock:
+    ws = make_ws()
+
+    async def aiter_idle():
+        await asyncio.Event().wait()
+        yield  # make it a generator
+
+    ws.__aiter__ = lambda self: aiter_idle()
+    return ws
+
+
+def make_reconnecting_socket(
+    policy: ReconnectPolicy | None = None,
+    on_reconnect: AsyncMock | None = None,
+) -> RealtimeWebSocket:
+    return RealtimeWebSocket(
+        model=RealtimeModel.GPT_REALTIME,
+        provider=OpenAIProvider(api_key="test-key"),
+        reconnect_policy=policy or ReconnectPolicy(initial_delay_seconds=0),
+        on_reconnect=on_reconnect,
+    )
+
+
+class TestReconnectPolicy:
+    def test_delays_back_off_exponentially_up_to_the_cap(self) -> None:
+        policy = ReconnectPolicy(
+            max_attempts=5,
+            initial_delay_seconds=0.5,
+            backoff_factor=2.0,
+            max_delay_seconds=3.0,
+        )
+
+        assert list(policy.delays()) == [0.5, 1.0, 2.0, 3.0, 3.0]
+
+
+class TestReconnect:
+    @pytest.mark.asyncio
+    async def test_reconnects_and_reports_replay_size(self) -> None:
+        on_reconnect = AsyncMock(return_value=3)
+        socket = make_reconnecting_socket(on_reconnect=on_reconnect)
+
+        with patch(
+            "rtvoice.realtime.websocket.connect",
+            AsyncMock(side_effect=[make_dropping_ws(), make_idle_ws()]),
+        ):
+            await socket.connect()
+            event = await asyncio.wait_for(socket.events().__anext__(), timeout=0.5)
+
+        assert isinstance(event, RealtimeReconnectedEvent)
+        assert event.attempts == 1
+        assert event.replayed_items == 3
+        assert socket.is_connected is True
+        on_reconnect.assert_awaited_once()
+        await socket.close()
+
+    @pytest.mark.asyncio
+    async def test_buffers_audio_during_gap_and_flushes_after_replay(self) -> None:
+        replacement = make_idle_ws()
+        socket: RealtimeWebSocket
+
+        async def restore() -> int:
+            await socket.send(InputAudioBufferAppendEvent(audio="QUFB"))
+            await socket.send(SampleMessage(type="session.update"))
+            return 1
+
+        socket = make_reconnecting_socket(on_reconnect=AsyncMock(side_effect=restore))
+
+        with patch(
+            "rtvoice.realtime.websocket.connect",
+            AsyncMock(side_effect=[make_dropping_ws(), replacement]),
+        ):
+            await socket.connect()
+            event = await asyncio.wait_for(socket.events().__anext__(), timeout=0.5)
+
+        sent_types = [
+            json.loads(call.args[0])["type"] for call in replacement.send.call_args_list
+        ]
+        assert sent_types == ["session.update", "input_audio_buffer.append"]
+        assert event.flushed_audio_chunks == 1
+        await socket.close()
+
+    @pytest.mark.asyncio
+    async def test_drops_oldest_audio_beyond_buffer_bound(self) -> None:
+        replacement = make_idle_ws()
+        socket: RealtimeWebSocket
+
+        async def restore() -> int:
+            for audio in ("AAAA", "BBBB", "CCCC"):
+                await socket.send(InputAudioBufferAppendEvent(audio=audio))
+            return 0
+
+        socket = make_reconnecting_socket(
+            policy=ReconnectPolicy(
+                initial_delay_seconds=0, max_buffered_audio_chunks=2
+            ),
+            on_reconnect=AsyncMock(side_effect=restore),
+        )
+
+        with patch(
+            "rtvoice.realtime.websocket.connect",
+            AsyncMock(side_effect=[make_dropping_ws(), replacement]),
+        ):
+            await socket.connect()
+            event = await asyncio.wait_for(socket.events().__anext__(), timeout=0.5)
+
+        flushed = [
+            json.loads(call.args[0])["audio"]
+            for call in replacement.send.call_args_list
+        ]
+        assert flushed == ["BBBB", "CCCC"]
+        assert event.dropped_audio_chunks == 1
+        await socket.close()
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self) -> None:
+        socket = make_reconnecting_socket(
+            policy=ReconnectPolicy(max_attempts=2, initial_delay_seconds=0)
+        )
+
+        with patch(
+            "rtvoice.realtime.websocket.connect",
+            AsyncMock(
+                side_effect=[make_dropping_ws(), OSError("refused"), OSError("refused")]
+            ),
+        ):
+            await socket.connect()
+            with pytest.raises(StopAsyncIteration):
+                await asyncio.wait_for(socket.events().__anext__(), timeout=0.5)
+
+        assert socket.is_connected is False
+        assert socket.is_reconnecting is False
+
+    @pytest.mark.asyncio
+    async def test_does_not_reconnect_without_policy(
+        self, socket: RealtimeWebSocket
+    ) -> None:
+        connect = AsyncMock(side_effect=[make_dropping_ws(), make_idle_ws()])
+
+        with patch("rtvoice.realtime.websocket.connect", connect):
+            await socket.connect()
+            with pytest.raises(StopAsyncIteration):
+                await asyncio.wait_for(socket.events().__anext__(), timeout=0.5)
+
+        assert connect.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_close_during_backoff_stops_the_reconnect(self) -> None:
+        socket = make_reconnecting_socket(
+            policy=ReconnectPolicy(initial_delay_seconds=10)
+        )
+        connect = AsyncMock(side_effect=[make_dropping_ws(), make_idle_ws()])
+
+        with patch("rtvoice.realtime.websocket.connect", connect):
+            await socket.connect()
+            await asyncio.sleep(0.05)
+            assert socket.is_reconnecting is True
+
+            await socket.close()
+            with pytest.raises(StopAsyncIteration):
+                await asyncio.wait_for(socket.events().__anext__(), timeout=0.5)
+
+        assert connect.await_count == 1
+        assert socket.is_connected is False
+        assert socket.is_reconnecting is False
@@ -108,6 +108,13 @@ class TestWirePayload:
             "interrupt_response": True,
         }
 
+    def test_auto_response_off_leaves_responding_to_the_client(self) -> None:
+        settings = RealtimeSessionSettings(auto_response=False)
+
+        turn_detection = payload(settings)["audio"]["input"]["turn_detection"]
+        assert turn_detection["create_response"] is False
+        assert turn_detection["interrupt_response"] is True
+
     def test_near_field_noise_reduction_maps_to_wire_value(self) -> None:
         settings = RealtimeSessionSettings(noise_reduction=NoiseReduction.NEAR_FIELD)
 
@@ -6,6 +6,11 @@ from tokenary.generator.schemas import GeneratedModelPricing
 from transitbus import EventBus
 
 import rtvoice.tokens.pricing as pricing_module
+from rtvoice.events.views import (
+    CostUpdatedEvent,
+    PromptCacheUsageEvent,
+    StopAgentCommand,
+)
 from rtvoice.realtime.schemas import (
     DurationUsage,
     InputAudioTranscriptionCompleted,
@@ -16,6 +21,7 @@ from rtvoice.realtime.schemas import (
     TokenUsage,
 )
 from rtvoice.tokens import (
+    CostAccumulator,
     Currency,
     PricingCatalog,
     RealtimeRates,
@@ -86,6 +92,25 @@ def transcription_done() -> InputAudioTranscriptionCompleted:
     )
 
 
+@pytest.mark.asyncio
+async def test_reports_prompt_cache_usage_per_response() -> None:
+    event_bus = EventBus()
+    reports: list[PromptCacheUsageEvent] = []
+
+    async def record(event: PromptCacheUsageEvent) -> None:
+        reports.append(event)
+
+    event_bus.on(PromptCacheUsageEvent, record)
+    tracker = TokenTracker(event_bus=event_bus, realtime_model="gpt-realtime-2.1")
+
+    await event_bus.dispatch(response_done())
+
+    assert reports[0].response_id == "response-1"
+    assert reports[0].cached_input_tokens == 50
+    assert reports[0].hit_ratio == pytest.approx(50 / 155)
+    assert tracker.totals.realtime.cache_hit_ratio == pytest.approx(50 / 155)
+
+
 @pytest.mark.asyncio
 async def test_tracks_response_and_transcription_events() -> None:
     event_bus = EventBus()
@@ -349,3 +374,116 @@ async def test_marks_estimate_incomplete_without_modality_details() -> None:
     assert report.cost.total == 0
     assert not report.cost.is_complete
     assert "could not be assigned" in report.cost.notes[0]
+
+
+@pytest.mark.asyncio
+async def test_running_cost_matches_itemised_estimate() -> None:
+    event_bus = EventBus()
+    tracker = TokenTracker(
+        event_bus=event_bus,
+        realtime_model="gpt-realtime-2.1",
+        transcription_model="whisper-1",
+    )
+
+    await event_bus.dispatch(response_done())
+    await event_bus.dispatch(transcription_done())
+
+    assert tracker.cost == tracker.report().cost.total
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("transcription_model", "usage"),
+    [
+        ("whisper-1", DurationUsage(seconds=30)),
+        ("gpt-4o-transcribe", None),
+    ],
+)
+async def test_running_cost_prices_transcriptions_like_the_estimate(
+    transcription_model: str, usage: DurationUsage | None
+) -> None:
+    event_bus = EventBus()
+    tracker = TokenTracker(
+        event_bus=event_bus,
+        realtime_model="gpt-realtime-2.1",
+        transcription_model=transcription_model,
+    )
+    event = transcription_done()
+    if usage is not None:
+        event = event.model_copy(update={"usage": usage})
+
+    await event_bus.dispatch(event)
+
+    assert tracker.cost == tracker.report().cost.total
+
+
+@pytest.mark.asyncio
+async def test_publishes_cost_updates() -> None:
+    event_bus = EventBus()
+    updates: list[CostUpdatedEvent] = []
+
+    async def record(event: CostUpdatedEvent) -> None:
+        updates.append(event)
+
+    event_bus.on(CostUpdatedEvent, record)
+    TokenTracker(
+        event_bus=event_bus,
+        realtime_model="gpt-realtime-2.1",
+        transcription_model="whisper-1",
+        cost_budget=Decimal(1),
+    )
+
+    await event_bus.dispatch(response_done())
+    await event_bus.dispatch(response_done())
+    await event_bus.dispatch(transcription_done())
+
+    assert [update.response_id for update in updates] == ["response-1", None]
+    assert updates[1].total == updates[0].delta + updates[1].delta
+    assert updates[1].budget_remaining == Decimal(1) - updates[1].total
+    assert all(update.is_complete for update in updates)
+
+
+@pytest.mark.asyncio
+async def test_cost_budget_stops_the_agent_once() -> None:
+    event_bus = EventBus()
+    stops: list[StopAgentCommand] = []
+
+    async def record(event: StopAgentCommand) -> None:
+        stops.append(event)
+
+    event_bus.on(StopAgentCommand, record)
+    tracker = TokenTracker(
+        event_bus=event_bus,
+        realtime_model="gpt-realtime-2.1",
+        transcription_model="whisper-1",
+        cost_budget=Decimal("0.004"),
+    )
+
+    await event_bus.dispatch(response_done())
+    assert stops == []
+
+    await event_bus.dispatch(transcription_done())
+    second = response_done().model_copy(update={"event_id": "event-3"})
+    second.response.id = "response-2"
+    await event_bus.dispatch(second)
+
+    assert tracker.cost > Decimal("0.004")
+    assert len(stops) == 1
+
+
+def test_rejects_non_positive_cost_budget() -> None:
+    with pytest.raises(ValueError, match="cost_budget"):
+        TokenTracker(
+            event_bus=EventBus(),
+            realtime_model="gpt-realtime-2.1",
+            cost_budget=Decimal(0),
+        )
+
+
+def test_unpriced_usage_marks_running_cost_incomplete() -> None:
+    accumulator = CostAccumulator(PricingCatalog(), realtime_model="unknown-model")
+
+    cost = accumulator.add_response(response_done().response.usage)
+
+    assert cost == 0
+    assert not accumulator.is_complete
@@ -0,0 +1,247 @@
+import asyncio
+import json
+import threading
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+from transitbus import EventBus
+
+from rtvoice.realtime.schemas import (
+    RealtimeResponseObject,
+    ResponseDoneEvent,
+    TokenInputTokenDetails,
+    TokenUsage,
+)
+from rtvoice.tokens import (
+    JSONLUsageSink,
+    SQLiteUsageSink,
+    TokenTracker,
+    UsageAggregator,
+    UsageBucket,
+    UsageRecord,
+    UsageSink,
+)
+
+HOUR = 3600
+
+
+class RecordingSink(UsageSink):
+    def __init__(self, failures: int = 0) -> None:
+        self.writes: list[list[UsageBucket]] = []
+        self._failures = failures
+
+    def write(self, buckets: Sequence[UsageBucket]) -> None:
+        if self._failures:
+            self._failures -= 1
+            raise OSError("sink unavailable")
+        self.writes.append(list(buckets))
+
+
+def record(
+    tenant: str = "acme",
+    model: str = "gpt-realtime",
+    at: float = 10 * HOUR,
+    tokens: int = 100,
+    cost: str = "0.01",
+) -> UsageRecord:
+    return UsageRecord(
+        tenant=tenant,
+        model=model,
+        at=at,
+        input_tokens=tokens,
+        cached_input_tokens=tokens // 2,
+        output_tokens=tokens // 4,
+        cost=Decimal(cost),
+    )
+
+
+def bucket(start_hour: int, requests: int = 1, **overrides) -> UsageBucket:
+    values = {
+        "tenant": "acme",
+        "model": "gpt-realtime",
+        "start": datetime.fromtimestamp(start_hour * HOUR, UTC),
+        "requests": requests,
+        "input_tokens": 100 * requests,
+        "cached_input_tokens": 50 * requests,
+        "output_tokens": 25 * requests,
+        "cost": Decimal("0.01") * requests,
+    }
+    values.update(overrides)
+    return UsageBucket(**values)
+
+
+class TestUsageAggregator:
+    def test_rejects_invalid_settings(self) -> None:
+        with pytest.raises(ValueError, match="bucket_seconds"):
+            UsageAggregator(bucket_seconds=0)
+        with pytest.raises(ValueError, match="flush_interval_seconds"):
+            UsageAggregator(flush_interval_seconds=0)
+        with pytest.raises(ValueError, match="retention_buckets"):
+            UsageAggregator(retention_buckets=0)
+
+    def test_rolls_records_up_per_tenant_model_and_hour(self) -> None:
+        aggregator = UsageAggregator()
+        aggregator.publish(record(at=10 * HOUR + 5))
+        aggregator.publish(record(at=10 * HOUR + 3000))
+        aggregator.publish(record(at=11 * HOUR))
+        aggregator.publish(record(tenant="globex"))
+
+        buckets = aggregator.snapshot()
+
+        assert buckets == [
+            bucket(10, requests=2),
+            bucket(10, tenant="globex"),
+            bucket(11),
+        ]
+        assert aggregator.snapshot(tenant="globex") == [bucket(10, tenant="globex")]
+
+    def test_retains_only_the_latest_buckets(self) -> None:
+        aggregator = UsageAggregator(retention_buckets=2)
+        for hour in range(10):
+            aggregator.publish(record(at=hour * HOUR))
+
+        assert [b.start.hour for b in aggregator.snapshot()] == [8, 9]
+
+    def test_publishing_from_many_threads_loses_nothing(self) -> None:
+        aggregator = UsageAggregator()
+
+        def publish() -> None:
+            for _ in range(1000):
+                aggregator.publish(record())
+
+        threads = [threading.Thread(target=publish) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert aggregator.drain() == 8000
+        assert aggregator.snapshot()[0].requests == 8000
+
+    @pytest.mark.asyncio
+    async def test_flush_sends_only_usage_added_since_the_last_flush(self) -> None:
+        sink = RecordingSink()
+        aggregator = UsageAggregator([sink])
+
+        aggregator.publish(record())
+        await aggregator.flush()
+        await aggregator.flush()
+        aggregator.publish(record())
+        aggregator.publish(record(at=11 * HOUR))
+        await aggregator.flush()
+
+        assert sink.writes == [[bucket(10)], [bucket(10), bucket(11)]]
+
+    @pytest.mark.asyncio
+    async def test_failed_write_is_retried_with_later_usage(self) -> None:
+        failing = RecordingSink(failures=1)
+        healthy = RecordingSink()
+        aggregator = UsageAggregator([failing, healthy])
+
+        aggregator.publish(record())
+        await aggregator.flush()
+        aggregator.publish(record())
+        await aggregator.flush()
+
+        assert failing.writes == [[bucket(10, requests=2)]]
+        assert healthy.writes == [[bucket(10)], [bucket(10)]]
+
+    @pytest.mark.asyncio
+    async def test_flushes_periodically_and_on_close(self) -> None:
+        sink = RecordingSink()
+        aggregator = UsageAggregator([sink], flush_interval_seconds=0.01)
+        aggregator.start()
+
+        aggregator.publish(record())
+        await asyncio.sleep(0.05)
+        aggregator.publish(record(at=11 * HOUR))
+        await aggregator.close()
+
+        assert sink.writes == [[bucket(10)], [bucket(11)]]
+
+
+class TestSinks:
+    def test_sqlite_sink_adds_writes_to_the_bucket(self, tmp_path: Path) -> None:
+        sink = SQLiteUsageSink(tmp_path / "usage.db")
+
+        sink.write([bucket(10)])
+        sink.write([bucket(10, requests=2), bucket(10, tenant="globex")])
+
+        assert sink.buckets(tenant="acme") == [bucket(10, requests=3)]
+        assert len(sink.buckets()) == 2
+        sink.close()
+
+    def test_jsonl_sink_appends_one_line_per_bucket(self, tmp_path: Path) -> None:
+        path = tmp_path / "usage" / "usage.jsonl"
+        sink = JSONLUsageSink(path)
+
+        sink.write([bucket(10)])
+        sink.write([bucket(10), bucket(11)])
+
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert len(lines) == 3
+        assert lines[0] == {
+            "tenant": "acme",
+            "model": "gpt-realtime",
+            "start": "1970-01-01T10:00:00+00:00",
+            "requests": 1,
+            "input_tokens": 100,
+            "cached_input_tokens": 50,
+            "output_tokens": 25,
+            "cost": "0.01",
+        }
+
+    def test_prometheus_sink_increments_counters(self) -> None:
+        prometheus_client = pytest.importorskip("prometheus_client")
+        from rtvoice.tokens import PrometheusUsageSink
+
+        registry = prometheus_client.CollectorRegistry()
+        sink = PrometheusUsageSink(registry)
+
+        sink.write([bucket(10), bucket(11)])
+
+        labels = {"tenant": "acme", "model": "gpt-realtime"}
+        assert registry.get_sample_value("rtvoice_requests_total", labels) == 2
+        assert registry.get_sample_value(
+            "rtvoice_tokens_total", {**labels, "kind": "output"}
+        ) == pytest.approx(50)
+
+
+class TestTrackerPublishing:
+    @pytest.mark.asyncio
+    async def test_tracker_publishes_each_priced_response(self) -> None:
+        event_bus = EventBus()
+        aggregator = UsageAggregator()
+        tracker = TokenTracker(
+            event_bus=event_bus,
+            realtime_model="gpt-realtime-2.1",
+            usage_aggregator=aggregator,
+            tenant="acme",
+        )
+        event = ResponseDoneEvent(
+            type="response.done",
+            event_id="event-1",
+            response=RealtimeResponseObject(
+                id="response-1",
+                usage=TokenUsage(
+                    input_tokens=100,
+                    output_tokens=20,
+                    input_token_details=TokenInputTokenDetails(
+                        text_tokens=100, cached_tokens=40
+                    ),
+                ),
+            ),
+        )
+
+        await event_bus.dispatch(event)
+        await event_bus.dispatch(event)
+
+        [published] = aggregator.snapshot()
+        assert published.tenant == "acme"
+        assert published.model == "gpt-realtime-2.1"
+        assert published.requests == 1
+        assert published.cached_input_tokens == 40
+        assert published.cost == tracker.cost
@@ -0,0 +1,37 @@
+import asyncio
+import time
+
+import pytest
+
+from rtvoice.shared.loop_lag import LoopLagMonitor
+
+
+class TestLoopLagMonitor:
+    def test_rejects_non_positive_interval(self) -> None:
+        with pytest.raises(ValueError, match="interval_seconds"):
+            LoopLagMonitor(0)
+
+    @pytest.mark.asyncio
+    async def test_measures_a_blocked_loop(self) -> None:
+        monitor = LoopLagMonitor(interval_seconds=0.01)
+        monitor.start()
+        await asyncio.sleep(0.005)
+
+        time.sleep(0.06)
+        await asyncio.sleep(0.03)
+        await monitor.close()
+
+        assert monitor.max_seconds >= 0.04
+
+    @pytest.mark.asyncio
+    async def test_reset_forgets_the_worst_lag(self) -> None:
+        monitor = LoopLagMonitor(interval_seconds=0.01)
+        monitor.start()
+        await asyncio.sleep(0.005)
+        time.sleep(0.03)
+        await asyncio.sleep(0.03)
+
+        monitor.reset()
+        await monitor.close()
+
+        assert monitor.max_seconds == monitor.latest_seconds
@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+from rtvoice.shared.partial_json import PartialJSONObject
+
+
+def feed_all(text: str, chunk_size: int = 1) -> PartialJSONObject:
+    parser = PartialJSONObject()
+    for start in range(0, len(text), chunk_size):
+        parser.feed(text[start : start + chunk_size])
+    return parser
+
+
+class TestPartialJSONObject:
+    def test_string_member_is_complete_when_its_quote_closes(self) -> None:
+        parser = PartialJSONObject()
+        parser.feed('{"city": "Ber')
+        assert parser.members == {}
+
+        parser.feed('lin", "da')
+        assert parser.members == {"city": "Berlin"}
+
+    def test_number_waits_for_the_delimiter(self) -> None:
+        parser = PartialJSONObject()
+        parser.feed('{"days": 1')
+        assert parser.members == {}
+
+        parser.feed("2}")
+        assert parser.members == {"days": 12}
+        assert parser.is_closed
+
+    def test_nested_values_complete_with_their_bracket(self) -> None:
+        parser = PartialJSONObject()
+        parser.feed('{"filter": {"tags": ["a", "b"]}, "limit"')
+
+        assert parser.members == {"filter": {"tags": ["a", "b"]}}
+
+    def test_escaped_quotes_do_not_end_a_string(self) -> None:
+        parser = feed_all('{"quote": "she said \\"hi\\", then left"}')
+
+        assert parser.members == {"quote": 'she said "hi", then left'}
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 100])
+    def test_matches_json_loads_for_any_chunking(self, chunk_size: int) -> None:
+        document = {
+            "query": "weather, {tomorrow}",
+            "count": -3.5e2,
+            "exact": False,
+            "tags": ["x", {"y": None}],
+            "empty": {},
+        }
+        text = json.dumps(document)
+
+        parser = feed_all(text, chunk_size)
+
+        assert parser.members == document
+        assert parser.is_closed
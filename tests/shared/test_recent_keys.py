@@ -0,0 +1,26 @@
+import pytest
+
+from rtvoice.shared.recent_keys import RecentKeys
+
+
+class TestRecentKeys:
+    def test_rejects_non_positive_capacity(self) -> None:
+        with pytest.raises(ValueError, match="capacity"):
+            RecentKeys(0)
+
+    def test_repeated_key_is_rejected(self) -> None:
+        keys = RecentKeys[str]()
+
+        assert keys.add("a")
+        assert not keys.add("a")
+
+    def test_memory_is_bounded_by_capacity(self) -> None:
+        keys = RecentKeys[int](capacity=3)
+
+        for key in range(10):
+            keys.add(key)
+
+        assert len(keys) == 3
+        assert 9 in keys
+        assert 0 not in keys
+        assert keys.add(0)
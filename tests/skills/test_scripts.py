@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import os
 from pathlib import Path
 from unittest.mock import patch
 
@@ -51,7 +53,41 @@ async def test_run_script_reports_os_error(tmp_path: Path) -> None:
     script = tmp_path / "check.py"
     script.write_text("print('hi')\n", encoding="utf-8")
 
-    with patch("rtvoice.skills.scripts.subprocess.run", side_effect=OSError("boom")):
+    with patch(
+        "rtvoice.skills.scripts.asyncio.create_subprocess_exec",
+        side_effect=OSError("boom"),
+    ):
         result = await run_script(script, cwd=tmp_path)
 
     assert result == "Error: boom"
+
+
+@pytest.mark.asyncio
+async def test_run_script_keeps_head_and_tail_of_long_output(tmp_path: Path) -> None:
+    script = tmp_path / "chatty.py"
+    script.write_text("print('begin' + 'x' * 100_000 + 'end')\n", encoding="utf-8")
+
+    result = await run_script(script, cwd=tmp_path, max_output_bytes=16)
+
+    assert result == "beginxxx\n[... 99993 bytes omitted ...]\nxxxxend"
+
+
+@pytest.mark.asyncio
+async def test_run_script_kills_the_script_when_cancelled(tmp_path: Path) -> None:
+    pid_file = tmp_path / "pid"
+    script = tmp_path / "slow.py"
+    script.write_text(
+        f"import os, time\nopen({str(pid_file)!r}, 'w').write(str(os.getpid()))\n"
+        "time.sleep(30)\n",
+        encoding="utf-8",
+    )
+
+    run = asyncio.create_task(run_script(script, cwd=tmp_path))
+    while not pid_file.exists() or not pid_file.read_text():
+        await asyncio.sleep(0.01)
+    run.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await run
+
+    with pytest.raises(ProcessLookupError):
+        os.kill(int(pid_file.read_text()), 0)
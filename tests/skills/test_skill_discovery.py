@@ -0,0 +1,132 @@
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from rtvoice.skills import Skills
+from rtvoice.skills.models import parse_skill_summary
+
+
+def make_skill(root: Path, name: str, body: str = "Use the workflow.") -> Path:
+    skill_dir = root / name
+    skill_dir.mkdir(parents=True, exist_ok=True)
+    (skill_dir / "SKILL.md").write_text(
+        f"---\nname: {name}\ndescription: About {name}.\n---\n{body}\n",
+        encoding="utf-8",
+    )
+    return skill_dir
+
+
+class TestParseSkillSummary:
+    def test_reads_frontmatter_without_body(self, tmp_path: Path) -> None:
+        skill_dir = make_skill(tmp_path, "research", body="")
+
+        summary = parse_skill_summary(skill_dir / "SKILL.md")
+
+        assert (summary.name, summary.description) == ("research", "About research.")
+        assert summary.location == (skill_dir / "SKILL.md").resolve()
+
+    def test_frontmatter_must_end_within_bound(self, tmp_path: Path) -> None:
+        skill_dir = tmp_path / "research"
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_text(
+            "---\nname: research\ndescription: " + "x" * 200 + "\n---\nBody\n"
+        )
+
+        with pytest.raises(ValueError, match="within 64 bytes"):
+            parse_skill_summary(skill_dir / "SKILL.md", max_bytes=64)
+
+    def test_requires_frontmatter(self, tmp_path: Path) -> None:
+        skill_dir = tmp_path / "research"
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_text("# No frontmatter\n")
+
+        with pytest.raises(ValueError, match="must start with YAML frontmatter"):
+            parse_skill_summary(skill_dir / "SKILL.md")
+
+
+class TestLazySkills:
+    def test_discovery_does_not_parse_bodies(self, tmp_path: Path) -> None:
+        make_skill(tmp_path, "research")
+        make_skill(tmp_path, "writing")
+
+        with patch("rtvoice.skills.discovery.parse_skill") as parse:
+            skills = Skills.from_local_dir(tmp_path, lazy=True)
+
+        parse.assert_not_called()
+        assert skills.names() == ["research", "writing"]
+        assert [s.description for s in skills.summaries()] == [
+            "About research.",
+            "About writing.",
+        ]
+        assert skills.discovery_stats.parsed == 2
+
+    def test_skill_is_parsed_on_first_use(self, tmp_path: Path) -> None:
+        make_skill(tmp_path, "research", body="Follow the steps.")
+        skills = Skills.from_local_dir(tmp_path, lazy=True)
+
+        assert skills.get("research").instructions == "Follow the steps."
+        assert "Follow the steps." in skills.load("research")
+
+    def test_cache_path_requires_lazy(self, tmp_path: Path) -> None:
+        make_skill(tmp_path, "research")
+
+        with pytest.raises(ValueError, match="lazy=True"):
+            Skills.from_local_dir(tmp_path, cache_path=tmp_path / "cache.json")
+
+
+class TestDiscoveryCache:
+    def test_second_start_reads_no_skill_files(self, tmp_path: Path) -> None:
+        root = tmp_path / "skills"
+        make_skill(root, "research")
+        make_skill(root, "writing")
+        cache = tmp_path / "cache.json"
+        Skills.from_local_dir(root, lazy=True, cache_path=cache)
+
+        with patch("rtvoice.skills.discovery.parse_skill_summary") as parse:
+            skills = Skills.from_local_dir(root, lazy=True, cache_path=cache)
+
+        parse.assert_not_called()
+        assert skills.names() == ["research", "writing"]
+        assert (skills.discovery_stats.parsed, skills.discovery_stats.cached) == (0, 2)
+
+    def test_changed_skill_is_read_again(self, tmp_path: Path) -> None:
+        root = tmp_path / "skills"
+        skill_dir = make_skill(root, "research")
+        cache = tmp_path / "cache.json"
+        Skills.from_local_dir(root, lazy=True, cache_path=cache)
+
+        location = skill_dir / "SKILL.md"
+        location.write_text(
+            "---\nname: research\ndescription: Updated.\n---\nBody\n", encoding="utf-8"
+        )
+        stat = location.stat()
+        os.utime(location, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        skills = Skills.from_local_dir(root, lazy=True, cache_path=cache)
+
+        assert skills.summaries()[0].description == "Updated."
+        assert skills.discovery_stats.parsed == 1
+
+    def test_added_skill_directory_is_found(self, tmp_path: Path) -> None:
+        root = tmp_path / "skills"
+        make_skill(root, "research")
+        cache = tmp_path / "cache.json"
+        Skills.from_local_dir(root, lazy=True, cache_path=cache)
+
+        make_skill(root, "writing")
+        stat = root.stat()
+        os.utime(root, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        skills = Skills.from_local_dir(root, lazy=True, cache_path=cache)
+
+        assert skills.names() == ["research", "writing"]
+        assert (skills.discovery_stats.parsed, skills.discovery_stats.cached) == (1, 1)
+
+    def test_corrupt_cache_is_ignored(self, tmp_path: Path) -> None:
+        make_skill(tmp_path / "skills", "research")
+        cache = tmp_path / "cache.json"
+        cache.write_text("{not json")
+
+        skills = Skills.from_local_dir(tmp_path / "skills", lazy=True, cache_path=cache)
+
+        assert skills.names() == ["research"]
@@ -0,0 +1,111 @@
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from rtvoice.skills import SkillIndex, Skills
+from rtvoice.skills.models import parse_skill
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_skill(root: Path, instructions: str = "Use the workflow.") -> Path:
+    skill_dir = root / "research"
+    skill_dir.mkdir(parents=True, exist_ok=True)
+    (skill_dir / "SKILL.md").write_text(
+        f"---\nname: research\ndescription: Research things.\n---\n{instructions}\n",
+        encoding="utf-8",
+    )
+    return skill_dir
+
+
+def _touch_later(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+class TestSkillIndex:
+    def test_rejects_negative_interval(self) -> None:
+        with pytest.raises(ValueError, match="revalidate_after_seconds"):
+            SkillIndex(revalidate_after_seconds=-1)
+
+    def test_skill_is_parsed_once_while_unchanged(self, tmp_path: Path) -> None:
+        location = make_skill(tmp_path) / "SKILL.md"
+        index = SkillIndex(revalidate_after_seconds=0)
+        index.add(parse_skill(location))
+
+        with patch("rtvoice.skills.index.parse_skill") as parse:
+            for _ in range(3):
+                index.skill(location.resolve())
+
+        parse.assert_not_called()
+
+    def test_changed_skill_file_is_parsed_again(self, tmp_path: Path) -> None:
+        location = (make_skill(tmp_path) / "SKILL.md").resolve()
+        index = SkillIndex(revalidate_after_seconds=0)
+        index.add(parse_skill(location))
+
+        make_skill(tmp_path, instructions="Use the new workflow.")
+        _touch_later(location)
+
+        assert index.skill(location).instructions == "Use the new workflow."
+
+    def test_checks_are_throttled(self, tmp_path: Path) -> None:
+        clock = FakeClock()
+        location = (make_skill(tmp_path) / "SKILL.md").resolve()
+        index = SkillIndex(revalidate_after_seconds=5, clock=clock)
+        index.add(parse_skill(location))
+        make_skill(tmp_path, instructions="Changed.")
+        _touch_later(location)
+
+        clock.now = 4
+        assert index.skill(location).instructions == "Use the workflow."
+        clock.now = 5
+        assert index.skill(location).instructions == "Changed."
+
+    def test_resource_listing_follows_added_files(self, tmp_path: Path) -> None:
+        skill_dir = make_skill(tmp_path)
+        (skill_dir / "references").mkdir()
+        (skill_dir / "references" / "guide.md").write_text("guide")
+        skill = parse_skill(skill_dir / "SKILL.md")
+        index = SkillIndex(revalidate_after_seconds=0)
+
+        assert index.resources(skill) == ["references/guide.md"]
+
+        (skill_dir / "references" / "extra.md").write_text("extra")
+        _touch_later(skill_dir / "references")
+
+        assert index.resources(skill) == [
+            "references/extra.md",
+            "references/guide.md",
+        ]
+
+    def test_unchanged_listing_is_not_rescanned(self, tmp_path: Path) -> None:
+        skill_dir = make_skill(tmp_path)
+        (skill_dir / "notes.md").write_text("notes")
+        skill = parse_skill(skill_dir / "SKILL.md")
+        index = SkillIndex(revalidate_after_seconds=0)
+        index.resources(skill)
+
+        with patch("rtvoice.skills.index._scan_resources") as scan:
+            assert index.resources(skill) == ["notes.md"]
+
+        scan.assert_not_called()
+
+
+class TestSkillsUsesIndex:
+    def test_load_reflects_edited_instructions(self, tmp_path: Path) -> None:
+        skill_dir = make_skill(tmp_path)
+        skills = Skills.from_local_dir(tmp_path, revalidate_after_seconds=0)
+
+        make_skill(tmp_path, instructions="Edited instructions.")
+        _touch_later(skill_dir / "SKILL.md")
+
+        assert "Edited instructions." in skills.load("research")
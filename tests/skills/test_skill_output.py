@@ -0,0 +1,141 @@
+from pathlib import Path
+
+import pytest
+
+from rtvoice.skills import OutputLimits, Skills
+from rtvoice.skills.output import HeadTailCapture
+
+
+def make_skill(root: Path) -> Path:
+    skill_dir = root / "research"
+    skill_dir.mkdir(parents=True)
+    (skill_dir / "SKILL.md").write_text(
+        "---\nname: research\ndescription: Research things.\n---\nBody\n",
+        encoding="utf-8",
+    )
+    return skill_dir
+
+
+class TestOutputLimits:
+    def test_tighter_limit_wins(self) -> None:
+        assert OutputLimits(max_bytes=100, max_tokens=10).budget_bytes == 40
+        assert OutputLimits(max_bytes=30, max_tokens=10).budget_bytes == 30
+        assert OutputLimits(max_bytes=30, max_tokens=None).budget_bytes == 30
+
+    def test_rejects_non_positive_limits(self) -> None:
+        with pytest.raises(ValueError, match="max_bytes"):
+            OutputLimits(max_bytes=0)
+        with pytest.raises(ValueError, match="max_tokens"):
+            OutputLimits(max_tokens=0)
+
+    def test_clip_keeps_short_text(self) -> None:
+        assert OutputLimits(max_bytes=10, max_tokens=None).clip("short") == "short"
+
+    def test_clip_keeps_head_and_tail(self) -> None:
+        clipped = OutputLimits(max_bytes=8, max_tokens=None).clip(
+            "abcd" + "x" * 50 + "wxyz"
+        )
+
+        assert clipped == "abcd\n[... 50 bytes omitted ...]\nwxyz"
+
+
+class TestHeadTailCapture:
+    def test_small_stream_is_kept_whole(self) -> None:
+        capture = HeadTailCapture(10)
+        capture.feed(b"abc")
+        capture.feed(b"def")
+
+        assert not capture.truncated
+        assert capture.text() == "abcdef"
+
+    def test_many_small_chunks_keep_the_latest_tail(self) -> None:
+        capture = HeadTailCapture(6)
+        for index in range(1000):
+            capture.feed(str(index % 10).encode())
+
+        assert capture.truncated
+        assert capture.text() == "012\n[... 994 bytes omitted ...]\n789"
+
+    def test_split_multibyte_characters_are_dropped(self) -> None:
+        capture = HeadTailCapture(4)
+        capture.feed("aé".encode() + b"-" * 10 + "éb".encode())
+
+        text = capture.text()
+
+        assert text.startswith("a\n")
+        assert text.endswith("\nb")
+
+
+class TestPagedResources:
+    def test_small_resource_is_returned_without_note(self, tmp_path: Path) -> None:
+        (make_skill(tmp_path) / "notes.md").write_text("hello", encoding="utf-8")
+        skills = Skills.from_local_dir(tmp_path)
+
+        assert skills.read_resource("research", "notes.md") == "hello"
+
+    def test_large_resource_is_paged(self, tmp_path: Path) -> None:
+        (make_skill(tmp_path) / "data.txt").write_text("0123456789" * 3)
+        skills = Skills.from_local_dir(
+            tmp_path, output_limits=OutputLimits(max_bytes=12, max_tokens=None)
+        )
+
+        first = skills.read_resource("research", "data.txt")
+        last = skills.read_resource("research", "data.txt", offset=24)
+
+        assert first == "012345678901\n[bytes 0-12 of 30; read on with offset=12]"
+        assert last == "456789\n[bytes 24-30 of 30]"
+
+    def test_length_narrows_the_page(self, tmp_path: Path) -> None:
+        (make_skill(tmp_path) / "data.txt").write_text("0123456789")
+        skills = Skills.from_local_dir(tmp_path)
+
+        page = skills.read_resource("research", "data.txt", offset=2, length=3)
+
+        assert page == "234\n[bytes 2-5 of 10; read on with offset=5]"
+
+    def test_page_boundaries_respect_utf8_characters(self, tmp_path: Path) -> None:
+        (make_skill(tmp_path) / "text.md").write_text("aéb", encoding="utf-8")
+        skills = Skills.from_local_dir(tmp_path)
+
+        first = skills.read_resource("research", "text.md", length=2)
+        inside = skills.read_resource("research", "text.md", offset=2, length=2)
+
+        assert first == "a\n[bytes 0-1 of 4; read on with offset=1]"
+        assert inside == "b\n[bytes 3-4 of 4]"
+
+    def test_binary_pages_stay_within_budget(self, tmp_path: Path) -> None:
+        (make_skill(tmp_path) / "blob.bin").write_bytes(b"\xff\x00" * 20)
+        skills = Skills.from_local_dir(
+            tmp_path, output_limits=OutputLimits(max_bytes=16, max_tokens=None)
+        )
+
+        page = skills.read_resource("research", "blob.bin")
+
+        encoded, note = page.split("\n")
+        assert len(encoded.removeprefix("base64: ")) <= 16
+        assert note == "[bytes 0-12 of 40; read on with offset=12]"
+
+    def test_rejects_negative_offset(self, tmp_path: Path) -> None:
+        (make_skill(tmp_path) / "notes.md").write_text("hello")
+        skills = Skills.from_local_dir(tmp_path)
+
+        with pytest.raises(ValueError, match="offset"):
+            skills.read_resource("research", "notes.md", offset=-1)
+
+
+class TestScriptOutputLimits:
+    @pytest.mark.asyncio
+    async def test_script_output_is_clipped_to_the_budget(self, tmp_path: Path) -> None:
+        scripts = make_skill(tmp_path) / "scripts"
+        scripts.mkdir()
+        (scripts / "loud.py").write_text(
+            "import sys\nsys.stdout.write('a' * 10 + 'b' * 5000 + 'c' * 10)\n"
+        )
+        skills = Skills.from_local_dir(
+            tmp_path, output_limits=OutputLimits(max_bytes=20, max_tokens=None)
+        )
+
+        result = await skills.run_script("research", "scripts/loud.py")
+
+        assert result.startswith("aaaaaaaaaa\n[... ")
+        assert result.endswith("]\ncccccccccc")
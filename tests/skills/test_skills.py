@@ -93,7 +93,7 @@ class TestSkills:
         skills = Skills.from_local_dir(tmp_path)
 
         with (
-            patch.object(Path, "read_bytes", side_effect=OSError("locked")),
+            patch.object(Path, "open", side_effect=OSError("locked")),
             pytest.raises(ValueError, match="Could not read resource"),
         ):
             skills.read_resource("internet-research", "notes.md")
@@ -0,0 +1,169 @@
+import asyncio
+import contextlib
+import os
+import sys
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import pytest
+
+from rtvoice.skills import PythonWorkerPool, Skills
+
+
+def write(path: Path, source: str) -> Path:
+    path.write_text(source, encoding="utf-8")
+    return path
+
+
+@contextlib.asynccontextmanager
+async def open_pool(**kwargs) -> AsyncIterator[PythonWorkerPool]:
+    pool = PythonWorkerPool(size=1, **kwargs)
+    try:
+        yield pool
+    finally:
+        await pool.close()
+
+
+class TestPythonWorkerPool:
+    def test_rejects_invalid_settings(self) -> None:
+        with pytest.raises(ValueError, match="size"):
+            PythonWorkerPool(size=0)
+        with pytest.raises(ValueError, match="max_runs_per_worker"):
+            PythonWorkerPool(max_runs_per_worker=0)
+
+    @pytest.mark.asyncio
+    async def test_runs_script_with_arguments_in_cwd(self, tmp_path: Path) -> None:
+        (tmp_path / "data.txt").write_text("from cwd")
+        script = write(
+            tmp_path / "echo.py",
+            "import sys\nprint(sys.argv[1:], open('data.txt').read())\n",
+        )
+
+        async with open_pool() as pool:
+            result = await pool.run(script, ["a", "b"], cwd=tmp_path)
+
+        assert result == "['a', 'b'] from cwd"
+
+    @pytest.mark.asyncio
+    async def test_reuses_the_warm_worker(self, tmp_path: Path) -> None:
+        script = write(tmp_path / "pid.py", "import os\nprint(os.getpid())\n")
+
+        async with open_pool() as pool:
+            first = await pool.run(script, cwd=tmp_path)
+            second = await pool.run(script, cwd=tmp_path)
+
+        assert first == second
+
+    @pytest.mark.asyncio
+    async def test_reports_exit_code_and_stderr(self, tmp_path: Path) -> None:
+        script = write(
+            tmp_path / "fail.py",
+            "import sys\nprint('bad input', file=sys.stderr)\nsys.exit(3)\n",
+        )
+
+        async with open_pool() as pool:
+            result = await pool.run(script, cwd=tmp_path)
+
+        assert result == "Error (exit code 3): bad input"
+
+    @pytest.mark.asyncio
+    async def test_exception_is_reported_with_traceback(self, tmp_path: Path) -> None:
+        script = write(tmp_path / "boom.py", "raise RuntimeError('boom')\n")
+
+        async with open_pool() as pool:
+            result = await pool.run(script, cwd=tmp_path)
+
+        assert result.startswith("Error (exit code 1): Traceback")
+        assert "RuntimeError: boom" in result
+
+    @pytest.mark.asyncio
+    async def test_timeout_replaces_the_worker(self, tmp_path: Path) -> None:
+        slow = write(tmp_path / "slow.py", "import time\ntime.sleep(5)\n")
+        quick = write(tmp_path / "quick.py", "print('ok')\n")
+
+        async with open_pool() as pool:
+            timed_out = await pool.run(slow, cwd=tmp_path, timeout=0.2)
+            after = await pool.run(quick, cwd=tmp_path)
+
+        assert timed_out == "Error: Script timed out after 0.2 seconds."
+        assert after == "ok"
+
+    @pytest.mark.asyncio
+    async def test_workers_are_recycled(self, tmp_path: Path) -> None:
+        script = write(tmp_path / "pid.py", "import os\nprint(os.getpid())\n")
+
+        async with open_pool(max_runs_per_worker=1) as pool:
+            first = await pool.run(script, cwd=tmp_path)
+            second = await pool.run(script, cwd=tmp_path)
+
+        assert first != second
+
+    @pytest.mark.asyncio
+    async def test_cancelling_a_run_kills_its_worker(self, tmp_path: Path) -> None:
+        pid_file = tmp_path / "pid"
+        slow = write(
+            tmp_path / "slow.py",
+            f"import os, time\nopen({str(pid_file)!r}, 'w').write(str(os.getpid()))\n"
+            "time.sleep(30)\n",
+        )
+        quick = write(tmp_path / "quick.py", "print('ok')\n")
+
+        async with open_pool() as pool:
+            run = asyncio.create_task(pool.run(slow, cwd=tmp_path))
+            while not pid_file.exists() or not pid_file.read_text():
+                await asyncio.sleep(0.01)
+            run.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await run
+            after = await pool.run(quick, cwd=tmp_path)
+
+        with pytest.raises(ProcessLookupError):
+            os.kill(int(pid_file.read_text()), 0)
+        assert after == "ok"
+
+    @pytest.mark.asyncio
+    async def test_non_ascii_output_fits_the_response_limit(
+        self, tmp_path: Path
+    ) -> None:
+        script = write(
+            tmp_path / "umlauts.py",
+            "import sys\nprint('ü' * 200_000)\nprint('ß' * 200_000, file=sys.stderr)\n",
+        )
+
+        async with open_pool(max_output_bytes=1_000) as pool:
+            result = await pool.run(script, cwd=tmp_path)
+
+        assert result.startswith("ü" * 250)
+        assert "bytes omitted" in result
+
+    @pytest.mark.skipif(sys.platform != "linux", reason="RLIMIT_AS is Linux-only")
+    @pytest.mark.asyncio
+    async def test_memory_cap_fails_the_run(self, tmp_path: Path) -> None:
+        hog = write(tmp_path / "hog.py", "data = bytearray(2 * 1024 ** 3)\n")
+        quick = write(tmp_path / "quick.py", "print('ok')\n")
+
+        async with open_pool(max_memory_mb=512) as pool:
+            result = await pool.run(hog, cwd=tmp_path)
+            after = await pool.run(quick, cwd=tmp_path)
+
+        assert "memory limit" in result
+        assert after == "ok"
+
+
+class TestSkillsWithWorkerPool:
+    @pytest.mark.asyncio
+    async def test_python_scripts_run_in_the_pool(self, tmp_path: Path) -> None:
+        skill_dir = tmp_path / "research"
+        (skill_dir / "scripts").mkdir(parents=True)
+        write(
+            skill_dir / "SKILL.md",
+            "---\nname: research\ndescription: Research.\n---\nRun the script.\n",
+        )
+        write(skill_dir / "scripts" / "pid.py", "import os\nprint(os.getpid())\n")
+
+        async with open_pool() as pool:
+            skills = Skills.from_local_dir(tmp_path, worker_pool=pool)
+            first = await skills.run_script("research", "scripts/pid.py")
+            second = await skills.run_script("research", "scripts/pid.py")
+
+        assert first == second
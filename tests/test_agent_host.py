@@ -0,0 +1,159 @@
+import asyncio
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from rtvoice.agent import AgentHost, RealtimeAgent
+from rtvoice.events.views import (
+    CostUpdatedEvent,
+    ToolExecutedEvent,
+    ToolExecutionCompletedEvent,
+    ToolExecutionStartedEvent,
+)
+from rtvoice.realtime import RealtimeProvider
+from rtvoice.skills import Skills
+from rtvoice.tokens import PricingCatalog
+from rtvoice.tools import Tools
+
+
+def make_host(**kwargs) -> AgentHost:
+    kwargs.setdefault("provider", MagicMock(spec=RealtimeProvider))
+    return AgentHost(**kwargs)
+
+
+def create_agent(host: AgentHost, **kwargs) -> RealtimeAgent:
+    agent = host.create_agent(
+        system_prompt="",
+        audio_input=MagicMock(),
+        audio_output=MagicMock(),
+        **kwargs,
+    )
+    agent._realtime_session.start = AsyncMock()
+    return agent
+
+
+async def start(host: AgentHost, agent: RealtimeAgent) -> asyncio.Task:
+    task = asyncio.create_task(host.run(agent))
+    await asyncio.sleep(0)
+    return task
+
+
+class TestSharing:
+    def test_agents_share_tools_skills_pricing_and_provider(self) -> None:
+        tools = Tools()
+
+        @tools.action("Look up the weather.")
+        def get_weather(city: str) -> str:
+            return city
+
+        skills = MagicMock(spec=Skills)
+        skills.summaries.return_value = []
+        pricing_catalog = PricingCatalog()
+        host = make_host(tools=tools, skills=skills, pricing_catalog=pricing_catalog)
+
+        first, second = create_agent(host), create_agent(host)
+
+        assert first._tools is not second._tools
+        assert first._tools.get("get_weather") is tools.get("get_weather")
+        assert second._tools.get("get_weather") is tools.get("get_weather")
+        assert first._skills is second._skills is skills
+        for agent in (first, second):
+            tracker = agent._realtime_session._token_tracker
+            assert tracker._pricing_catalog is pricing_catalog
+            websocket = agent._realtime_session._websocket
+            assert websocket._provider is host._provider
+
+    def test_tools_registered_later_do_not_reach_hosted_agents(self) -> None:
+        tools = Tools()
+        host = make_host(tools=tools)
+
+        @tools.action("Added later.")
+        def later() -> None: ...
+
+        assert create_agent(host)._tools.get("later") is None
+
+    def test_passes_tenant_and_options_through(self) -> None:
+        host = make_host()
+
+        agent = create_agent(host, tenant="acme", cost_budget=1.0)
+
+        tracker = agent._realtime_session._token_tracker
+        assert tracker._tenant == "acme"
+        assert tracker._cost_budget == Decimal("1.0")
+
+
+class TestValidation:
+    def test_rejects_provider_and_api_key(self) -> None:
+        with pytest.raises(ValueError, match="either `provider` or `api_key`"):
+            AgentHost(provider=MagicMock(spec=RealtimeProvider), api_key="key")
+
+    def test_rejects_duplicate_agent_id(self) -> None:
+        host = make_host()
+        create_agent(host, agent_id="call-1")
+
+        with pytest.raises(ValueError, match="call-1"):
+            create_agent(host, agent_id="call-1")
+
+    @pytest.mark.asyncio
+    async def test_rejects_agents_of_another_host(self) -> None:
+        agent = create_agent(make_host())
+
+        with pytest.raises(ValueError, match="not created by this host"):
+            await make_host().run(agent)
+
+
+class TestAccounting:
+    @pytest.mark.asyncio
+    async def test_tracks_usage_while_running_and_totals_after(self) -> None:
+        host = make_host()
+        agent = create_agent(host, agent_id="call-1", tenant="acme")
+        task = await start(host, agent)
+        bus = agent._event_bus
+
+        await bus.dispatch(
+            CostUpdatedEvent(
+                response_id="response-1", delta=Decimal("0.02"), total=Decimal("0.02")
+            )
+        )
+        await bus.dispatch(ToolExecutionStartedEvent(response_id="response-1"))
+        await bus.dispatch(
+            ToolExecutedEvent(
+                name="stop", action_kind="end_session", silent=False, result="ok"
+            )
+        )
+        await bus.dispatch(
+            ToolExecutionCompletedEvent(response_id="response-1", response_pending=True)
+        )
+
+        [usage] = host.usage(tenant="acme")
+        assert usage.agent_id == "call-1"
+        assert usage.started_at is not None
+        assert usage.cost == Decimal("0.02")
+        assert usage.responses == 1
+        assert usage.tool_calls == 1
+        assert usage.tool_seconds > 0
+        assert host.usage(tenant="globex") == []
+        assert host.stats().running_agents == 1
+
+        await agent.stop()
+        await task
+
+        stats = host.stats()
+        assert host.get("call-1") is None
+        assert (stats.agents, stats.running_agents, stats.finished_agents) == (0, 0, 1)
+        assert stats.cost == Decimal("0.02")
+
+    @pytest.mark.asyncio
+    async def test_close_stops_running_agents_and_drops_idle_ones(self) -> None:
+        host = make_host()
+        running = create_agent(host)
+        create_agent(host, agent_id="idle")
+        task = await start(host, running)
+
+        await host.close()
+        await task
+
+        stats = host.stats()
+        assert (stats.agents, stats.finished_agents) == (0, 1)
+        assert host.get("idle") is None
@@ -0,0 +1,190 @@
+import asyncio
+import os
+import time
+from decimal import Decimal
+
+import pytest
+
+from rtvoice.agent import (
+    AgentHost,
+    AgentSupervisor,
+    SessionFailedError,
+    SessionHandler,
+    SessionRequest,
+)
+
+HANDLER = f"{__name__}:ScriptedHandler"
+
+
+class ScriptedHandler(SessionHandler):
+    """Does what the payload says instead of running an agent."""
+
+    def create_host(self) -> AgentHost:
+        return AgentHost(api_key="test")
+
+    async def run_session(self, host: AgentHost, request: SessionRequest) -> None:
+        match request.payload.get("action"):
+            case "fail":
+                raise ValueError("no such call")
+            case "crash":
+                os._exit(3)
+            case "hang":
+                time.sleep(60)
+            case _:
+                await asyncio.sleep(request.payload.get("seconds", 0))
+
+
+def make_supervisor(**kwargs) -> AgentSupervisor:
+    kwargs.setdefault("workers", 2)
+    kwargs.setdefault("heartbeat_interval_seconds", 0.05)
+    kwargs.setdefault("heartbeat_timeout_seconds", 1.0)
+    return AgentSupervisor(HANDLER, **kwargs)
+
+
+async def wait_for(condition, timeout: float = 20.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        await asyncio.sleep(0.05)
+
+
+class TestValidation:
+    def test_rejects_handler_without_attribute(self) -> None:
+        with pytest.raises(ValueError, match="import path"):
+            AgentSupervisor("myapp.calls")
+
+    def test_rejects_invalid_settings(self) -> None:
+        with pytest.raises(ValueError, match="workers"):
+            AgentSupervisor(HANDLER, workers=0)
+        with pytest.raises(ValueError, match="max_sessions_per_worker"):
+            AgentSupervisor(HANDLER, max_sessions_per_worker=0)
+        with pytest.raises(ValueError, match="heartbeat_timeout_seconds"):
+            AgentSupervisor(
+                HANDLER, heartbeat_interval_seconds=1, heartbeat_timeout_seconds=1
+            )
+
+    @pytest.mark.asyncio
+    async def test_run_session_needs_a_started_supervisor(self) -> None:
+        with pytest.raises(RuntimeError, match="not running"):
+            await make_supervisor().run_session("call-1")
+
+    @pytest.mark.asyncio
+    async def test_start_fails_when_the_handler_cannot_be_imported(self) -> None:
+        supervisor = AgentSupervisor(f"{__name__}:Missing", workers=1)
+
+        with pytest.raises(RuntimeError, match="did not start"):
+            await supervisor.start()
+
+
+class TestSupervisor:
+    @pytest.mark.asyncio
+    async def test_routes_runs_and_reports(self) -> None:
+        supervisor = make_supervisor(max_sessions_per_worker=1)
+        await supervisor.start()
+        try:
+            first = asyncio.create_task(
+                supervisor.run_session("call-1", {"seconds": 0.5})
+            )
+            second = asyncio.create_task(
+                supervisor.run_session("call-2", {"seconds": 0.5})
+            )
+            await asyncio.sleep(0.1)
+
+            stats = supervisor.stats()
+            assert [worker.sessions for worker in stats.workers] == [1, 1]
+            with pytest.raises(RuntimeError, match="No worker"):
+                await supervisor.run_session("call-3")
+            with pytest.raises(ValueError, match="already exists"):
+                await supervisor.run_session("call-1")
+
+            await asyncio.gather(first, second)
+            with pytest.raises(SessionFailedError, match="no such call"):
+                await supervisor.run_session("call-4", {"action": "fail"})
+
+            await wait_for(lambda: supervisor.stats().workers[1].host is not None)
+            stats = supervisor.stats()
+            assert stats.sessions == 0
+            assert stats.cost == Decimal(0)
+            assert all(worker.healthy for worker in stats.workers)
+        finally:
+            await supervisor.close(drain_timeout_seconds=1)
+
+    @pytest.mark.asyncio
+    async def test_replaces_crashed_and_stuck_workers(self) -> None:
+        supervisor = make_supervisor(workers=1)
+        await supervisor.start()
+        try:
+            with pytest.raises(SessionFailedError, match="exit code 3"):
+                await supervisor.run_session("call-1", {"action": "crash"})
+            await wait_for(lambda: supervisor.stats().workers[0].healthy)
+
+            with pytest.raises(SessionFailedError, match="lost"):
+                await supervisor.run_session("call-2", {"action": "hang"})
+            await wait_for(lambda: supervisor.stats().workers[0].healthy)
+
+            await supervisor.run_session("call-3")
+            assert supervisor.stats().workers[0].restarts == 2
+        finally:
+            await supervisor.close(drain_timeout_seconds=1)
+
+    @pytest.mark.asyncio
+    async def test_survives_bad_replies_and_failed_restarts(self) -> None:
+        supervisor = make_supervisor(workers=1)
+        await supervisor.start()
+        spawn = supervisor._spawn
+        handle_reply = supervisor._handle_reply
+        failures = {"spawn": 1, "reply": 1}
+
+        async def flaky_spawn(index: int, restarts: int = 0):
+            if failures["spawn"]:
+                failures["spawn"] -= 1
+                raise OSError("too many open files")
+            return await spawn(index, restarts)
+
+        def garbled_reply(worker, reply) -> None:
+            if failures["reply"]:
+                failures["reply"] -= 1
+                reply = {"op": "heartbeat", "stats": "garbled"}
+            handle_reply(worker, reply)
+
+        supervisor._spawn = flaky_spawn
+        supervisor._handle_reply = garbled_reply
+        try:
+            await wait_for(lambda: not failures["reply"])
+            await supervisor.run_session("call-1")
+
+            with pytest.raises(SessionFailedError, match="exit code 3"):
+                await supervisor.run_session("call-2", {"action": "crash"})
+            await wait_for(lambda: supervisor.stats().workers[0].healthy)
+
+            await supervisor.run_session("call-3")
+            assert not failures["spawn"]
+            assert supervisor.stats().workers[0].restarts == 1
+        finally:
+            await supervisor.close(drain_timeout_seconds=1)
+
+    @pytest.mark.asyncio
+    async def test_close_lets_running_sessions_finish(self) -> None:
+        supervisor = make_supervisor(workers=1)
+        await supervisor.start()
+        session = asyncio.create_task(
+            supervisor.run_session("call-1", {"seconds": 0.3})
+        )
+        await asyncio.sleep(0.1)
+
+        await supervisor.close(drain_timeout_seconds=5)
+
+        await session
+        assert not supervisor.stats().workers[0].healthy
+
+    @pytest.mark.asyncio
+    async def test_close_cancels_sessions_past_the_drain_timeout(self) -> None:
+        supervisor = make_supervisor(workers=1)
+        await supervisor.start()
+        session = asyncio.create_task(supervisor.run_session("call-1", {"seconds": 60}))
+        await asyncio.sleep(0.1)
+
+        await supervisor.close(drain_timeout_seconds=0.1)
+
+        with pytest.raises(SessionFailedError, match="cancelled"):
+            await session
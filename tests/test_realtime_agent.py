@@ -1,5 +1,6 @@
 import asyncio
 import logging
+from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -21,6 +22,13 @@ from rtvoice.agent.views import (
     TranscriptionModel,
 )
 from rtvoice.audio import EchoCancellation
+from rtvoice.conversation import (
+    AssistantTurn,
+    ConversationStore,
+    SQLiteConversationStore,
+    ToolTurn,
+    UserTurn,
+)
 from rtvoice.events.views import (
     AgentErrorEvent,
     AgentSessionConnectedEvent,
@@ -39,7 +47,8 @@ from rtvoice.events.views import (
     UserStoppedSpeakingEvent,
     UserTranscriptCompletedEvent,
 )
-from rtvoice.tools import ActionResult, Inject, Tools
+from rtvoice.skills import Skills
+from rtvoice.tools import ActionResult, Inject, ToolRetrieval, Tools
 
 
 class FileSystem:
@@ -318,6 +327,176 @@ class TestInactivityTimeout:
         assert not hasattr(agent._realtime_session, "_conversation_inactivity_monitor")
 
 
+class TestCostBudget:
+    def test_budget_reaches_the_token_tracker(self) -> None:
+        agent = make_agent(cost_budget=0.5)
+
+        assert agent._realtime_session._token_tracker._cost_budget == Decimal("0.5")
+        assert agent.cost == 0
+
+    def test_rejects_non_positive_budget(self) -> None:
+        with pytest.raises(ValueError, match="cost_budget"):
+            make_agent(cost_budget=0)
+
+
+class TestToolAvailability:
+    def test_tool_context_changes_notify_the_agent_tools(self) -> None:
+        agent = make_agent()
+        calls: list[None] = []
+        agent._tools.subscribe(lambda: calls.append(None))
+
+        agent.tool_context.provide(FileSystem())
+        agent.refresh_tools()
+
+        assert len(calls) == 2
+
+
+class TestToolRetrieval:
+    def _skills(self, tmp_path) -> Skills:
+        skill_dir = tmp_path / "travel-planning"
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_text(
+            "---\nname: travel-planning\ndescription: Plan trips.\n---\nBody\n",
+            encoding="utf-8",
+        )
+        return Skills.from_local_dir(tmp_path)
+
+    def test_retrieved_skills_leave_the_system_prompt(self, tmp_path) -> None:
+        agent = make_agent(
+            skills=self._skills(tmp_path), tool_retrieval=ToolRetrieval()
+        )
+
+        assert "travel-planning" not in str(agent._system_prompt)
+        assert agent._realtime_session._tool_retrieval_runner is not None
+
+    def test_skills_stay_in_prompt_without_skill_retrieval(self, tmp_path) -> None:
+        agent = make_agent(
+            skills=self._skills(tmp_path),
+            tool_retrieval=ToolRetrieval(top_k_skills=None),
+        )
+
+        assert "travel-planning" in str(agent._system_prompt)
+
+    def test_no_runner_without_retrieval(self) -> None:
+        agent = make_agent()
+
+        assert agent._realtime_session._tool_retrieval_runner is None
+        assert agent._realtime_session.settings.auto_response is True
+
+    def test_retrieval_answers_spoken_turns_itself(self) -> None:
+        agent = make_agent(tool_retrieval=ToolRetrieval())
+
+        assert agent._realtime_session.settings.auto_response is False
+
+    def test_retrieval_needs_transcription(self) -> None:
+        with pytest.raises(ValueError, match="transcription_model"):
+            make_agent(tool_retrieval=ToolRetrieval(), transcription_model=None)
+
+
+class TestResume:
+    def _store(self, tmp_path) -> SQLiteConversationStore:
+        store = SQLiteConversationStore(tmp_path / "calls.db")
+        store.save(
+            "call-1",
+            list(
+                enumerate(
+                    [
+                        UserTurn(transcript="My name is Max."),
+                        ToolTurn(name="lookup", result="found"),
+                        AssistantTurn(transcript="Hello Max."),
+                    ]
+                )
+            ),
+        )
+        return store
+
+    def test_requires_a_store(self) -> None:
+        with pytest.raises(ValueError, match="conversation_store"):
+            make_agent(resume_from="call-1")
+
+    @pytest.mark.asyncio
+    async def test_seeds_history_and_injects_spoken_turns(self, tmp_path) -> None:
+        agent = make_agent(
+            conversation_store=self._store(tmp_path), resume_from="call-1"
+        )
+
+        await agent._restore_conversation()
+
+        assert len(agent._conversation_history.turns) == 3
+        injected = agent._realtime_session._injected_conversation
+        assert [message.text for message in injected.messages] == [
+            "My name is Max.",
+            "Hello Max.",
+        ]
+        assert injected.summary is None
+        assert agent._conversation_id == "call-1"
+
+    @pytest.mark.asyncio
+    async def test_older_turns_beyond_the_budget_are_folded(self, tmp_path) -> None:
+        store = SQLiteConversationStore(tmp_path / "calls.db")
+        store.save(
+            "call-1",
+            list(
+                enumerate(
+                    UserTurn(transcript=f"Message number {i} of a long call.")
+                    for i in range(5)
+                )
+            ),
+        )
+        agent = make_agent(
+            conversation_store=store, resume_from="call-1", resume_token_budget=40
+        )
+
+        await agent._restore_conversation()
+
+        injected = agent._realtime_session._injected_conversation
+        assert [message.text for message in injected.recent_messages] == [
+            f"Message number {i} of a long call." for i in (2, 3, 4)
+        ]
+        # the older turns survive in the summary as far as its share allows
+        summary = injected.summary_text()
+        assert summary.startswith("This call continues an earlier conversation.")
+        assert "(1 earlier message omitted)" in summary
+        assert "[USER]: Message number 1 of a long call." in summary
+
+    @pytest.mark.asyncio
+    async def test_new_turns_continue_the_stored_conversation(self, tmp_path) -> None:
+        store = self._store(tmp_path)
+        agent = make_agent(conversation_store=store, resume_from="call-1")
+        await agent._restore_conversation()
+
+        agent._conversation_history.add(UserTurn(transcript="Still there?"))
+        await agent._event_bus.dispatch(AgentStoppedEvent())
+
+        assert store.load("call-1")[-1] == UserTurn(transcript="Still there?")
+
+    @pytest.mark.asyncio
+    async def test_copies_the_history_to_a_new_id(self, tmp_path) -> None:
+        store = self._store(tmp_path)
+        agent = make_agent(
+            conversation_store=store, resume_from="call-1", conversation_id="call-2"
+        )
+
+        await agent._restore_conversation()
+
+        assert store.load("call-2") == store.load("call-1")
+
+    @pytest.mark.asyncio
+    async def test_store_is_untouched_until_the_agent_starts(self) -> None:
+        store = MagicMock(spec=ConversationStore)
+        store.load.return_value = []
+        agent = make_agent(conversation_store=store, resume_from="call-1")
+        fresh = make_agent(conversation_store=store)
+
+        store.load.assert_not_called()
+        await agent._restore_conversation()
+        await fresh._restore_conversation()
+
+        store.load.assert_called_once_with("call-1")
+        # a new conversation has nothing to store yet
+        store.save.assert_not_called()
+
+
 class TestStop:
     @pytest.mark.asyncio
     async def test_dispatches_agent_stopped_event(self) -> None:
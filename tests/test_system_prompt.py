@@ -41,3 +41,13 @@ class TestSystemPrompt:
         )
 
         assert "A &lt; B &amp; current facts." in str(prompt)
+
+    def test_canonical_lists_skills_by_name(self) -> None:
+        skills = [SkillInfo("zeta", "Last."), SkillInfo("alpha", "First.")]
+
+        canonical = str(SystemPrompt("", skills=skills, canonical=True))
+
+        assert canonical.index("alpha") < canonical.index("zeta")
+        assert canonical == str(
+            SystemPrompt("", skills=list(reversed(skills)), canonical=True)
+        )
@@ -1,11 +1,19 @@
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from transitbus import EventBus
 
 from rtvoice import TextAgent
-from rtvoice.conversation import ConversationHistory
-from rtvoice.tools import ActionResult, Inject, ToolContext, Tools, ToolSchemaFormat
+from rtvoice.conversation import ConversationHistory, UserTurn
+from rtvoice.tools import (
+    ActionResult,
+    Inject,
+    ToolContext,
+    Tools,
+    ToolSchemaFormat,
+    ToolTurnEnded,
+)
 
 
 class FileSystem:
@@ -112,3 +120,89 @@ async def test_handoff_result_carries_the_agents_result_instructions() -> None:
 
     assert result.value == "Done"
     assert result.instruction == "Read the answer verbatim."
+
+
+@pytest.mark.asyncio
+async def test_streaming_handoff_speaks_each_sentence_once() -> None:
+    text_agent = make_text_agent(streaming=True)
+
+    async def stream(task: str, context: str | None = None):
+        for delta in [
+            "Let me check. ",
+            ToolTurnEnded(),
+            "Two slots are free. ",
+            "Mon",
+            "day at nine. ",
+            "Shall I book it?",
+        ]:
+            yield delta
+
+    text_agent.stream = stream
+    tools = Tools()
+    tools.set_context(ToolContext(text_agent, ConversationHistory(EventBus())))
+    spoken: list[str] = []
+
+    result = await tools.execute(
+        "text_agent", {"task": "Find a slot"}, speech=spoken.append
+    )
+    await asyncio.sleep(0.01)
+
+    assert result.value == "Two slots are free. Monday at nine. Shall I book it?"
+    assert result.respond is False
+    # the remark before the tool calls is never said, the last finished
+    # sentence waits for the next one, and the rest goes out at the end
+    assert spoken == ["Two slots are free.", "Monday at nine. Shall I book it?"]
+
+
+@pytest.mark.asyncio
+async def test_streaming_handoff_answers_like_start_at_max_iterations() -> None:
+    text_agent = make_text_agent(streaming=True)
+
+    async def stream(task: str, context: str | None = None):
+        for delta in ["Checking. ", ToolTurnEnded(), "Max iterations reached."]:
+            yield delta
+
+    text_agent.stream = stream
+    tools = Tools()
+    tools.set_context(ToolContext(text_agent, ConversationHistory(EventBus())))
+    spoken: list[str] = []
+
+    result = await tools.execute(
+        "text_agent", {"task": "Find a slot"}, speech=spoken.append
+    )
+    await asyncio.sleep(0.01)
+
+    assert result.value == "Max iterations reached."
+    assert spoken == ["Max iterations reached."]
+
+
+@pytest.mark.asyncio
+async def test_streaming_handoff_answers_once_when_nothing_can_speak() -> None:
+    text_agent = make_text_agent(
+        streaming=True, result_instructions="Read the answer verbatim."
+    )
+    text_agent.start = AsyncMock(return_value="Done")
+    tools = Tools()
+    tools.set_context(ToolContext(text_agent, ConversationHistory(EventBus())))
+
+    result = await tools.execute("text_agent", {"task": "Find a slot"})
+
+    assert result.value == "Done"
+    assert result.respond is None
+    assert result.instruction == "Read the answer verbatim."
+
+
+@pytest.mark.asyncio
+async def test_handoff_passes_a_token_bounded_context() -> None:
+    text_agent = make_text_agent(context_token_budget=10)
+    text_agent.start = AsyncMock(return_value="Done")
+    history = ConversationHistory(EventBus())
+    history.seed(UserTurn(transcript=f"message {i:022d}") for i in range(5))
+    tools = Tools()
+    tools.set_context(ToolContext(text_agent, history))
+
+    await tools.execute("text_agent", {"task": "Plan my day"})
+
+    assert text_agent.start.await_args.kwargs["context"] == (
+        f"(4 earlier turns omitted)\n[USER]: message {4:022d}"
+    )
@@ -1,15 +1,18 @@
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from llmify import (
     ChatInvokeCompletion,
     Function,
+    StreamEnd,
+    StreamTextDelta,
     ToolCall,
     ToolResultMessage,
 )
 
 from rtvoice import TextAgent
-from rtvoice.tools import Tools
+from rtvoice.tools import ActionKind, Tools, ToolTurnEnded
 
 
 @pytest.mark.asyncio
@@ -169,3 +172,154 @@ async def test_returns_max_iterations_message() -> None:
 
     assert await text_agent.start("Plan my day") == "Max iterations reached."
     assert llm.invoke.await_count == 2
+
+
+def _call(call_id: str, name: str, arguments: str = "{}") -> ToolCall:
+    return ToolCall(id=call_id, function=Function(name=name, arguments=arguments))
+
+
+@pytest.mark.asyncio
+async def test_runs_a_turns_tool_calls_concurrently() -> None:
+    llm = MagicMock()
+    llm.invoke = AsyncMock(
+        side_effect=[
+            ChatInvokeCompletion(
+                completion="",
+                tool_calls=[_call("call_a", "lookup_a"), _call("call_b", "lookup_b")],
+            ),
+            ChatInvokeCompletion(completion="Done"),
+        ]
+    )
+    tools = Tools()
+    both_started = asyncio.Barrier(2)
+
+    @tools.action("Lookup A", kind=ActionKind.READ)
+    async def lookup_a() -> str:
+        await asyncio.wait_for(both_started.wait(), 1)
+        return "a"
+
+    @tools.action("Lookup B", kind=ActionKind.READ)
+    async def lookup_b() -> str:
+        await asyncio.wait_for(both_started.wait(), 1)
+        return "b"
+
+    text_agent = TextAgent(
+        description="Helper", system_prompt="Help.", llm=llm, tools=tools
+    )
+
+    assert await text_agent.start("Look both up") == "Done"
+    messages = llm.invoke.await_args_list[1].args[0]
+    assert [(m.tool_call_id, m.content) for m in messages[-2:]] == [
+        ("call_a", "a"),
+        ("call_b", "b"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_mutating_calls_wait_for_the_calls_before_them() -> None:
+    llm = MagicMock()
+    llm.invoke = AsyncMock(
+        side_effect=[
+            ChatInvokeCompletion(
+                completion="",
+                tool_calls=[
+                    _call("call_read", "read_balance"),
+                    _call("call_pay", "pay"),
+                    _call("call_check", "read_balance"),
+                ],
+            ),
+            ChatInvokeCompletion(completion="Paid"),
+        ]
+    )
+    tools = Tools()
+    log: list[str] = []
+
+    @tools.action("Read balance", kind=ActionKind.READ)
+    async def read_balance() -> str:
+        await asyncio.sleep(0.01)
+        log.append("read")
+        return "100"
+
+    @tools.action("Pay", kind=ActionKind.MUTATE)
+    async def pay() -> str:
+        log.append("pay")
+        return "paid"
+
+    text_agent = TextAgent(
+        description="Helper", system_prompt="Help.", llm=llm, tools=tools
+    )
+
+    await text_agent.start("Pay the bill")
+
+    assert log == ["read", "pay", "read"]
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_final_completion_deltas() -> None:
+    turns = [
+        [
+            StreamTextDelta(delta="Let me look. "),
+            StreamEnd(
+                completion="Let me look. ",
+                tool_calls=[_call("call_echo", "echo", '{"text":"hi"}')],
+            ),
+        ],
+        [
+            StreamTextDelta(delta="Found "),
+            StreamTextDelta(delta="it."),
+            StreamEnd(completion="Found it."),
+        ],
+    ]
+    seen_messages: list[list] = []
+
+    async def stream(messages: list, **_: object):
+        seen_messages.append(list(messages))
+        for event in turns[len(seen_messages) - 1]:
+            yield event
+
+    llm = MagicMock()
+    llm.stream = stream
+    tools = Tools()
+
+    @tools.action(description="Echo text")
+    async def echo(text: str) -> str:
+        return text
+
+    text_agent = TextAgent(
+        description="Helper", system_prompt="Help.", llm=llm, tools=tools
+    )
+
+    deltas = [delta async for delta in text_agent.stream("Find it")]
+
+    assert deltas == ["Let me look. ", ToolTurnEnded(), "Found ", "it."]
+    assert seen_messages[1][-1].content == "hi"
+
+
+@pytest.mark.asyncio
+async def test_stream_ends_with_max_iterations_after_the_last_tool_turn() -> None:
+    async def stream(messages: list, **_: object):
+        yield StreamTextDelta(delta="Checking. ")
+        yield StreamEnd(
+            completion="Checking. ",
+            tool_calls=[_call("call_echo", "echo", '{"text":"hi"}')],
+        )
+
+    llm = MagicMock()
+    llm.stream = stream
+    tools = Tools()
+
+    @tools.action(description="Echo text")
+    async def echo(text: str) -> str:
+        return text
+
+    text_agent = TextAgent(
+        description="Helper",
+        system_prompt="Help.",
+        llm=llm,
+        tools=tools,
+        max_iterations=1,
+    )
+
+    deltas = [delta async for delta in text_agent.stream("Find it")]
+
+    assert deltas == ["Checking. ", ToolTurnEnded(), "Max iterations reached."]
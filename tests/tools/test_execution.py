@@ -0,0 +1,106 @@
+import logging
+import os
+import threading
+import time
+
+import pytest
+from transitbus import EventBus
+
+from rtvoice.tools import ExecutionPolicy, Inject, ToolExecutors, Tools
+
+
+def _process_id(offset: int) -> int:
+    return os.getpid() + offset
+
+
+@pytest.fixture
+def executors() -> ToolExecutors:
+    executors = ToolExecutors(max_thread_workers=2, max_process_workers=1)
+    yield executors
+    executors.shutdown()
+
+
+class TestExecutionPolicy:
+    def test_sync_tools_default_to_thread(self, executors: ToolExecutors) -> None:
+        tools = Tools(executors=executors)
+
+        @tools.action("Sync tool.")
+        def sync_tool() -> None: ...
+
+        @tools.action("Async tool.")
+        async def async_tool() -> None: ...
+
+        assert tools.get("sync_tool").execution is ExecutionPolicy.THREAD
+        assert tools.get("async_tool").execution is ExecutionPolicy.INLINE
+
+    def test_async_tool_cannot_leave_the_loop(self) -> None:
+        tools = Tools()
+
+        with pytest.raises(ValueError, match="needs a sync function"):
+
+            @tools.action("Async tool.", execution=ExecutionPolicy.THREAD)
+            async def async_tool() -> None: ...
+
+    def test_process_tool_cannot_take_injected_dependencies(self) -> None:
+        tools = Tools()
+
+        with pytest.raises(ValueError, match="worker process"):
+
+            @tools.action("Process tool.", execution=ExecutionPolicy.PROCESS)
+            def process_tool(bus: Inject[EventBus]) -> None: ...
+
+
+class TestToolExecutors:
+    @pytest.mark.asyncio
+    async def test_thread_tools_run_off_the_loop(
+        self, executors: ToolExecutors
+    ) -> None:
+        tools = Tools(executors=executors)
+
+        @tools.action("Where am I?")
+        def where() -> int:
+            return threading.get_ident()
+
+        result = await tools.execute("where")
+
+        assert result.ok
+        assert result.value != threading.get_ident()
+
+    @pytest.mark.asyncio
+    async def test_inline_tools_run_on_the_loop(self, executors: ToolExecutors) -> None:
+        tools = Tools(executors=executors)
+
+        @tools.action("Where am I?", execution=ExecutionPolicy.INLINE)
+        def where() -> int:
+            return threading.get_ident()
+
+        result = await tools.execute("where")
+
+        assert result.value == threading.get_ident()
+
+    @pytest.mark.asyncio
+    async def test_process_tools_run_in_a_worker_process(
+        self, executors: ToolExecutors
+    ) -> None:
+        tools = Tools(executors=executors)
+        tools.action("Which process?", execution=ExecutionPolicy.PROCESS)(_process_id)
+
+        result = await tools.execute("_process_id", {"offset": 0})
+
+        assert result.ok
+        assert result.value != os.getpid()
+
+    @pytest.mark.asyncio
+    async def test_warns_when_an_inline_tool_blocks_the_loop(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        tools = Tools(executors=ToolExecutors(block_warning_seconds=0.001))
+
+        @tools.action("Slow.", execution=ExecutionPolicy.INLINE)
+        def slow() -> None:
+            time.sleep(0.01)
+
+        with caplog.at_level(logging.WARNING):
+            await tools.execute("slow")
+
+        assert "Inline tool 'slow' blocked the event loop" in caplog.text
@@ -0,0 +1,50 @@
+from pydantic import BaseModel
+from transitbus import EventBus
+
+from rtvoice.tools.di import Inject
+from rtvoice.tools.invocation import InjectedSlot, InvocationPlan
+
+
+class SearchParams(BaseModel):
+    query: str
+
+
+class TestInvocationPlan:
+    def test_records_sync_and_async_dispatch(self) -> None:
+        def sync_tool() -> None: ...
+
+        async def async_tool() -> None: ...
+
+        assert not InvocationPlan.compile(sync_tool).is_async
+        assert InvocationPlan.compile(async_tool).is_async
+
+    def test_collects_injected_slots(self) -> None:
+        def tool(query: str, bus: Inject[EventBus]) -> None: ...
+
+        plan = InvocationPlan.compile(tool)
+
+        assert plan.injected == (InjectedSlot("bus", EventBus, required=True),)
+
+    def test_optional_injected_slot_is_not_required(self) -> None:
+        def tool(bus: Inject[EventBus] = None) -> None: ...  # type: ignore[assignment]
+
+        plan = InvocationPlan.compile(tool)
+
+        assert plan.injected == (InjectedSlot("bus", EventBus, required=False),)
+
+    def test_finds_param_model_target_by_annotation(self) -> None:
+        def tool(bus: Inject[EventBus], other: str, params: SearchParams) -> None: ...
+
+        plan = InvocationPlan.compile(tool, SearchParams)
+
+        assert plan.param_target == "params"
+
+    def test_single_plain_parameter_receives_param_model(self) -> None:
+        def tool(anything, bus: Inject[EventBus]) -> None: ...
+
+        assert InvocationPlan.compile(tool, SearchParams).param_target == "anything"
+
+    def test_no_target_when_ambiguous(self) -> None:
+        def tool(first, second) -> None: ...
+
+        assert InvocationPlan.compile(tool, SearchParams).param_target is None
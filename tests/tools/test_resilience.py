@@ -0,0 +1,206 @@
+import asyncio
+
+import pytest
+
+from rtvoice.tools import ActionResult, ResiliencePolicy, Tools
+from rtvoice.tools.middleware import CircuitBreakerMiddleware, ToolCall
+from rtvoice.tools.views import Tool
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestResiliencePolicy:
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"timeout_seconds": 0},
+            {"max_concurrency": 0},
+            {"failure_threshold": 0},
+            {"recovery_seconds": -1},
+        ],
+    )
+    def test_rejects_invalid_values(self, kwargs: dict) -> None:
+        with pytest.raises(ValueError):
+            ResiliencePolicy(**kwargs)
+
+    def test_merges_only_the_given_fields(self) -> None:
+        default = ResiliencePolicy(max_concurrency=2, failure_threshold=1)
+
+        merged = ResiliencePolicy(timeout_seconds=None).merged_over(default)
+
+        assert merged.timeout_seconds is None
+        assert merged.max_concurrency == 2
+        assert merged.failure_threshold == 1
+        assert merged.recovery_seconds == 30.0
+
+
+class TestTimeout:
+    @pytest.mark.asyncio
+    async def test_hung_tool_fails_with_speakable_message(self) -> None:
+        tools = Tools(resilience=ResiliencePolicy(timeout_seconds=0.01))
+
+        @tools.action("Hangs forever.")
+        async def hang() -> None:
+            await asyncio.Event().wait()
+
+        result = await tools.execute("hang")
+
+        assert not result.ok
+        assert result.error == "'hang' did not finish within 0.01 seconds."
+
+    @pytest.mark.asyncio
+    async def test_per_tool_policy_overrides_default(self) -> None:
+        tools = Tools(resilience=ResiliencePolicy(timeout_seconds=0.01))
+
+        @tools.action("Slow.", resilience=ResiliencePolicy(timeout_seconds=1))
+        async def slow() -> str:
+            await asyncio.sleep(0.05)
+            return "done"
+
+        result = await tools.execute("slow")
+
+        assert result == ActionResult.success("done")
+
+    @pytest.mark.asyncio
+    async def test_per_tool_policy_keeps_the_other_defaults(self) -> None:
+        tools = Tools(resilience=ResiliencePolicy(failure_threshold=1))
+
+        @tools.action("Crashes.", resilience=ResiliencePolicy(timeout_seconds=None))
+        async def crash() -> None:
+            raise RuntimeError("backend down")
+
+        await tools.execute("crash")
+        result = await tools.execute("crash")
+
+        assert "temporarily unavailable" in result.error
+
+
+class TestConcurrencyLimit:
+    @pytest.mark.asyncio
+    async def test_caps_parallel_calls_per_tool(self) -> None:
+        tools = Tools(resilience=ResiliencePolicy(max_concurrency=2))
+        running = 0
+        peak = 0
+
+        @tools.action("Busy.")
+        async def busy() -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        results = await asyncio.gather(*(tools.execute("busy") for _ in range(5)))
+
+        assert all(result.ok for result in results)
+        assert peak == 2
+
+
+class TestCircuitBreaker:
+    @pytest.mark.asyncio
+    async def test_opens_after_consecutive_crashes(self) -> None:
+        tools = Tools(resilience=ResiliencePolicy(failure_threshold=2))
+        calls = 0
+
+        @tools.action("Broken backend.")
+        async def broken() -> None:
+            nonlocal calls
+            calls += 1
+            raise ConnectionError("backend down")
+
+        await tools.execute("broken")
+        await tools.execute("broken")
+        result = await tools.execute("broken")
+
+        assert calls == 2
+        assert not result.ok
+        assert "temporarily unavailable" in result.error
+
+    @pytest.mark.asyncio
+    async def test_failed_results_do_not_count(self) -> None:
+        tools = Tools(resilience=ResiliencePolicy(failure_threshold=1))
+        calls = 0
+
+        @tools.action("Not found.")
+        async def lookup() -> ActionResult:
+            nonlocal calls
+            calls += 1
+            return ActionResult.fail("no such user")
+
+        await tools.execute("lookup")
+        await tools.execute("lookup")
+
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_half_open_trial_closes_on_success(self) -> None:
+        clock = FakeClock()
+        policy = ResiliencePolicy(failure_threshold=1, recovery_seconds=10)
+        breaker = CircuitBreakerMiddleware(policy, clock=clock)
+        tool = Tool("flaky", "Flaky.", lambda: None)
+        call = ToolCall(name="flaky", raw_args={}, tool=tool)
+        healthy = False
+
+        async def handler(_: ToolCall) -> ActionResult:
+            if not healthy:
+                raise ConnectionError("down")
+            return ActionResult.success()
+
+        with pytest.raises(ConnectionError):
+            await breaker(call, handler)
+        assert breaker.is_open("flaky")
+
+        clock.now = 5
+        with pytest.raises(Exception, match="about 5 seconds"):
+            await breaker(call, handler)
+
+        clock.now = 10
+        healthy = True
+        assert (await breaker(call, handler)).ok
+        assert not breaker.is_open("flaky")
+
+    @pytest.mark.asyncio
+    async def test_failed_trial_reopens(self) -> None:
+        clock = FakeClock()
+        policy = ResiliencePolicy(failure_threshold=3, recovery_seconds=10)
+        breaker = CircuitBreakerMiddleware(policy, clock=clock)
+        tool = Tool("flaky", "Flaky.", lambda: None)
+        call = ToolCall(name="flaky", raw_args={}, tool=tool)
+
+        async def handler(_: ToolCall) -> ActionResult:
+            raise ConnectionError("down")
+
+        for _ in range(3):
+            with pytest.raises(ConnectionError):
+                await breaker(call, handler)
+
+        clock.now = 10
+        with pytest.raises(ConnectionError):
+            await breaker(call, handler)
+
+        assert breaker.is_open("flaky")
+
+    @pytest.mark.asyncio
+    async def test_timeouts_count_as_failures(self) -> None:
+        tools = Tools(
+            resilience=ResiliencePolicy(timeout_seconds=0.01, failure_threshold=1)
+        )
+        calls = 0
+
+        @tools.action("Hangs.")
+        async def hang() -> None:
+            nonlocal calls
+            calls += 1
+            await asyncio.Event().wait()
+
+        await tools.execute("hang")
+        result = await tools.execute("hang")
+
+        assert calls == 1
+        assert "temporarily unavailable" in result.error
@@ -0,0 +1,197 @@
+import pytest
+from pydantic import BaseModel
+
+from rtvoice.tools import ActionKind, ActionResult, CachePolicy, Tools
+from rtvoice.tools.middleware import ResultCacheMiddleware, ToolCall
+from rtvoice.tools.views import Tool
+
+
+class LookupParams(BaseModel):
+    user_id: int
+    fields: list[str] = []
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _counting_tools(policy: CachePolicy) -> tuple[Tools, list[int]]:
+    tools = Tools()
+    calls: list[int] = []
+
+    @tools.action(
+        "Look up a user.", params=LookupParams, kind=ActionKind.READ, cache=policy
+    )
+    async def lookup_user(params: LookupParams) -> str:
+        calls.append(params.user_id)
+        return f"user {params.user_id}"
+
+    return tools, calls
+
+
+class TestCachePolicy:
+    def test_rejects_non_positive_ttl(self) -> None:
+        with pytest.raises(ValueError, match="ttl_seconds"):
+            CachePolicy(ttl_seconds=0)
+
+    def test_rejects_empty_cache(self) -> None:
+        with pytest.raises(ValueError, match="max_entries"):
+            CachePolicy(ttl_seconds=1, max_entries=0)
+
+    @pytest.mark.parametrize(
+        "kind",
+        [
+            ActionKind.GENERIC,
+            ActionKind.MUTATE,
+            ActionKind.DESTRUCTIVE,
+            ActionKind.END_SESSION,
+        ],
+    )
+    def test_only_read_tools_can_cache(self, kind: ActionKind) -> None:
+        tools = Tools()
+
+        with pytest.raises(ValueError, match=r"only ActionKind\.READ"):
+
+            @tools.action("Tool.", kind=kind, cache=CachePolicy(ttl_seconds=10))
+            async def tool() -> None: ...
+
+
+class TestToolsResultCache:
+    @pytest.mark.asyncio
+    async def test_identical_arguments_hit_the_cache(self) -> None:
+        tools, calls = _counting_tools(CachePolicy(ttl_seconds=60))
+
+        first = await tools.execute("lookup_user", {"user_id": 1})
+        second = await tools.execute("lookup_user", {"user_id": 1})
+
+        assert first == second == ActionResult.success("user 1")
+        assert calls == [1]
+        stats = tools.cache_stats("lookup_user")
+        assert (stats.hits, stats.misses) == (1, 1)
+        assert stats.hit_ratio == 0.5
+
+    @pytest.mark.asyncio
+    async def test_key_uses_validated_params(self) -> None:
+        tools, calls = _counting_tools(CachePolicy(ttl_seconds=60))
+
+        await tools.execute("lookup_user", {"user_id": 1})
+        await tools.execute("lookup_user", {"user_id": "1", "fields": []})
+
+        assert calls == [1]
+
+    @pytest.mark.asyncio
+    async def test_different_arguments_miss(self) -> None:
+        tools, calls = _counting_tools(CachePolicy(ttl_seconds=60))
+
+        await tools.execute("lookup_user", {"user_id": 1})
+        await tools.execute("lookup_user", {"user_id": 2})
+
+        assert calls == [1, 2]
+        assert tools.cache_stats().misses == 2
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached(self) -> None:
+        tools = Tools()
+        calls = 0
+
+        @tools.action("Flaky.", kind=ActionKind.READ, cache=CachePolicy(ttl_seconds=60))
+        async def flaky() -> ActionResult:
+            nonlocal calls
+            calls += 1
+            return ActionResult.fail("backend down")
+
+        await tools.execute("flaky")
+        await tools.execute("flaky")
+
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_uncached_tools_are_untouched(self) -> None:
+        tools = Tools()
+        calls = 0
+
+        @tools.action("Read.", kind=ActionKind.READ)
+        async def read() -> str:
+            nonlocal calls
+            calls += 1
+            return "value"
+
+        await tools.execute("read")
+        await tools.execute("read")
+
+        assert calls == 2
+        assert tools.cache_stats("read").misses == 0
+
+    @pytest.mark.asyncio
+    async def test_clear_cache_forces_a_fresh_call(self) -> None:
+        tools, calls = _counting_tools(CachePolicy(ttl_seconds=60))
+
+        await tools.execute("lookup_user", {"user_id": 1})
+        tools.clear_cache()
+        await tools.execute("lookup_user", {"user_id": 1})
+
+        assert calls == [1, 1]
+
+
+class TestResultCacheMiddleware:
+    def _call(self, tool: Tool, user_id: int) -> ToolCall:
+        return ToolCall(
+            name=tool.name,
+            raw_args={"user_id": user_id},
+            tool=tool,
+            params=LookupParams(user_id=user_id),
+        )
+
+    def _tool(self, policy: CachePolicy) -> Tool:
+        async def lookup_user(params: LookupParams) -> None: ...
+
+        return Tool(
+            "lookup_user",
+            "Look up a user.",
+            lookup_user,
+            param_model=LookupParams,
+            kind=ActionKind.READ,
+            cache=policy,
+        )
+
+    @pytest.mark.asyncio
+    async def test_entries_expire_after_ttl(self) -> None:
+        clock = FakeClock()
+        middleware = ResultCacheMiddleware(clock=clock)
+        tool = self._tool(CachePolicy(ttl_seconds=5))
+        calls = 0
+
+        async def handler(call: ToolCall) -> ActionResult:
+            nonlocal calls
+            calls += 1
+            return ActionResult.success(str(calls))
+
+        await middleware(self._call(tool, 1), handler)
+        clock.now = 4.9
+        await middleware(self._call(tool, 1), handler)
+        clock.now = 5.0
+        result = await middleware(self._call(tool, 1), handler)
+
+        assert calls == 2
+        assert result.value == "2"
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self) -> None:
+        middleware = ResultCacheMiddleware()
+        tool = self._tool(CachePolicy(ttl_seconds=60, max_entries=2))
+        seen: list[int] = []
+
+        async def handler(call: ToolCall) -> ActionResult:
+            seen.append(call.params.user_id)
+            return ActionResult.success()
+
+        for user_id in (1, 2, 1, 3, 1, 2):
+            await middleware(self._call(tool, user_id), handler)
+
+        # 1 stays warm by being reused, so 2 is evicted when 3 arrives
+        assert seen == [1, 2, 3, 2]
+        assert middleware.stats("lookup_user").evictions == 2
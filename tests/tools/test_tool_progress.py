@@ -0,0 +1,61 @@
+import asyncio
+import threading
+
+import pytest
+
+from rtvoice.tools import Inject, ToolProgress, Tools
+
+
+class TestToolProgress:
+    @pytest.mark.asyncio
+    async def test_async_tool_reports_to_the_call_handler(self) -> None:
+        tools = Tools()
+        messages: list[str] = []
+
+        @tools.action("Search.")
+        async def search(progress: Inject[ToolProgress]) -> str:
+            progress.report("Searching the archive")
+            await asyncio.sleep(0)
+            return "found"
+
+        async def on_progress(message: str) -> None:
+            messages.append(message)
+
+        result = await tools.execute("search", progress=on_progress)
+        await asyncio.sleep(0)
+
+        assert result.value == "found"
+        assert messages == ["Searching the archive"]
+
+    @pytest.mark.asyncio
+    async def test_thread_tool_reports_from_its_worker(self) -> None:
+        tools = Tools()
+        reported = asyncio.Event()
+        threads: list[int] = []
+
+        @tools.action("Crunch.")
+        def crunch(progress: Inject[ToolProgress]) -> str:
+            threads.append(threading.get_ident())
+            progress.report("Halfway there")
+            return "done"
+
+        async def on_progress(message: str) -> None:
+            reported.set()
+
+        await tools.execute("crunch", progress=on_progress)
+        await asyncio.wait_for(reported.wait(), 1)
+
+        assert threads != [threading.get_ident()]
+
+    @pytest.mark.asyncio
+    async def test_reports_without_a_handler_are_dropped(self) -> None:
+        tools = Tools()
+
+        @tools.action("Search.")
+        async def search(progress: Inject[ToolProgress]) -> str:
+            progress.report("Searching")
+            return "found"
+
+        result = await tools.execute("search")
+
+        assert result.ok
@@ -0,0 +1,193 @@
+from pathlib import Path
+
+import pytest
+from transitbus import EventBus
+
+from rtvoice.skills import Skills
+from rtvoice.tools import BM25Index, ToolContext, ToolRetrieval, ToolRetriever, Tools
+
+
+def make_tools() -> Tools:
+    tools = Tools()
+
+    @tools.action("Look up the weather forecast for a city.")
+    def get_weather(city: str) -> str: ...
+
+    @tools.action("Create a calendar event with a title and a date.")
+    def create_event(title: str, date: str) -> str: ...
+
+    @tools.action("Send an email message to a recipient.")
+    def send_email(recipient: str, body: str) -> str: ...
+
+    tools.set_context(ToolContext(EventBus()))
+    return tools
+
+
+def exposed(tools: Tools) -> set[str]:
+    return {schema.name for schema in tools.get_schema()}
+
+
+def make_skill(root: Path, name: str, description: str) -> None:
+    skill_dir = root / name
+    skill_dir.mkdir(parents=True)
+    (skill_dir / "SKILL.md").write_text(
+        f"---\nname: {name}\ndescription: {description}\n---\nBody\n",
+        encoding="utf-8",
+    )
+
+
+class TestBM25Index:
+    def test_ranks_matching_documents_first(self) -> None:
+        index = BM25Index(
+            {
+                "weather": "weather forecast for a city",
+                "calendar": "calendar events and meetings",
+                "email": "send email to a recipient",
+            }
+        )
+
+        results = index.search("what's the weather forecast", k=2)
+
+        assert [key for key, _ in results] == ["weather"]
+        assert results[0][1] > 0
+
+    def test_limits_results_to_k(self) -> None:
+        index = BM25Index({f"doc{i}": f"shared term {i}" for i in range(10)})
+
+        assert len(index.search("shared", k=3)) == 3
+
+    def test_rare_terms_weigh_more(self) -> None:
+        index = BM25Index(
+            {
+                "common": "city city",
+                "rare": "city forecast",
+                "other": "city",
+            }
+        )
+
+        results = index.search("city forecast", k=3)
+
+        assert results[0][0] == "rare"
+
+    def test_splits_identifiers_and_strips_suffixes(self) -> None:
+        index = BM25Index({"get_weather": "get_weather", "sendEmail": "sendEmail"})
+
+        assert index.search("weathers", k=1)[0][0] == "get_weather"
+        assert index.search("emailing", k=1)[0][0] == "sendEmail"
+
+    def test_unknown_query_returns_nothing(self) -> None:
+        index = BM25Index({"weather": "weather forecast"})
+
+        assert index.search("banana", k=5) == []
+
+    def test_empty_index(self) -> None:
+        index = BM25Index({})
+
+        assert len(index) == 0
+        assert index.search("anything", k=5) == []
+
+
+class TestToolRetrieval:
+    def test_rejects_invalid_limits(self) -> None:
+        with pytest.raises(ValueError, match="top_k"):
+            ToolRetrieval(top_k=0)
+        with pytest.raises(ValueError, match="top_k_skills"):
+            ToolRetrieval(top_k_skills=0)
+
+
+class TestFocus:
+    def test_focus_keeps_builtin_tools(self) -> None:
+        tools = make_tools()
+
+        assert tools.focus({"get_weather"})
+
+        assert exposed(tools) == {"get_weather", "stop"}
+
+    def test_unchanged_focus_reports_no_change(self) -> None:
+        tools = make_tools()
+        tools.focus({"get_weather"})
+
+        assert not tools.focus(["get_weather"])
+
+    def test_none_lifts_the_focus(self) -> None:
+        tools = make_tools()
+        tools.focus({"get_weather"})
+
+        tools.focus(None)
+
+        assert exposed(tools) == {"get_weather", "create_event", "send_email", "stop"}
+
+    def test_catalog_ignores_focus_and_builtins(self) -> None:
+        tools = make_tools()
+        tools.focus(set())
+
+        names = [schema.name for schema in tools.catalog()]
+
+        assert names == ["get_weather", "create_event", "send_email"]
+
+
+class TestToolRetriever:
+    def test_exposes_every_tool_until_the_first_selection(self) -> None:
+        tools = make_tools()
+
+        ToolRetriever(tools, policy=ToolRetrieval(always_available={"send_email"}))
+
+        assert exposed(tools) == {"get_weather", "create_event", "send_email", "stop"}
+
+    def test_selects_top_k_tools_for_the_query(self) -> None:
+        tools = make_tools()
+        retriever = ToolRetriever(tools, policy=ToolRetrieval(top_k=1))
+
+        assert retriever.select("Will it rain in Berlin? Check the weather.")
+
+        assert exposed(tools) == {"get_weather", "stop"}
+
+    def test_unmatched_query_keeps_previous_selection(self) -> None:
+        tools = make_tools()
+        retriever = ToolRetriever(tools, policy=ToolRetrieval(top_k=1))
+        retriever.select("put a meeting on my calendar")
+
+        assert not retriever.select("yes, do that")
+
+        assert exposed(tools) == {"create_event", "stop"}
+
+    def test_new_tools_are_indexed(self) -> None:
+        tools = make_tools()
+        retriever = ToolRetriever(tools, policy=ToolRetrieval(top_k=1))
+        retriever.select("weather")
+
+        @tools.action("Translate text into another language.")
+        def translate(text: str, language: str) -> str: ...
+
+        assert retriever.select("translate this into French")
+        assert "translate" in exposed(tools)
+
+    def test_relevant_skills_are_listed_in_load_skill(self, tmp_path: Path) -> None:
+        make_skill(tmp_path, "pdf-forms", "Fill in PDF forms.")
+        make_skill(tmp_path, "travel-planning", "Plan trips and book flights.")
+        skills = Skills.from_local_dir(tmp_path)
+        tools = make_tools()
+        retriever = ToolRetriever(tools, skills, ToolRetrieval(top_k_skills=1))
+        tools.set_context(ToolContext(EventBus(), skills, retriever))
+
+        assert retriever.select("I need to book a flight to Rome")
+
+        load_skill = next(s for s in tools.get_schema() if s.name == "load_skill")
+        assert "- travel-planning: Plan trips and book flights." in (
+            load_skill.description
+        )
+        assert "pdf-forms" not in load_skill.description
+
+    def test_skills_stay_out_of_load_skill_without_skill_retrieval(
+        self, tmp_path: Path
+    ) -> None:
+        make_skill(tmp_path, "travel-planning", "Plan trips and book flights.")
+        skills = Skills.from_local_dir(tmp_path)
+        tools = make_tools()
+        retriever = ToolRetriever(tools, skills, ToolRetrieval(top_k_skills=None))
+        tools.set_context(ToolContext(EventBus(), skills, retriever))
+
+        retriever.select("book a flight")
+
+        load_skill = next(s for s in tools.get_schema() if s.name == "load_skill")
+        assert "travel-planning" not in load_skill.description
@@ -1,9 +1,12 @@
+import json
+
 import pytest
 from pydantic import BaseModel
 from transitbus import EventBus
 
 from rtvoice.tools import ActionResult, Tools, ToolSchemaFormat
 from rtvoice.tools.argument_resolver import resolve_arguments
+from rtvoice.tools.binding import provided
 from rtvoice.tools.di import Inject, ToolContext
 
 
@@ -273,6 +276,75 @@ class TestTextToolSchema:
         assert [tool.name for tool in schema] == ["stop"]
 
 
+class TestSchemaCache:
+    def test_reuses_schemas_until_something_changes(self) -> None:
+        tools = Tools()
+        first = tools.get_schema()
+
+        assert tools.get_schema()[0] is first[0]
+
+    def test_registration_invalidates(self) -> None:
+        tools = Tools()
+        tools.get_schema()
+
+        @tools.action(description="A tool")
+        def my_tool() -> None: ...
+
+        assert "my_tool" in [tool.name for tool in tools.get_schema()]
+
+    def test_merge_invalidates(self) -> None:
+        tools = Tools()
+        tools.get_schema(ToolSchemaFormat.TEXT)
+        other = Tools()
+
+        @other.action(description="A tool")
+        def my_tool() -> None: ...
+
+        tools.merge(other)
+
+        assert "my_tool" in [t.name for t in tools.get_schema(ToolSchemaFormat.TEXT)]
+
+    def test_context_changes_invalidate(self) -> None:
+        class Catalog:
+            pass
+
+        tools = Tools()
+        context = ToolContext()
+        tools.set_context(context)
+
+        @tools.action(description="A tool", available_when=provided(Catalog))
+        def browse() -> None: ...
+
+        assert "browse" not in [tool.name for tool in tools.get_schema()]
+
+        context.provide(Catalog())
+        assert "browse" in [tool.name for tool in tools.get_schema()]
+
+        context.without(Catalog)
+        assert "browse" not in [tool.name for tool in tools.get_schema()]
+
+    def test_returned_list_does_not_leak_into_cache(self) -> None:
+        tools = Tools()
+        tools.get_schema().clear()
+
+        assert [tool.name for tool in tools.get_schema()] == ["stop"]
+
+    def test_schema_json_matches_schema_and_is_cached(self) -> None:
+        tools = Tools()
+
+        @tools.action(description="A tool")
+        def alpha() -> None: ...
+
+        payload = tools.get_schema_json(sort_by_name=True)
+
+        assert [tool["name"] for tool in json.loads(payload)] == ["alpha", "stop"]
+        assert tools.get_schema_json(sort_by_name=True) is payload
+        assert [tool["name"] for tool in json.loads(tools.get_schema_json())] == [
+            "stop",
+            "alpha",
+        ]
+
+
 class TestToolStatuses:
     def test_tool_format_status_formats_template(self) -> None:
         agent = Tools()
@@ -320,3 +392,65 @@ class TestToolStatuses:
         status = tool.format_status({"date": "Montag"})
 
         assert status == "Erstelle Termin am {date} mit {attendees}..."
+
+
+class TestChangeNotifications:
+    def test_registration_and_context_changes_notify(self, tools: Tools) -> None:
+        context = ToolContext()
+        tools.set_context(context)
+        calls: list[None] = []
+        tools.subscribe(lambda: calls.append(None))
+
+        @tools.action("Do something")
+        def my_tool() -> None: ...
+
+        context.provide(object())
+        tools.invalidate_schema()
+
+        assert len(calls) == 3
+
+    def test_replaced_context_no_longer_notifies(self, tools: Tools) -> None:
+        old_context = ToolContext()
+        tools.set_context(old_context)
+        tools.set_context(ToolContext())
+        calls: list[None] = []
+        tools.subscribe(lambda: calls.append(None))
+
+        old_context.provide(object())
+
+        assert calls == []
+
+
+class TestFork:
+    def test_shares_compiled_tools_but_not_state(self, tools: Tools) -> None:
+        @tools.action("Do something")
+        def my_tool() -> None: ...
+
+        forked = tools.fork()
+        forked.focus({"my_tool"})
+        forked.set_context(ToolContext())
+
+        assert forked.get("my_tool") is tools.get("my_tool")
+        assert forked.get("stop") is Tools().get("stop")
+        assert forked._executors is tools._executors
+        assert tools._focus is None
+        assert tools._context is None
+
+    def test_later_registrations_stay_with_the_original(self, tools: Tools) -> None:
+        forked = tools.fork()
+
+        @tools.action("Do something")
+        def my_tool() -> None: ...
+
+        assert forked.get("my_tool") is None
+
+    def test_static_schemas_are_shared(self, tools: Tools) -> None:
+        @tools.action("Do something")
+        def my_tool() -> None: ...
+
+        first = tools.fork()
+        second = tools.fork()
+        first.set_context(ToolContext())
+        second.set_context(ToolContext())
+
+        assert first.get_schema()[-1] is second.get_schema()[-1]